@@ -1,17 +1,9 @@
 import argparse
+import importlib
 import os
 import sys
 
 import aviary
-from aviary.interface.methods_for_level1 import _exec_level1, _setup_level1_parser
-from aviary.utils.fortran_to_aviary import _exec_F2A, _setup_F2A_parser
-from aviary.utils.engine_deck_conversion import _exec_EDC, _setup_EDC_parser, EDC_description
-from aviary.utils.aero_table_conversion import _exec_ATC, _setup_ATC_parser
-from aviary.utils.propeller_map_conversion import _exec_PMC, _setup_PMC_parser
-from aviary.visualization.dashboard import _dashboard_setup_parser, _dashboard_cmd
-from aviary.interface.graphical_input import _exec_flight_profile, _setup_flight_profile_parser
-from aviary.interface.download_models import _exec_hangar, _setup_hangar_parser
-from aviary.interface.plot_drag_polar import _exec_plot_drag_polar, _setup_plot_drag_polar_parser
 
 
 def _load_and_exec(script_name, user_args):
@@ -43,26 +35,61 @@ def _load_and_exec(script_name, user_args):
     exec(code, globals_dict)  # nosec: private, internal use only
 
 
+# The module of each sub-command is only imported when that sub-command is run, since
+# importing all of them (and the dashboard, plotting, and OpenMDAO modules they use)
+# takes seconds. Each entry is (module, parser setup function, executor, help string).
 _command_map = {
-    'fortran_to_aviary': (_setup_F2A_parser, _exec_F2A,
+    'fortran_to_aviary': ('aviary.utils.fortran_to_aviary', '_setup_F2A_parser', '_exec_F2A',
                           "Converts legacy Fortran input decks to Aviary csv based decks"),
-    'run_mission': (_setup_level1_parser, _exec_level1,
-                    "Runs Aviary using a provided input deck"),
-    'draw_mission': (_setup_flight_profile_parser, _exec_flight_profile,
+    'run_mission': ('aviary.interface.methods_for_level1', '_setup_level1_parser',
+                    '_exec_level1', "Runs Aviary using a provided input deck"),
+    'run_doe': ('aviary.interface.design_of_experiments', '_setup_doe_parser', '_exec_doe',
+                "Runs a design of experiments over the inputs of an input deck"),
+    'draw_mission': ('aviary.interface.graphical_input', '_setup_flight_profile_parser',
+                     '_exec_flight_profile',
                      "Allows users to draw a mission profile for use in Aviary."),
-    'dashboard': (_dashboard_setup_parser, _dashboard_cmd,
-                  "Run the Dashboard tool"),
-    'hangar': (_setup_hangar_parser, _exec_hangar,
+    'dashboard': ('aviary.visualization.dashboard', '_dashboard_setup_parser',
+                  '_dashboard_cmd', "Run the Dashboard tool"),
+    'hangar': ('aviary.interface.download_models', '_setup_hangar_parser', '_exec_hangar',
                "Allows users that pip installed Aviary to download models from the Aviary hangar"),
-    'convert_engine': (_setup_EDC_parser, _exec_EDC, EDC_description),
-    'convert_aero_table': (_setup_ATC_parser, _exec_ATC,
+    'convert_engine': ('aviary.utils.engine_deck_conversion', '_setup_EDC_parser',
+                       '_exec_EDC',
+                       'Converts FLOPS- or GASP-formatted engine decks into Aviary csv format.'),
+    'convert_aero_table': ('aviary.utils.aero_table_conversion', '_setup_ATC_parser',
+                           '_exec_ATC',
                            'Converts FLOPS- or GASP-formatted aero data files into Aviary csv format.'),
-    'convert_prop_table': (_setup_PMC_parser, _exec_PMC,
+    'convert_prop_table': ('aviary.utils.propeller_map_conversion', '_setup_PMC_parser',
+                           '_exec_PMC',
                            'Converts GASP-formatted propeller map file into Aviary csv format.'),
-    'plot_drag_polar': (_setup_plot_drag_polar_parser, _exec_plot_drag_polar, 'Plot a Drag Polar Graph using a provided polar data csv input'),
+    'compile_data_file': ('aviary.utils.csv_data_file', '_setup_DFC_parser', '_exec_DFC',
+                          'Converts Aviary csv data files (such as engine decks) into a '
+                          'binary format that loads faster.'),
+    'plot_drag_polar': ('aviary.interface.plot_drag_polar', '_setup_plot_drag_polar_parser',
+                        '_exec_plot_drag_polar',
+                        'Plot a Drag Polar Graph using a provided polar data csv input'),
 }
 
 
+def _load_command(name):
+    """
+    Import the module of a sub-command.
+
+    Parameters
+    ----------
+    name : str
+        The name of the sub-command.
+
+    Returns
+    -------
+    tuple
+        The parser setup function and the executor of the sub-command.
+    """
+    module_name, setup_func_name, executor_name, _ = _command_map[name]
+    module = importlib.import_module(module_name)
+
+    return getattr(module, setup_func_name), getattr(module, executor_name)
+
+
 def aviary_cmd():
     """
     Run an 'aviary' sub-command or list help info for 'aviary' command or sub-commands.
@@ -88,11 +115,17 @@ def aviary_cmd():
     # Adding the --version argument
     parser.add_argument('--version', action='store_true', help='show version and exit')
 
+    # only the arguments of the sub-command being run are needed, so only its module
+    # is imported
+    command = next((a for a in sys.argv[1:] if a in _command_map), None)
+
     subs = parser.add_subparsers(title='Tools', metavar='', dest="subparser_name")
-    for p, (parser_setup_func, executor, help_str) in sorted(_command_map.items()):
+    for p, (_, _, _, help_str) in sorted(_command_map.items()):
         subp = subs.add_parser(p, help=help_str)
-        parser_setup_func(subp)
-        subp.set_defaults(executor=executor)
+        if p == command:
+            parser_setup_func, executor = _load_command(p)
+            parser_setup_func(subp)
+            subp.set_defaults(executor=executor)
 
     args = [a for a in sys.argv[1:] if not a.startswith('-')]
     # '--version', '--dependency_versions')]
@@ -0,0 +1,361 @@
+"""
+Run a design of experiments (DOE) over the inputs of an Aviary model.
+
+Each case of a DOE is a set of values for Aviary input variables. Cases are run by a
+pool of worker processes, each of which sets up a single AviaryProblem and rebinds the
+inputs of every case it runs to that problem. Results are written to a SQLite case
+database as each case finishes, so an interrupted DOE can be resumed without repeating
+the cases that were already run.
+"""
+import json
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import closing
+from pathlib import Path
+
+import numpy as np
+
+from aviary.interface.methods_for_level1 import load_phase_info_file
+from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.interface.solution_store import SolutionStore
+from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.csv_data_file import read_data_file
+from aviary.utils.functions import get_path
+from aviary.utils.named_values import NamedValues, get_items, get_keys
+from aviary.variable_info.enums import AnalysisScheme, Verbosity
+from aviary.variable_info.variable_meta_data import _MetaData
+from aviary.variable_info.variables import Aircraft, Mission
+
+
+# outputs recorded for each case if none are specified
+default_outputs = [
+    (Mission.Summary.GROSS_MASS, 'lbm'),
+    (Mission.Summary.FUEL_BURNED, 'lbm'),
+    (Mission.Summary.RANGE, 'NM'),
+    (Aircraft.Design.OPERATING_MASS, 'lbm'),
+]
+
+# set up problem held by each worker process
+_problem = None
+_run_driver = True
+_solution_store = None
+
+
+def read_doe_cases(filename, meta_data=_MetaData):
+    """
+    Read DOE cases from a data file in Aviary format, with one column per Aviary
+    variable and one row per case.
+
+    Parameters
+    ----------
+    filename : str or Path
+        Data file containing the cases.
+    meta_data : dict, optional
+        Variable metadata used to check the column headers. Columns that are not in
+        the metadata are skipped.
+
+    Returns
+    -------
+    list of AviaryValues
+        Input values of each case.
+    """
+    data = read_data_file(filename, metadata=meta_data)
+
+    keys = list(get_keys(data))
+    if not keys:
+        raise ValueError(f'No Aviary variables found in DOE case file <{filename}>')
+    num_cases = len(data.get_item(keys[0])[0])
+
+    cases = []
+    for idx in range(num_cases):
+        case = AviaryValues()
+        case.update_many([(key, (val[idx], units)) for key, (val, units) in get_items(data)],
+                         meta_data=meta_data)
+        cases.append(case)
+
+    return cases
+
+
+def run_doe(aircraft_filename, cases, phase_info=None, case_db='doe_cases.db',
+            num_procs=1, outputs=None, optimizer=None, objective_type=None,
+            max_iter=50, run_driver=True, analysis_scheme=AnalysisScheme.COLLOCATION,
+            verbosity=Verbosity.QUIET, solution_store=None):
+    """
+    Run an Aviary model for every case of a DOE, recording the results of each case to
+    a case database as soon as it finishes.
+
+    If the case database already holds results for some of the cases, only the
+    remaining cases are run.
+
+    Parameters
+    ----------
+    aircraft_filename : str or Path
+        Filename of the aircraft input deck defining the baseline model.
+    cases : str, Path, or list of AviaryValues
+        Input values of each case, or a data file to read them from (see
+        read_doe_cases). Only values of inputs to the model may differ between cases.
+    phase_info : dict, str, or Path, optional
+        Information about the phases of the mission, or a python file defining it.
+        If None, the default phase_info for the aircraft is used.
+    case_db : str or Path, optional
+        SQLite database that results are written to, defaults to 'doe_cases.db'.
+    num_procs : int, optional
+        Number of worker processes, defaults to 1 (cases are run in this process).
+    outputs : list of tuple, optional
+        (name, units) of each output to record. Defaults to default_outputs.
+    optimizer : str, optional
+        The optimizer to use.
+    objective_type : str, optional
+        Type of the optimization objective.
+    max_iter : int, optional
+        Maximum number of iterations for the optimizer, defaults to 50.
+    run_driver : bool, optional
+        If True (default), the driver is run for each case, otherwise each case is a
+        single model evaluation.
+    analysis_scheme : AnalysisScheme, optional
+        The analysis scheme to use, defaults to AnalysisScheme.COLLOCATION.
+    verbosity : Verbosity or int, optional
+        Sets level of information outputted to the terminal by each problem, defaults
+        to Verbosity.QUIET.
+    solution_store : str or Path, optional
+        SQLite database of a SolutionStore. If given, each case is warm started from
+        the stored solutions nearest to it, and is added to the store once the driver
+        has converged (cases are not stored if run_driver is False).
+
+    Returns
+    -------
+    list of dict
+        Results of every case, as returned by load_doe_results().
+    """
+    if isinstance(cases, (str, Path)):
+        cases = read_doe_cases(cases)
+    if outputs is None:
+        outputs = default_outputs
+
+    case_inputs = [_encode_values(case) for case in cases]
+
+    with closing(_connect(case_db)) as connection:
+        finished = _finished_cases(connection, case_inputs, case_db)
+        pending = [idx for idx in range(len(cases)) if idx not in finished]
+
+        if pending:
+            # workers may run in other directories, so find files relative to this one
+            if isinstance(aircraft_filename, (str, Path)):
+                aircraft_filename = str(get_path(aircraft_filename).resolve())
+            if isinstance(phase_info, (str, Path)):
+                phase_info = str(get_path(phase_info).resolve())
+            if solution_store is not None:
+                solution_store = str(Path(solution_store).resolve())
+
+            problem_args = (aircraft_filename, phase_info, optimizer, objective_type,
+                            max_iter, run_driver, analysis_scheme, Verbosity(verbosity),
+                            solution_store)
+
+            if num_procs <= 1:
+                _init_worker(*problem_args)
+                for idx in pending:
+                    _record_case(connection, case_inputs[idx],
+                                 *_run_case(idx, cases[idx], outputs))
+
+            else:
+                # keep recordings and reports of each worker in their own directory
+                work_dir = Path(case_db).resolve()
+                work_dir = work_dir.with_name(work_dir.stem + '_workers')
+
+                with ProcessPoolExecutor(min(num_procs, len(pending)),
+                                         initializer=_init_worker,
+                                         initargs=problem_args + (work_dir,)) as executor:
+                    futures = [executor.submit(_run_case, idx, cases[idx], outputs)
+                               for idx in pending]
+                    for future in as_completed(futures):
+                        result = future.result()
+                        _record_case(connection, case_inputs[result[0]], *result)
+
+    return load_doe_results(case_db)
+
+
+def load_doe_results(case_db):
+    """
+    Load the results of all cases recorded in a DOE case database.
+
+    Parameters
+    ----------
+    case_db : str or Path
+        SQLite database written by run_doe().
+
+    Returns
+    -------
+    list of dict
+        For each case, in order: the case index ('case'), input values ('inputs') and
+        recorded outputs ('outputs') as NamedValues, whether the case ran successfully
+        ('success'), and the error message of failed cases ('message').
+    """
+    if not Path(case_db).exists():
+        raise FileNotFoundError(f'DOE case database <{case_db}> not found')
+
+    with closing(_connect(case_db)) as connection:
+        rows = connection.execute(
+            'SELECT case_index, inputs, outputs, success, message FROM cases '
+            'ORDER BY case_index').fetchall()
+
+    return [{'case': idx,
+             'inputs': _decode_values(inputs),
+             'outputs': _decode_values(outputs),
+             'success': bool(success),
+             'message': message} for idx, inputs, outputs, success, message in rows]
+
+
+def _connect(case_db):
+    connection = sqlite3.connect(case_db)
+    connection.execute(
+        'CREATE TABLE IF NOT EXISTS cases (case_index INTEGER PRIMARY KEY, '
+        'inputs TEXT, outputs TEXT, success INTEGER, message TEXT)')
+    connection.commit()
+    return connection
+
+
+def _finished_cases(connection, case_inputs, case_db):
+    """
+    Find cases that already have results, checking that they were run with the same
+    inputs as the current cases.
+    """
+    finished = set()
+
+    for idx, inputs in connection.execute('SELECT case_index, inputs FROM cases'):
+        if idx >= len(case_inputs) or inputs != case_inputs[idx]:
+            raise ValueError(
+                f'DOE case database <{case_db}> contains results for case {idx} that do '
+                'not match the provided cases. Use a new case database to run a '
+                'different DOE.')
+        finished.add(idx)
+
+    return finished
+
+
+def _record_case(connection, inputs, idx, outputs, success, message):
+    connection.execute('INSERT INTO cases VALUES (?, ?, ?, ?, ?)',
+                       (idx, inputs, outputs, int(success), message))
+    connection.commit()
+
+
+def _encode_values(values):
+    return json.dumps({key: [np.asarray(val).tolist(), units]
+                       for key, (val, units) in get_items(values)}, sort_keys=True)
+
+
+def _decode_values(encoded):
+    values = NamedValues()
+    for key, (val, units) in json.loads(encoded).items():
+        values.set_val(key, np.array(val), units)
+    return values
+
+
+def _init_worker(aircraft_filename, phase_info, optimizer, objective_type, max_iter,
+                 run_driver, analysis_scheme, verbosity, solution_store, work_dir=None):
+    """
+    Set up the AviaryProblem that all cases run by this process are bound to.
+    """
+    global _problem, _run_driver, _solution_store
+
+    if work_dir is not None:
+        work_dir = Path(work_dir, f'worker_{os.getpid()}')
+        work_dir.mkdir(parents=True, exist_ok=True)
+        os.chdir(work_dir)
+
+    phase_info_parameterization = None
+    if isinstance(phase_info, str):
+        phase_info, phase_info_parameterization = load_phase_info_file(phase_info)
+
+    prob = AviaryProblem(analysis_scheme)
+
+    prob.load_inputs(aircraft_filename, phase_info, verbosity=verbosity)
+    prob.check_and_preprocess_inputs()
+
+    prob.add_pre_mission_systems()
+    prob.add_phases(phase_info_parameterization=phase_info_parameterization)
+    prob.add_post_mission_systems()
+
+    prob.link_phases()
+
+    if run_driver:
+        prob.add_driver(optimizer, max_iter=max_iter, verbosity=verbosity)
+    prob.add_design_variables()
+    prob.add_objective(objective_type=objective_type)
+
+    prob.setup()
+    prob.set_initial_guesses()
+
+    _problem = prob
+    _run_driver = run_driver
+    _solution_store = None if solution_store is None else SolutionStore(solution_store)
+
+
+def _run_case(idx, case, outputs):
+    """
+    Run a single case on the problem of this process.
+
+    Returns
+    -------
+    tuple
+        Case index, encoded output values, success flag, and error message.
+    """
+    prob = _problem
+
+    try:
+        prob.rebind_inputs(case, solution_store=_solution_store)
+        prob.run_aviary_problem(run_driver=_run_driver, make_plots=False,
+                                solution_store=_solution_store)
+
+        values = NamedValues()
+        for name, units in outputs:
+            values.set_val(name, prob.get_val(name, units=units), units)
+
+    except Exception as err:
+        return idx, _encode_values(NamedValues()), False, repr(err)
+
+    return idx, _encode_values(values), prob.problem_ran_successfully, ''
+
+
+def _setup_doe_parser(parser):
+    parser.add_argument(
+        'input_deck', metavar='indeck', type=str, nargs=1,
+        help='Name of vehicle input deck file')
+    parser.add_argument(
+        'cases', type=str, nargs=1,
+        help='Data file of DOE cases, with one column per Aviary variable')
+    parser.add_argument(
+        '-o', '--case_db', type=str, default='doe_cases.db',
+        help='SQLite database that results are written to. Results already in the '
+             'database are kept and only the remaining cases are run')
+    parser.add_argument(
+        '-n', '--num_procs', type=int, default=1,
+        help='Number of worker processes')
+    parser.add_argument(
+        '--optimizer', type=str, default='None', help='Name of optimizer',
+        choices=('SNOPT', 'IPOPT', 'SLSQP', 'None'))
+    parser.add_argument(
+        '--phase_info', type=str, default=None, help='Path to phase info file')
+    parser.add_argument(
+        '--max_iter', type=int, default=50, help='maximum number of iterations')
+    parser.add_argument(
+        '--run_model', action='store_true',
+        help='Evaluate the model once per case instead of running the driver')
+    parser.add_argument(
+        '--solution_store', type=str, default=None,
+        help='SQLite database of converged trajectories used to warm start each case')
+
+
+def _exec_doe(args, user_args):
+    optimizer = None if args.optimizer == 'None' else args.optimizer
+
+    results = run_doe(args.input_deck[0], args.cases[0], phase_info=args.phase_info,
+                      case_db=args.case_db, num_procs=args.num_procs,
+                      optimizer=optimizer, max_iter=args.max_iter,
+                      run_driver=not args.run_model,
+                      solution_store=args.solution_store)
+
+    failed = [result['case'] for result in results if not result['success']]
+    print(f'{len(results)} cases recorded to {args.case_db}, {len(failed)} failed')
+    if failed:
+        print(f'Failed cases: {failed}')
@@ -106,6 +106,32 @@ def run_aviary(aircraft_filename, phase_info, optimizer=None,
     return prob
 
 
+def load_phase_info_file(filename):
+    """
+    Load phase_info, and phase_info_parameterization if present, from a python file.
+
+    Parameters
+    ----------
+    filename : str or Path
+        Path to the python file defining phase_info.
+
+    Returns
+    -------
+    phase_info : dict
+        The phase_info defined in the file.
+    phase_info_parameterization : function or None
+        The phase_info_parameterization function defined in the file, if any.
+    """
+    phase_info_path = get_path(filename)
+    phase_info_file = SourceFileLoader(
+        "phase_info_file", str(phase_info_path)).load_module()
+    phase_info = getattr(phase_info_file, 'phase_info')
+    phase_info_parameterization = getattr(
+        phase_info_file, 'phase_info_parameterization', None)
+
+    return phase_info, phase_info_parameterization
+
+
 def run_level_1(
     input_deck,
     outdir='output',
@@ -131,12 +157,8 @@ def run_level_1(
     kwargs['optimizer'] = optimizer
 
     if isinstance(phase_info, str):
-        phase_info_path = get_path(phase_info)
-        phase_info_file = SourceFileLoader(
-            "phase_info_file", str(phase_info_path)).load_module()
-        phase_info = getattr(phase_info_file, 'phase_info')
-        kwargs['phase_info_parameterization'] = getattr(
-            phase_info_file, 'phase_info_parameterization', None)
+        phase_info, kwargs['phase_info_parameterization'] = \
+            load_phase_info_file(phase_info)
 
     prob = run_aviary(input_deck, phase_info, **kwargs)
 
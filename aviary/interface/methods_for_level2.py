@@ -8,6 +8,7 @@ import importlib.util
 import sys
 import json
 import enum
+from concurrent.futures import ProcessPoolExecutor
 
 import numpy as np
 
@@ -51,6 +52,7 @@ from aviary.subsystems.propulsion.utils import build_engine_deck
 from aviary.subsystems.propulsion.propulsion_builder import CorePropulsionBuilder
 
 from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.named_values import get_items
 from aviary.utils.functions import create_opts2vals, add_opts2vals, promote_aircraft_and_mission_vars, wrapped_convert_units
 from aviary.utils.functions import convert_strings_to_data, set_value
 from aviary.utils.merge_variable_metadata import merge_meta_data
@@ -260,6 +262,9 @@ class AviaryProblem(om.Problem):
         self.regular_phases = []
         self.reserve_phases = []
 
+        # formats the timeseries report is written in, out of 'csv', 'parquet', and 'hdf5'
+        self.timeseries_file_formats = ['csv']
+
     def load_inputs(self, aviary_inputs, phase_info=None, engine_builders=None, meta_data=BaseMetaData, verbosity=Verbosity.BRIEF):
         """
         This method loads the aviary_values inputs and options that the
@@ -1978,7 +1983,7 @@ class AviaryProblem(om.Problem):
             warnings.simplefilter("ignore", om.PromotionWarning)
             super().setup(**kwargs)
 
-    def set_initial_guesses(self):
+    def set_initial_guesses(self, solution_store=None):
         """
         Call `set_val` on the trajectory for states and controls to seed
         the problem with reasonable initial guesses. This is especially
@@ -1992,6 +1997,12 @@ class AviaryProblem(om.Problem):
         and continue to the next phase after that. For other phases, we set the initial
         guesses for states and controls according to the information available
         in the 'initial_guesses' attribute of the phase.
+
+        Parameters
+        ----------
+        solution_store : SolutionStore, optional
+            If given, the trajectory is then warm started from the stored solutions
+            nearest to this problem, if there are any for the same phases.
         """
         # Grab the trajectory object from the model
         if self.analysis_scheme is AnalysisScheme.SHOOTING:
@@ -2049,6 +2060,9 @@ class AviaryProblem(om.Problem):
             # Set initial guesses for states and controls for each phase
             self._add_guesses(phase_name, phase, guesses)
 
+        if solution_store is not None:
+            solution_store.apply(self)
+
     def _process_guess_var(self, val, key, phase):
         """
         Process the guess variable, which can either be a float or an array of floats.
@@ -2315,7 +2329,8 @@ class AviaryProblem(om.Problem):
     def run_aviary_problem(self,
                            record_filename="problem_history.db",
                            optimization_history_filename=None,
-                           restart_filename=None, suppress_solver_print=True, run_driver=True, simulate=False, make_plots=True):
+                           restart_filename=None, suppress_solver_print=True, run_driver=True, simulate=False, make_plots=True,
+                           solution_store=None):
         """
         This function actually runs the Aviary problem, which could be a simulation, optimization, or a driver execution, depending on the arguments provided.
 
@@ -2335,6 +2350,10 @@ class AviaryProblem(om.Problem):
             If True, an explicit Dymos simulation will be performed. The default is False.
         make_plots : bool, optional
             If True (default), Dymos html plots will be generated as part of the output.
+        solution_store : SolutionStore, optional
+            If given and the driver runs successfully, the converged trajectory is added
+            to the store to warm start later problems. Nothing is stored if run_driver is
+            False.
         """
 
         if self.aviary_inputs.get_val(Settings.VERBOSITY).value >= 2:
@@ -2365,6 +2384,76 @@ class AviaryProblem(om.Problem):
 
         self.problem_ran_successfully = not failed
 
+        # only a converged trajectory is a useful guess for later problems
+        if solution_store is not None and run_driver and \
+                self.problem_ran_successfully and \
+                self.analysis_scheme is AnalysisScheme.COLLOCATION:
+            solution_store.add(self)
+
+    def rebind_inputs(self, aviary_inputs, reset_initial_guesses=True,
+                      solution_store=None):
+        """
+        Bind new input values to a problem that has already been set up, so that the
+        same model can be reused for many cases without calling setup() again. This
+        replaces the full load_inputs() through setup() sequence with a pass of
+        set_val() calls.
+
+        Only the values of variables that are inputs to the model can be changed.
+        Options (and any other values used while building the model) must match the
+        values the problem was set up with, as changing them requires a new problem.
+
+        Parameters
+        ----------
+        aviary_inputs : AviaryValues
+            New input values. Variables that are not provided keep their current
+            values.
+        reset_initial_guesses : bool, optional
+            If True (default), the trajectory is reset to the initial guesses in
+            phase_info so that every case starts from the same point. If False, the
+            solution of the previous case is used as the starting point.
+        solution_store : SolutionStore, optional
+            If given and the initial guesses are reset, the trajectory is warm started
+            from the stored solutions nearest to the new inputs.
+
+        Raises
+        ------
+        RuntimeError
+            If the problem has not been set up.
+        ValueError
+            If the value of an option or of a variable that is not an input to the
+            model differs from the value the problem was set up with.
+        """
+        if self._metadata is None:
+            raise RuntimeError(
+                'rebind_inputs() can only be called after the problem has been set up')
+
+        prom2abs = self.model._var_allprocs_prom2abs_list
+        rebound = []
+        changed = []
+
+        # check every value before setting any, so a rejected rebind leaves the problem
+        # unchanged
+        for key, (val, units) in get_items(aviary_inputs):
+            if key in prom2abs['input'] or key in prom2abs['output']:
+                if key in self.meta_data and not self.meta_data[key]['option']:
+                    rebound.append((key, val, units))
+                    continue
+
+            if _values_differ(self.aviary_inputs, key, val, units):
+                changed.append(key)
+
+        if changed:
+            raise ValueError(
+                'The following values cannot be changed without setting up a new '
+                f'problem, as they are options or are not inputs to the model: {changed}')
+
+        for key, val, units in rebound:
+            self.set_val(key, val, units)
+            self.aviary_inputs.set_val(key, val, units, meta_data=self.meta_data)
+
+        if reset_initial_guesses:
+            self.set_initial_guesses(solution_store=solution_store)
+
     def alternate_mission(self, run_mission=True,
                           json_filename='sizing_problem.json',
                           payload_mass=None, mission_range=None,
@@ -2391,7 +2480,7 @@ class AviaryProblem(om.Problem):
         if phase_info is None:
             phase_info = self.phase_info
         if mission_range is None:
-            design_range = self.get_val(Mission.Design.RANGE)
+            mission_range = self.get_val(Mission.Design.RANGE)
         if payload_mass is None:
             if self.mission_method is HEIGHT_ENERGY:
                 payload_mass = self.get_val(Aircraft.CrewPayload.TOTAL_PAYLOAD_MASS)
@@ -2401,19 +2490,9 @@ class AviaryProblem(om.Problem):
         mission_mass = self.get_val(Mission.Design.GROSS_MASS)
         optimizer = self.driver.options["optimizer"]
 
-        prob_alternate = _load_off_design(json_filename, ProblemType.ALTERNATE,
-                                          phase_info, payload_mass, design_range, mission_mass)
-
-        prob_alternate.check_and_preprocess_inputs()
-        prob_alternate.add_pre_mission_systems()
-        prob_alternate.add_phases()
-        prob_alternate.add_post_mission_systems()
-        prob_alternate.link_phases()
-        prob_alternate.add_driver(optimizer, verbosity=verbosity)
-        prob_alternate.add_design_variables()
-        prob_alternate.add_objective()
-        prob_alternate.setup()
-        prob_alternate.set_initial_guesses()
+        prob_alternate = _setup_off_design(json_filename, ProblemType.ALTERNATE,
+                                           phase_info, payload_mass, mission_range,
+                                           mission_mass, optimizer, verbosity)
         if run_mission:
             prob_alternate.run_aviary_problem(
                 record_filename='alternate_problem_history.db')
@@ -2455,23 +2534,108 @@ class AviaryProblem(om.Problem):
         design_range = self.get_val(Mission.Design.RANGE)
         optimizer = self.driver.options["optimizer"]
 
-        prob_fallout = _load_off_design(json_filename, ProblemType.FALLOUT, phase_info,
-                                        payload_mass, design_range, mission_mass)
-
-        prob_fallout.check_and_preprocess_inputs()
-        prob_fallout.add_pre_mission_systems()
-        prob_fallout.add_phases()
-        prob_fallout.add_post_mission_systems()
-        prob_fallout.link_phases()
-        prob_fallout.add_driver(optimizer, verbosity=verbosity)
-        prob_fallout.add_design_variables()
-        prob_fallout.add_objective()
-        prob_fallout.setup()
-        prob_fallout.set_initial_guesses()
+        prob_fallout = _setup_off_design(json_filename, ProblemType.FALLOUT, phase_info,
+                                         payload_mass, design_range, mission_mass,
+                                         optimizer, verbosity)
         if run_mission:
             prob_fallout.run_aviary_problem(record_filename='fallout_problem_history.db')
         return prob_fallout
 
+    def run_off_design_missions(self, missions, problem_type=ProblemType.FALLOUT,
+                                json_filename='sizing_problem.json', phase_info=None,
+                                run_driver=True, num_procs=1,
+                                verbosity=Verbosity.BRIEF):
+        """
+        This function runs a batch of off-design missions based on a sizing mission
+        output, such as the points of a payload-range diagram.
+
+        Payload is applied through the aircraft inputs before setup, so one off-design
+        problem is set up for each distinct payload mass and reused for every mission
+        with that payload, with each mission starting from the solution of the
+        previous one. The initial guesses of 2DOF alternate missions depend on their
+        range, so those missions start from their own initial guesses instead. The
+        history of each of these groups of missions is recorded to its own file. When
+        num_procs is greater than one, the groups (split further if there are fewer
+        groups than processes) are run in separate processes, each with its own copy
+        of the off-design problem.
+
+        Parameters
+        ----------
+        missions : list of tuple
+            For alternate missions, (payload_mass, mission_range) pairs in lbm and NM.
+            For fallout missions, (payload_mass, mission_mass) pairs in lbm.
+        problem_type : ProblemType
+            ProblemType.ALTERNATE or ProblemType.FALLOUT.
+        json_filename : str
+            Name of the file that the sizing mission has been saved to.
+        phase_info : dict, optional
+            Dictionary containing the phases and their required parameters. Must be
+            picklable when num_procs is greater than one.
+        run_driver : bool
+            If True (default), the driver is run for each mission. If False, each
+            mission is only run through the model once.
+        num_procs : int
+            Number of processes used to run the missions.
+        verbosity : Verbosity or list, optional
+            If Verbosity.DEBUG, debug print options ['desvars','ln_cons','nl_cons','objs'] will be set.
+            If a list is provided, it will be used as the debug print options.
+
+        Returns
+        -------
+        list of dict
+            Results of each mission, in the same order as missions, with payload mass,
+            range, gross mass, total fuel mass, and whether the mission ran successfully.
+        """
+        if problem_type not in (ProblemType.ALTERNATE, ProblemType.FALLOUT):
+            raise ValueError(f'{problem_type} is not a valid off-design problem type.')
+        if phase_info is None:
+            phase_info = self.phase_info
+
+        optimizer = self.driver.options["optimizer"]
+        record_prefix = problem_type.value
+
+        # missions sharing a payload reuse one problem
+        blocks = {}
+        for idx, (payload, _) in enumerate(missions):
+            blocks.setdefault(payload, []).append(idx)
+        blocks = list(blocks.values())
+
+        results = [None] * len(missions)
+
+        if num_procs <= 1:
+            for block_idx, block in enumerate(blocks):
+                block_results = _run_off_design_missions(
+                    json_filename, problem_type, phase_info,
+                    [missions[idx] for idx in block], optimizer, run_driver, verbosity,
+                    f'{record_prefix}_{block_idx}_problem_history.db')
+                for idx, result in zip(block, block_results):
+                    results[idx] = result
+
+            return results
+
+        # split the largest blocks until every process has work
+        while len(blocks) < num_procs:
+            largest = max(blocks, key=len)
+            if len(largest) < 2:
+                break
+            blocks.remove(largest)
+            half = len(largest) // 2
+            blocks.extend([largest[:half], largest[half:]])
+
+        with ProcessPoolExecutor(max_workers=num_procs) as executor:
+            futures = [
+                executor.submit(
+                    _run_off_design_missions, json_filename, problem_type, phase_info,
+                    [missions[idx] for idx in block], optimizer, run_driver, verbosity,
+                    f'{record_prefix}_{block_idx}_problem_history.db')
+                for block_idx, block in enumerate(blocks)
+            ]
+            for block, future in zip(blocks, futures):
+                for idx, result in zip(block, future.result()):
+                    results[idx] = result
+
+        return results
+
     def save_sizing_to_json(self, json_filename='sizing_problem.json'):
         """
         This function saves an aviary problem object into a json file.
@@ -2768,6 +2932,21 @@ class AviaryProblem(om.Problem):
                                             )
 
 
+def _values_differ(aviary_values, key, val, units):
+    """
+    Check if a value differs from the one stored in AviaryValues.
+    """
+    if key not in aviary_values:
+        return True
+
+    if units == 'unitless':
+        current = aviary_values.get_val(key)
+    else:
+        current = aviary_values.get_val(key, units)
+
+    return not np.array_equal(np.ravel(current), np.ravel(val))
+
+
 def _read_sizing_json(aviary_problem, json_filename):
     """
     This function reads in an aviary problem object from a json file.
@@ -2902,4 +3081,89 @@ def _load_off_design(json_filename, ProblemType, phase_info,
 
     # Load inputs
     prob.load_inputs(prob.aviary_inputs, phase_info)
+
+    if ProblemType == ProblemType.ALTERNATE:
+        # the target range in phase_info is that of the sizing mission
+        prob.aviary_inputs.set_val(Mission.Design.RANGE, mission_range, units='NM')
+        prob.target_range = prob.aviary_inputs.get_val(Mission.Design.RANGE, units='NM')
+
     return prob
+
+
+def _setup_off_design(json_filename, ProblemType, phase_info, payload, mission_range,
+                      mission_gross_mass, optimizer, verbosity):
+    """
+    This function loads a sized aircraft and builds, sets up, and sets initial
+    guesses for an off design mission problem.
+
+    Returns
+    ----------
+    Aviary Problem object ready to run the specified off design mission
+    """
+    prob = _load_off_design(json_filename, ProblemType, phase_info,
+                            payload, mission_range, mission_gross_mass)
+
+    prob.check_and_preprocess_inputs()
+    prob.add_pre_mission_systems()
+    prob.add_phases()
+    prob.add_post_mission_systems()
+    prob.link_phases()
+    prob.add_driver(optimizer, verbosity=verbosity)
+    prob.add_design_variables()
+    prob.add_objective()
+    prob.setup()
+    prob.set_initial_guesses()
+    return prob
+
+
+def _run_off_design_missions(json_filename, problem_type, phase_info, missions,
+                             optimizer, run_driver, verbosity, record_filename):
+    """
+    This function sets up one off design problem and runs it for each of the given
+    (payload, range or gross mass) missions in turn, warm starting each mission from
+    the previous solution unless its initial guesses depend on its range. All missions
+    are expected to share the same payload.
+
+    Returns
+    ----------
+    List of result dictionaries, one per mission
+    """
+    payload, value = missions[0]
+    if problem_type is ProblemType.ALTERNATE:
+        prob = _setup_off_design(json_filename, problem_type, phase_info, payload,
+                                 value, None, optimizer, verbosity)
+    else:
+        prob = _setup_off_design(json_filename, problem_type, phase_info, payload,
+                                 None, value, optimizer, verbosity)
+
+    results = []
+    for idx, (_, value) in enumerate(missions):
+        if idx > 0:
+            new_inputs = AviaryValues()
+            if problem_type is ProblemType.ALTERNATE:
+                new_inputs.set_val(Mission.Design.RANGE, value, units='NM')
+                prob.target_range = value
+            else:
+                new_inputs.set_val(Mission.Summary.GROSS_MASS, value, units='lbm')
+
+            # the 2DOF initial guesses depend on the target range, so they are set
+            # again for the new range instead of starting from the previous solution
+            reset_initial_guesses = problem_type is ProblemType.ALTERNATE and \
+                prob.mission_method is TWO_DEGREES_OF_FREEDOM
+            prob.rebind_inputs(new_inputs, reset_initial_guesses=reset_initial_guesses)
+
+        prob.run_aviary_problem(record_filename=record_filename,
+                                run_driver=run_driver, make_plots=False)
+
+        results.append({
+            Aircraft.CrewPayload.PASSENGER_PAYLOAD_MASS: prob.aviary_inputs.get_val(
+                Aircraft.CrewPayload.PASSENGER_PAYLOAD_MASS, units='lbm'),
+            Mission.Summary.RANGE: prob.get_val(Mission.Summary.RANGE, units='NM')[0],
+            Mission.Summary.GROSS_MASS: prob.get_val(
+                Mission.Summary.GROSS_MASS, units='lbm')[0],
+            Mission.Summary.TOTAL_FUEL_MASS: prob.get_val(
+                Mission.Summary.TOTAL_FUEL_MASS, units='lbm')[0],
+            'success': prob.problem_ran_successfully,
+        })
+
+    return results
@@ -3,6 +3,7 @@ import json
 from pathlib import Path
 import sys
 import time
+import warnings
 import pandas as pd
 import numpy as np
 
@@ -14,6 +15,9 @@ from aviary.interface.utils.markdown_utils import write_markdown_variable_table
 from aviary.utils.named_values import NamedValues
 from aviary.utils.functions import wrapped_convert_units
 
+# file extensions of the formats the timeseries report can be written in
+_timeseries_file_extensions = {'csv': '.csv', 'parquet': '.parquet', 'hdf5': '.h5'}
+
 
 def register_custom_reports():
     """
@@ -217,7 +221,7 @@ def mission_report(prob, **kwargs):
                                            'Ground Distance': {'units': 'nmi'}})
 
 
-def timeseries_csv(prob, **kwargs):
+def timeseries_csv(prob, file_formats=None, **kwargs):
     """
     Generates a CSV file containing timeseries data for variables from an Aviary mission.
 
@@ -226,84 +230,98 @@ def timeseries_csv(prob, **kwargs):
     The 'time' variable is moved to the beginning of the dataset so it's always the leftmost column.
     Duplicate consecutive rows are eliminated.
 
+    The timeseries outputs of all phases are gathered in a single pass over the model
+    outputs, and each column is filled into a preallocated array, converting the units
+    of each phase's block at once.
+
     Parameters
     ----------
     prob : AviaryProblem
         The AviaryProblem used to generate this report
+    file_formats : iterable of str or None
+        Formats to write the data in, out of 'csv', 'parquet', and 'hdf5'. If None, the
+        timeseries_file_formats attribute of prob is used, defaulting to only 'csv'.
+        Writing Parquet requires pyarrow (or fastparquet), and writing HDF5 requires
+        PyTables.
     kwargs : dict
         Additional keyword arguments (unused)
 
     The output CSV file is named 'mission_timeseries_data.csv' and is saved in the reports directory.
     The first row of the CSV file contains headers with variable names and units.
     Each subsequent row represents the mission outputs at a different time step.
+    The Parquet and HDF5 files have the same name and columns, with the extensions
+    '.parquet' and '.h5'.
     """
-    timeseries_outputs = prob.model.list_outputs(
-        includes='*timeseries*', out_stream=None, return_format='dict', units=True)
-    phase_names = prob.model.traj._phases.keys()
+    if file_formats is None:
+        file_formats = getattr(prob, 'timeseries_file_formats', None) or ('csv',)
+
+    file_formats = [file_format.lower() for file_format in file_formats]
+    for file_format in file_formats:
+        if file_format not in _timeseries_file_extensions:
+            raise ValueError(f'Unknown timeseries file format "{file_format}". Valid '
+                             f'formats are {list(_timeseries_file_extensions)}.')
+
+    model = prob.model
+    phase_names = list(model.traj._phases.keys())
+    abs2meta = model._var_allprocs_abs2meta['output']
+
+    # Find the timeseries outputs of every phase with a single pass over the outputs,
+    # rather than listing all of them and searching for each variable in each phase.
+    timeseries_prefixes = {f'traj.{phase_name}.timeseries': phase_name
+                           for phase_name in phase_names}
+    phase_outputs = {phase_name: {} for phase_name in phase_names}
+
+    for abs_name, prom_name in model._var_allprocs_abs2prom['output'].items():
+        prefix, _, variable_name = prom_name.rpartition('.')
+        phase_name = timeseries_prefixes.get(prefix)
+
+        if phase_name is None or variable_name.endswith('_phase'):
+            continue
+
+        # getting remote values is a collective call, so every proc gets them
+        val = model._abs_get_val(abs_name, get_remote=True)
+        phase_outputs[phase_name][variable_name] = (val, abs2meta[abs_name]['units'])
 
     # There are no more collective calls, so we can exit.
     if MPI and MPI.COMM_WORLD.rank != 0:
         return
 
-    timeseries_outputs = {value['prom_name']: value for key,
-                          value in timeseries_outputs.items()}
+    # grab the units from the first phase that uses each variable; use these units for
+    # all others
+    units = {}
+    for outputs in phase_outputs.values():
+        for variable_name, (_, variable_units) in outputs.items():
+            units.setdefault(variable_name, variable_units)
 
-    timeseries_outputs = {key: value for key,
-                          value in timeseries_outputs.items() if not key.endswith('_phase')}
-
-    unique_variable_names = set([timeseries_output.split('.')[-1]
-                                for timeseries_output in timeseries_outputs])
+    num_nodes = [outputs['time'][0].shape[0] for outputs in phase_outputs.values()]
 
     timeseries_data = {}
-    for variable_name in unique_variable_names:
-        timeseries_data[variable_name] = {}
-        first = True  # flag to check if this is first iteration in for loop
-        units = None
-        for idx_phase, phase_name in enumerate(phase_names):
-            variable_str = f'traj.{phase_name}.timeseries.{variable_name}'
-            time_str = f'traj.{phase_name}.timeseries.time'
-
-            if variable_str not in timeseries_outputs:
-                Warning(
-                    f'Variable {variable_str} not found in timeseries_outputs for phase {phase_name}.')
-                val = np.zeros_like(timeseries_outputs[time_str]['val'])
-                val[:] = np.nan
-                if first:
-                    val_full_traj = val
-                    first = False
-                else:
-                    val_full_traj = np.vstack((val_full_traj, val))
+    for variable_name, variable_units in units.items():
+        # phases that don't have the variable are filled with NaN
+        block_sizes = [
+            outputs[variable_name][0].size if variable_name in outputs else nn
+            for outputs, nn in zip(phase_outputs.values(), num_nodes)]
+        offsets = np.cumsum([0] + block_sizes)
 
-            else:
-                val = timeseries_outputs[variable_str]['val']
-
-                # grab the units from the first phase that uses this variable; use these units for all others
-                if units is None:
-                    units = timeseries_outputs[variable_str]['units']
-                    if first:
-                        val_full_traj = val
-                        first = False
-                    else:
-                        val_full_traj = np.vstack((val_full_traj, val))
-                else:
-                    original_units = timeseries_outputs[variable_str]['units']
-
-                    if original_units != units:
-                        val = wrapped_convert_units((val, original_units), units)
-
-                    if first:
-                        val_full_traj = val
-                        first = False
-                    else:
-                        val_full_traj = np.vstack((val_full_traj, val))
-
-        timeseries_data[variable_name]['val'] = val_full_traj
-        timeseries_data[variable_name]['units'] = units
-        timeseries_data[variable_name]['shape'] = val_full_traj.shape
+        val_full_traj = np.full(offsets[-1], np.nan)
+
+        for idx_phase, outputs in enumerate(phase_outputs.values()):
+            if variable_name not in outputs:
+                continue
+
+            val, original_units = outputs[variable_name]
+
+            if original_units != variable_units:
+                val = wrapped_convert_units((val, original_units), variable_units)
+
+            val_full_traj[offsets[idx_phase]:offsets[idx_phase + 1]] = \
+                np.ravel(val)
+
+        timeseries_data[variable_name] = val_full_traj
 
     # Create a DataFrame from timeseries_data
-    df_data = {variable_name: pd.Series(timeseries_data[variable_name]['val'].flatten())
-               for variable_name in timeseries_data}
+    df_data = {variable_name: pd.Series(val)
+               for variable_name, val in timeseries_data.items()}
     df = pd.DataFrame(df_data)
 
     time_column = ['time']  # Isolate the 'time' column
@@ -313,13 +331,27 @@ def timeseries_csv(prob, **kwargs):
     df = df[columns]
 
     # Add units to column names
-    df.columns = [f'{col} ({timeseries_data[col]["units"]})' for col in df.columns]
+    df.columns = [f'{col} ({units[col]})' for col in df.columns]
 
     df.drop_duplicates()
 
-    # The path where you want to save the CSV file
+    # The path where you want to save the files
     reports_folder = Path(prob.get_reports_dir())
-    report_file = reports_folder / 'mission_timeseries_data.csv'
 
-    # Write the DataFrame to a CSV file
-    df.to_csv(report_file, index=False)
+    for file_format in file_formats:
+        report_file = reports_folder / \
+            f'mission_timeseries_data{_timeseries_file_extensions[file_format]}'
+
+        if file_format == 'csv':
+            # Write the DataFrame to a CSV file
+            df.to_csv(report_file, index=False)
+            continue
+
+        try:
+            if file_format == 'parquet':
+                df.to_parquet(report_file, index=False)
+            else:
+                df.to_hdf(report_file, key='timeseries', mode='w', index=False)
+        except ImportError as err:
+            # a missing optional dependency shouldn't stop the other reports
+            warnings.warn(f'Could not write the timeseries data as {file_format}: {err}')
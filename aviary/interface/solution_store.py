@@ -0,0 +1,275 @@
+"""
+Store converged trajectories to warm start similar problems.
+
+Restarting from a previous solution with a recorded case only works for an identical
+problem. In a sweep, the aircraft changes slightly from one case to the next, and
+starting each case from the solution of the most similar case converges in far fewer
+iterations than starting from the linear initial guesses in phase_info.
+
+A SolutionStore keeps the time, states, and controls of every phase of converged
+trajectories in a SQLite database. Solutions are grouped by the structure of the
+trajectory (its phases and their states and controls) and located by the values of a
+few key inputs. The stored values are kept at the nodes of the grid they were solved on,
+in normalized phase time, so they can be projected onto a problem with a different
+number of segments or transcription order.
+"""
+import json
+import sqlite3
+from contextlib import closing
+
+import numpy as np
+
+from aviary.variable_info.variables import Aircraft, Mission
+
+
+# inputs used to find the most similar stored solution if none are specified
+default_key_inputs = [
+    (Mission.Design.GROSS_MASS, 'lbm'),
+    (Mission.Design.RANGE, 'NM'),
+    (Aircraft.Wing.AREA, 'ft**2'),
+    (Aircraft.CrewPayload.NUM_PASSENGERS, 'unitless'),
+]
+
+
+class SolutionStore:
+    """
+    A database of converged trajectories used to warm start similar problems.
+
+    Parameters
+    ----------
+    filename : str or Path
+        SQLite database the solutions are stored in. It is created if it doesn't exist.
+    key_inputs : list of tuple, optional
+        (name, units) of the Aviary inputs that the distance between problems is
+        measured over. Defaults to default_key_inputs.
+    num_neighbors : int, optional
+        Number of the nearest stored solutions that are blended, weighted by inverse
+        distance, to form the guess for a new problem. Defaults to 1 (the nearest
+        solution is used as is).
+    """
+
+    def __init__(self, filename='solution_store.db', key_inputs=None, num_neighbors=1):
+        self.filename = str(filename)
+        self.key_inputs = default_key_inputs if key_inputs is None else key_inputs
+        self.num_neighbors = num_neighbors
+
+        with closing(self._connect()) as connection:
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS solutions (id INTEGER PRIMARY KEY, '
+                'structure TEXT, key_inputs TEXT, solution TEXT)')
+            connection.commit()
+
+    def __len__(self):
+        with closing(self._connect()) as connection:
+            return connection.execute('SELECT COUNT(*) FROM solutions').fetchone()[0]
+
+    def add(self, prob):
+        """
+        Store the current trajectory of a problem, which should have converged.
+
+        Parameters
+        ----------
+        prob : AviaryProblem
+            The problem, which must use collocation.
+        """
+        solution = {}
+
+        for phase_name, phase in prob.model.traj._phases.items():
+            time_units = phase.time_options['units']
+            time = prob.get_val(f'traj.{phase_name}.timeseries.time',
+                                units=time_units).ravel()
+            t_initial = time[0]
+            t_duration = time[-1] - time[0]
+
+            # the timeseries repeats the nodes at segment boundaries
+            _, idxs = np.unique(time, return_index=True)
+            time = time[idxs]
+            if t_duration != 0.0:
+                tau = 2.0 * (time - t_initial) / t_duration - 1.0
+            else:
+                tau = np.linspace(-1.0, 1.0, time.size)
+
+            variables = {}
+            for name, units in _phase_variables(phase):
+                path = f'traj.{phase_name}.timeseries.{name}'
+                try:
+                    val = prob.get_val(path, units=units)
+                except KeyError:
+                    # not all variables are in the timeseries of every transcription
+                    continue
+                variables[name] = [val[idxs].tolist(), units]
+
+            solution[phase_name] = {
+                'time_units': time_units,
+                't_initial': float(t_initial),
+                't_duration': float(t_duration),
+                'tau': tau.tolist(),
+                'variables': variables,
+            }
+
+        with closing(self._connect()) as connection:
+            connection.execute(
+                'INSERT INTO solutions (structure, key_inputs, solution) '
+                'VALUES (?, ?, ?)',
+                (_structure(prob), json.dumps(self._key_values(prob)),
+                 json.dumps(solution)))
+            connection.commit()
+
+    def find(self, prob):
+        """
+        Find the stored solutions nearest to a problem.
+
+        Parameters
+        ----------
+        prob : AviaryProblem
+            The problem to find solutions for.
+
+        Returns
+        -------
+        list of tuple
+            (distance, solution) of up to num_neighbors stored solutions of trajectories
+            with the same structure as that of the problem, nearest first.
+        """
+        with closing(self._connect()) as connection:
+            rows = connection.execute(
+                'SELECT key_inputs, solution FROM solutions WHERE structure = ?',
+                (_structure(prob),)).fetchall()
+
+        if not rows:
+            return []
+
+        key_values = np.array(self._key_values(prob), dtype=float)
+        stored_values = np.array([json.loads(row[0]) for row in rows], dtype=float)
+
+        # relative differences, so the distance doesn't depend on the units of the
+        # inputs; inputs missing from either problem are ignored
+        scale = np.maximum(np.abs(stored_values), np.abs(key_values))
+        scale[scale == 0.0] = 1.0
+        distances = np.sqrt(np.nansum(((stored_values - key_values) / scale) ** 2,
+                                      axis=1))
+
+        nearest = np.argsort(distances, kind='stable')[:self.num_neighbors]
+
+        return [(distances[idx], json.loads(rows[idx][1])) for idx in nearest]
+
+    def apply(self, prob):
+        """
+        Set the initial guesses of a problem from the nearest stored solutions.
+
+        Parameters
+        ----------
+        prob : AviaryProblem
+            The problem, which must be set up.
+
+        Returns
+        -------
+        bool
+            True if a stored solution was applied, False if there were none for
+            trajectories with the same structure as that of the problem.
+        """
+        neighbors = self.find(prob)
+        if not neighbors:
+            return False
+
+        distances = np.array([distance for distance, _ in neighbors])
+        if distances[0] == 0.0:
+            # an exact match isn't blended with anything else
+            neighbors = neighbors[:1]
+            weights = np.ones(1)
+        else:
+            weights = 1.0 / distances
+            weights /= weights.sum()
+
+        # states, controls, and times are outputs if they are design variables, and
+        # inputs otherwise
+        prom2abs = prob.model._var_allprocs_prom2abs_list
+        promoted_names = set(prom2abs['input']).union(prom2abs['output'])
+
+        for phase_name, phase in prob.model.traj._phases.items():
+            stored_phases = [solution[phase_name] for _, solution in neighbors]
+            time_units = stored_phases[0]['time_units']
+
+            for name in ('t_initial', 't_duration'):
+                path = f'traj.{phase_name}.{name}'
+                if path in promoted_names:
+                    val = sum(weight * stored[name]
+                              for weight, stored in zip(weights, stored_phases))
+                    prob.set_val(path, val, units=time_units)
+
+            for name, units in _phase_variables(phase):
+                path = _guess_path(phase_name, phase, name, promoted_names)
+                if path is None or name not in stored_phases[0]['variables']:
+                    continue
+
+                # project each stored solution onto the grid of this phase
+                val = 0.0
+                for weight, stored in zip(weights, stored_phases):
+                    ys, stored_units = stored['variables'][name]
+                    val = val + weight * phase.interp(name, ys=np.array(ys),
+                                                      xs=np.array(stored['tau']))
+
+                prob.set_val(path, val, units=stored_units)
+
+        return True
+
+    def _connect(self):
+        # several processes of a sweep may share a store
+        return sqlite3.connect(self.filename, timeout=60.0)
+
+    def _key_values(self, prob):
+        values = []
+        for name, units in self.key_inputs:
+            try:
+                val = prob.aviary_inputs.get_val(name, units=units)
+            except KeyError:
+                values.append(np.nan)
+                continue
+
+            values.append(float(np.asarray(val, dtype=float).ravel()[0]))
+
+        return values
+
+
+def _phase_variables(phase):
+    """
+    Get the (name, units) of the states and controls of a phase.
+    """
+    variables = []
+
+    for options in (phase.state_options, phase.control_options,
+                    phase.polynomial_control_options):
+        for name in sorted(options):
+            variables.append((name, options[name]['units']))
+
+    return variables
+
+
+def _structure(prob):
+    """
+    Get a string describing the phases of the trajectory of a problem, and the states
+    and controls of each phase, which stored solutions must match to be used.
+    """
+    structure = [[phase_name, [name for name, _ in _phase_variables(phase)]]
+                 for phase_name, phase in prob.model.traj._phases.items()]
+
+    return json.dumps(structure)
+
+
+def _guess_path(phase_name, phase, name, promoted_names):
+    """
+    Get the path of the input that sets the guess of a state or control, or None if it
+    can't be set (for instance, the states of analytic phases).
+    """
+    if name in phase.state_options:
+        prefixes = ('states',)
+    elif name in phase.control_options:
+        prefixes = ('controls',)
+    else:
+        prefixes = ('polynomial_controls', 'controls')
+
+    for prefix in prefixes:
+        path = f'traj.{phase_name}.{prefix}:{name}'
+        if path in promoted_names:
+            return path
+
+    return None
@@ -0,0 +1,62 @@
+from copy import deepcopy
+import unittest
+
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.default_phase_info.height_energy import phase_info
+from aviary.interface.design_of_experiments import run_doe, read_doe_cases
+from aviary.interface.solution_store import SolutionStore
+from aviary.variable_info.variables import Aircraft
+
+
+@use_tempdirs
+class DesignOfExperimentsTest(unittest.TestCase):
+    """
+    Test running a DOE in parallel and resuming it from a partial case database.
+    """
+
+    def test_run_doe(self):
+        with open('cases.csv', 'w') as file:
+            file.write('aircraft:fuselage:mass_scaler, aircraft:wing:mass_scaler\n')
+            file.write('1.0, 1.0\n1.2, 1.0\n1.0, 1.1\n')
+
+        cases = read_doe_cases('cases.csv')
+        self.assertEqual(len(cases), 3)
+
+        aircraft = 'models/test_aircraft/aircraft_for_bench_FwFm.csv'
+        outputs = [(Aircraft.Fuselage.MASS, 'lbm'), (Aircraft.Wing.MASS, 'lbm')]
+        kwargs = {'phase_info': deepcopy(phase_info), 'outputs': outputs,
+                  'run_driver': False}
+
+        # partial DOE, run in this process; cases that are not converged by the driver
+        # are not stored
+        results = run_doe(aircraft, cases[:1], solution_store='solutions.db', **kwargs)
+        self.assertEqual(len(results), 1)
+        self.assertEqual(len(SolutionStore('solutions.db')), 0)
+
+        # remaining cases are run by worker processes
+        results = run_doe(aircraft, 'cases.csv', num_procs=2, **kwargs)
+        self.assertEqual([result['case'] for result in results], [0, 1, 2])
+        self.assertTrue(all(result['success'] for result in results))
+
+        fuselage_mass = [result['outputs'].get_val(Aircraft.Fuselage.MASS, 'lbm')
+                         for result in results]
+        wing_mass = [result['outputs'].get_val(Aircraft.Wing.MASS, 'lbm')
+                     for result in results]
+        assert_near_equal(fuselage_mass[1] / fuselage_mass[0], 1.2, 1e-10)
+        assert_near_equal(wing_mass[2] / wing_mass[0], 1.1, 1e-10)
+        assert_near_equal(
+            results[2]['inputs'].get_val(Aircraft.Wing.MASS_SCALER, 'unitless'), 1.1)
+
+        # all cases are finished, so no problem needs to be built
+        results = run_doe('not_an_aircraft.csv', cases, **kwargs)
+        self.assertEqual(len(results), 3)
+
+        # a different DOE can't be resumed from this case database
+        with self.assertRaises(ValueError):
+            run_doe(aircraft, cases[::-1], **kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+import subprocess
+import sys
+import unittest
+
+
+# modules that take seconds to import, which shouldn't be imported until they're used
+heavy_modules = ['openmdao.api', 'dymos', 'scipy', 'matplotlib', 'pandas', 'bokeh',
+                 'panel']
+
+
+def _loaded_heavy_modules(statement):
+    # run in a new interpreter, so nothing has been imported yet
+    code = (
+        'import sys\n'
+        f'{statement}\n'
+        'loaded = [m for m in %r if m in sys.modules]\n'
+        'print("loaded:", *loaded)\n' % heavy_modules)
+
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+    _, *loaded = output.strip().split('\n')[-1].split()
+
+    return loaded
+
+
+class ImportTimeTest(unittest.TestCase):
+    """
+    Test that the api and the command line tools don't import everything up front.
+
+    The loaded modules are checked instead of timing the imports, which would depend on
+    the load of the machine running the tests.
+    """
+
+    def test_api_import(self):
+        loaded = _loaded_heavy_modules('import aviary.api')
+
+        self.assertEqual(loaded, [])
+
+    def test_api_attribute(self):
+        loaded = _loaded_heavy_modules(
+            'import aviary.api as av; av.Aircraft; av.AviaryValues')
+
+        self.assertNotIn('dymos', loaded)
+
+    def test_cmd_entry_points_import(self):
+        loaded = _loaded_heavy_modules('import aviary.interface.cmd_entry_points')
+
+        self.assertEqual(loaded, [])
+
+    def test_version(self):
+        loaded = _loaded_heavy_modules(
+            'import sys; sys.argv = ["aviary", "--version"]\n'
+            'from aviary.interface.cmd_entry_points import aviary_cmd; aviary_cmd()')
+
+        self.assertEqual(loaded, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
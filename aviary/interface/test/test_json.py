@@ -3,6 +3,7 @@ from pathlib import Path
 from copy import deepcopy
 
 from aviary.utils.functions import get_aviary_resource_path
+from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 import aviary.api as av
 from aviary.interface.default_phase_info.height_energy import phase_info, phase_info_parameterization
@@ -17,7 +18,9 @@ class TestJson(unittest.TestCase):
     These tests just check that the json files can be saved or loaded
     They don't check that the files were properly created or that the
     off-design mission ran correctly.
-    run_off_design_example.py in aviary/examples tests the full functionality
+    run_off_design_example.py in aviary/examples tests the full functionality.
+    test_off_design_missions checks a batch of alternate missions against
+    missions run one at a time.
     """
 
     def get_file(self, filename):
@@ -64,6 +67,56 @@ class TestJson(unittest.TestCase):
         prob_fallout = self.prob.fallout_mission(
             run_mission=False, json_filename=filepath, phase_info=local_phase_info)
 
+    def test_off_design_missions(self):
+        filepath = self.get_file('interface/test/sizing_problem_for_test.json')
+        # the first two missions share a problem
+        missions = [(36000., 2500.), (36000., 2000.), (30000., 2000.)]
+        results = self.prob.run_off_design_missions(
+            missions, problem_type=av.ProblemType.ALTERNATE, json_filename=filepath,
+            phase_info=local_phase_info)
+
+        self.assertEqual(len(results), len(missions))
+        for block_idx in range(2):
+            self.assertTrue(Path(f'alternate_{block_idx}_problem_history.db').exists())
+
+        for (payload, mission_range), result in zip(missions, results):
+            self.assertEqual(
+                result[av.Aircraft.CrewPayload.PASSENGER_PAYLOAD_MASS], payload)
+            self.assertTrue(result['success'])
+
+            prob_alternate = self.prob.alternate_mission(
+                json_filename=filepath, payload_mass=payload,
+                mission_range=mission_range, phase_info=deepcopy(local_phase_info))
+            self.assertTrue(prob_alternate.problem_ran_successfully)
+
+            for name, units in ((av.Mission.Summary.RANGE, 'NM'),
+                                (av.Mission.Summary.TOTAL_FUEL_MASS, 'lbm')):
+                assert_near_equal(
+                    result[name], prob_alternate.get_val(name, units=units)[0], 1e-4)
+
+    def test_off_design_missions_parallel(self):
+        filepath = self.get_file('interface/test/sizing_problem_for_test.json')
+        # the missions share a payload, so their problem is split between the processes
+        missions = [(36000., 2500.), (36000., 2000.)]
+        expected = self.prob.run_off_design_missions(
+            missions, problem_type=av.ProblemType.ALTERNATE, json_filename=filepath,
+            phase_info=local_phase_info)
+        results = self.prob.run_off_design_missions(
+            missions, problem_type=av.ProblemType.ALTERNATE, json_filename=filepath,
+            phase_info=local_phase_info, num_procs=2)
+
+        self.assertEqual(len(results), len(missions))
+        for block_idx in range(2):
+            self.assertTrue(Path(f'alternate_{block_idx}_problem_history.db').exists())
+
+        for result, expected_result in zip(results, expected):
+            self.assertTrue(result['success'])
+            payload_name = av.Aircraft.CrewPayload.PASSENGER_PAYLOAD_MASS
+            self.assertEqual(result[payload_name], expected_result[payload_name])
+
+            for name in (av.Mission.Summary.RANGE, av.Mission.Summary.GROSS_MASS,
+                         av.Mission.Summary.TOTAL_FUEL_MASS):
+                assert_near_equal(result[name], expected_result[name], 1e-4)
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,72 @@
+from copy import deepcopy
+import unittest
+
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.interface.default_phase_info.height_energy import phase_info
+from aviary.utils.aviary_values import AviaryValues
+from aviary.variable_info.variables import Aircraft
+
+
+@use_tempdirs
+class RebindInputsTest(unittest.TestCase):
+    """
+    Test that new input values can be bound to a problem without setting it up again.
+    """
+
+    def test_rebind_inputs(self):
+        prob = AviaryProblem()
+
+        prob.load_inputs("models/test_aircraft/aircraft_for_bench_FwFm.csv",
+                         deepcopy(phase_info))
+        prob.check_and_preprocess_inputs()
+
+        prob.add_pre_mission_systems()
+        prob.add_phases()
+        prob.add_post_mission_systems()
+
+        prob.link_phases()
+
+        prob.add_design_variables()
+        prob.add_objective(objective_type="mass", ref=-1e5)
+
+        prob.setup()
+        prob.set_initial_guesses()
+
+        fuselage_mass = []
+        for scaler in (1.0, 1.2):
+            new_inputs = AviaryValues()
+            new_inputs.set_val(Aircraft.Fuselage.MASS_SCALER, scaler)
+            prob.rebind_inputs(new_inputs)
+
+            prob.run_model()
+
+            fuselage_mass.append(
+                prob.get_val(Aircraft.Fuselage.MASS, units='lbm').copy())
+            assert_near_equal(
+                prob.aviary_inputs.get_val(Aircraft.Fuselage.MASS_SCALER), scaler)
+
+        assert_near_equal(fuselage_mass[1] / fuselage_mass[0], 1.2, 1e-10)
+
+        # options define the structure of the model, so they can't be rebound, and a
+        # rejected rebind doesn't change any of the other values
+        new_inputs = AviaryValues()
+        new_inputs.set_val(Aircraft.Fuselage.MASS_SCALER, 1.5)
+        new_inputs.set_val(Aircraft.Design.RESERVE_FUEL_ADDITIONAL, 10000.0, 'lbm')
+        with self.assertRaises(ValueError):
+            prob.rebind_inputs(new_inputs)
+
+        assert_near_equal(prob.get_val(Aircraft.Fuselage.MASS_SCALER), 1.2)
+        assert_near_equal(
+            prob.aviary_inputs.get_val(Aircraft.Fuselage.MASS_SCALER), 1.2)
+
+    def test_rebind_before_setup(self):
+        prob = AviaryProblem()
+        with self.assertRaises(RuntimeError):
+            prob.rebind_inputs(AviaryValues())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+from copy import deepcopy
+import unittest
+
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.interface.default_phase_info.height_energy import phase_info
+from aviary.interface.solution_store import SolutionStore
+from aviary.variable_info.enums import Verbosity
+from aviary.variable_info.variables import Aircraft
+
+
+def _build_problem(num_segments=None, phases=('climb', 'cruise', 'descent'),
+                   wing_area=None):
+    local_phase_info = deepcopy(phase_info)
+    for phase_name in list(local_phase_info):
+        if phase_name in ('pre_mission', 'post_mission'):
+            continue
+        if phase_name not in phases:
+            del local_phase_info[phase_name]
+        elif num_segments is not None:
+            local_phase_info[phase_name]['user_options']['num_segments'] = num_segments
+
+    prob = AviaryProblem()
+
+    prob.load_inputs("models/test_aircraft/aircraft_for_bench_FwFm.csv",
+                     local_phase_info, verbosity=Verbosity.QUIET)
+    if wing_area is not None:
+        prob.aviary_inputs.set_val(Aircraft.Wing.AREA, wing_area, 'ft**2')
+    prob.check_and_preprocess_inputs()
+
+    prob.add_pre_mission_systems()
+    prob.add_phases()
+    prob.add_post_mission_systems()
+
+    prob.link_phases()
+
+    prob.add_driver("SLSQP", max_iter=50, verbosity=Verbosity.QUIET)
+
+    prob.add_design_variables()
+    prob.add_objective(objective_type="mass", ref=-1e5)
+
+    prob.setup()
+    prob.set_initial_guesses()
+
+    return prob
+
+
+def _cruise_duration(prob):
+    time = prob.get_val('traj.cruise.timeseries.time', units='s')
+    return time[-1] - time[0]
+
+
+@use_tempdirs
+class SolutionStoreTest(unittest.TestCase):
+    """
+    Test warm starting problems from stored trajectories.
+    """
+
+    def test_warm_start(self):
+        store = SolutionStore('solutions.db')
+
+        # a single pass through the model isn't converged, so it isn't stored
+        prob = _build_problem()
+        prob.run_aviary_problem(run_driver=False, make_plots=False, solution_store=store)
+        self.assertEqual(len(store), 0)
+
+        prob.run_aviary_problem(make_plots=False, solution_store=store)
+        self.assertTrue(prob.problem_ran_successfully)
+        self.assertEqual(len(store), 1)
+
+        cruise_duration = _cruise_duration(prob)
+        cruise_mass = prob.get_val('traj.cruise.timeseries.mass', units='lbm').copy()
+        wing_area = prob.aviary_inputs.get_val(Aircraft.Wing.AREA, 'ft**2')
+
+        # a second, farther away solution
+        other_prob = _build_problem(wing_area=wing_area + 200.0)
+        other_prob.run_aviary_problem(make_plots=False, solution_store=store)
+        self.assertTrue(other_prob.problem_ran_successfully)
+        self.assertEqual(len(store), 2)
+
+        other_cruise_duration = _cruise_duration(other_prob)
+
+        # the nearest solution is projected onto a different grid
+        new_prob = _build_problem(num_segments=3)
+        new_prob.set_initial_guesses(solution_store=store)
+        new_prob.final_setup()
+
+        # the duration is an input of several components, so get it from its source
+        t_duration_source = \
+            new_prob.model.get_source('traj.phases.cruise.time.t_duration')
+        assert_near_equal(new_prob.get_val(t_duration_source, units='s'),
+                          cruise_duration, 1e-12)
+
+        cruise = new_prob.model.traj.phases.cruise
+        mass = new_prob.get_val('traj.cruise.states:mass', units='lbm')
+        grid_data = cruise.options['transcription'].grid_data
+        self.assertEqual(mass.shape[0], grid_data.subset_num_nodes['state_input'])
+        assert_near_equal(mass[[0, -1]], cruise_mass[[0, -1]], 1e-12)
+
+        # blending the two nearest solutions gives a duration between theirs (an exact
+        # match would not be blended)
+        store.num_neighbors = 2
+        new_prob.aviary_inputs.set_val(Aircraft.Wing.AREA, wing_area + 100.0, 'ft**2')
+        store.apply(new_prob)
+        t_duration = new_prob.get_val(t_duration_source, units='s')[0]
+        durations = sorted([cruise_duration[0], other_cruise_duration[0]])
+        self.assertTrue(durations[0] < t_duration < durations[1])
+
+        # a trajectory with different phases has no stored solutions
+        other_prob = _build_problem(phases=('climb', 'cruise'))
+        self.assertEqual(store.find(other_prob), [])
+        self.assertFalse(store.apply(other_prob))
+
+
+if __name__ == "__main__":
+    unittest.main()
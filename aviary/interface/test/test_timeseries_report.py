@@ -1,14 +1,19 @@
 from copy import deepcopy
 from pathlib import Path
+import io
 import unittest
 import csv
 
+import pandas as pd
+
 import openmdao.api as om
 from openmdao.core.problem import _clear_problem_names
+from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs, set_env_vars
 
 from aviary.interface.default_phase_info.height_energy import phase_info
 from aviary.interface.methods_for_level1 import run_aviary
+from aviary.interface.reports import timeseries_csv
 
 
 @use_tempdirs
@@ -56,6 +61,32 @@ class AviaryMissionTimeseries(unittest.TestCase):
                     self.assertAlmostEqual(float(expected_val), float(
                         output_val), places=7, msg="CSV row value does not match expected value within tolerance")
 
+        with self.assertRaises(ValueError) as cm:
+            timeseries_csv(self.prob, file_formats=['xlsx'])
+        self.assertIn('Unknown timeseries file format "xlsx"', str(cm.exception))
+
+    @set_env_vars(TESTFLO_RUNNING='0', OPENMDAO_REPORTS='timeseries_csv')
+    def test_timeseries_parquet(self):
+        try:
+            pd.DataFrame({'a': [1.0]}).to_parquet(io.BytesIO())
+        except ImportError:
+            raise unittest.SkipTest('pandas can not write parquet files')
+
+        local_phase_info = deepcopy(phase_info)
+        self.prob = run_aviary('models/test_aircraft/aircraft_for_bench_FwFm.csv',
+                               local_phase_info,
+                               optimizer='SLSQP',
+                               max_iter=0)
+
+        timeseries_csv(self.prob, file_formats=['csv', 'parquet'])
+
+        reports_dir = Path(self.prob.get_reports_dir())
+        expected = pd.read_csv(reports_dir / 'mission_timeseries_data.csv')
+        data = pd.read_parquet(reports_dir / 'mission_timeseries_data.parquet')
+
+        self.assertEqual(list(expected.columns), list(data.columns))
+        assert_near_equal(data.to_numpy(), expected.to_numpy(), 1e-12)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -372,7 +372,8 @@ class FlightPhaseBase(PhaseBuilderBase):
             'meta_data': self.meta_data,
             'subsystem_options': self.subsystem_options,
             'throttle_enforcement': self.user_options.get_val('throttle_enforcement'),
-            'throttle_allocation': self.user_options.get_val('throttle_allocation')
+            'throttle_allocation': self.user_options.get_val('throttle_allocation'),
+            'node_decoupled_solver': self.user_options.get_val('node_decoupled_solver'),
         }
 
 
@@ -439,6 +440,10 @@ FlightPhaseBase._add_meta_data('throttle_enforcement', val=None)
 
 FlightPhaseBase._add_meta_data('throttle_allocation', val=ThrottleAllocation.FIXED)
 
+FlightPhaseBase._add_meta_data(
+    'node_decoupled_solver', val=False,
+    desc='solve the ODE of each node independently, skipping converged nodes')
+
 FlightPhaseBase._add_meta_data('mach_bounds', val=(0., 2.), units='unitless')
 
 FlightPhaseBase._add_meta_data('altitude_bounds', val=(0., 60.e3), units='ft')
@@ -4,6 +4,10 @@ import openmdao.api as om
 from aviary.subsystems.atmosphere.atmosphere import Atmosphere
 
 from aviary.mission.flops_based.ode.mission_EOM import MissionEOM
+from aviary.mission.ode.node_decoupled_solvers import (
+    NodeDecoupledDirectSolver,
+    NodeDecoupledNewtonSolver,
+)
 from aviary.mission.gasp_based.ode.time_integration_base_classes import (
     add_SGM_required_inputs,
     add_SGM_required_outputs,
@@ -80,6 +84,13 @@ class MissionODE(om.Group):
             types=AnalysisScheme,
             desc="The analysis method that will be used to close the trajectory; for example collocation or time integration",
         )
+        self.options.declare(
+            'node_decoupled_solver',
+            default=False,
+            types=bool,
+            desc='if True, the nonlinear solver treats each node as an independent '
+            'system, only updating nodes that have not converged',
+        )
 
     def setup(self):
         options = self.options
@@ -284,12 +295,20 @@ class MissionODE(om.Group):
 
         print_level = 0 if analysis_scheme is AnalysisScheme.SHOOTING else 2
 
-        self.nonlinear_solver = om.NewtonSolver(
-            solve_subsystems=True,
-            atol=1.0e-10,
-            rtol=1.0e-10,
-        )
+        if options['node_decoupled_solver']:
+            self.nonlinear_solver = NodeDecoupledNewtonSolver(
+                solve_subsystems=True,
+                atol=1.0e-10,
+                rtol=1.0e-10,
+            )
+            self.linear_solver = NodeDecoupledDirectSolver()
+        else:
+            self.nonlinear_solver = om.NewtonSolver(
+                solve_subsystems=True,
+                atol=1.0e-10,
+                rtol=1.0e-10,
+            )
+            self.linear_solver = om.DirectSolver(assemble_jac=True)
         self.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-        self.linear_solver = om.DirectSolver(assemble_jac=True)
         self.nonlinear_solver.options['err_on_non_converge'] = True
         self.nonlinear_solver.options['iprint'] = print_level
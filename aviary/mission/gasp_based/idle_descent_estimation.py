@@ -1,7 +1,10 @@
+import numpy as np
 import openmdao.api as om
 
 from aviary.mission.gasp_based.phases.time_integration_traj import FlexibleTraj
+from aviary.mission.gasp_based.sgm_batch import simulate_sgm_batch
 from aviary.utils.functions import promote_aircraft_and_mission_vars
+from aviary.utils.named_values import NamedValues
 from aviary.variable_info.variables import Aircraft, Dynamic
 from aviary.variable_info.enums import Verbosity
 
@@ -30,68 +33,16 @@ def add_descent_estimation_as_submodel(
     if all_subsystems is None:
         all_subsystems = []
 
-    traj = FlexibleTraj(
-        Phases=phases,
-        traj_initial_state_input=[
-            Dynamic.Mission.MASS,
-            Dynamic.Mission.DISTANCE,
-            Dynamic.Mission.ALTITUDE,
-        ],
-        traj_final_state_output=[
-            Dynamic.Mission.MASS,
-            Dynamic.Mission.DISTANCE,
-            Dynamic.Mission.ALTITUDE,
-        ],
-        promote_all_auto_ivc=True,
-    )
+    traj = _build_descent_traj(phases)
 
     model = om.Group()
 
-    if isinstance(initial_mass, str):
-        model.add_subsystem(
-            'top_of_descent_mass',
-            om.ExecComp(
-                'mass_initial = top_of_descent_mass',
-                mass_initial={'units': 'lbm'},
-                top_of_descent_mass={'units': 'lbm'},
-            ),
-            promotes_inputs=['top_of_descent_mass'],
-            promotes_outputs=['mass_initial'])
-    else:
-        model.add_subsystem(
-            'top_of_descent_mass',
-            om.ExecComp(
-                'mass_initial = operating_mass + payload_mass + reserve_fuel + descent_fuel_estimate',
-                mass_initial={'units': 'lbm'},
-                operating_mass={'units': 'lbm'},
-                payload_mass={'units': 'lbm'},
-                reserve_fuel={'units': 'lbm', 'val': 0},
-                descent_fuel_estimate={'units': 'lbm', 'val': 0},
-            ),
-            promotes_inputs=[
-                ('operating_mass', Aircraft.Design.OPERATING_MASS),
-                ('payload_mass', Aircraft.CrewPayload.PASSENGER_PAYLOAD_MASS),
-                'reserve_fuel',
-                # ('reserve_fuel', Mission.Design.RESERVE_FUEL),
-                ('descent_fuel_estimate', 'descent_fuel'),
-            ],
-            promotes_outputs=['mass_initial']
-        )
-
-    all_bus_vars = set()
-    for subsystem in all_subsystems:
-        bus_vars = subsystem.get_bus_variables()
-        for var, data in bus_vars.items():
-            mission_variable_name = data['mission_name']
-            if not isinstance(mission_variable_name, list):
-                mission_variable_name = [mission_variable_name]
-            for mission_var_name in mission_variable_name:
-                all_bus_vars.add(mission_var_name)
+    _add_top_of_descent_mass(model, initial_mass)
 
     model.add_subsystem(
         'descent_traj', traj,
         promotes_inputs=['altitude_initial', 'mass_initial', 'aircraft:*'] +
-        [(var, 'parameters:'+var) for var in all_bus_vars],
+        _bus_variable_promotes(all_subsystems),
         promotes_outputs=['mass_final', 'distance_final'],
     )
 
@@ -139,25 +90,8 @@ def add_descent_estimation_as_submodel(
     model.linear_solver = om.DirectSolver(assemble_jac=True)
     model.nonlinear_solver = om.NonlinearBlockGS(iprint=3, rtol=1e-2, maxiter=5)
 
-    input_aliases = []
-    if isinstance(initial_mass, str):
-        input_aliases.append(('top_of_descent_mass', initial_mass))
-    elif isinstance(initial_mass, (int, float)):
-        model.set_input_defaults('mass_initial', initial_mass)
+    input_aliases = _set_descent_inputs(model, initial_mass, cruise_alt, reserve_fuel)
 
-    if isinstance(cruise_alt, str):
-        input_aliases.append(('altitude_initial', cruise_alt))
-    elif isinstance(cruise_alt, (int, float)):
-        model.set_input_defaults('altitude_initial', cruise_alt)
-
-    if isinstance(reserve_fuel, str):
-        input_aliases.append(('reserve_fuel', reserve_fuel))
-    elif isinstance(reserve_fuel, (int, float)):
-        model.set_input_defaults('reserve_fuel', reserve_fuel)
-
-    model.set_input_defaults(Aircraft.CrewPayload.PASSENGER_PAYLOAD_MASS, 0)
-    model.set_input_defaults(
-        Aircraft.Design.OPERATING_MASS, val=0, units='lbm')
     model.set_input_defaults('descent_traj.'+Dynamic.Mission.THROTTLE, 0)
 
     promote_aircraft_and_mission_vars(model)
@@ -185,3 +119,355 @@ def add_descent_estimation_as_submodel(
         ],
 
     )
+
+
+def tabulate_descent_estimation(
+        masses,
+        cruise_alts,
+        cruise_machs,
+        phases=None,
+        ode_args=None,
+        all_subsystems=None,
+        inputs=None,
+        sized_problem=None,
+        num_procs=1,
+):
+    """
+    Simulate the descent portion of the mission's trajectory for every combination of
+    top of descent mass, cruise altitude, and cruise Mach number, so that the fuel burn
+    and distance of the descent can be interpolated with add_descent_estimation_as_table
+    instead of simulating the descent each time the model runs. The points are simulated
+    in parallel by num_procs worker processes.
+
+    Parameters
+    ----------
+    masses : array_like
+        Top of descent masses, in lbm.
+    cruise_alts : array_like
+        Cruise altitudes, in ft.
+    cruise_machs : array_like
+        Cruise Mach numbers. They are used in every descent phase flown at a given Mach
+        number.
+    phases : dict, optional
+        Phases of the descent, defaults to the descent phases of the 2DOF forward in
+        time integration phase info.
+    ode_args : dict, optional
+        Arguments of the ODEs of the default descent phases.
+    all_subsystems : list, optional
+        Subsystems whose bus variables are parameters of the descent.
+    inputs : dict, optional
+        Values of other inputs of the descent that are the same for every point, as
+        {name: (val, units)}, such as the aircraft variables.
+    sized_problem : Problem, optional
+        Problem containing the sized aircraft, which the values of the inputs of the
+        descent that are not in inputs are taken from.
+    num_procs : int, optional
+        Number of worker processes, defaults to 1 (points are simulated in this
+        process).
+
+    Returns
+    -------
+    NamedValues
+        The mass_initial (lbm), altitude_initial (ft), and mach grids, and the
+        descent_fuel (lbm) and descent_range (NM) at each point of the grid, indexed by
+        mass, altitude, and Mach number. Points where the simulation failed are NaN.
+
+    Raises
+    ------
+    ValueError
+        If the value of an input of the descent is neither in inputs nor in
+        sized_problem.
+    """
+    if phases is None:
+        from aviary.interface.default_phase_info.two_dof_fiti import \
+            descent_phases as phases, add_default_sgm_args
+        add_default_sgm_args(phases, ode_args)
+
+    if all_subsystems is None:
+        all_subsystems = []
+
+    inputs = _get_descent_inputs(phases, all_subsystems, inputs, sized_problem)
+
+    # the user options of the phases are changed for each point, so don't change
+    # those of the phases that were passed in
+    phases = {
+        phase_name: {**info, 'user_options': dict(info['user_options'])}
+        for phase_name, info in phases.items()
+    }
+    mach_phases = [phase_name for phase_name, info in phases.items()
+                   if 'mach' in info['user_options']]
+
+    masses = np.atleast_1d(np.asarray(masses, dtype=float))
+    cruise_alts = np.atleast_1d(np.asarray(cruise_alts, dtype=float))
+    cruise_machs = np.atleast_1d(np.asarray(cruise_machs, dtype=float))
+
+    cases = []
+    for mass in masses:
+        for cruise_alt in cruise_alts:
+            for cruise_mach in cruise_machs:
+                case = {
+                    **inputs,
+                    'mass_initial': (mass, 'lbm'),
+                    'altitude_initial': (cruise_alt, 'ft'),
+                }
+                for phase_name in mach_phases:
+                    case[(phase_name, 'mach')] = (cruise_mach, 'unitless')
+                cases.append(case)
+
+    results = simulate_sgm_batch(
+        _build_descent_problem,
+        cases,
+        outputs=[('mass_final', 'lbm'), ('distance_final', 'NM')],
+        num_procs=num_procs,
+        build_args=(phases, all_subsystems),
+    )
+
+    shape = (masses.size, cruise_alts.size, cruise_machs.size)
+
+    descent_table = NamedValues()
+    descent_table.set_val('mass_initial', masses, 'lbm')
+    descent_table.set_val('altitude_initial', cruise_alts, 'ft')
+    descent_table.set_val('mach', cruise_machs, 'unitless')
+    descent_table.set_val(
+        'descent_fuel', masses[:, None, None] - results[:, 0].reshape(shape), 'lbm')
+    descent_table.set_val('descent_range', results[:, 1].reshape(shape), 'NM')
+
+    return descent_table
+
+
+def add_descent_estimation_as_table(
+        main_prob: om.Problem,
+        descent_table,
+        subsys_name='idle_descent_estimation',
+        initial_mass=None,
+        cruise_alt=None,
+        cruise_mach=None,
+        reserve_fuel=None,
+):
+    """
+    This adds the same estimation of the fuel burn and distance required for the descent
+    as add_descent_estimation_as_submodel, interpolated from a table made by
+    tabulate_descent_estimation instead of simulating the descent. If the table only
+    has a single cruise altitude or Mach number, that value is used instead of
+    cruise_alt or cruise_mach.
+    """
+    table_inputs = [
+        (name, units, descent_table.get_val(name, units)) for name, units in
+        [('mass_initial', 'lbm'), ('altitude_initial', 'ft'), ('mach', 'unitless')]
+    ]
+    descent_fuel = descent_table.get_val('descent_fuel', 'lbm')
+    descent_range = descent_table.get_val('descent_range', 'NM')
+
+    if np.any(np.isnan(descent_fuel)) or np.any(np.isnan(descent_range)):
+        raise ValueError('The descent table contains points where the simulation of '
+                         'the descent failed.')
+
+    # variables with a single value in the table can't be interpolated
+    fixed_axes = tuple(axis for axis, (_, _, grid) in enumerate(table_inputs)
+                       if len(grid) == 1)
+    if len(fixed_axes) == len(table_inputs):
+        raise ValueError('The descent table must have more than one value of at least '
+                         'one of mass, cruise altitude, or cruise Mach number.')
+
+    model = om.Group()
+
+    _add_top_of_descent_mass(model, initial_mass)
+
+    interp = om.MetaModelStructuredComp(method='slinear', extrapolate=True)
+    interp_inputs = []
+    for name, units, grid in table_inputs:
+        if len(grid) > 1:
+            interp.add_input(name, grid[0], training_data=grid, units=units)
+            interp_inputs.append(name)
+
+    interp.add_output('descent_fuel', training_data=descent_fuel.squeeze(fixed_axes),
+                      units='lbm')
+    interp.add_output('distance_final',
+                      training_data=descent_range.squeeze(fixed_axes), units='NM')
+
+    model.add_subsystem(
+        'descent_table', interp,
+        promotes_inputs=interp_inputs,
+        promotes_outputs=['descent_fuel', 'distance_final'],
+    )
+
+    # the table is cheap to evaluate, so the top of descent mass can be converged
+    model.linear_solver = om.DirectSolver()
+    model.nonlinear_solver = om.NonlinearBlockGS(iprint=0, maxiter=20)
+
+    if 'altitude_initial' not in interp_inputs:
+        cruise_alt = None
+    input_aliases = _set_descent_inputs(model, initial_mass, cruise_alt, reserve_fuel)
+
+    if 'mach' in interp_inputs:
+        if isinstance(cruise_mach, str):
+            input_aliases.append(('mach', cruise_mach))
+        elif cruise_mach is not None:
+            model.set_input_defaults('mach', cruise_mach)
+
+    main_prob.model.add_subsystem(
+        subsys_name,
+        model,
+        promotes_inputs=[
+            'aircraft:*',
+        ] + input_aliases,
+        promotes_outputs=[
+            ('distance_final', 'descent_range'),
+            'descent_fuel',
+            ('mass_initial', 'start_of_descent_mass'),
+        ],
+    )
+
+
+def _build_descent_traj(phases):
+    return FlexibleTraj(
+        Phases=phases,
+        traj_initial_state_input=[
+            Dynamic.Mission.MASS,
+            Dynamic.Mission.DISTANCE,
+            Dynamic.Mission.ALTITUDE,
+        ],
+        traj_final_state_output=[
+            Dynamic.Mission.MASS,
+            Dynamic.Mission.DISTANCE,
+            Dynamic.Mission.ALTITUDE,
+        ],
+        promote_all_auto_ivc=True,
+    )
+
+
+def _bus_variable_promotes(all_subsystems):
+    all_bus_vars = set()
+    for subsystem in all_subsystems:
+        bus_vars = subsystem.get_bus_variables()
+        for var, data in bus_vars.items():
+            mission_variable_name = data['mission_name']
+            if not isinstance(mission_variable_name, list):
+                mission_variable_name = [mission_variable_name]
+            for mission_var_name in mission_variable_name:
+                all_bus_vars.add(mission_var_name)
+
+    return [(var, 'parameters:'+var) for var in all_bus_vars]
+
+
+def _build_descent_problem(phases, all_subsystems):
+    """
+    Set up a problem that simulates the descent from a given mass and altitude.
+    """
+    model = om.Group()
+    model.add_subsystem(
+        'descent_traj', _build_descent_traj(phases),
+        promotes_inputs=['altitude_initial', 'mass_initial', 'aircraft:*'] +
+        _bus_variable_promotes(all_subsystems),
+        promotes_outputs=['mass_final', 'distance_final'],
+    )
+    model.set_input_defaults('descent_traj.'+Dynamic.Mission.THROTTLE, 0)
+
+    promote_aircraft_and_mission_vars(model)
+
+    prob = om.Problem(model=model, reports=False)
+    prob.setup()
+
+    return prob
+
+
+def _get_descent_inputs(phases, all_subsystems, inputs, sized_problem):
+    """
+    Get the values of the inputs of the descent that are the same for every point, as
+    {name: (val, units)}. These are the inputs that come from the pre-mission systems
+    when the descent is a submodel, so each of them must either be given in inputs or
+    be taken from the sized problem.
+    """
+    inputs = {} if inputs is None else dict(inputs)
+
+    prob = _build_descent_problem(phases, all_subsystems)
+    io_meta = prob.model.get_io_metadata(iotypes='input', metadata_keys=['units'],
+                                         get_remote=True)
+
+    missing = []
+    for meta in io_meta.values():
+        name = meta['prom_name']
+        # inputs of the trajectory itself, and those set for each point, have defaults
+        if '.' in name or name in ('mass_initial', 'altitude_initial') or \
+                name in inputs:
+            continue
+        if not prob.model.get_source(name).startswith('_auto_ivc'):
+            continue
+
+        if sized_problem is not None:
+            try:
+                val = sized_problem.get_val(name, units=meta['units'])
+            except KeyError:
+                pass
+            else:
+                inputs[name] = (val, meta['units'])
+                continue
+
+        missing.append(name)
+
+    if missing:
+        raise ValueError('The values of the following inputs of the descent must be '
+                         f'given in inputs, or be in the sized problem: {missing}')
+
+    return inputs
+
+
+def _add_top_of_descent_mass(model, initial_mass):
+    if isinstance(initial_mass, str):
+        model.add_subsystem(
+            'top_of_descent_mass',
+            om.ExecComp(
+                'mass_initial = top_of_descent_mass',
+                mass_initial={'units': 'lbm'},
+                top_of_descent_mass={'units': 'lbm'},
+            ),
+            promotes_inputs=['top_of_descent_mass'],
+            promotes_outputs=['mass_initial'])
+    else:
+        model.add_subsystem(
+            'top_of_descent_mass',
+            om.ExecComp(
+                'mass_initial = operating_mass + payload_mass + reserve_fuel + descent_fuel_estimate',
+                mass_initial={'units': 'lbm'},
+                operating_mass={'units': 'lbm'},
+                payload_mass={'units': 'lbm'},
+                reserve_fuel={'units': 'lbm', 'val': 0},
+                descent_fuel_estimate={'units': 'lbm', 'val': 0},
+            ),
+            promotes_inputs=[
+                ('operating_mass', Aircraft.Design.OPERATING_MASS),
+                ('payload_mass', Aircraft.CrewPayload.PASSENGER_PAYLOAD_MASS),
+                'reserve_fuel',
+                # ('reserve_fuel', Mission.Design.RESERVE_FUEL),
+                ('descent_fuel_estimate', 'descent_fuel'),
+            ],
+            promotes_outputs=['mass_initial']
+        )
+
+
+def _set_descent_inputs(model, initial_mass, cruise_alt, reserve_fuel):
+    """
+    Set the default values of the inputs of a descent estimation, returning the
+    aliases of the inputs that are connected to variables of the main problem.
+    """
+    input_aliases = []
+    if isinstance(initial_mass, str):
+        input_aliases.append(('top_of_descent_mass', initial_mass))
+    elif isinstance(initial_mass, (int, float)):
+        model.set_input_defaults('mass_initial', initial_mass)
+
+    if isinstance(cruise_alt, str):
+        input_aliases.append(('altitude_initial', cruise_alt))
+    elif isinstance(cruise_alt, (int, float)):
+        model.set_input_defaults('altitude_initial', cruise_alt)
+
+    if isinstance(reserve_fuel, str):
+        input_aliases.append(('reserve_fuel', reserve_fuel))
+    elif isinstance(reserve_fuel, (int, float)):
+        model.set_input_defaults('reserve_fuel', reserve_fuel)
+
+    model.set_input_defaults(Aircraft.CrewPayload.PASSENGER_PAYLOAD_MASS, 0)
+    model.set_input_defaults(
+        Aircraft.Design.OPERATING_MASS, val=0, units='lbm')
+
+    return input_aliases
@@ -0,0 +1,201 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from scipy.integrate import solve_ivp
+
+from aviary.mission.gasp_based.ode.time_integration_base_classes import SimuPyProblem
+from aviary.mission.gasp_based.phases.time_integration_traj import FlexibleTraj
+
+
+def _build_ode():
+    ode = om.Group()
+    ode.add_subsystem(
+        'eom',
+        om.ExecComp(
+            ['x_rate = -k * x + t_curr', 'y = 2.0 * x'],
+            x_rate={'units': 'm/s'},
+            x={'units': 'm'},
+            k={'units': '1/s', 'val': 0.5},
+            t_curr={'units': 'm/s'},
+            y={'units': 'm'},
+        ),
+        promotes=['*'],
+    )
+    return ode
+
+
+class SimuPyProblemCacheTestCase(unittest.TestCase):
+    """
+    Test that repeated evaluations of a SimuPyProblem are served from the compute
+    cache and give the same results as running the model.
+    """
+
+    def _build_problem(self, cache_size):
+        return SimuPyProblem(
+            _build_ode(),
+            states={'x': {'units': 'm', 'rate': 'x_rate', 'rate_units': 'm/s'}},
+            parameters={'k': '1/s'},
+            outputs={'y': 'm'},
+            cache_size=cache_size,
+        )
+
+    def test_cache_hits(self):
+        prob = self._build_problem(cache_size=2)
+
+        rate = prob.state_equation_function(1.0, np.array([2.0]))
+        assert_near_equal(rate, [0.0], tolerance=1e-12)
+        self.assertEqual(prob.cache_info()['misses'], 1)
+
+        # same point, served from cache
+        assert_near_equal(prob.prepare_to_integrate(1.0, np.array([2.0])), [4.0])
+        self.assertEqual(prob.cache_info()['hits'], 1)
+
+        # new points fill the cache past its limit and evict the first point
+        prob.state_equation_function(2.0, np.array([2.0]))
+        assert_near_equal(prob.state_equation_function(1.0, np.array([3.0])), [-0.5])
+        prob.state_equation_function(1.0, np.array([2.0]))
+
+        info = prob.cache_info()
+        self.assertEqual(info['hits'], 1)
+        self.assertEqual(info['misses'], 4)
+        self.assertEqual(info['currsize'], 2)
+
+        # changing a parameter changes the cache key
+        prob.set_val('k', 1.0, units='1/s')
+        assert_near_equal(prob.state_equation_function(1.0, np.array([2.0])), [-1.0])
+        self.assertEqual(prob.cache_info()['misses'], 5)
+
+        prob.clear_cache()
+        self.assertEqual(prob.cache_info()['currsize'], 0)
+
+    def test_restored_values(self):
+        cached = self._build_problem(cache_size=16)
+        uncached = self._build_problem(cache_size=0)
+
+        points = [(0.0, 1.0), (0.5, 1.5), (0.0, 1.0), (0.5, 1.5)]
+        for t, x in points:
+            for prob in (cached, uncached):
+                prob.state_equation_function(t, np.array([x]))
+            assert_near_equal(cached.state_rate, uncached.state_rate, tolerance=1e-15)
+            assert_near_equal(cached.get_val('y'), uncached.get_val('y'),
+                              tolerance=1e-15)
+            assert_near_equal(
+                cached.compute_totals('x_rate', 'x', return_format='array'),
+                uncached.compute_totals('x_rate', 'x', return_format='array'),
+                tolerance=1e-15)
+
+        self.assertEqual(cached.cache_info()['hits'], 2)
+        self.assertEqual(uncached.cache_info()['misses'], 0)
+
+
+def _build_phase(x_rate_scale, y_final):
+    ode = om.Group()
+    ode.add_subsystem(
+        'eom',
+        om.ExecComp(
+            [f'x_rate = -k * x + {x_rate_scale} * c', 'y_rate = x + 0.1 * t_curr',
+             'z = x * y'],
+            x_rate={'units': 'm/s'},
+            y_rate={'units': 'm/s'},
+            x={'units': 'm'},
+            y={'units': 'm'},
+            k={'units': '1/s', 'val': 0.5},
+            c={'units': 'm/s', 'val': 1.0},
+            t_curr={'units': 's'},
+            z={'units': 'm**2'},
+        ),
+        promotes=['*'],
+    )
+    phase = SimuPyProblem(
+        ode,
+        states={'x': {'units': 'm', 'rate': 'x_rate', 'rate_units': 'm/s'},
+                'y': {'units': 'm', 'rate': 'y_rate', 'rate_units': 'm/s'}},
+        parameters={'k': '1/s', 'c': 'm/s'},
+        outputs={'z': 'm**2'},
+    )
+    phase.add_trigger('y', y_final, units='m')
+    return phase
+
+
+def _simulate_reference(x_initial, y_initial, k, c):
+    """
+    Integrate the trajectory built by SGMTrajPartialsTestCase to a tight tolerance,
+    returning the final values of x, y, and z.
+    """
+    t = 0.
+    state = np.array([x_initial, y_initial])
+    for x_rate_scale, y_final in ((1.0, 2.0), (0.5, 5.0)):
+        def event(t, state):
+            return state[1] - y_final
+        event.terminal = True
+
+        res = solve_ivp(
+            lambda t, state: [-k * state[0] + x_rate_scale * c, state[0] + 0.1 * t],
+            (t, 1000.), state, events=event, rtol=1e-12, atol=1e-14)
+        t = res.t_events[0][0]
+        state = res.y_events[0][0]
+
+    return np.array([state[0], state[1], state[0] * state[1]])
+
+
+class SGMTrajPartialsTestCase(unittest.TestCase):
+    """
+    Test the adjoint derivatives of a trajectory with two phases against finite
+    differences of a reference integrated to a tight tolerance.
+    """
+
+    def _build_problem(self):
+        prob = om.Problem(reports=False)
+        prob.model.add_subsystem(
+            'traj',
+            FlexibleTraj(
+                Phases={
+                    'first': {'builder': lambda: _build_phase(1.0, 2.0),
+                              'user_options': {}},
+                    'second': {'builder': lambda: _build_phase(0.5, 5.0),
+                               'user_options': {}},
+                },
+                traj_final_state_output=['x', 'y'],
+                traj_promote_final_output=['z'],
+                traj_initial_state_input=['x', 'y'],
+                param_dict={'k': {'val': 0.5, 'units': '1/s'},
+                            'c': {'val': 1.0, 'units': 'm/s'}},
+            ),
+            promotes=['*'],
+        )
+        return prob
+
+    def test_partials(self):
+        of = ['x_final', 'y_final', 'z_final']
+        wrt = ['x_initial', 'y_initial', 'k', 'c']
+
+        prob = self._build_problem()
+        prob.setup()
+        prob.set_val('x_initial', 0.3, units='m')
+        prob.set_val('y_initial', 0.0, units='m')
+        prob.run_model()
+        totals = prob.compute_totals(of, wrt, return_format='array')
+
+        # finite differences of the trajectory itself are limited by the tolerance of
+        # the event location, so a tighter reference is differenced instead
+        inputs = np.array([0.3, 0.0, 0.5, 1.0])
+        step = 1e-5
+        reference = np.empty((len(of), len(wrt)))
+        for idx in range(len(wrt)):
+            delta = np.zeros(len(wrt))
+            delta[idx] = step
+            reference[:, idx] = (_simulate_reference(*(inputs + delta)) -
+                                 _simulate_reference(*(inputs - delta))) / (2 * step)
+
+        # the final value of y is fixed by the event that ends the trajectory
+        assert_near_equal(totals[1], np.zeros(len(wrt)), tolerance=1e-12)
+
+        # compared entry by entry, so an error in any single derivative fails
+        for actual, desired in zip(totals[[0, 2]].ravel(), reference[[0, 2]].ravel()):
+            assert_near_equal(actual, desired, tolerance=1e-4)
+
+
+if __name__ == "__main__":
+    unittest.main()
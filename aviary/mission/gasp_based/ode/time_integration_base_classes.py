@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import numpy as np
 from scipy import interpolate
 
@@ -96,7 +98,7 @@ class SimuPyProblem(SimulationMixin):
         verbosity=Verbosity.QUIET,
         max_allowable_time=1_000_000,
         adjoint_int_opts=DEFAULT_INTEGRATOR_OPTIONS.copy(),
-
+        cache_size=128,
     ):
         """
         states: a dictionary of the form {state_name:{'units':unit, 'rate':state_rate_name, 'rate_units':state_rate_units}}
@@ -109,6 +111,7 @@ class SimuPyProblem(SimulationMixin):
         include_state_outputs : automatically add the state to the input
         works well for auto-parsed naming, does not check for duplication before adding
         states, parameters, outputs, and controls can also be input as a list of keys for the dictionary
+        cache_size: maximum number of model evaluations kept in the compute cache, set to 0 to disable caching
         """
 
         default_om_list_args = dict(prom_name=True, val=False,
@@ -145,6 +148,22 @@ class SimuPyProblem(SimulationMixin):
 
         prob.final_setup()
 
+        # results of run_model are cached, keyed on the values of all independent
+        # variables in the model (time, states, controls, parameters and any other
+        # inputs set directly on the problem)
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._compute_cache = OrderedDict()
+        self._computed_from_cache = False
+        slices = prob.model._outputs.get_slice_dict()
+        self._independent_idxs = np.concatenate([
+            np.arange(slices[abs_name].start, slices[abs_name].stop, dtype=int)
+            for ivc in prob.model.system_iter(include_self=False, recurse=True,
+                                              typ=om.IndepVarComp)
+            for abs_name in ivc._var_abs2meta['output']
+        ] + [np.zeros(0, dtype=int)])
+
         if triggers is None:
             triggers = []
         elif not isinstance(triggers, list):
@@ -377,16 +396,63 @@ class SimuPyProblem(SimulationMixin):
             ]
         )
 
-    @property
     def compute(self):
-        # TODO: create cache -- t, x (optionally u) as hash
-        # I guess just set_val for every input and output?
-        # for compute_totals, force run_model. anywhere else that needs forced
-        # run_model?
-        return self.prob.run_model
+        """
+        Run the model at the current time, state, control, and parameter values.
+        The integrator evaluates the same point several times per step (state,
+        output, and event functions), so results are stored in a bounded LRU cache
+        and restored into the model instead of calling run_model again.
+        """
+        if not self.cache_size:
+            self.prob.run_model()
+            return
+
+        model = self.prob.model
+        key = model._outputs.asarray()[self._independent_idxs].tobytes()
+        cached = self._compute_cache.get(key)
+
+        if cached is None:
+            self.cache_misses += 1
+            self.prob.run_model()
+            self._compute_cache[key] = (
+                model._outputs.asarray().copy(), model._inputs.asarray().copy())
+            if len(self._compute_cache) > self.cache_size:
+                self._compute_cache.popitem(last=False)
+            self._computed_from_cache = False
+        else:
+            self.cache_hits += 1
+            self._compute_cache.move_to_end(key)
+            outputs, inputs = cached
+            model._outputs.set_val(outputs)
+            model._inputs.set_val(inputs)
+            self._computed_from_cache = True
+
+    def cache_info(self):
+        """
+        Return hit and miss counts and current size of the compute cache.
+        """
+        return {
+            'hits': self.cache_hits,
+            'misses': self.cache_misses,
+            'maxsize': self.cache_size,
+            'currsize': len(self._compute_cache),
+        }
+
+    def clear_cache(self):
+        """
+        Remove all entries from the compute cache and reset its counters.
+        """
+        self._compute_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     @property
     def compute_totals(self):
+        if self._computed_from_cache:
+            # model values were restored from the cache, make sure every component
+            # has actually been evaluated at this point before linearizing
+            self.prob.run_model()
+            self._computed_from_cache = False
         return self.prob.compute_totals
 
     def state_equation_function(self, t, x, u=None):
@@ -690,6 +756,9 @@ class SGMTrajBase(om.ExplicitComponent):
             sim_result = current_problem.simulate(
                 (t, self.max_allowable_time),
             )
+            if self.verbosity >= Verbosity.VERBOSE:
+                print(current_problem.phase_name, "compute cache:",
+                      current_problem.cache_info())
             if sim_result.t.shape[0] == 2:
                 print("\n"*3, "IMMEDIATE PHASE TERMINATION", current_problem, "\n"*2)
             sim_results.append(sim_result)
@@ -777,9 +846,15 @@ class SGMTrajBase(om.ExplicitComponent):
             )
 
         param_dict = self.options["param_dict"]
+        param_names = list(param_dict.keys())
+        output_names = [output_data["name"]
+                        for output_data in self.all_traj_outputs.values()]
+        num_outputs = len(output_names)
+
+        if not num_outputs:
+            return
 
         # assume the first problem has the most states?
-        costate_reses = {output: [] for output in self.all_traj_outputs}
         tf_total = self.sim_results[-1].t[-1]
 
         next_res = self.sim_results[-1]
@@ -798,33 +873,31 @@ class SGMTrajBase(om.ExplicitComponent):
         # keep directionality of forward for plant, backward for adjoint by caching
         # everything in order to ensure fewest number of ODE calls with smallest
         # step-size sum(abs(x[i]-x[i-1]), )
-        costate_ics = []
-        param_derivs = []
 
-        for output in self.all_traj_outputs:
-            output_name = self.all_traj_outputs[output]["name"]
-            costate = np.zeros(next_prob.dim_state)
-            param_deriv = np.zeros(len(param_dict))
+        # the co-states of all outputs are the columns of a single matrix, so they are
+        # integrated together as one system
+        costate = np.zeros((next_prob.dim_state, num_outputs))
+        param_deriv = np.zeros((num_outputs, len(param_dict)))
+
+        total_outputs = [
+            output for output in self.all_traj_outputs
+            if output not in self.traj_final_state_output
+        ]  # in self.traj_promote_final_output
+        if total_outputs:
+            next_prob.state_equation_function(next_res.t[-1], next_res.x[-1, :])
+            output_totals = next_prob.compute_totals(
+                total_outputs,
+                next_prob.state_names + param_names,
+                return_format='array'
+            )
 
+        for output_idx, output in enumerate(self.all_traj_outputs):
             if output in self.traj_final_state_output:
-                costate[next_prob.state_names.index(output)] = 1.
-            else:  # in self.traj_promote_final_output
-
-                next_prob.state_equation_function(next_res.t[-1], next_res.x[-1, :])
-                costate[:] = next_prob.compute_totals(
-                    output,
-                    next_prob.state_names,
-                    return_format='array'
-                ).squeeze()
-
-                param_deriv[:] = next_prob.compute_totals(
-                    output,
-                    list(param_dict.keys()),
-                    return_format='array'
-                ).squeeze()
-
-            param_derivs.append(param_deriv)
-            costate_ics.append(costate)
+                costate[next_prob.state_names.index(output), output_idx] = 1.
+            else:
+                totals = output_totals[total_outputs.index(output)]
+                costate[:, output_idx] = totals[:next_prob.dim_state]
+                param_deriv[output_idx] = totals[next_prob.dim_state:]
 
         # pre-compute data for adjoint
         for phase_idx, res, prob in zip(
@@ -842,9 +915,9 @@ class SGMTrajBase(om.ExplicitComponent):
 
             num_active_event_channels = 0
 
+            # every phase ends with an event, including the first one
             state_rate = prob.state_equation_function(res.t[-1], res.x[-1, :])
-            if (prob is not self.sim_problems[0]):
-                f_minuses.append(state_rate)
+            f_minuses.append(state_rate)
 
             for channel_idx, channel_name in enumerate(prob.event_channel_names):
 
@@ -876,6 +949,11 @@ class SGMTrajBase(om.ExplicitComponent):
                                  "time in the future?? but currently no time-based "
                                  "events are used")
 
+            state_rate_names = [val['rate'] for _, val in prob.states.items()]
+
+            # the Jacobians are evaluated at the steps accepted by the forward
+            # integration and interpolated, so the adjoint integration doesn't need to
+            # evaluate the ODE
             for idx, (t, x) in enumerate(zip(res.t[::-1], res.x[::-1, :])):
                 state_rate = prob.state_equation_function(t, x)
 
@@ -903,10 +981,6 @@ class SGMTrajBase(om.ExplicitComponent):
                                 state_idx
                             ] = plus_rate[prob.state_names.index(state_name)]
 
-                            # state_update[
-                            #    next_prob.state_names.index(state_name)
-                            # ] = x[prob.state_names.index(state_name)]
-
                             # TODO: make sure index multiplying next_pronb costate
                             # lines up -- since costate is pre-filled to next_prob's
                             # order, the continuous terms should be right
@@ -918,16 +992,12 @@ class SGMTrajBase(om.ExplicitComponent):
                                 state_idx
                             ] = res.y[-1, list(prob.outputs.keys()).index(state_name)]
 
-                            dh_j_dx = prob.compute_totals(
-                                [state_name],
-                                prob.state_names,
-                                return_format='array').squeeze()
-
-                            dh_dparam[state_idx, :] = prob.compute_totals(
+                            dh_j = prob.compute_totals(
                                 [state_name],
-                                list(param_dict.keys()),
-                                return_format='array'
-                            ).squeeze()
+                                prob.state_names + param_names,
+                                return_format='array').squeeze(axis=0)
+                            dh_j_dx = dh_j[:prob.dim_state]
+                            dh_dparam[state_idx, :] = dh_j[prob.dim_state:]
 
                             for state_name_2 in prob.state_names:
                                 # I'm actually computing dh_dx.T
@@ -949,16 +1019,14 @@ class SGMTrajBase(om.ExplicitComponent):
                     dh_dxs.append(dh_dx)
                     dh_dparams.append(dh_dparam)
 
-                state_rate_names = [val['rate'] for _, val in prob.states.items()]
-                df_dx_data[idx, :, :] = prob.compute_totals(state_rate_names,
-                                                            prob.state_names,
-                                                            return_format='array').T
+                # one linearization gives the rates with respect to both the states and
+                # the parameters
+                rate_totals = prob.compute_totals(state_rate_names,
+                                                  prob.state_names + param_names,
+                                                  return_format='array')
+                df_dx_data[idx, :, :] = rate_totals[:, :prob.dim_state].T
                 if param_dict:
-                    df_dparam_data[idx, ...] = prob.compute_totals(
-                        state_rate_names,
-                        list(param_dict.keys()),
-                        return_format='array'
-                    )
+                    df_dparam_data[idx, ...] = rate_totals[:, prob.dim_state:]
 
             k = min(3, res.t.shape[0]-1)
             skip_interp = (k == 1) and np.isclose(res.t[0], res.t[1])
@@ -1005,187 +1073,147 @@ class SGMTrajBase(om.ExplicitComponent):
                   len(f_pluses), )
 
         # main loop
-        for output, costate_ic, param_deriv in zip(self.all_traj_outputs, costate_ics,
-                                                   param_derivs):
+        costate_reses = []
+        next_prob = self.sim_problems[-1]
+
+        if self.verbosity >= Verbosity.VERBOSE:
+            print("\nstarting partials for", list(self.all_traj_outputs), costate)
+
+        dg_dt = 0.
+
+        for (
+            phase_idx,
+            res,
+            prob,
+            df_dx,
+            df_dparam,
+            dg_dx,
+            f_minus,
+            f_plus,
+            state_update,
+            dh_dx,
+            dh_dparam,
+        ) in zip(
+            range(len(self.sim_results), 0, -1),
+            self.sim_results[::-1],
+            self.sim_problems[::-1],
+            df_dxs,
+            df_dparams,
+            dg_dxs,
+            f_minuses,
+            f_pluses,
+            state_updates,
+            dh_dxs,
+            dh_dparams,
+        ):
 
-            output_name = self.all_traj_outputs[output]["name"]
-            next_prob = self.sim_problems[-1]
-            costate = costate_ic
-            lamda_dot_plus = np.zeros_like(costate)
+            t0, tf = tf_total - res.t[[-1, 0]]
 
-            # self.sim_results[-1].x[-1, next_prob.state_names.index(output)]
-            if self.verbosity >= Verbosity.VERBOSE:
-                print("\nstarting partial for %s" % output, costate)
-
-            dg_dt = 0.
-
-            for (
-                phase_idx,
-                res,
-                prob,
-                df_dx,
-                df_dparam,
-                dg_dx,
-                f_minus,
-                f_plus,
-                state_update,
-                dh_dx,
-                dh_dparam,
-            ) in zip(
-                range(len(self.sim_results), 0, -1),
-                self.sim_results[::-1],
-                self.sim_problems[::-1],
-                df_dxs,
-                df_dparams,
-                dg_dxs,
-                f_minuses,
-                f_pluses,
-                state_updates,
-                dh_dxs,
-                dh_dparams,
-            ):
-
-                t0, tf = tf_total - res.t[[-1, 0]]
-
-                # assumes only 1 of time, state, or output dependence
-                # assume no discontinuous state update, would need an API for that in
-                # compute as well --
-                # but assume some form of event has happened
-
-                # already checked that event_channel_names was well-defined in the
-                # pre-compute, so will just assign the co-state just once
-                for channel_idx, channel_name in enumerate(prob.event_channel_names):
-                    if np.argmin(np.abs(res.e[-1, :])) not in [channel_idx]:
-                        continue
+            # assumes only 1 of time, state, or output dependence
+            # assume no discontinuous state update, would need an API for that in
+            # compute as well --
+            # but assume some form of event has happened
 
-                    state_disc = res.x[-1] - state_update
-                    state_disc[np.where(np.isinf(state_update))] = 0.
-
-                    if channel_name != prob.t_name:
-                        lamda_dot = df_dx(res.t[-1]) @ costate
-                        # lamda_dot_plus = lamda_dot
-                        if self.verbosity == Verbosity.DEBUG:
-                            if np.any(state_disc):
-                                print("update is non-zero!", prob, prob.state_names,
-                                      state_disc, costate, lamda_dot)
-                                print(
-                                    "inner product becomes...",
-                                    state_disc[None,
-                                               :] @ dh_dx @ lamda_dot_plus[:, None],
-                                    state_disc[None,
-                                               :] @ dh_dx.T @ lamda_dot_plus[:, None]
-                                )
-                            print("dh_dx for", prob, prob.state_names, "\n",  dh_dx)
-                            print("costate", costate)
-                        costate_update_terms = [
-                            dh_dx.T @ costate[:, None],
-                            # costate[:, None],
-                            # TODO: should this be f_plus? probably not
-                            (dg_dx.T @ (f_plus - f_minus)
-                             [None, :] @ costate[:, None]) / (dg_dx@f_minus),
-                            # don't believe in lamda_dot terms anymore
-                            # -(dg_dx.T @ state_disc[None, :] @ dh_dx.T @ lamda_dot_plus[:, None]) / (dg_dx@f_minus),
-
-                        ]
-
-                        # TODO: is this wrong?
-                        costate[:] = np.sum(costate_update_terms, axis=0).squeeze()
-
-                    if (
-                        (event_key := (prob, channel_name, channel_idx))
-                        in self.traj_event_trigger_input
-                    ):
-                        event_trigger_name = self.traj_event_trigger_input[event_key]["name"]
-                        if self.verbosity >= Verbosity.VERBOSE:
-                            print("setting event trigger data", event_trigger_name)
-                        J[output_name, event_trigger_name] = (
-                            + costate[None, :] @ (f_minus - f_plus) /
-                            (dg_dt + dg_dx@f_minus)
-                            # +(lamda_dot_plus[None, :] @ dh_dx @ state_disc[None, :])/(dg_dt + dg_dx@f_minus)
-                        )
+            # already checked that event_channel_names was well-defined in the
+            # pre-compute, so will just assign the co-state just once
+            for channel_idx, channel_name in enumerate(prob.event_channel_names):
+                if np.argmin(np.abs(res.e[-1, :])) not in [channel_idx]:
+                    continue
 
-                    # how to account for terminal event? through costate IC.
-                    # TODO: Is this wrong?
-                    param_deriv += (costate[None, :] @ dh_dparam).squeeze()
+                if channel_name != prob.t_name:
+                    if self.verbosity == Verbosity.DEBUG:
+                        state_disc = res.x[-1] - state_update
+                        state_disc[np.where(np.isinf(state_update))] = 0.
+                        if np.any(state_disc):
+                            print("update is non-zero!", prob, prob.state_names,
+                                  state_disc, costate)
+                        print("dh_dx for", prob, prob.state_names, "\n",  dh_dx)
+                        print("costate", costate)
+
+                    # TODO: should this be f_plus? probably not
+                    costate = (
+                        dh_dx.T @ costate
+                        + (dg_dx.T @ (f_plus - f_minus)[None, :] @ costate)
+                        / (dg_dx @ f_minus)
+                    )
 
-                # build co-state systems
+                if (
+                    (event_key := (prob, channel_name, channel_idx))
+                    in self.traj_event_trigger_input
+                ):
+                    event_trigger_name = self.traj_event_trigger_input[event_key]["name"]
+                    if self.verbosity >= Verbosity.VERBOSE:
+                        print("setting event trigger data", event_trigger_name)
+                    trigger_derivs = (
+                        costate.T @ (f_minus - f_plus) / (dg_dt + dg_dx @ f_minus)
+                    )
+                    for output_name, trigger_deriv in zip(output_names, trigger_derivs):
+                        J[output_name, event_trigger_name] = trigger_deriv
+
+                # how to account for terminal event? through costate IC.
+                # TODO: Is this wrong?
+                param_deriv += costate.T @ dh_dparam
+
+            # build co-state system, the columns of the co-state matrix are flattened
+            # into a single state vector, followed by the integrals of the parameter
+            # derivatives so that they are integrated to the same tolerance
+            costate_shape = costate.shape
+            costate_size = costate.size
+            param_deriv_shape = param_deriv.shape
+
+            def co_state_rate(t, costate_and_integrals, *args):
+                costate = costate_and_integrals[:costate_size].reshape(costate_shape)
+                rate = df_dx(t) @ costate
+                if param_dict:
+                    return np.concatenate(
+                        (rate.ravel(), (costate.T @ df_dparam(t)).ravel()))
+                return rate.ravel()
 
-                def co_state_rate(t, costate, *args):
-                    return df_dx(t) @ costate
+            if self.verbosity >= Verbosity.VERBOSE:
+                print('dim_state:', prob.dim_state, "ic:", costate)
 
-                if self.verbosity >= Verbosity.VERBOSE:
-                    print('dim_state:', prob.dim_state, "ic:", costate)
+            initial_condition = costate.ravel()
+            if param_dict:
+                initial_condition = np.concatenate(
+                    (initial_condition, np.zeros(param_deriv.size)))
 
-                costate_sys = DynamicalSystem(state_equation_function=co_state_rate,
-                                              dim_state=prob.dim_state)
-                costate_sys.initial_condition = costate
+            costate_sys = DynamicalSystem(state_equation_function=co_state_rate,
+                                          dim_state=initial_condition.size)
+            costate_sys.initial_condition = initial_condition
 
-                # simulate co-state system
-                co_res = costate_sys.simulate(
-                    (t0, tf), integrator_options=self.adjoint_int_opts)
-                costate_reses[output].append(co_res)
+            # simulate co-state system
+            co_res = costate_sys.simulate(
+                (t0, tf), integrator_options=self.adjoint_int_opts)
+            costate_reses.append(co_res)
+            co_x = co_res.x[:, :costate_size].reshape((-1,) + costate_shape)
 
-                if param_dict:
-                    df_dparam_val = df_dparam(co_res.t)
-                    param_deriv_integrand_data = np.matmul(
-                        co_res.x[:, None, :],
-                        df_dparam_val
-                    ).squeeze()
-                    try:
-                        param_deriv_integrand = interpolate.make_interp_spline(
-                            co_res.t,
-                            np.atleast_1d(param_deriv_integrand_data),
-                            # k=df_dparam.k
-                            k=min(3, co_res.t.shape[0]-1)
-                        )
-                    except ValueError as e:
-                        print(
-                            "HIT VALUE ERROR!",
-                            output,
-                            prob,
-                            co_res.t.shape,
-                            co_res.x.shape,
-                            df_dparam_val.shape,
-                            df_dparam.k,
-                            "final_results:\n\n",
-                            t0, tf,
-                            co_res.t,
-                            co_res.x,
-                        )
-                        raise e
-                    param_deriv_integrand_antideriv = param_deriv_integrand.antiderivative()
+            if param_dict:
+                param_deriv += co_res.x[-1, costate_size:].reshape(param_deriv_shape)
 
-                    # TODO: is the sign wrong here?
-                    param_deriv -= (
-                        param_deriv_integrand_antideriv(t0)
-                        - param_deriv_integrand_antideriv(tf)
-                    )
+            # consume initial condition
+            if prob is not self.sim_problems[0]:
+                next_prob = self.sim_problems[self.sim_problems.index(prob)-1]
+            else:
+                break
+            costate = np.zeros((next_prob.dim_state, num_outputs))
 
-                # consume initial condition
-                if prob is not self.sim_problems[0]:
-                    next_prob = self.sim_problems[self.sim_problems.index(prob)-1]
-                else:
-                    break
-                costate = np.zeros(next_prob.dim_state)
-                lamda_dot_plus = np.zeros_like(costate)
-                lamda_dot_plus_rate = co_state_rate(co_res.t[-1], co_res.x[-1])
-
-                # TODO: do co-states need unit changes? probably not...
-                for state_name in prob.state_names:
-                    costate[next_prob.state_names.index(
-                        state_name)] = co_res.x[-1, prob.state_names.index(state_name)]
-                    lamda_dot_plus[
-                        next_prob.state_names.index(state_name)
-                    ] = lamda_dot_plus_rate[prob.state_names.index(state_name)]
-
-            for state_to_deriv, metadata in self.traj_initial_state_input.items():
-                param_name = metadata["name"]
-                J[output_name, param_name] = costate_reses[output][-1].x[
-                    -1,
-                    prob.state_names.index(state_to_deriv)
-                ]
-            for param_deriv_val, param_deriv_name in zip(param_deriv, param_dict):
-                J[output_name, param_deriv_name] = param_deriv_val
+            # TODO: do co-states need unit changes? probably not...
+            for state_name in prob.state_names:
+                costate[next_prob.state_names.index(
+                    state_name)] = co_x[-1, prob.state_names.index(state_name)]
+
+        for state_to_deriv, metadata in self.traj_initial_state_input.items():
+            param_name = metadata["name"]
+            initial_state_derivs = co_x[-1, prob.state_names.index(state_to_deriv)]
+            for output_name, deriv in zip(output_names, initial_state_derivs):
+                J[output_name, param_name] = deriv
+
+        for output_name, output_param_derivs in zip(output_names, param_deriv):
+            for param_deriv_val, param_name in zip(output_param_derivs, param_dict):
+                J[output_name, param_name] = param_deriv_val
+
+        # co-state results of each phase, last phase first, with the integrals of the
+        # parameter derivatives after the co-states
         self.costate_reses = costate_reses
 
 
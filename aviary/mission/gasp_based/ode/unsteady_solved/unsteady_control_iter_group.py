@@ -7,6 +7,8 @@ from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.variables import Dynamic
 
 from aviary.mission.gasp_based.ode.unsteady_solved.unsteady_solved_eom import UnsteadySolvedEOM
+from aviary.mission.ode.node_decoupled_solvers import NodeDecoupledDirectSolver, \
+    NodeDecoupledNewtonSolver
 
 
 class UnsteadyControlIterGroup(om.Group):
@@ -37,6 +39,12 @@ class UnsteadyControlIterGroup(om.Group):
             desc='dictionary of parameters to be passed to the subsystem builders'
         )
 
+        self.options.declare(
+            'node_decoupled_solver', types=bool, default=False,
+            desc='If True, the nonlinear solver treats each node as an independent '
+                 'system, only updating nodes that have not converged.'
+        )
+
     def setup(self):
         nn = self.options["num_nodes"]
         ground_roll = self.options["ground_roll"]
@@ -88,11 +96,17 @@ class UnsteadyControlIterGroup(om.Group):
                            promotes_inputs=["*"],
                            promotes_outputs=["*"])
 
-        self.nonlinear_solver = om.NewtonSolver(solve_subsystems=True,
-                                                atol=1.0e-10,
-                                                rtol=1.0e-10)
+        if self.options['node_decoupled_solver']:
+            self.nonlinear_solver = NodeDecoupledNewtonSolver(solve_subsystems=True,
+                                                              atol=1.0e-10,
+                                                              rtol=1.0e-10)
+            self.linear_solver = NodeDecoupledDirectSolver()
+        else:
+            self.nonlinear_solver = om.NewtonSolver(solve_subsystems=True,
+                                                    atol=1.0e-10,
+                                                    rtol=1.0e-10)
+            self.linear_solver = om.DirectSolver(assemble_jac=True)
         # self.nonlinear_solver.linesearch = om.ArmijoGoldsteinLS()
-        self.linear_solver = om.DirectSolver(assemble_jac=True)
 
         # Set common default values for promoted inputs
         onn = np.ones(nn)
@@ -9,6 +9,8 @@ from aviary.mission.gasp_based.ode.unsteady_solved.gamma_comp import GammaComp
 from aviary.mission.gasp_based.ode.unsteady_solved.unsteady_solved_flight_conditions import \
     UnsteadySolvedFlightConditions
 from aviary.mission.gasp_based.ode.unsteady_solved.unsteady_solved_eom import UnsteadySolvedEOM
+from aviary.mission.ode.node_decoupled_solvers import NodeDecoupledDirectSolver, \
+    NodeDecoupledNewtonSolver
 from aviary.variable_info.enums import SpeedType, LegacyCode
 from aviary.variable_info.variables import Dynamic
 from aviary.subsystems.aerodynamics.aerodynamics_builder import AerodynamicsBuilderBase
@@ -70,6 +72,13 @@ class UnsteadySolvedODE(BaseODE):
             desc='flag to enforce throttle constraints on the path or at the segment '
             'boundaries or using solver bounds',
         )
+        self.options.declare(
+            'node_decoupled_solver',
+            types=bool,
+            default=False,
+            desc='If True, the nonlinear solvers treat each node as an independent '
+            'system, only updating nodes that have not converged.',
+        )
         self.options.declare(
             'external_subsystems', default=[],
             desc='list of external subsystem builder instances to be added to the ODE')
@@ -86,6 +95,13 @@ class UnsteadySolvedODE(BaseODE):
         core_subsystems = self.options['core_subsystems']
         throttle_enforcement = self.options['throttle_enforcement']
 
+        if self.options['node_decoupled_solver']:
+            newton_solver = NodeDecoupledNewtonSolver
+            direct_solver = NodeDecoupledDirectSolver
+        else:
+            newton_solver = om.NewtonSolver
+            direct_solver = om.DirectSolver
+
         if self.options["include_param_comp"]:
             # TODO: paramport
             self.add_subsystem("params", ParamPort(), promotes=["*"])
@@ -148,12 +164,12 @@ class UnsteadySolvedODE(BaseODE):
                                              promotes_inputs=["*"],
                                              promotes_outputs=["*"])
 
-        throttle_balance_group.nonlinear_solver = om.NewtonSolver(solve_subsystems=True,
-                                                                  atol=1.0e-10,
-                                                                  rtol=1.0e-10,
-                                                                  )
+        throttle_balance_group.nonlinear_solver = newton_solver(solve_subsystems=True,
+                                                                atol=1.0e-10,
+                                                                rtol=1.0e-10,
+                                                                )
         throttle_balance_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-        throttle_balance_group.linear_solver = om.DirectSolver(assemble_jac=True)
+        throttle_balance_group.linear_solver = direct_solver(assemble_jac=True)
         throttle_balance_group.nonlinear_solver.options['err_on_non_converge'] = True
 
         kwargs = {
@@ -226,11 +242,11 @@ class UnsteadySolvedODE(BaseODE):
                                          promotes_inputs=["*"],
                                          promotes_outputs=["*"])
 
-        control_iter_group.nonlinear_solver = om.NewtonSolver(solve_subsystems=True,
-                                                              atol=1.0e-10,
-                                                              rtol=1.0e-10)
+        control_iter_group.nonlinear_solver = newton_solver(solve_subsystems=True,
+                                                            atol=1.0e-10,
+                                                            rtol=1.0e-10)
         # control_iter_group.nonlinear_solver.linesearch = om.BoundsEnforceLS()
-        control_iter_group.linear_solver = om.DirectSolver(assemble_jac=True)
+        control_iter_group.linear_solver = direct_solver(assemble_jac=True)
 
         self.add_subsystem("mass_rate",
                            om.ExecComp("dmass_dr = fuelflow * dt_dr",
@@ -0,0 +1,90 @@
+import unittest
+import warnings
+from copy import deepcopy
+from unittest import mock
+
+from openmdao.utils.assert_utils import assert_near_equal
+
+from aviary.interface.default_phase_info.two_dof_fiti import add_default_sgm_args, \
+    takeoff_phases
+from aviary.interface.methods_for_level2 import AviaryProblem
+from aviary.mission.gasp_based.ode.params import ParamPort
+from aviary.mission.gasp_based.phases.time_integration_phases import SGMAscentCombined
+from aviary.mission.gasp_based.phases.time_integration_traj import FlexibleTraj
+from aviary.variable_info.enums import AnalysisScheme
+from aviary.variable_info.variables import Aircraft, Dynamic, Mission, Settings
+
+
+class SGMAscentCombinedTestCase(unittest.TestCase):
+    """
+    Test that the persistent alpha cache of the combined ascent does not change the
+    simulated trajectory.
+    """
+
+    def _run(self, alpha_cache_size):
+        phase_info = deepcopy(takeoff_phases)
+        phase_info['ascent']['kwargs'] = {'alpha_cache_size': alpha_cache_size}
+
+        prob = AviaryProblem(AnalysisScheme.SHOOTING)
+        prob.load_inputs('models/test_aircraft/aircraft_for_bench_GwGm.csv', phase_info)
+        prob.aviary_inputs.set_val(Settings.VERBOSITY, 0)
+        prob.check_and_preprocess_inputs()
+
+        add_default_sgm_args(phase_info, prob.ode_args)
+        traj = FlexibleTraj(
+            Phases=phase_info,
+            traj_final_state_output=[Dynamic.Mission.MASS, Dynamic.Mission.DISTANCE],
+            traj_initial_state_input=[Dynamic.Mission.MASS, Dynamic.Mission.DISTANCE],
+            traj_event_trigger_input=[('groundroll', Dynamic.Mission.VELOCITY, 0,)],
+        )
+        prob.model.add_subsystem(
+            'traj', traj, promotes_inputs=list(ParamPort.param_data) +
+            [Aircraft.Design.MAX_FUSELAGE_PITCH_ANGLE])
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            prob.setup()
+
+        gross_mass = prob.aviary_inputs.get_val(Mission.Design.GROSS_MASS, 'lbm')
+        prob.set_val('traj.SGMGroundroll_velocity_trigger', 143.0, units='kn')
+
+        # the second integration starts near the first one, where the cache is used
+        results = []
+        with mock.patch.object(SGMAscentCombined, 'compute_alpha', autospec=True,
+                               side_effect=SGMAscentCombined.compute_alpha) as compute:
+            for mass in (gross_mass, gross_mass - 10.0):
+                prob.set_val('traj.mass_initial', mass, units='lbm')
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore')
+                    prob.run_model()
+                results.append([prob.get_val('traj.mass_final', units='lbm')[0],
+                                prob.get_val('traj.distance_final', units='ft')[0]])
+
+        ascent = next(ode for ode in traj.ODEs if ode.phase_name == 'ascent')
+        seeds = [call.args[4] for call in compute.call_args_list]
+
+        return results, ascent.alpha_cache_info(), seeds
+
+    def test_alpha_cache_disabled(self):
+        results, info, seeds = self._run(alpha_cache_size=0)
+        self.assertEqual(info['currsize'], 0)
+        self.assertEqual(info['hits'], 0)
+        self.assertEqual(info['misses'], 0)
+        self.assertGreater(sum(info['branches'].values()), 0)
+
+        # without the cache, the alpha balances are never seeded
+        self.assertGreater(len(seeds), 0)
+        self.assertTrue(all(seed is None for seed in seeds))
+
+    def test_alpha_cache(self):
+        expected, *_ = self._run(alpha_cache_size=0)
+
+        results, info, seeds = self._run(alpha_cache_size=512)
+        self.assertGreater(info['hits'], 0)
+        self.assertTrue(any(seed is not None for seed in seeds))
+
+        assert_near_equal(results, expected, tolerance=1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
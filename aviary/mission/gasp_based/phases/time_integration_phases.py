@@ -1,3 +1,5 @@
+from collections import Counter, OrderedDict
+
 import numpy as np
 
 from aviary.mission.gasp_based.ode.accel_ode import AccelODE
@@ -180,6 +182,16 @@ class SGMAscentCombined(SGMAscent):
     '''
     This combines the different methods of limiting angle of attack to ensure that
     none of the constraints are violated.
+
+    If alpha_cache_size is nonzero (it is off by default), the ODE that satisfied the
+    constraints and the alpha it found are remembered in a bounded cache that persists
+    across integrations, keyed on time and state rounded to alpha_cache_digits
+    significant digits. When a nearby point is evaluated again (for example by the next
+    integration of an optimization), the constraint checks start from the remembered
+    ODE and the alpha balance is seeded with the remembered alpha. Otherwise the alpha
+    balances start from the alpha state.
+    Results are always computed and checked at the exact time and state, the cache only
+    provides a starting point.
     '''
 
     def __init__(
@@ -188,8 +200,17 @@ class SGMAscentCombined(SGMAscent):
         fuselage_pitch_max=(0, 'deg'),
         ode_args={},
         simupy_args={},
+        alpha_cache_size=0,
+        alpha_cache_digits=4,
     ):
         self.ode_args = ode_args
+        self.alpha_cache_size = alpha_cache_size
+        self.alpha_cache_digits = alpha_cache_digits
+        self._alpha_hints = OrderedDict()
+        self.alpha_hint_hits = 0
+        self.alpha_hint_misses = 0
+        self.alpha_switches = 0
+        self.alpha_branch_counts = Counter()
         super().__init__(phase_name=phase_name, alpha_mode=AlphaModes.DEFAULT,
                          ode_args=ode_args, simupy_args=simupy_args)
 
@@ -228,12 +249,15 @@ class SGMAscentCombined(SGMAscent):
             fuselage_pitch: "fuselage pitch",
             decel: "decel"
         }
+        # ODEs that solve for alpha with a balance, which benefit from a good seed
+        self.seeded_odes = (load_factor, decel)
 
     def prepare_to_integrate(self, t0, x0):
         self.output_nan = False
         self.alpha_cache = {}
         self.prob_cache = {}
         self.last_prob = self.rotation
+        self.last_alpha = None
         for ode in self.odes[:]:
             ode.prepare_to_integrate(t0, x0)
         return self.output_equation_function(t0, x0)
@@ -243,8 +267,57 @@ class SGMAscentCombined(SGMAscent):
         for ode in self.odes:
             ode.set_val(*args, **kwargs)
 
-    def compute_alpha(self, ode, t, x):
-        return ode.output_equation_function(t, x)[list(ode.outputs.keys()).index("alpha")]
+    def cache_info(self):
+        info = super().cache_info()
+        for ode in self.odes:
+            for key, val in ode.cache_info().items():
+                info[key] += val
+        return info
+
+    def alpha_cache_info(self):
+        """
+        Return hit and miss counts and current size of the persistent alpha cache,
+        the number of constraint switches, and how often each ODE satisfied the
+        constraints.
+        """
+        return {
+            'hits': self.alpha_hint_hits,
+            'misses': self.alpha_hint_misses,
+            'maxsize': self.alpha_cache_size,
+            'currsize': len(self._alpha_hints),
+            'switches': self.alpha_switches,
+            'branches': dict(self.alpha_branch_counts),
+        }
+
+    def clear_cache(self):
+        """
+        Remove all entries from the compute caches and the persistent alpha cache, and
+        reset their counters.
+        """
+        super().clear_cache()
+        for ode in self.odes:
+            ode.clear_cache()
+        self._alpha_hints.clear()
+        self.alpha_hint_hits = 0
+        self.alpha_hint_misses = 0
+        self.alpha_switches = 0
+        self.alpha_branch_counts.clear()
+
+    def compute_alpha(self, ode, t, x, seed=None):
+        if seed is not None and np.isfinite(seed) and ode in self.seeded_odes:
+            # start the alpha balance from the seed instead of the alpha state
+            ode.time = t
+            ode.state = x
+            ode.set_val("alpha", seed)
+            ode.compute()
+            outputs = ode.output
+        else:
+            outputs = ode.output_equation_function(t, x)
+        return outputs[list(ode.outputs.keys()).index("alpha")]
+
+    def _alpha_hint_key(self, t, x):
+        digits = self.alpha_cache_digits
+        return tuple(float(f'{val:.{digits}g}') for val in (t, *x))
 
     def get_alpha(self, t, x):
         a_key = (t,) + tuple(x)
@@ -260,10 +333,27 @@ class SGMAscentCombined(SGMAscent):
             # (not implemented in gaspy)
             # then check decel, line search -alpha until satisfied
             (ode0, rotation, load_factor, fuselage_pitch, decel,) = self.odes
-            ode = self.last_prob
+            hint_key = None
+            if self.alpha_cache_size:
+                hint_key = self._alpha_hint_key(t, x)
+            hint = self._alpha_hints.get(hint_key)
+            if hint is None:
+                ode = self.last_prob
+                seed = None
+                if hint_key is not None:
+                    self.alpha_hint_misses += 1
+                    seed = self.last_alpha
+            else:
+                self.alpha_hint_hits += 1
+                self._alpha_hints.move_to_end(hint_key)
+                ode, seed = hint
             SATISFIED_CONSTRAINTS = False
             for count in range(4):
-                alpha = self.compute_alpha(ode, t, x)
+                if count:
+                    self.alpha_switches += 1
+                alpha = self.compute_alpha(ode, t, x, seed)
+                if hint_key is not None:
+                    seed = alpha
                 load_factor_val = ode.get_val("load_factor")
                 fuselage_pitch_val = ode.get_val("fuselage_pitch", units="deg")
                 velocity_rate_val = ode.get_val("velocity_rate")
@@ -301,6 +391,12 @@ class SGMAscentCombined(SGMAscent):
                 self.alpha_cache[a_key] = alpha
                 self.prob_cache[a_key] = ode
                 self.last_prob = ode
+                self.last_alpha = alpha
+                self.alpha_branch_counts[self.ode_name[ode]] += 1
+                if hint_key is not None:
+                    self._alpha_hints[hint_key] = (ode, alpha)
+                    if len(self._alpha_hints) > self.alpha_cache_size:
+                        self._alpha_hints.popitem(last=False)
             else:
                 print("time :", t)
                 print("ode :", self.ode_name[ode])
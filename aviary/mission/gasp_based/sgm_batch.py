@@ -0,0 +1,128 @@
+"""
+Simulate many cases of the same shooting (SGM) trajectory in parallel.
+
+The phases of an SGM trajectory are integrated one after the other, but separate
+simulations of a trajectory (from different initial conditions, or with different
+parameters) are independent of each other. Cases are run by a pool of worker processes,
+each of which builds the problem containing the trajectory once and reuses it for every
+case it runs.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import os
+from pathlib import Path
+
+import numpy as np
+import openmdao.api as om
+
+from aviary.mission.gasp_based.phases.time_integration_traj import FlexibleTraj
+
+
+# set up problem held by each worker process, and the user options of the phases of
+# its trajectories before any case was run
+_problem = None
+_user_options = None
+
+
+def simulate_sgm_batch(build_problem, cases, outputs, num_procs=1, build_args=(),
+                       work_dir='sgm_batch_workers'):
+    """
+    Simulate every case of an SGM trajectory, returning the requested outputs.
+
+    Parameters
+    ----------
+    build_problem : callable
+        Function that returns a set up Problem containing the trajectory. It is called
+        once by each worker process, with build_args as its arguments.
+    cases : list of dict
+        Values of each case, as {name: (val, units)}. A name is either the promoted
+        name of an input of the problem, or a tuple (phase_name, option_name) of a user
+        option of a phase, which is set in the Phases option of every FlexibleTraj in
+        the model.
+    outputs : list of tuple
+        (name, units) of each scalar output to return.
+    num_procs : int, optional
+        Number of worker processes, defaults to 1 (cases are run in this process).
+    build_args : tuple, optional
+        Arguments passed to build_problem.
+    work_dir : str or Path, optional
+        Directory that worker processes run in, each in its own subdirectory, so that
+        the reports and other files written by their problems don't collide. Files
+        read by build_problem can't be given relative to the current directory. Not
+        used if num_procs is 1.
+
+    Returns
+    -------
+    ndarray
+        Value of each output (columns) for each case (rows). Outputs of cases whose
+        simulation failed with an AnalysisError are NaN.
+    """
+    if num_procs <= 1:
+        _init_worker(build_problem, build_args)
+        results = [_run_case(case, outputs) for case in cases]
+
+    else:
+        work_dir = Path(work_dir).resolve()
+
+        with ProcessPoolExecutor(min(num_procs, len(cases)),
+                                 initializer=_init_worker,
+                                 initargs=(build_problem, build_args,
+                                           work_dir)) as executor:
+            results = list(executor.map(_run_case, cases, [outputs] * len(cases)))
+
+    return np.array(results, dtype=float).reshape((len(cases), len(outputs)))
+
+
+def _init_worker(build_problem, build_args, work_dir=None):
+    """
+    Set up the problem that all cases run by this process are bound to.
+    """
+    global _problem, _user_options
+
+    if work_dir is not None:
+        work_dir = Path(work_dir, f'worker_{os.getpid()}')
+        work_dir.mkdir(parents=True, exist_ok=True)
+        os.chdir(work_dir)
+
+    _problem = build_problem(*build_args)
+
+    _user_options = [
+        (phases, {phase_name: dict(info['user_options'])
+                  for phase_name, info in phases.items() if 'user_options' in info})
+        for phases in _trajectory_phases(_problem)
+    ]
+
+
+def _run_case(case, outputs):
+    """
+    Run a single case on the problem of this process.
+    """
+    prob = _problem
+
+    # options not set by this case keep their original values, whichever cases this
+    # process ran before
+    for phases, user_options in _user_options:
+        for phase_name, options in user_options.items():
+            phases[phase_name]['user_options'] = dict(options)
+
+    for name, (val, units) in case.items():
+        if isinstance(name, tuple):
+            phase_name, option_name = name
+            for phases in _trajectory_phases(prob):
+                phases[phase_name]['user_options'][option_name] = (val, units)
+        else:
+            prob.set_val(name, val, units=units)
+
+    try:
+        prob.run_model()
+    except om.AnalysisError:
+        return [np.nan] * len(outputs)
+
+    return [prob.get_val(name, units=units).item() for name, units in outputs]
+
+
+def _trajectory_phases(prob):
+    """
+    Get the Phases option of every FlexibleTraj in a problem.
+    """
+    return [traj.options['Phases'] for traj in
+            prob.model.system_iter(include_self=True, recurse=True, typ=FlexibleTraj)]
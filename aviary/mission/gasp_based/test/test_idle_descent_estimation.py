@@ -2,13 +2,18 @@ import unittest
 import warnings
 import importlib
 
+import numpy as np
 import openmdao.api as om
 from openmdao.utils.assert_utils import assert_near_equal, assert_check_partials
+from openmdao.utils.testing_utils import use_tempdirs
 
 from aviary.interface.default_phase_info.two_dof_fiti import descent_phases, add_default_sgm_args
 
-from aviary.mission.gasp_based.idle_descent_estimation import add_descent_estimation_as_submodel
-from aviary.mission.gasp_based.ode.params import set_params_for_unit_tests
+from aviary.mission.gasp_based.idle_descent_estimation import \
+    add_descent_estimation_as_submodel, add_descent_estimation_as_table, \
+    tabulate_descent_estimation
+from aviary.mission.gasp_based.ode.params import ParamPort, \
+    params_for_unit_tests, set_params_for_unit_tests
 from aviary.subsystems.propulsion.utils import build_engine_deck
 from aviary.variable_info.variables import Aircraft, Dynamic, Settings
 from aviary.utils.process_input_decks import create_vehicle
@@ -16,10 +21,9 @@ from aviary.utils.preprocessors import preprocess_propulsion
 from aviary.utils.test_utils.default_subsystems import get_default_mission_subsystems
 
 
-@unittest.skipUnless(importlib.util.find_spec("pyoptsparse") is not None, "pyoptsparse is not installed")
-class IdleDescentTestCase(unittest.TestCase):
+class IdleDescentTestBase(unittest.TestCase):
     """
-    Test idle descent for 2DOF mission
+    Set up the descent phases of a 2DOF mission
     """
 
     def setUp(self):
@@ -45,6 +49,35 @@ class IdleDescentTestCase(unittest.TestCase):
         add_default_sgm_args(descent_phases, self.ode_args)
         self.phases = descent_phases
 
+
+def _build_sized_problem():
+    """
+    Build a problem with the values of the aircraft inputs of the descent.
+    """
+    prob = om.Problem(reports=False)
+
+    # other SGM ODEs can add entries to the shared ParamPort data
+    param_data = {**ParamPort.param_data, **params_for_unit_tests}
+
+    ivc = om.IndepVarComp()
+    for name, data in param_data.items():
+        ivc.add_output(name, data.get('val', 1), units=data.get('units'))
+    ivc.add_output(
+        "parameters:interference_independent_of_shielded_area", 1.89927266)
+    ivc.add_output("parameters:drag_loss_due_to_shielded_wing_area", 68.02065834)
+    prob.model.add_subsystem('IVC', ivc, promotes=['*'])
+
+    prob.setup()
+
+    return prob
+
+
+@unittest.skipUnless(importlib.util.find_spec("pyoptsparse") is not None, "pyoptsparse is not installed")
+class IdleDescentTestCase(IdleDescentTestBase):
+    """
+    Test idle descent for 2DOF mission
+    """
+
     def test_subproblem(self):
         prob = om.Problem()
         prob.model = om.Group()
@@ -84,5 +117,74 @@ class IdleDescentTestCase(unittest.TestCase):
         # assert_check_partials(partial_data, atol=0.0005, rtol=1e-9)
 
 
+@use_tempdirs
+class DescentTableTestCase(IdleDescentTestBase):
+    """
+    Test tabulating idle descent for 2DOF mission
+    """
+
+    def test_table(self):
+        masses = [130000, 140000]
+        kwargs = dict(
+            cruise_alts=35000,
+            cruise_machs=0.8,
+            phases=self.phases,
+            ode_args=self.ode_args,
+            all_subsystems=self.ode_args['core_subsystems'],
+        )
+
+        # the aircraft inputs are required
+        with self.assertRaises(ValueError):
+            tabulate_descent_estimation(masses, **kwargs)
+
+        # values that aren't in the sized problem are given as inputs
+        inputs = {
+            Aircraft.Wing.INCIDENCE: (0.0, 'deg'),
+            Aircraft.Wing.FLAP_DEFLECTION_TAKEOFF: (10.0, 'deg'),
+            Aircraft.Wing.FLAP_DEFLECTION_LANDING: (40.0, 'deg'),
+            Aircraft.Wing.FORM_FACTOR: (1.25, 'unitless'),
+            Aircraft.VerticalTail.FORM_FACTOR: (1.25, 'unitless'),
+            Aircraft.HorizontalTail.FORM_FACTOR: (1.25, 'unitless'),
+            Aircraft.Strut.FUSELAGE_INTERFERENCE_FACTOR: (0.0, 'unitless'),
+            Aircraft.Engine.SCALE_FACTOR: (1.0, 'unitless'),
+        }
+
+        warnings.filterwarnings('ignore', category=UserWarning)
+        descent_table = tabulate_descent_estimation(
+            masses, inputs=inputs, sized_problem=_build_sized_problem(), num_procs=2,
+            **kwargs)
+        warnings.filterwarnings('default', category=UserWarning)
+
+        descent_fuel = descent_table.get_val('descent_fuel', 'lbm')
+        self.assertEqual(descent_fuel.shape, (2, 1, 1))
+        assert_near_equal(descent_table.get_val('descent_range', 'NM').ravel(),
+                          [95.45829016, 98.95674678], self.tol)
+        assert_near_equal(descent_fuel.ravel(), [244.60253346, 252.06641891], self.tol)
+
+        prob = om.Problem()
+        prob.model = om.Group()
+
+        ivc = om.IndepVarComp()
+        ivc.add_output(Aircraft.Design.OPERATING_MASS, 97500, units='lbm')
+        ivc.add_output(Aircraft.CrewPayload.PASSENGER_PAYLOAD_MASS, 36000, units='lbm')
+        prob.model.add_subsystem('IVC', ivc, promotes=['*'])
+
+        add_descent_estimation_as_table(
+            prob,
+            descent_table,
+            cruise_alt=35000,
+            reserve_fuel=4500,
+        )
+
+        prob.setup()
+        prob.run_model()
+
+        # the top of descent mass includes the fuel interpolated at that mass
+        mass = prob.get_val('start_of_descent_mass', 'lbm')
+        fuel = prob.get_val('descent_fuel', 'lbm')
+        assert_near_equal(mass, 97500 + 36000 + 4500 + fuel, 1e-10)
+        assert_near_equal(fuel, np.interp(mass, masses, descent_fuel.ravel()), 1e-10)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.mission.gasp_based.ode.time_integration_base_classes import SimuPyProblem
+from aviary.mission.gasp_based.phases.time_integration_traj import FlexibleTraj
+from aviary.mission.gasp_based.sgm_batch import simulate_sgm_batch
+
+
+def _build_phase():
+    ode = om.Group()
+    ode.add_subsystem(
+        'eom',
+        om.ExecComp(
+            ['x_rate = -k * x + c', 'y_rate = x + 0.1 * y'],
+            x_rate={'units': 'm/s'},
+            y_rate={'units': 'm/s'},
+            x={'units': 'm'},
+            y={'units': 'm'},
+            k={'units': '1/s', 'val': 0.5},
+            c={'units': 'm/s', 'val': 1.0},
+        ),
+        promotes=['*'],
+    )
+    phase = SimuPyProblem(
+        ode,
+        states={'x': {'units': 'm', 'rate': 'x_rate', 'rate_units': 'm/s'},
+                'y': {'units': 'm', 'rate': 'y_rate', 'rate_units': 'm/s'}},
+        parameters={'k': '1/s', 'c': 'm/s'},
+        time_independent=True,
+    )
+    phase.add_trigger('y', 2.0, units='m')
+    return phase
+
+
+def _build_problem(k):
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem(
+        'traj',
+        FlexibleTraj(
+            Phases={'phase': {'builder': _build_phase,
+                              'user_options': {'k': (k, '1/s')}}},
+            traj_final_state_output=['x'],
+            traj_initial_state_input=['x', 'y'],
+            param_dict={'c': {'val': 1.0, 'units': 'm/s'}},
+        ),
+        promotes=['*'],
+    )
+    prob.setup()
+    return prob
+
+
+@use_tempdirs
+class SimulateSGMBatchTestCase(unittest.TestCase):
+    """
+    Test that a batch of simulations of a trajectory gives the same results as running
+    each case on its own problem.
+    """
+
+    def test_batch(self):
+        cases = [
+            {'x_initial': (x_initial, 'm'), 'c': (c, 'm/s'),
+             ('phase', 'k'): (k, '1/s')}
+            for x_initial, c, k in [(0.5, 1.0, 0.5), (0.2, 2.0, 0.5), (0.5, 1.0, 1.0)]
+        ]
+        outputs = [('x_final', 'm')]
+
+        expected = []
+        for case in cases:
+            prob = _build_problem(case[('phase', 'k')][0])
+            prob.set_val('x_initial', case['x_initial'][0], units='m')
+            prob.set_val('c', case['c'][0], units='m/s')
+            prob.run_model()
+            expected.append([prob.get_val('x_final', units='m').item()])
+
+        for num_procs in (1, 2):
+            results = simulate_sgm_batch(_build_problem, cases, outputs,
+                                         num_procs=num_procs, build_args=(0.5,))
+            assert_near_equal(results, np.array(expected), tolerance=1e-12)
+
+        # a case that doesn't set a phase option uses its original value, even after a
+        # case that did
+        default_k_case = {'x_initial': (0.5, 'm'), 'c': (1.0, 'm/s')}
+        results = simulate_sgm_batch(_build_problem, [cases[2], default_k_case],
+                                     outputs, build_args=(0.5,))
+        assert_near_equal(results, np.array([expected[2], expected[0]]), tolerance=1e-12)
+
+        # invalid cases are errors rather than failed simulations
+        with self.assertRaises(KeyError):
+            simulate_sgm_batch(_build_problem, [{'z': (1.0, 'm')}], outputs,
+                               build_args=(0.5,))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,517 @@
+"""
+Solvers for ODE groups whose nodes are independent of each other.
+
+The residuals at each node of a mission ODE only depend on the unknowns at that same
+node, so apart from variables that are the same for every node (such as geometry
+computed inside the ODE), its Jacobian is block-diagonal with one small block per node.
+NodeDecoupledDirectSolver factors each node block separately, and
+NodeDecoupledNewtonSolver uses it to stop updating nodes that have already converged.
+"""
+import numpy as np
+import openmdao.api as om
+import scipy.sparse.linalg
+
+from openmdao.solvers.linear.direct import format_singular_error
+from openmdao.utils.om_warnings import SolverWarning, issue_warning
+from scipy.sparse import csc_matrix, csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+
+def _peel(dependencies, dependents, remaining):
+    """
+    Repeatedly remove variables that have no dependencies among the remaining
+    variables, returning them in the order they were removed.
+    """
+    n = dependencies.shape[0]
+    count = np.diff(dependencies.indptr)
+    # dependencies on already removed variables do not count
+    count -= np.bincount(dependents[~remaining].indices, minlength=n)
+
+    order = []
+    level = np.flatnonzero(remaining & (count == 0))
+    while level.size:
+        order.append(level)
+        remaining[level] = False
+        count -= np.bincount(dependents[level].indices, minlength=n)
+        level = np.flatnonzero(remaining & (count == 0))
+
+    if order:
+        return np.concatenate(order)
+    return np.array([], dtype=int)
+
+
+def find_node_blocks(matrix, max_block_size=100):
+    """
+    Find a block lower-triangular ordering of a sparse Jacobian, separating the
+    independent blocks (the nodes) from variables that only feed into, or are only
+    fed by, the rest of the system.
+
+    Parameters
+    ----------
+    matrix : sparse matrix
+        Square Jacobian. Only its numerically nonzero entries are considered.
+    max_block_size : int
+        Blocks larger than this are factored with a sparse LU decomposition instead of
+        being inverted.
+
+    Returns
+    -------
+    dict
+        The ordering of the variables ('order'): feed-forward variables that are solved
+        first ('num_upstream' of them), then the independent blocks, then feedback
+        variables that are solved last ('num_downstream' of them). Independent blocks
+        of equal size are grouped into batches, listed by (number of blocks, block size)
+        in 'batch_shapes' and followed by the sizes of blocks larger than
+        max_block_size ('large_block_sizes'). Each variable is also numbered by its
+        position in the ordering, with all variables of a block sharing a number
+        ('group').
+    """
+    n = matrix.shape[0]
+    coo = matrix.tocoo()
+    nonzero = (coo.row != coo.col) & (coo.data != 0)
+    rows = coo.row[nonzero]
+    cols = coo.col[nonzero]
+
+    # row i of dependencies lists the variables that residual i depends on
+    dependencies = csr_matrix((np.ones(rows.size), (rows, cols)), shape=(n, n))
+    dependents = dependencies.T.tocsr()
+
+    remaining = np.ones(n, dtype=bool)
+    upstream = _peel(dependencies, dependents, remaining)
+    # variables that nothing else depends on are solved last, in reverse order
+    downstream = _peel(dependents, dependencies, remaining)[::-1]
+
+    coupled = np.flatnonzero(remaining)
+    num_blocks, labels = connected_components(
+        dependencies[coupled][:, coupled], directed=False)
+
+    block_sizes = np.bincount(labels, minlength=num_blocks)
+    blocks = np.split(coupled[np.argsort(labels, kind='stable')],
+                      np.cumsum(block_sizes)[:-1])
+
+    batches = {}
+    large_blocks = []
+    for block in blocks:
+        if block.size > max_block_size:
+            large_blocks.append(block)
+        else:
+            batches.setdefault(block.size, []).append(block)
+
+    blocks = [block for batch in batches.values() for block in batch] + large_blocks
+
+    group = np.empty(n, dtype=int)
+    group[upstream] = np.arange(upstream.size)
+    for idx, block in enumerate(blocks):
+        group[block] = upstream.size + idx
+    group[downstream] = upstream.size + num_blocks + np.arange(downstream.size)
+
+    return {
+        'order': np.concatenate([upstream, *blocks, downstream]).astype(int),
+        'num_upstream': upstream.size,
+        'num_downstream': downstream.size,
+        'batch_shapes': [(len(batch), size) for size, batch in batches.items()],
+        'large_block_sizes': [block.size for block in large_blocks],
+        'group': group,
+    }
+
+
+class NodeDecoupledDirectSolver(om.DirectSolver):
+    """
+    DirectSolver that exploits the block structure of ODEs whose nodes are independent.
+
+    Variables are ordered so that the assembled Jacobian is block lower-triangular:
+    feed-forward variables that do not depend on any node, then independent blocks of
+    coupled variables (one per node), then variables that nothing else depends on.
+    Blocks of equal size are inverted together as a batch of small dense matrices.
+    The ordering is found from the numerically nonzero entries of the Jacobian, and is
+    found again if a later Jacobian no longer fits it.
+
+    Requires an assembled Jacobian. OpenMDAO has no public access to the assembled
+    matrix, so it is read from the same private attributes that DirectSolver uses. If
+    they are not available in the installed version of OpenMDAO, a warning is issued and
+    the solver falls back to factoring the whole Jacobian like DirectSolver.
+    """
+
+    SOLVER = 'LN: NodeDecoupledDirect'
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('assemble_jac', True)
+        super().__init__(**kwargs)
+
+        self._structure = None
+        self._factors = None
+        # True if the assembled matrix can't be accessed, so DirectSolver is used
+        self._fallback = False
+        # set by NodeDecoupledNewtonSolver, blocks with residuals below this are not
+        # updated
+        self._converged_atol = None
+
+    def _declare_options(self):
+        super()._declare_options()
+
+        self.options.declare(
+            'max_block_size', types=int, default=100, lower=1,
+            desc='Independent blocks larger than this are factored with a sparse LU '
+            'decomposition instead of being inverted')
+
+    def _setup_solvers(self, system, depth):
+        super()._setup_solvers(system, depth)
+
+        if not self.options['assemble_jac']:
+            raise ValueError(f'{self.msginfo}: NodeDecoupledDirectSolver requires '
+                             'assemble_jac=True')
+
+        self._structure = None
+        self._fallback = False
+
+    def _assembled_matrix(self):
+        """
+        Return the assembled Jacobian matrix, or None if it can't be accessed.
+        """
+        try:
+            return self._assembled_jac._int_mtx._matrix
+        except AttributeError:
+            return None
+
+    def _linearize(self):
+        if not self._fallback:
+            matrix = self._assembled_matrix()
+            if matrix is None:
+                issue_warning('The assembled Jacobian matrix is not accessible with '
+                              'this version of OpenMDAO, so the whole Jacobian is '
+                              'factored as in DirectSolver instead.',
+                              prefix=self.msginfo, category=SolverWarning)
+                self._fallback = True
+
+        if self._fallback:
+            super()._linearize()
+            return
+
+        system = self._system()
+
+        if not isinstance(matrix, csc_matrix):
+            raise RuntimeError(f'{self.msginfo}: NodeDecoupledDirectSolver requires a '
+                               'sparse assembled Jacobian')
+
+        structure = self._structure
+        if structure is None or structure['nnz'] != matrix.nnz or \
+                np.any(matrix.data[structure['outside']]):
+            structure = self._structure = self._build_structure(matrix)
+
+        data = matrix.data
+        factors = {}
+
+        try:
+            for name in ('upstream', 'downstream', 'coupled_upstream',
+                         'downstream_upstream', 'downstream_coupled'):
+                submatrix, data_indices = structure[name]
+                submatrix.data = data[data_indices]
+                factors[name] = submatrix
+
+            for name in ('upstream', 'downstream'):
+                if factors[name].shape[0] > 0:
+                    # already triangular, so keep the natural ordering to avoid any
+                    # fill-in
+                    factors[name] = scipy.sparse.linalg.splu(factors[name],
+                                                             permc_spec='NATURAL')
+
+            factors['batches'] = []
+            for (num_blocks, size), (flat_indices, data_indices) in zip(
+                    structure['batch_shapes'], structure['batch_indices']):
+                blocks = np.zeros(num_blocks * size * size)
+                blocks[flat_indices] = data[data_indices]
+                factors['batches'].append(
+                    np.linalg.inv(blocks.reshape(num_blocks, size, size)))
+
+            factors['large_blocks'] = []
+            for submatrix, data_indices in structure['large_blocks']:
+                submatrix.data = data[data_indices]
+                factors['large_blocks'].append(scipy.sparse.linalg.splu(submatrix))
+
+        except (RuntimeError, np.linalg.LinAlgError):
+            raise RuntimeError(format_singular_error(system, matrix))
+
+        self._factors = factors
+
+        lin_rhs_checker = getattr(self, '_lin_rhs_checker', None)
+        if lin_rhs_checker is not None:
+            lin_rhs_checker.clear()
+
+    def _build_structure(self, matrix):
+        """
+        Find the block ordering of the Jacobian, and where each entry of the sparse
+        matrix data goes in the blocks that are factored.
+        """
+        structure = find_node_blocks(matrix, self.options['max_block_size'])
+        order = structure['order']
+        num_upstream = structure['num_upstream']
+        n = order.size
+        num_coupled = n - num_upstream - structure['num_downstream']
+        num_blocks = len(structure['large_block_sizes']) + \
+            sum(num for num, _ in structure['batch_shapes'])
+
+        structure['nnz'] = matrix.nnz
+        structure['num_blocks'] = num_blocks
+
+        # entries that would not fit this ordering if they became nonzero
+        coo = matrix.tocoo()
+        group = structure['group']
+        row_group = group[coo.row]
+        col_group = group[coo.col]
+        in_block = (group >= num_upstream) & (group < num_upstream + num_blocks)
+        between_blocks = in_block[coo.row] & in_block[coo.col] & \
+            (row_group != col_group)
+        structure['outside'] = np.flatnonzero((col_group > row_group) | between_blocks)
+
+        # permuted matrix with the (one-based) index of each entry of the original data
+        # as values
+        positions = csc_matrix((np.arange(1, matrix.nnz + 1), matrix.indices.copy(),
+                                matrix.indptr.copy()), shape=matrix.shape)
+        positions = positions[order][:, order].tocsc()
+
+        slices = {
+            'upstream': slice(0, num_upstream),
+            'coupled': slice(num_upstream, num_upstream + num_coupled),
+            'downstream': slice(num_upstream + num_coupled, n),
+        }
+
+        for name, rows, cols in (('upstream', 'upstream', 'upstream'),
+                                 ('downstream', 'downstream', 'downstream'),
+                                 ('coupled_upstream', 'coupled', 'upstream'),
+                                 ('downstream_upstream', 'downstream', 'upstream'),
+                                 ('downstream_coupled', 'downstream', 'coupled')):
+            structure[name] = self._submatrix(positions, slices[rows], slices[cols])
+
+        structure['batch_indices'] = []
+        start = num_upstream
+        for num_blocks, size in structure['batch_shapes']:
+            end = start + num_blocks * size
+            batch = positions[start:end, start:end].tocoo()
+            # only entries within a block, the rest are zero
+            block = batch.row // size
+            within = block == batch.col // size
+            flat_indices = (block * size * size + (batch.row % size) * size
+                            + batch.col % size)[within]
+            structure['batch_indices'].append((flat_indices, batch.data[within] - 1))
+            start = end
+
+        structure['large_blocks'] = []
+        for size in structure['large_block_sizes']:
+            block = slice(start, start + size)
+            structure['large_blocks'].append(self._submatrix(positions, block, block))
+            start += size
+
+        return structure
+
+    @staticmethod
+    def _submatrix(positions, rows, cols):
+        submatrix = positions[rows, cols].tocsc()
+        # splu sorts the indices in place, so they must already be sorted to keep
+        # data_indices valid
+        submatrix.sort_indices()
+        data_indices = submatrix.data - 1
+        submatrix.data = np.zeros(data_indices.size)
+        return submatrix, data_indices
+
+    def solve(self, mode, rel_systems=None):
+        """
+        Run the solver.
+
+        Parameters
+        ----------
+        mode : str
+            'fwd' or 'rev'.
+        rel_systems : set of str
+            Names of systems relevant to the current solve.  Deprecated.
+        """
+        if self._fallback:
+            super().solve(mode, rel_systems)
+            return
+
+        system = self._system()
+        lin_rhs_checker = getattr(self, '_lin_rhs_checker', None)
+
+        d_residuals = system._dresiduals
+        d_outputs = system._doutputs
+
+        # assign x and b vectors based on mode
+        if mode == 'fwd':
+            x_vec = d_outputs.asarray()
+            b_vec = d_residuals.asarray()
+        else:  # rev
+            x_vec = d_residuals.asarray()
+            b_vec = d_outputs.asarray()
+
+            if lin_rhs_checker is not None:
+                sol_array, is_zero = lin_rhs_checker.get_solution(b_vec, system)
+                if is_zero:
+                    x_vec[:] = 0.0
+                    return
+                if sol_array is not None:
+                    x_vec[:] = sol_array
+                    return
+
+        order = self._structure['order']
+
+        # converged blocks are found from the scaled residuals, as used by the
+        # nonlinear solver
+        converged = None
+        if mode == 'fwd' and self._converged_atol is not None:
+            converged = self._find_converged_blocks(b_vec[order])
+
+        # AssembledJacobians are unscaled.
+        with system._unscaled_context(outputs=[d_outputs], residuals=[d_residuals]):
+            if mode == 'fwd':
+                solution = self._solve_fwd(b_vec[order], converged)
+            else:
+                solution = self._solve_rev(b_vec[order])
+
+            sol_array = np.empty_like(solution)
+            sol_array[order] = solution
+            x_vec[:] = sol_array
+
+        if not system.under_complex_step and lin_rhs_checker is not None and \
+                mode == 'rev':
+            lin_rhs_checker.add_solution(b_vec, sol_array, copy=True)
+
+    def _find_converged_blocks(self, b):
+        """
+        Flag the independent blocks whose residual norm is below the tolerance of the
+        nonlinear solver, scaled so that the blocks together meet the tolerance.
+        """
+        structure = self._structure
+        atol = self._converged_atol / np.sqrt(max(structure['num_blocks'], 1))
+
+        converged = []
+        start = structure['num_upstream']
+        for num_blocks, size in structure['batch_shapes']:
+            end = start + num_blocks * size
+            converged.append(
+                np.linalg.norm(b[start:end].reshape(num_blocks, size), axis=1) < atol)
+            start = end
+        for size in structure['large_block_sizes']:
+            converged.append(np.linalg.norm(b[start:start + size]) < atol)
+            start += size
+
+        return converged
+
+    def _solve_fwd(self, b, converged=None):
+        """
+        Solve the permuted system by forward block substitution.
+        """
+        structure = self._structure
+        factors = self._factors
+        num_upstream = structure['num_upstream']
+        num_downstream = structure['num_downstream']
+        n = b.size
+
+        x = np.zeros_like(b)
+        x_up = x[:num_upstream]
+        x_coupled = x[num_upstream:n - num_downstream]
+        x_down = x[n - num_downstream:]
+
+        if num_upstream:
+            x_up[:] = factors['upstream'].solve(b[:num_upstream])
+
+        rhs = b[num_upstream:n - num_downstream] - factors['coupled_upstream'] @ x_up
+
+        start = 0
+        for idx, ((num_blocks, size), inverse) in enumerate(zip(
+                structure['batch_shapes'], factors['batches'])):
+            end = start + num_blocks * size
+            rhs_blocks = rhs[start:end].reshape(num_blocks, size, 1)
+            if converged is None:
+                x_coupled[start:end] = (inverse @ rhs_blocks).ravel()
+            else:
+                active = ~converged[idx]
+                x_blocks = x_coupled[start:end].reshape(num_blocks, size)
+                x_blocks[active] = (inverse[active] @ rhs_blocks[active])[..., 0]
+            start = end
+
+        num_batches = len(factors['batches'])
+        for idx, (size, lu) in enumerate(zip(structure['large_block_sizes'],
+                                             factors['large_blocks'])):
+            if converged is None or not converged[num_batches + idx]:
+                x_coupled[start:start + size] = lu.solve(rhs[start:start + size])
+            start += size
+
+        if num_downstream:
+            x_down[:] = factors['downstream'].solve(
+                b[n - num_downstream:]
+                - factors['downstream_upstream'] @ x_up
+                - factors['downstream_coupled'] @ x_coupled)
+
+        return x
+
+    def _solve_rev(self, b):
+        """
+        Solve the transpose of the permuted system by backward block substitution.
+        """
+        structure = self._structure
+        factors = self._factors
+        num_upstream = structure['num_upstream']
+        num_downstream = structure['num_downstream']
+        n = b.size
+
+        x = np.zeros_like(b)
+        x_up = x[:num_upstream]
+        x_coupled = x[num_upstream:n - num_downstream]
+        x_down = x[n - num_downstream:]
+
+        if num_downstream:
+            x_down[:] = factors['downstream'].solve(b[n - num_downstream:], 'T')
+
+        rhs = b[num_upstream:n - num_downstream] - \
+            factors['downstream_coupled'].T @ x_down
+
+        start = 0
+        for (num_blocks, size), inverse in zip(structure['batch_shapes'],
+                                               factors['batches']):
+            end = start + num_blocks * size
+            rhs_blocks = rhs[start:end].reshape(num_blocks, size, 1)
+            x_coupled[start:end] = (inverse.transpose(0, 2, 1) @ rhs_blocks).ravel()
+            start = end
+
+        for size, lu in zip(structure['large_block_sizes'], factors['large_blocks']):
+            x_coupled[start:start + size] = lu.solve(rhs[start:start + size], 'T')
+            start += size
+
+        if num_upstream:
+            x_up[:] = factors['upstream'].solve(
+                b[:num_upstream]
+                - factors['coupled_upstream'].T @ x_coupled
+                - factors['downstream_upstream'].T @ x_down, 'T')
+
+        return x
+
+
+class NodeDecoupledNewtonSolver(om.NewtonSolver):
+    """
+    NewtonSolver for ODEs whose nodes are independent, using a
+    NodeDecoupledDirectSolver to solve for the Newton step.
+
+    Nodes (independent blocks of the Jacobian) whose residual norm is small enough
+    that they cannot prevent convergence of the full system are not updated. The
+    convergence check for the full system is unchanged.
+    """
+
+    def _setup_solvers(self, system, depth):
+        super()._setup_solvers(system, depth)
+
+        if not isinstance(self._linear_solver(), NodeDecoupledDirectSolver):
+            raise TypeError(f'{self.msginfo}: NodeDecoupledNewtonSolver requires a '
+                            'NodeDecoupledDirectSolver as its linear solver')
+
+    def _linear_solver(self):
+        if self.linear_solver is not None:
+            return self.linear_solver
+        return self._system().linear_solver
+
+    def _single_iteration(self):
+        linear_solver = self._linear_solver()
+
+        linear_solver._converged_atol = self.options['atol']
+        try:
+            super()._single_iteration()
+        finally:
+            linear_solver._converged_atol = None
@@ -0,0 +1,203 @@
+import unittest
+from unittest import mock
+
+import numpy as np
+import openmdao.api as om
+import scipy.sparse.linalg
+from openmdao.utils.assert_utils import assert_near_equal, assert_warning
+from openmdao.utils.om_warnings import SolverWarning
+
+from aviary.mission.flops_based.ode.mission_ODE import MissionODE
+from aviary.mission.gasp_based.ode.params import set_params_for_unit_tests
+from aviary.mission.gasp_based.ode.unsteady_solved.unsteady_solved_ode import \
+    UnsteadySolvedODE
+from aviary.mission.ode.node_decoupled_solvers import NodeDecoupledDirectSolver
+from aviary.subsystems.propulsion.utils import build_engine_deck
+from aviary.utils.functions import set_aviary_initial_values
+from aviary.utils.preprocessors import preprocess_options
+from aviary.utils.test_utils.default_subsystems import get_default_mission_subsystems
+from aviary.validation_cases.validation_tests import get_flops_inputs, get_flops_outputs
+from aviary.variable_info.enums import SpeedType
+from aviary.variable_info.options import get_option_defaults
+from aviary.variable_info.variables import Dynamic, Settings
+
+
+class NodeDecoupledSolverTest(unittest.TestCase):
+    """
+    Test that the node decoupled solvers give the same solution as the default solvers
+    of the unsteady solved ODE.
+    """
+
+    def _run_ode(self, node_decoupled_solver):
+        nn = 5
+
+        prob = om.Problem()
+
+        aviary_options = get_option_defaults()
+        default_mission_subsystems = get_default_mission_subsystems(
+            'GASP', build_engine_deck(aviary_options))
+
+        ode = UnsteadySolvedODE(num_nodes=nn,
+                                input_speed_type=SpeedType.MACH,
+                                clean=True,
+                                aviary_options=aviary_options,
+                                core_subsystems=default_mission_subsystems,
+                                node_decoupled_solver=node_decoupled_solver)
+
+        prob.model.add_subsystem("ode", ode, promotes=["*"])
+        prob.model.set_input_defaults(Dynamic.Mission.MACH, 0.8 * np.ones(nn))
+
+        prob.setup()
+
+        set_params_for_unit_tests(prob)
+
+        prob.set_val(Dynamic.Mission.SPEED_OF_SOUND, 968.076 * np.ones(nn), units="ft/s")
+        prob.set_val(Dynamic.Mission.DENSITY, np.linspace(6e-4, 8e-4, nn),
+                     units="slug/ft**3")
+        prob.set_val("mach", np.linspace(0.7, 0.8, nn), units="unitless")
+        prob.set_val("mass", np.linspace(170_000, 160_000, nn), units="lbm")
+        prob.set_val(Dynamic.Mission.FLIGHT_PATH_ANGLE, np.zeros(nn), units="rad")
+        prob.set_val("alpha", 4 * np.ones(nn), units="deg")
+        prob.set_val("dh_dr", np.linspace(0.0, 100.0, nn), units="ft/NM")
+        prob.set_val("d2h_dr2", np.zeros(nn), units="1/NM")
+        prob.set_val("thrust_req", 8000 * np.ones(nn), units="lbf")
+
+        prob.run_model()
+
+        return prob
+
+    def test_solution(self):
+        expected = self._run_ode(node_decoupled_solver=False)
+        prob = self._run_ode(node_decoupled_solver=True)
+
+        for name in ("alpha", "thrust_req", Dynamic.Mission.THROTTLE, "dt_dr"):
+            assert_near_equal(prob.get_val(name), expected.get_val(name), 1e-10)
+
+        of = ["dt_dr", Dynamic.Mission.THROTTLE]
+        wrt = ["mach", "mass", "dh_dr"]
+        totals = prob.compute_totals(of, wrt)
+        expected_totals = expected.compute_totals(of, wrt)
+        for key, val in expected_totals.items():
+            assert_near_equal(totals[key], val, 1e-8)
+
+    def test_fallback(self):
+        expected = self._run_ode(node_decoupled_solver=False)
+
+        # as if the assembled matrix could not be accessed in this version of OpenMDAO
+        msg = ("NodeDecoupledDirectSolver in 'ode.throttle_balance_group' "
+               "<class Group>: The assembled Jacobian matrix is not accessible with "
+               "this version of OpenMDAO, so the whole Jacobian is factored as in "
+               "DirectSolver instead.")
+        with mock.patch.object(NodeDecoupledDirectSolver, '_assembled_matrix',
+                               return_value=None):
+            with assert_warning(SolverWarning, msg):
+                prob = self._run_ode(node_decoupled_solver=True)
+
+        for name in ("alpha", "thrust_req", Dynamic.Mission.THROTTLE, "dt_dr"):
+            assert_near_equal(prob.get_val(name), expected.get_val(name), 1e-10)
+
+    def test_linear_solve(self):
+        prob = self._run_ode(node_decoupled_solver=True)
+
+        group = prob.model.ode.throttle_balance_group
+        solver = group.linear_solver
+        self.assertIsInstance(solver, NodeDecoupledDirectSolver)
+
+        group._linearize(group._assembled_jac, sub_do_ln=True)
+        solver._linearize()
+
+        # one independent block per node
+        num_blocks = sum(num for num, _ in solver._structure['batch_shapes']) + \
+            len(solver._structure['large_block_sizes'])
+        self.assertEqual(num_blocks, 5)
+
+        matrix = solver._assembled_matrix()
+        order = solver._structure['order']
+        b = np.random.default_rng(0).uniform(-1.0, 1.0, matrix.shape[0])
+
+        for mode, expected in (
+                ('fwd', scipy.sparse.linalg.spsolve(matrix, b)),
+                ('rev', scipy.sparse.linalg.spsolve(matrix.T.tocsc(), b))):
+            if mode == 'fwd':
+                solution = solver._solve_fwd(b[order])
+            else:
+                solution = solver._solve_rev(b[order])
+
+            x = np.empty_like(solution)
+            x[order] = solution
+            assert_near_equal(x, expected, 1e-10)
+
+
+class MissionODENodeDecoupledSolverTest(unittest.TestCase):
+    """
+    Test that the node decoupled solvers give the same solution as the default solvers
+    of the height energy mission ODE.
+    """
+
+    def _run_ode(self, node_decoupled_solver):
+        nn = 5
+
+        aviary_options = get_flops_inputs('N3CC')
+        aviary_options.set_val(Settings.VERBOSITY, 0)
+        engine = build_engine_deck(aviary_options)
+        preprocess_options(aviary_options, engine_models=engine)
+
+        prob = om.Problem()
+
+        default_mission_subsystems = get_default_mission_subsystems('FLOPS', engine)
+
+        ode = MissionODE(num_nodes=nn,
+                         aviary_options=aviary_options,
+                         subsystem_options={'core_aerodynamics': {'method': 'computed'}},
+                         core_subsystems=default_mission_subsystems,
+                         node_decoupled_solver=node_decoupled_solver)
+
+        prob.model.add_subsystem("ode", ode, promotes=["*"])
+
+        prob.setup(check=False)
+
+        set_aviary_initial_values(prob, aviary_options)
+        # geometry that is computed by pre-mission
+        input_names = {meta['prom_name'] for meta in
+                       prob.model.get_io_metadata(iotypes='input').values()}
+        for name, (val, units) in get_flops_outputs('N3CC'):
+            if name in input_names:
+                prob.set_val(name, val, units=units)
+
+        prob.set_val(Dynamic.Mission.ALTITUDE, np.linspace(30_000, 35_000, nn),
+                     units='ft')
+        prob.set_val(Dynamic.Mission.MACH, np.linspace(0.7, 0.78, nn))
+        prob.set_val(Dynamic.Mission.MASS, np.linspace(130_000, 120_000, nn),
+                     units='lbm')
+        prob.set_val(Dynamic.Mission.VELOCITY, np.linspace(700, 760, nn), units='ft/s')
+        prob.set_val(Dynamic.Mission.ALTITUDE_RATE, np.linspace(10, 0, nn), units='ft/s')
+        prob.set_val(Dynamic.Mission.MACH_RATE, np.zeros(nn), units='unitless/s')
+
+        prob.run_model()
+
+        return prob
+
+    def test_solution(self):
+        expected = self._run_ode(node_decoupled_solver=False)
+        prob = self._run_ode(node_decoupled_solver=True)
+
+        # one independent block per node
+        structure = prob.model.ode.linear_solver._structure
+        num_blocks = sum(num for num, _ in structure['batch_shapes']) + \
+            len(structure['large_block_sizes'])
+        self.assertEqual(num_blocks, 5)
+
+        for name in (Dynamic.Mission.THROTTLE, 'thrust_required',
+                     Dynamic.Mission.SPECIFIC_ENERGY_RATE_EXCESS):
+            assert_near_equal(prob.get_val(name), expected.get_val(name), 1e-10)
+
+        of = [Dynamic.Mission.THROTTLE, Dynamic.Mission.SPECIFIC_ENERGY_RATE_EXCESS]
+        wrt = [Dynamic.Mission.MACH, Dynamic.Mission.MASS, Dynamic.Mission.ALTITUDE]
+        totals = prob.compute_totals(of, wrt)
+        expected_totals = expected.compute_totals(of, wrt)
+        for key, val in expected_totals.items():
+            assert_near_equal(totals[key], val, 1e-8)
+
+
+if __name__ == "__main__":
+    unittest.main()
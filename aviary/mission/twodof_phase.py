@@ -113,6 +113,7 @@ class TwoDOFPhase(FlightPhaseBase):
             'clean': self.user_options.get_val('clean'),
             'ground_roll': self.user_options.get_val('ground_roll'),
             'throttle_enforcement': self.user_options.get_val('throttle_enforcement'),
+            'node_decoupled_solver': self.user_options.get_val('node_decoupled_solver'),
         }
 
 
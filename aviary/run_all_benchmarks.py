@@ -1,3 +1,351 @@
+"""
+Run the Aviary benchmark cases across a pool of worker processes and record
+performance data for each case to a JSON history file.
+
+For every case, the wall time, time spent in problem setup, driver iterations,
+model evaluations and peak resident memory are recorded, and compared against the
+most recent previous run of that case so that performance regressions are reported
+alongside test failures.
+
+Usage:
+    python run_all_benchmarks.py [-n NUM_PROCS] [--history FILE] [--testmatch PATTERN]
+"""
+import argparse
+import ast
+import contextlib
+import fnmatch
+import importlib
+import io
+import json
+import multiprocessing
+import os
 import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+AVIARY_DIR = Path(__file__).parent
+BENCHMARK_DIR = AVIARY_DIR / 'validation_cases' / 'benchmark_tests'
+
+# bench tests anywhere in Aviary, plus every test in the benchmark_tests folder
+DEFAULT_TESTMATCH = ['bench_test*']
+
+
+def find_cases(testmatch=None):
+    """
+    Find all benchmark cases without importing any test modules.
+
+    Parameters
+    ----------
+    testmatch : list of str, optional
+        Glob patterns that test method names must match. If None, all methods
+        matching bench_test* in Aviary are found, along with all test methods in
+        validation_cases/benchmark_tests.
+
+    Returns
+    -------
+    list of tuple
+        (module name, class name, method name) of each case, sorted by module.
+    """
+    cases = []
+
+    for path in sorted(AVIARY_DIR.rglob('test_*.py')):
+        if testmatch is None:
+            patterns = list(DEFAULT_TESTMATCH)
+            if BENCHMARK_DIR in path.parents:
+                patterns.append('test*')
+        else:
+            patterns = testmatch
+
+        module_name = '.'.join(
+            ('aviary',) + path.relative_to(AVIARY_DIR).with_suffix('').parts)
+        tree = ast.parse(path.read_text(encoding='utf-8'))
+
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            for item in node.body:
+                if not isinstance(item, ast.FunctionDef):
+                    continue
+                case = (module_name, node.name, item.name)
+                # methods can be redefined within a class, only the last one runs
+                if case not in cases and any(
+                        fnmatch.fnmatchcase(item.name, pattern) for pattern in patterns):
+                    cases.append(case)
+
+    return cases
+
+
+def _peak_rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # bytes on macOS, kilobytes elsewhere
+    if sys.platform == 'darwin':
+        return peak / 1024**2
+    return peak / 1024
+
+
+def run_case(case):
+    """
+    Run a single benchmark case and collect its performance data. This is intended
+    to be run in a fresh worker process, so that OpenMDAO can be instrumented and
+    peak memory use is attributed to the case.
+
+    Parameters
+    ----------
+    case : tuple
+        (module name, class name, method name) of the case.
+
+    Returns
+    -------
+    dict
+        Status and performance data for the case.
+    """
+    import openmdao.api as om
+
+    module_name, class_name, method_name = case
+
+    problems = []
+    setup_time = [0.0]
+
+    # count work done by every problem the case creates
+    problem_init = om.Problem.__init__
+    problem_setup = om.Problem.setup
+    problem_final_setup = om.Problem.final_setup
+
+    def __init__(self, *args, **kwargs):
+        problem_init(self, *args, **kwargs)
+        problems.append(self)
+
+    def timed(func):
+        def wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                setup_time[0] += time.perf_counter() - start
+        return wrapper
+
+    om.Problem.__init__ = __init__
+    om.Problem.setup = timed(problem_setup)
+    om.Problem.final_setup = timed(problem_final_setup)
+
+    result = unittest.TestResult()
+    output = io.StringIO()
+    start = time.perf_counter()
+
+    with tempfile.TemporaryDirectory() as tmpdir, \
+            contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+        cwd = os.getcwd()
+        os.chdir(tmpdir)
+        try:
+            test_class = getattr(importlib.import_module(module_name), class_name)
+            test_class(method_name).run(result)
+        except Exception as err:
+            result.errors.append((case, repr(err)))
+        finally:
+            os.chdir(cwd)
+
+    wall_time = time.perf_counter() - start
+
+    if result.errors or result.failures:
+        status = 'fail'
+        message = (result.errors + result.failures)[0][1]
+    elif result.skipped:
+        status = 'skip'
+        message = result.skipped[0][1]
+    else:
+        status = 'pass'
+        message = ''
+
+    driver_iterations = 0
+    model_evaluations = 0
+    for prob in problems:
+        try:
+            driver_iterations += prob.driver.iter_count
+            model_evaluations += prob.model.iter_count
+        except AttributeError:
+            # problem was never set up
+            pass
+
+    return {
+        'status': status,
+        'message': message,
+        'wall_time': wall_time,
+        'setup_time': setup_time[0],
+        'driver_iterations': driver_iterations,
+        'model_evaluations': model_evaluations,
+        'peak_rss_mb': _peak_rss_mb(),
+    }
+
+
+def _case_name(case):
+    module_name, class_name, method_name = case
+    return f'{module_name}:{class_name}.{method_name}'
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=AVIARY_DIR, capture_output=True,
+            text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(filename):
+    """
+    Load the list of previous benchmark runs, or an empty list if the history file
+    does not exist yet.
+    """
+    if not Path(filename).exists():
+        return []
+    with open(filename) as f:
+        return json.load(f)
+
+
+def find_regressions(cases, history, tolerance=0.25, min_time=1.0):
+    """
+    Compare the wall time of each passing case to the most recent previous passing
+    run of the same case.
+
+    Parameters
+    ----------
+    cases : dict
+        Performance data for the current run, keyed by case name.
+    history : list
+        Previous runs, oldest first.
+    tolerance : float
+        Allowed fractional increase in wall time.
+    min_time : float
+        Increases in wall time smaller than this (in seconds) are ignored.
+
+    Returns
+    -------
+    dict
+        (previous wall time, current wall time) for each regressed case.
+    """
+    regressions = {}
+
+    for name, data in cases.items():
+        if data['status'] != 'pass':
+            continue
+        for run in reversed(history):
+            previous = run['cases'].get(name)
+            if previous is not None and previous['status'] == 'pass':
+                old, new = previous['wall_time'], data['wall_time']
+                if new > old * (1. + tolerance) and new - old > min_time:
+                    regressions[name] = (old, new)
+                break
+
+    return regressions
+
+
+def run_benchmarks(cases, num_procs=None):
+    """
+    Run benchmark cases in a process pool, using a new process for each case.
+
+    Returns
+    -------
+    dict
+        Performance data for each case, keyed by case name.
+    """
+    if num_procs is None:
+        num_procs = os.cpu_count()
+
+    results = {}
+    with multiprocessing.Pool(num_procs, maxtasksperchild=1) as pool:
+        for case, data in zip(cases, pool.imap(run_case, cases)):
+            name = _case_name(case)
+            results[name] = data
+            print(f"{data['status']:5s} {data['wall_time']:9.2f} s  {_short_name(name)}",
+                  flush=True)
+
+    return results
+
+
+def _short_name(name):
+    # drop the package path from the module name
+    module_name, test_name = name.split(':')
+    return module_name.rsplit('.', 1)[-1] + ':' + test_name
+
+
+def _print_report(cases, regressions):
+    width = max([len(_short_name(name)) for name in cases] + [4])
+    header = (f"{'case':{width}s} {'status':>6s} {'wall (s)':>9s} {'setup (s)':>9s} "
+              f"{'driver it':>9s} {'model ev':>9s} {'RSS (MB)':>9s}")
+    print('\n' + header)
+    print('-' * len(header))
+    for name, data in cases.items():
+        rss = data['peak_rss_mb']
+        rss = f'{rss:9.0f}' if rss is not None else f"{'-':>9s}"
+        print(f"{_short_name(name):{width}s} {data['status']:>6s} {data['wall_time']:9.2f} "
+              f"{data['setup_time']:9.2f} {data['driver_iterations']:9d} "
+              f"{data['model_evaluations']:9d} {rss}")
+
+    failed = [name for name, data in cases.items() if data['status'] == 'fail']
+    if failed:
+        print('\nFailed cases:')
+        for name in failed:
+            print(f'  {_short_name(name)}')
+            print('    ' + cases[name]['message'].strip().splitlines()[-1])
+
+    if regressions:
+        print('\nWall time regressions:')
+        for name, (old, new) in regressions.items():
+            print(f'  {_short_name(name)}: {old:.2f} s -> {new:.2f} s')
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0].strip())
+    parser.add_argument('-n', '--num-procs', type=int, default=None,
+                        help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('--history', default='benchmark_history.json',
+                        help='JSON file that benchmark timing data is appended to')
+    parser.add_argument('--testmatch', action='append', default=None,
+                        help='glob pattern for test method names; can be repeated')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='fractional increase in wall time reported as a regression')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='return a nonzero exit code if any regression is found')
+    args = parser.parse_args(args)
+
+    cases = find_cases(args.testmatch)
+    print(f'Running {len(cases)} benchmark cases')
+
+    start = time.perf_counter()
+    results = run_benchmarks(cases, args.num_procs)
+    total_time = time.perf_counter() - start
+
+    history = load_history(args.history)
+    regressions = find_regressions(results, history, tolerance=args.tolerance)
+
+    history.append({
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': sys.version.split()[0],
+        'wall_time': total_time,
+        'cases': results,
+    })
+    with open(args.history, 'w') as f:
+        json.dump(history, f, indent=2)
+
+    _print_report(results, regressions)
+    print(f'\nTotal wall time: {total_time:.2f} s, history written to {args.history}')
+
+    failed = any(data['status'] == 'fail' for data in results.values())
+    return int(failed or (args.fail_on_regression and bool(regressions)))
+
 
-subprocess.run(["testflo", "--testmatch=bench_test*"])
+if __name__ == '__main__':
+    sys.exit(main())
@@ -22,7 +22,9 @@ from aviary.subsystems.aerodynamics.flops_based.solved_alpha_group import \
     SolvedAlphaGroup
 from aviary.subsystems.aerodynamics.flops_based.tabular_aero_group import \
     TabularAeroGroup
-from aviary.subsystems.aerodynamics.flops_based.drag_polar import DragPolar
+from aviary.subsystems.aerodynamics.flops_based.drag_polar import (
+    DRAG_POLAR_ALTITUDE, DRAG_POLAR_LIFT_COEFFICIENT, DRAG_POLAR_MACH,
+    ComputedDragPolar, DragPolar)
 from aviary.subsystems.aerodynamics.flops_based.design import Design
 from aviary.subsystems.aerodynamics.gasp_based.premission_aero import PreMissionAero
 from aviary.subsystems.aerodynamics.gasp_based.gaspaero import CruiseAero
@@ -109,6 +111,15 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
         elif code_origin is FLOPS:
             aero_group = Design(aviary_options=aviary_inputs)
 
+            if _use_drag_polar_tables(aviary_inputs):
+                design = aero_group
+                aero_group = om.Group()
+                aero_group.add_subsystem('design', design,
+                                         promotes_inputs=['*'], promotes_outputs=['*'])
+                aero_group.add_subsystem(
+                    'drag_polar', ComputedDragPolar(aviary_options=aviary_inputs),
+                    promotes_inputs=['*'], promotes_outputs=['*'])
+
         return aero_group
 
     def build_mission(self, num_nodes, aviary_inputs, **kwargs):
@@ -207,6 +218,10 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
                             Dynamic.Mission.MASS,
                             'aircraft:*', 'mission:*']
 
+                if _use_drag_polar_tables(kwargs.get('aviary_inputs')):
+                    # drag polar tables are interpolated in altitude instead
+                    promotes[2] = Dynamic.Mission.ALTITUDE
+
             elif method == 'solved_alpha':
                 promotes = [Dynamic.Mission.ALTITUDE,
                             Dynamic.Mission.MACH,
@@ -370,8 +385,14 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
                         params[Aircraft.Design.DRAG_POLAR] = drag_opts
 
             if method == 'computed':
+                use_tables = _use_drag_polar_tables(aviary_inputs)
+
+                if use_tables:
+                    core_inputs = COMPUTED_TABLE_CORE_INPUTS
+                else:
+                    core_inputs = COMPUTED_CORE_INPUTS
 
-                for var in COMPUTED_CORE_INPUTS:
+                for var in core_inputs:
 
                     meta = _MetaData[var]
 
@@ -389,8 +410,19 @@ class CoreAerodynamicsBuilder(AerodynamicsBuilderBase):
                     params[var] = {'val': val,
                                    'static_target': True}
 
-                for var in ENGINE_SIZED_INPUTS:
-                    params[var] = {'shape': (num_engine_type, ), 'static_target': True}
+                if use_tables:
+                    num_mach = DRAG_POLAR_MACH.size
+                    params[Aircraft.Design.ZERO_LIFT_DRAG_POLAR] = {
+                        'shape': (num_mach, DRAG_POLAR_ALTITUDE.size),
+                        'static_target': True}
+                    params[Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR] = {
+                        'shape': (num_mach, DRAG_POLAR_LIFT_COEFFICIENT.size),
+                        'static_target': True}
+
+                else:
+                    for var in ENGINE_SIZED_INPUTS:
+                        params[var] = {'shape': (num_engine_type, ),
+                                       'static_target': True}
 
             elif method == 'tabular':
 
@@ -540,6 +572,20 @@ COMPUTED_CORE_INPUTS = [
     Mission.Design.MACH,
 ]
 
+# Parameters for computed aero interpolated from drag polar tables.
+COMPUTED_TABLE_CORE_INPUTS = [
+    Aircraft.Design.LIFT_DEPENDENT_DRAG_COEFF_FACTOR,
+    Aircraft.Design.SUBSONIC_DRAG_COEFF_FACTOR,
+    Aircraft.Design.SUPERSONIC_DRAG_COEFF_FACTOR,
+    Aircraft.Design.ZERO_LIFT_DRAG_COEFF_FACTOR,
+    Aircraft.Wing.AREA,
+    Aircraft.Wing.ASPECT_RATIO,
+    Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN,
+    Aircraft.Wing.SWEEP,
+    Aircraft.Wing.THICKNESS_TO_CHORD,
+    Mission.Design.MACH,
+]
+
 TABULAR_CORE_INPUTS = [
     Aircraft.Wing.AREA,
 ]
@@ -610,3 +656,16 @@ AERO_CLEAN_2DOF_INPUTS = [
     Aircraft.Design.SUPERCRITICAL_DIVERGENCE_SHIFT,  # super drag shift?
     Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP,
 ]
+
+
+def _use_drag_polar_tables(aviary_inputs):
+    """
+    Return whether computed aero is interpolated from drag polar tables.
+    """
+    if aviary_inputs is None:
+        return False
+
+    use_tables, _ = aviary_inputs.get_item(
+        Aircraft.Design.USE_DRAG_POLAR_TABLES, (False, 'unitless'))
+
+    return use_tables
@@ -9,6 +9,8 @@ from aviary.subsystems.aerodynamics.flops_based.buffet_lift import BuffetLift
 from aviary.subsystems.aerodynamics.flops_based.compressibility_drag import \
     CompressibilityDrag
 from aviary.subsystems.aerodynamics.flops_based.drag import TotalDrag
+from aviary.subsystems.aerodynamics.flops_based.drag_polar import (
+    DRAG_POLAR_ALTITUDE, DRAG_POLAR_LIFT_COEFFICIENT, DRAG_POLAR_MACH)
 from aviary.subsystems.aerodynamics.flops_based.induced_drag import InducedDrag
 from aviary.subsystems.aerodynamics.flops_based.lift import LiftEqualsWeight
 from aviary.subsystems.aerodynamics.flops_based.lift_dependent_drag import \
@@ -24,6 +26,10 @@ from aviary.variable_info.variables import Aircraft, Dynamic, Mission
 class ComputedAeroGroup(om.Group):
     """
     FLOPS-based computed aero group
+
+    If Aircraft.Design.USE_DRAG_POLAR_TABLES is set, zero-lift and lift-dependent drag
+    are interpolated from the drag polar tables computed by ComputedDragPolar during
+    pre-mission instead of being computed at every node.
     """
 
     def initialize(self):
@@ -36,11 +42,26 @@ class ComputedAeroGroup(om.Group):
         self.options.declare(
             'aviary_options', types=AviaryValues,
             desc='collection of Aircraft/Mission specific options')
+        self.options.declare(
+            'polar_mach', default=DRAG_POLAR_MACH,
+            desc='Mach numbers of the drag polar tables.')
+        self.options.declare(
+            'polar_altitude', default=DRAG_POLAR_ALTITUDE,
+            desc='Altitudes (ft) of the zero-lift drag polar table.')
+        self.options.declare(
+            'polar_lift_coefficient', default=DRAG_POLAR_LIFT_COEFFICIENT,
+            desc='Lift coefficients of the lift-dependent drag polar table.')
 
     def setup(self):
         num_nodes = self.options["num_nodes"]
         gamma = self.options['gamma']
         aviary_options: AviaryValues = self.options['aviary_options']
+        use_tables, _ = aviary_options.get_item(
+            Aircraft.Design.USE_DRAG_POLAR_TABLES, (False, 'unitless'))
+
+        if use_tables:
+            self._setup_tabulated()
+            return
 
         comp = MuxComponent(aviary_options=aviary_options)
         self.add_subsystem(
@@ -149,6 +170,72 @@ class ComputedAeroGroup(om.Group):
         self.connect(
             'SkinFrictionDrag.skin_friction_drag_coeff', 'Drag.skin_friction_drag_coeff')
 
+    def _setup_tabulated(self):
+        """
+        Interpolate drag from the drag polar tables.
+        """
+        options = self.options
+        num_nodes = options['num_nodes']
+        gamma = options['gamma']
+
+        self.add_subsystem(
+            'DynamicPressure', DynamicPressure(num_nodes=num_nodes, gamma=gamma),
+            promotes_inputs=[Dynamic.Mission.MACH, Dynamic.Mission.STATIC_PRESSURE],
+            promotes_outputs=[Dynamic.Mission.DYNAMIC_PRESSURE])
+
+        comp = LiftEqualsWeight(num_nodes=num_nodes)
+        self.add_subsystem(
+            name=Dynamic.Mission.LIFT, subsys=comp,
+            promotes_inputs=[Aircraft.Wing.AREA, Dynamic.Mission.MASS,
+                             Dynamic.Mission.DYNAMIC_PRESSURE],
+            promotes_outputs=['cl', Dynamic.Mission.LIFT])
+
+        tables = [
+            ('CD0', Dynamic.Mission.ALTITUDE, options['polar_altitude'], 'ft',
+             Aircraft.Design.ZERO_LIFT_DRAG_POLAR),
+            ('CDI', 'cl', options['polar_lift_coefficient'], 'unitless',
+             Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR),
+        ]
+
+        for output, name, training_data, units, table in tables:
+            # training data are connected so that drag has derivatives with respect to
+            # the aircraft inputs of the tables
+            comp = om.MetaModelStructuredComp(method='lagrange3', extrapolate=True,
+                                              vec_size=num_nodes,
+                                              training_data_gradients=True)
+            comp.add_input(Dynamic.Mission.MACH, training_data=options['polar_mach'],
+                           units='unitless')
+            comp.add_input(name, training_data=training_data, units=units)
+            comp.add_output(output, units='unitless')
+
+            self.add_subsystem(
+                f'{output}_interp', comp,
+                promotes_inputs=[Dynamic.Mission.MACH, name, (f'{output}_train', table)],
+                promotes_outputs=[output])
+
+        self.add_subsystem(
+            'Drag', TotalDrag(num_nodes=num_nodes),
+            promotes_inputs=[
+                Aircraft.Design.ZERO_LIFT_DRAG_COEFF_FACTOR,
+                Aircraft.Design.LIFT_DEPENDENT_DRAG_COEFF_FACTOR,
+                Aircraft.Wing.AREA,
+                Aircraft.Design.SUBSONIC_DRAG_COEFF_FACTOR,
+                Aircraft.Design.SUPERSONIC_DRAG_COEFF_FACTOR,
+                'CDI', 'CD0', Dynamic.Mission.MACH, Dynamic.Mission.DYNAMIC_PRESSURE],
+            promotes_outputs=['CD', Dynamic.Mission.DRAG])
+
+        self.add_subsystem(
+            'Buffet', BuffetLift(num_nodes=num_nodes),
+            promotes_inputs=[
+                Dynamic.Mission.MACH,
+                Mission.Design.MACH,
+                Aircraft.Wing.ASPECT_RATIO,
+                Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN,
+                Aircraft.Wing.SWEEP,
+                Aircraft.Wing.THICKNESS_TO_CHORD])
+
+        self.set_input_defaults(Aircraft.Wing.AREA, 1., 'ft**2')
+
 
 class ComputedDrag(om.Group):
     """
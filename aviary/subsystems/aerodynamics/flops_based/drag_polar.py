@@ -4,10 +4,28 @@ OpenMDAO system for generating the aero tables that were typically printed in FL
 import numpy as np
 
 import openmdao.api as om
+from dymos.models.atmosphere.atmos_1976 import USatm1976Comp
 
+from aviary.subsystems.aerodynamics.flops_based.compressibility_drag import \
+    CompressibilityDrag
+from aviary.subsystems.aerodynamics.flops_based.induced_drag import InducedDrag
+from aviary.subsystems.aerodynamics.flops_based.lift_dependent_drag import \
+    LiftDependentDrag
+from aviary.subsystems.aerodynamics.flops_based.mux_component import MuxComponent
+from aviary.subsystems.aerodynamics.flops_based.skin_friction import SkinFriction
+from aviary.subsystems.aerodynamics.flops_based.skin_friction_drag import \
+    SkinFrictionDrag
 from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.functions import add_aviary_input
-from aviary.variable_info.variables import Aircraft, Mission
+from aviary.variable_info.variables import Aircraft, Dynamic, Mission
+
+
+# default grid of the drag polar tables computed by ComputedDragPolar, refined in the
+# transonic range where drag rises quickly with Mach number
+DRAG_POLAR_MACH = np.concatenate([[0.2, 0.3, 0.4, 0.5, 0.6, 0.65],
+                                  np.linspace(0.7, 0.9, 9)])
+DRAG_POLAR_ALTITUDE = np.linspace(0.0, 45000.0, 7)  # ft
+DRAG_POLAR_LIFT_COEFFICIENT = np.linspace(0.0, 1.2, 13)
 
 
 class DragPolar(om.ExplicitComponent):
@@ -52,3 +70,198 @@ class DragPolar(om.ExplicitComponent):
 
         add_aviary_input(self, Mission.Design.MACH, 0.0)
         add_aviary_input(self, Mission.Design.LIFT_COEFFICIENT, 0.0)
+
+
+class ComputedDragPolar(om.Group):
+    """
+    Evaluate the FLOPS-based computed aero on a grid of flight conditions, producing
+    drag polar tables that the mission aero interpolates instead of running the full
+    computation at every node.
+
+    Zero-lift drag (skin friction and compressibility drag) only depends on Mach number
+    and altitude (through Reynolds number in the standard atmosphere), and
+    lift-dependent drag (pressure and induced drag) only depends on Mach number and lift
+    coefficient, so they are tabulated on separate two-dimensional grids. The tables
+    depend on the aircraft geometry, so they are recomputed, with derivatives, whenever
+    the geometry changes.
+    """
+
+    def initialize(self):
+        self.options.declare(
+            'aviary_options', types=AviaryValues,
+            desc='collection of Aircraft/Mission specific options')
+        self.options.declare(
+            'gamma', default=1.4,
+            desc='Ratio of specific heats for air.')
+        self.options.declare(
+            'mach', default=DRAG_POLAR_MACH,
+            desc='Mach numbers of the drag polar tables.')
+        self.options.declare(
+            'altitude', default=DRAG_POLAR_ALTITUDE,
+            desc='Altitudes (ft) of the zero-lift drag polar table.')
+        self.options.declare(
+            'lift_coefficient', default=DRAG_POLAR_LIFT_COEFFICIENT,
+            desc='Lift coefficients of the lift-dependent drag polar table.')
+
+    def setup(self):
+        options = self.options
+        aviary_options: AviaryValues = options['aviary_options']
+        gamma = options['gamma']
+        mach = np.asarray(options['mach'])
+        altitude = np.asarray(options['altitude'])
+        lift_coefficient = np.asarray(options['lift_coefficient'])
+
+        num_mach = mach.size
+        num_alt = altitude.size
+        num_cl = lift_coefficient.size
+        n_zero_lift = num_mach * num_alt
+        n_lift_dep = num_mach * num_cl
+
+        # Lift-dependent drag only depends on lift through the lift coefficient, so the
+        # grid lift is computed at an arbitrary pressure.
+        pressure = 2116.22  # lbf/ft**2
+        lift_dep_mach = np.repeat(mach, num_cl)
+        lift_per_area = 0.5 * gamma * pressure * lift_dep_mach ** 2 \
+            * np.tile(lift_coefficient, num_mach)
+
+        grid = self.add_subsystem('grid', om.IndepVarComp())
+        grid.add_output('zero_lift_mach', np.repeat(mach, num_alt), units='unitless')
+        grid.add_output('altitude', np.tile(altitude, num_mach), units='ft')
+        grid.add_output('lift_dependent_mach', lift_dep_mach, units='unitless')
+        grid.add_output('static_pressure', pressure * np.ones(n_lift_dep),
+                        units='lbf/ft**2')
+
+        self.add_subsystem(
+            'lift',
+            om.ExecComp('lift = lift_per_area * wing_area',
+                        lift={'shape': n_lift_dep, 'units': 'lbf'},
+                        lift_per_area={'val': lift_per_area, 'units': 'lbf/ft**2'},
+                        wing_area={'units': 'ft**2'}),
+            promotes_inputs=[('wing_area', Aircraft.Wing.AREA)])
+
+        # zero-lift drag
+        self.add_subsystem(
+            'Mux', MuxComponent(aviary_options=aviary_options),
+            promotes_inputs=['aircraft:*'])
+
+        self.add_subsystem('atmosphere', USatm1976Comp(num_nodes=n_zero_lift))
+
+        self.add_subsystem(
+            'SkinFrictionCoef',
+            SkinFriction(num_nodes=n_zero_lift, aviary_options=aviary_options))
+
+        self.add_subsystem(
+            'SkinFrictionDrag',
+            SkinFrictionDrag(num_nodes=n_zero_lift, aviary_options=aviary_options),
+            promotes_inputs=[Aircraft.Wing.AREA])
+
+        self.add_subsystem(
+            'CompressibilityDrag', CompressibilityDrag(num_nodes=n_zero_lift),
+            promotes_inputs=[
+                Mission.Design.MACH,
+                Aircraft.Design.BASE_AREA,
+                Aircraft.Wing.AREA,
+                Aircraft.Wing.ASPECT_RATIO,
+                Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN,
+                Aircraft.Wing.SWEEP,
+                Aircraft.Wing.TAPER_RATIO,
+                Aircraft.Wing.THICKNESS_TO_CHORD,
+                Aircraft.Fuselage.CROSS_SECTION,
+                Aircraft.Fuselage.DIAMETER_TO_WING_SPAN,
+                Aircraft.Fuselage.LENGTH_TO_DIAMETER])
+
+        self._add_table(
+            'CD0', 'SkinFrictionDrag.skin_friction_drag_coeff',
+            'CompressibilityDrag.compress_drag_coeff',
+            (num_mach, num_alt), Aircraft.Design.ZERO_LIFT_DRAG_POLAR)
+
+        self.connect('grid.altitude', 'atmosphere.h')
+        self.connect('grid.zero_lift_mach', [
+            f'SkinFrictionCoef.{Dynamic.Mission.MACH}',
+            f'CompressibilityDrag.{Dynamic.Mission.MACH}'])
+        self.connect('atmosphere.temp',
+                     f'SkinFrictionCoef.{Dynamic.Mission.TEMPERATURE}')
+        self.connect('atmosphere.pres',
+                     f'SkinFrictionCoef.{Dynamic.Mission.STATIC_PRESSURE}')
+        self.connect('Mux.characteristic_lengths',
+                     'SkinFrictionCoef.characteristic_lengths')
+
+        for name in ('skin_friction_coeff', 'Re'):
+            self.connect(f'SkinFrictionCoef.{name}', f'SkinFrictionDrag.{name}')
+
+        for name in ('fineness_ratios', 'wetted_areas', 'laminar_fractions_upper',
+                     'laminar_fractions_lower'):
+            self.connect(f'Mux.{name}', f'SkinFrictionDrag.{name}')
+
+        # lift-dependent drag
+        self.add_subsystem(
+            'PressureDrag', LiftDependentDrag(num_nodes=n_lift_dep, gamma=gamma),
+            promotes_inputs=[
+                Mission.Design.MACH,
+                Mission.Design.LIFT_COEFFICIENT,
+                Aircraft.Wing.AREA,
+                Aircraft.Wing.ASPECT_RATIO,
+                Aircraft.Wing.MAX_CAMBER_AT_70_SEMISPAN,
+                Aircraft.Wing.SWEEP,
+                Aircraft.Wing.THICKNESS_TO_CHORD])
+
+        self.add_subsystem(
+            'InducedDrag',
+            InducedDrag(num_nodes=n_lift_dep, gamma=gamma,
+                        aviary_options=aviary_options),
+            promotes_inputs=[
+                Aircraft.Wing.AREA,
+                Aircraft.Wing.ASPECT_RATIO,
+                Aircraft.Wing.SPAN_EFFICIENCY_FACTOR,
+                Aircraft.Wing.SWEEP,
+                Aircraft.Wing.TAPER_RATIO])
+
+        self._add_table(
+            'CDI', 'PressureDrag.CD', 'InducedDrag.induced_drag_coeff',
+            (num_mach, num_cl), Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR)
+
+        for comp in ('PressureDrag', 'InducedDrag'):
+            self.connect('grid.lift_dependent_mach', f'{comp}.{Dynamic.Mission.MACH}')
+            self.connect('lift.lift', f'{comp}.{Dynamic.Mission.LIFT}')
+            self.connect('grid.static_pressure',
+                         f'{comp}.{Dynamic.Mission.STATIC_PRESSURE}')
+
+    def _add_table(self, name, source0, source1, shape, output):
+        """
+        Add the sum of two drag coefficients evaluated at the grid points, reshaped into
+        a table.
+        """
+        self.add_subsystem(name, _DragPolarTable(shape=shape),
+                           promotes_outputs=[('table', output)])
+
+        self.connect(source0, f'{name}.drag_coeff0')
+        self.connect(source1, f'{name}.drag_coeff1')
+
+
+class _DragPolarTable(om.ExplicitComponent):
+    """
+    Sum two drag coefficients evaluated at the flattened grid points of a table.
+    """
+
+    def initialize(self):
+        self.options.declare('shape', types=tuple)
+
+    def setup(self):
+        shape = self.options['shape']
+        n = int(np.prod(shape))
+
+        self.add_input('drag_coeff0', np.zeros(n), units='unitless')
+        self.add_input('drag_coeff1', np.zeros(n), units='unitless')
+
+        self.add_output('table', np.zeros(shape), units='unitless')
+
+    def setup_partials(self):
+        n = int(np.prod(self.options['shape']))
+        row_col = np.arange(n)
+
+        self.declare_partials('table', ['drag_coeff0', 'drag_coeff1'],
+                              rows=row_col, cols=row_col, val=1.0)
+
+    def compute(self, inputs, outputs):
+        outputs['table'] = (inputs['drag_coeff0'] + inputs['drag_coeff1']).reshape(
+            self.options['shape'])
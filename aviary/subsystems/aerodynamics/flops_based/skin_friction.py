@@ -1,3 +1,5 @@
+from collections import OrderedDict
+
 import numpy as np
 import openmdao.api as om
 
@@ -5,28 +7,30 @@ from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.variables import Aircraft, Dynamic
 
 
-class SkinFriction(om.ImplicitComponent):
+class SkinFriction(om.ExplicitComponent):
     """
     Computes skin friction coefficient using the Sommer and Short T Prime method as used
     in FLOPS AERSCL.
 
-    The fixed-point iteration scheme has been replaced with Newton's method, which can
-    converge the equations for multiple mach numbers and characteristic lengths
-    simultaneously.
+    The fixed-point iteration scheme has been replaced with Newton's method. Wall
+    temperature and skin friction coefficient are coupled only within each pair of
+    flight condition and characteristic length, so the 2x2 Newton systems of all of
+    them are solved together, elementwise, and derivatives are computed analytically by
+    applying the implicit function theorem to the converged solution.
+
+    The converged solution of each distinct flight condition is cached, so that nodes
+    that share a flight condition, or evaluations that revisit one, are solved only
+    once.
     """
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
         self.CONLOG = 2.302585
-        self.TAW = 1.0
         self.sea_level_pressure = 14.6959 * 144  # psi -> psf
 
-        self.nonlinear_solver = om.NewtonSolver(solve_subsystems=False,
-                                                atol=1e-12, rtol=1e-12)
-        self.linear_solver = om.DirectSolver()
-        self.nonlinear_solver.options['iprint'] = -1
-        self.linear_solver.options['iprint'] = -1
+        self._solution_cache = OrderedDict()
+        self._cache_lengths = None
 
     def initialize(self):
         """
@@ -38,6 +42,17 @@ class SkinFriction(om.ImplicitComponent):
         self.options.declare(
             'aviary_options', types=AviaryValues,
             desc='collection of Aircraft/Mission specific options')
+        self.options.declare(
+            'cache_size', types=int, default=1024,
+            desc='Maximum number of flight conditions (temperature, static pressure, '
+                 'Mach number) whose converged wall temperature and skin friction '
+                 'coefficient are kept for reuse, set to 0 to disable caching.')
+        self.options.declare(
+            'max_iter', types=int, default=50,
+            desc='Maximum number of Newton iterations.')
+        self.options.declare(
+            'tol', types=float, default=1e-13,
+            desc='Convergence tolerance on the relative size of the Newton step.')
 
     def setup(self):
         nn = self.options['num_nodes']
@@ -62,78 +77,194 @@ class SkinFriction(om.ImplicitComponent):
 
         self.add_output('cf_iter', np.ones((nn, nc)), units='unitless')
         self.add_output('skin_friction_coeff', np.ones((nn, nc)), units='unitless')
-        self.add_output('Re', np.ones((nn, nc)), units='unitless', res_ref=1e6)
+        self.add_output('Re', np.ones((nn, nc)), units='unitless')
         self.add_output('wall_temp', np.ones((nn, nc)), units='degR')
 
+        self.clear_cache()
+
     def setup_partials(self):
         nn = self.options["num_nodes"]
         nc = self.nc
         n = nn * nc
 
         row_col = np.arange(n)
-        self.declare_partials('Re', 'Re', rows=row_col, cols=row_col, val=1.0)
-        self.declare_partials(
-            'skin_friction_coeff', 'skin_friction_coeff',
-            rows=row_col, cols=row_col, val=1.0)
-
-        self.declare_partials(
-            'cf_iter', ['wall_temp', 'cf_iter'], rows=row_col, cols=row_col)
-        self.declare_partials(
-            'wall_temp', ['wall_temp', 'cf_iter'], rows=row_col, cols=row_col)
-        self.declare_partials(
-            'skin_friction_coeff', ['wall_temp', 'cf_iter'], rows=row_col, cols=row_col)
+        of = ['cf_iter', 'wall_temp', 'Re', 'skin_friction_coeff']
 
-        col = np.arange(nn)
-        cols = np.repeat(col, nc)
-        self.declare_partials(
-            'cf_iter', [Dynamic.Mission.TEMPERATURE, Dynamic.Mission.STATIC_PRESSURE, Dynamic.Mission.MACH], rows=row_col, cols=cols)
+        cols = np.repeat(np.arange(nn), nc)
         self.declare_partials(
-            'wall_temp', [Dynamic.Mission.TEMPERATURE, Dynamic.Mission.STATIC_PRESSURE, Dynamic.Mission.MACH], rows=row_col, cols=cols)
-        self.declare_partials(
-            'Re', [Dynamic.Mission.TEMPERATURE, Dynamic.Mission.STATIC_PRESSURE, Dynamic.Mission.MACH], rows=row_col, cols=cols)
-        self.declare_partials(
-            'skin_friction_coeff', [Dynamic.Mission.TEMPERATURE,
-                                    Dynamic.Mission.STATIC_PRESSURE, Dynamic.Mission.MACH],
+            of, [Dynamic.Mission.TEMPERATURE, Dynamic.Mission.STATIC_PRESSURE,
+                 Dynamic.Mission.MACH],
             rows=row_col, cols=cols)
 
-        col = np.arange(nc)
-        cols = np.tile(col, nn)
-        self.declare_partials('Re', 'characteristic_lengths', rows=row_col, cols=cols)
-        self.declare_partials(
-            'cf_iter', 'characteristic_lengths', rows=row_col, cols=cols)
+        cols = np.tile(np.arange(nc), nn)
+        self.declare_partials(of, 'characteristic_lengths', rows=row_col, cols=cols)
 
-    def guess_nonlinear(self, inputs, outputs, resids):
-        nn = self.options["num_nodes"]
-        nc = self.nc
+    def clear_cache(self):
+        """
+        Clear the cached solutions.
+        """
+        self._solution_cache.clear()
+        self._cache_lengths = None
 
-        rankine, pressure, mach, length = inputs.values()
+    def compute(self, inputs, outputs):
+        T, pressure, mach, length = inputs.values()
 
-        Pratio = pressure / self.sea_level_pressure
-        kelvin = rankine / 1.8
-        RE = 1.479301E9 * Pratio * (kelvin + 110.4) / kelvin ** 2
+        wall_temp, cf = self._solve(T, pressure, mach, length)
 
-        # REYNOLDS NUMBER
+        RE = self._reynolds_per_length(T, pressure)
+        wall_temp_ratio = self._wall_temp_ratio(T, mach, wall_temp)
+
+        outputs['Re'] = np.einsum('i,i,j->ij', RE, mach, length)
+        outputs['wall_temp'] = wall_temp
+        outputs['cf_iter'] = cf
+        outputs['skin_friction_coeff'] = cf / wall_temp_ratio
+
+    def compute_partials(self, inputs, partials):
+        T, pressure, mach, length = inputs.values()
+
+        wall_temp, cf = self._solve(T, pressure, mach, length)
+
+        _, jac, (dres, dRe, dwtr) = self._residual_partials(
+            T, pressure, mach, length, wall_temp, cf, wrt_inputs=True)
+
+        (dR1_dwt, dR1_dcf), (dR2_dwt, dR2_dcf) = jac
+        det = dR1_dwt * dR2_dcf - dR1_dcf * dR2_dwt
+
+        wall_temp_ratio = self._wall_temp_ratio(T, mach, wall_temp)
+        dskf_dwtr = -cf / wall_temp_ratio ** 2
+
+        for name, (dR1, dR2) in dres.items():
+            # implicit function theorem on the converged residuals
+            dwt = -(dR2_dcf * dR1 - dR1_dcf * dR2) / det
+            dcf = -(dR1_dwt * dR2 - dR2_dwt * dR1) / det
+
+            dskf = dcf / wall_temp_ratio + dskf_dwtr * (dwtr['wall_temp'] * dwt
+                                                        + dwtr[name])
+
+            partials['wall_temp', name] = dwt.ravel()
+            partials['cf_iter', name] = dcf.ravel()
+            partials['Re', name] = dRe[name].ravel()
+            partials['skin_friction_coeff', name] = dskf.ravel()
+
+    def _solve(self, T, pressure, mach, length):
+        """
+        Return the converged wall temperature and skin friction coefficient.
+
+        Nodes that share a flight condition are solved once, and solutions are reused
+        from the cache when possible. Complex inputs (complex step) always solve every
+        node.
+        """
+        cache_size = self.options['cache_size']
+
+        if any(np.iscomplexobj(val) for val in (T, pressure, mach, length)):
+            return self._newton(T, pressure, mach, length)
+
+        conditions = np.stack((T, pressure, mach), axis=-1)
+        unique, index = np.unique(conditions, axis=0, return_inverse=True)
+        index = index.ravel()
+
+        if not cache_size:
+            wall_temp, cf = self._newton(*unique.T, length)
+            return wall_temp[index], cf[index]
+
+        cache = self._solution_cache
+
+        # cached solutions are only valid for the current characteristic lengths
+        if (self._cache_lengths is None
+                or not np.array_equal(self._cache_lengths, length)):
+            cache.clear()
+            self._cache_lengths = length.copy()
+
+        keys = [tuple(condition) for condition in unique]
+        missing = [i for i, key in enumerate(keys) if key not in cache]
+
+        if missing:
+            wall_temp, cf = self._newton(*unique[missing].T, length)
+
+            for i, wall_temp_i, cf_i in zip(missing, wall_temp, cf):
+                cache[keys[i]] = (wall_temp_i, cf_i)
+
+        wall_temp = np.empty((unique.shape[0], self.nc))
+        cf = np.empty((unique.shape[0], self.nc))
+
+        for i, key in enumerate(keys):
+            wall_temp[i], cf[i] = cache[key]
+            cache.move_to_end(key)
+
+        while len(cache) > cache_size:
+            cache.popitem(last=False)
+
+        return wall_temp[index], cf[index]
+
+    def _newton(self, T, pressure, mach, length):
+        """
+        Converge the wall temperature and skin friction coefficient residuals with
+        Newton's method, elementwise over flight conditions and characteristic lengths.
+        """
+        RE = self._reynolds_per_length(T, pressure)
         reynolds_num = np.einsum('i,i,j->ij', RE, mach, length)
-        outputs['Re'] = reynolds_num
 
         # Initial guess for WALL TEMPERATURE
-        wall_temp = (1.0 + 0.176 * mach * mach) * rankine
-        wall_temp = np.tile(wall_temp, nc).reshape((nc, nn)).T
-        outputs['wall_temp'] = wall_temp
-        self.TAW = wall_temp
+        wall_temp = np.einsum('i,j->ij', (1.0 + 0.176 * mach * mach) * T,
+                              np.ones(length.size))
 
         # INITIAL GUESS AT SKIN FRICTION COEFFICIENT
-        outputs['cf_iter'] = (0.242 / (np.log(reynolds_num * 0.0015) / self.CONLOG)) ** 2
+        cf = (0.242 / (np.log(reynolds_num * 0.0015) / self.CONLOG)) ** 2
 
-    def apply_nonlinear(self, inputs, outputs, residuals):
-        T, pressure, mach, length = inputs.values()
-        cf = outputs['cf_iter']
-        wall_temp = outputs['wall_temp']
-        nc = self.nc
+        for _ in range(self.options['max_iter']):
+            (R1, R2), jac, _ = self._residual_partials(
+                T, pressure, mach, length, wall_temp, cf)
+
+            (dR1_dwt, dR1_dcf), (dR2_dwt, dR2_dcf) = jac
+            det = dR1_dwt * dR2_dcf - dR1_dcf * dR2_dwt
+
+            dwt = -(dR2_dcf * R1 - dR1_dcf * R2) / det
+            dcf = -(dR1_dwt * R2 - dR2_dwt * R1) / det
+
+            wall_temp = wall_temp + dwt
+            cf = cf + dcf
+
+            step = max(np.max(np.abs(dwt / wall_temp), initial=0.0),
+                       np.max(np.abs(dcf / cf), initial=0.0))
+
+            if step < self.options['tol']:
+                break
 
+        return wall_temp, cf
+
+    def _reynolds_per_length(self, T, pressure):
+        """
+        Return the Reynolds number per unit length per Mach number.
+        """
         Pratio = pressure / self.sea_level_pressure
         kelvin = T / 1.8
-        RE = 1.479301E9 * Pratio * (kelvin + 110.4) / kelvin ** 2
+
+        return 1.479301E9 * Pratio * (kelvin + 110.4) / kelvin ** 2
+
+    def _wall_temp_ratio(self, T, mach, wall_temp):
+        """
+        Return the wall temperature ratio.
+        """
+        return (1.0 + 0.45 * (np.einsum('ij,i->ij', wall_temp, 1.0 / T) - 1.0)
+                + (0.035 * mach * mach)[:, np.newaxis])
+
+    def _residual_partials(self, T, pressure, mach, length, wall_temp, cf,
+                           wrt_inputs=False):
+        """
+        Return the wall temperature and skin friction coefficient residuals and their
+        derivatives.
+
+        The residuals are those of the T Prime method, with the adiabatic wall
+        temperature given by a recovery factor of 0.88. If wrt_inputs is set, the
+        derivatives of the residuals, Reynolds number, and wall temperature ratio with
+        respect to the inputs are also returned, as dictionaries keyed on input name.
+        Otherwise, None is returned in their place.
+        """
+        nc = length.size
+
+        Pratio = pressure / self.sea_level_pressure
+        kelvin = T / 1.8
+        RE = self._reynolds_per_length(T, pressure)
 
         # SUTHERLAND'S CONSTANT IS 198.72 DEG R FROM 1962 ON
         suth_const = T + 198.72
@@ -142,138 +273,114 @@ class SkinFriction(om.ImplicitComponent):
         # COMBINED CONSTANT INCLUDING 1/RHO
         combined_const = 4.593153E-6 * E * suth_const / (RE * mach * T ** 1.5)
 
+        # ADIABATIC WALL TEMPERATURE
+        adiabatic_temp = (1.0 + 0.176 * mach * mach) * T
+
         # REYNOLDS NUMBER
         reynolds_num = np.einsum('i,i,j->ij', RE, mach, length)
-        residuals['Re'] = outputs['Re'] - reynolds_num
 
         # WALL TEMPERATURE RATIO
-        wall_temp_ratio = 1.0 + 0.45 * (np.einsum('ij,i->ij', wall_temp,  1.0 / T) - 1.0)
-        fact = 0.035 * mach * mach
-        for i in range(nc):
-            wall_temp_ratio[:, i] += fact
+        wall_temp_ratio = self._wall_temp_ratio(T, mach, wall_temp)
+        dwtr_dwt = np.einsum('i,j->ij', 0.45 / T, np.ones(nc))
 
-        CFL = cf / (1.0 + 3.59 * np.sqrt(cf) * wall_temp_ratio)
+        sqrt_cf = np.sqrt(cf)
+        den = 1.0 + 3.59 * sqrt_cf * wall_temp_ratio
+        CFL = cf / den
+        dCFL_dcf = 1.0 / den - cf * 3.59 * wall_temp_ratio * 0.5 / (sqrt_cf * den ** 2)
+        dCFL_dwtr = -cf * 3.59 * sqrt_cf / den ** 2
 
-        prod = np.einsum('j,jk->jk', combined_const, wall_temp ** 3)
-        residuals['wall_temp'] = (
-            self.TAW / (1.0 + prod / CFL) + wall_temp) * 0.5 - wall_temp
+        ratio = np.einsum('i,ij->ij', combined_const, wall_temp ** 3) / CFL
+        wall_temp_den = 1.0 + ratio
+        R1 = 0.5 * (np.einsum('i,ij->ij', adiabatic_temp, 1.0 / wall_temp_den)
+                    - wall_temp)
 
-        RP = (
-            reynolds_num * (np.einsum('ij,i->ij', wall_temp_ratio, T) + 198.72)
-            / np.einsum('i,ij->ij', suth_const, wall_temp_ratio ** 2.5))
+        dR1_dratio = -0.5 * np.einsum('i,ij->ij', adiabatic_temp,
+                                      1.0 / wall_temp_den ** 2)
+        dratio_dcomb = wall_temp ** 3 / CFL
+        dratio_dCFL = -ratio / CFL
+        dR1_dwtr = dR1_dratio * dratio_dCFL * dCFL_dwtr
 
-        residuals['cf_iter'] = (0.242 * self.CONLOG / np.log(RP * cf)) ** 2 - cf
+        dR1_dwt = dR1_dratio * 3.0 * ratio / wall_temp + dR1_dwtr * dwtr_dwt - 0.5
+        dR1_dcf = dR1_dratio * dratio_dCFL * dCFL_dcf
 
-        residuals['skin_friction_coeff'] = \
-            outputs['skin_friction_coeff'] - outputs['cf_iter'] / wall_temp_ratio
+        num = np.einsum('ij,i->ij', wall_temp_ratio, T) + 198.72
+        RP_den = np.einsum('i,ij->ij', suth_const, wall_temp_ratio ** 2.5)
+        RP = reynolds_num * num / RP_den
+        log_RP_cf = np.log(RP * cf)
 
-    def linearize(self, inputs, outputs, partials):
-        nn = self.options["num_nodes"]
-        nc = self.nc
+        fact = (0.242 * self.CONLOG) ** 2
+        R2 = fact / log_RP_cf ** 2 - cf
 
-        T, pressure, mach, length = inputs.values()
-        cf = outputs['cf_iter']
-        wall_temp = outputs['wall_temp']
+        dR2_dRP = -2.0 * fact / (RP * log_RP_cf ** 3)
+        dRP_dwtr = reynolds_num * (np.einsum('i,ij->ij', T, 1.0 / RP_den)
+                                   - 2.5 * num / (wall_temp_ratio * RP_den))
+        dR2_dwtr = dR2_dRP * dRP_dwtr
 
-        Pratio = pressure / self.sea_level_pressure
-        kelvin = T / 1.8
-        RE = 1.479301E9 * Pratio * (kelvin + 110.4) / kelvin ** 2
+        dR2_dwt = dR2_dwtr * dwtr_dwt
+        dR2_dcf = -2.0 * fact / (cf * log_RP_cf ** 3) - 1.0
 
-        dRE_dp = 1.479301E9 * (kelvin + 110.4) / (self.sea_level_pressure * kelvin ** 2)
-        dRE_dT = -1.479301E9 / 1.8 * (
-            Pratio * (1.0 / kelvin ** 2 + 2.0 * 110.4 / kelvin ** 3))
+        jac = ((dR1_dwt, dR1_dcf), (dR2_dwt, dR2_dcf))
 
-        reynolds_num = np.einsum('i,i,j->ij', RE, mach, length)
-        dreyn_dp = np.einsum('i,i,j->ij', dRE_dp, mach, length)
-        dreyn_dT = np.einsum('i,i,j->ij', dRE_dT, mach, length)
-        dreyn_dmach = np.einsum('i,j->ij', RE, length)
-        dreyn_dlen = np.tile(RE * mach, nc).reshape((nc, nn)).T
+        if not wrt_inputs:
+            return (R1, R2), jac, None
 
-        partials['Re', Dynamic.Mission.STATIC_PRESSURE] = -dreyn_dp.ravel()
-        partials['Re', Dynamic.Mission.TEMPERATURE] = -dreyn_dT.ravel()
-        partials['Re', Dynamic.Mission.MACH] = -dreyn_dmach.ravel()
-        partials['Re', 'characteristic_lengths'] = -dreyn_dlen.ravel()
+        ones = np.ones(nc)
 
-        suth_const = T + 198.72
-        E = 0.80
-        combined_const = 4.593153E-6 * E * suth_const / (RE * mach * T ** 1.5)
-        dcomb_dRE = -4.593153E-6 * E * suth_const / (RE * RE * mach * T ** 1.5)
-        dcomb_dmach = -4.593153E-6 * E * suth_const / (RE * mach * mach * T ** 1.5)
-        dcomb_dT = 4.593153E-6 * E * (1.0 / T ** 1.5 - 1.5 * suth_const / T ** 2.5) / (
-            RE * mach) + dcomb_dRE * dRE_dT
-        dcomb_dp = dcomb_dRE * dRE_dp
-
-        wall_temp_ratio = 1.0 + 0.45 * (np.einsum('ij,i->ij', wall_temp,  1.0 / T) - 1.0)
-        fact = 0.035 * mach * mach
-        for i in range(nc):
-            wall_temp_ratio[:, i] += fact
-        dwtr_dmach = 0.07 * mach
-        dwtr_dT = -0.45 * np.einsum('ij,i->ij', wall_temp, 1.0 / T ** 2)
-        dwtr_dwt = 0.45 / T
-
-        den = 1.0 + 3.59 * np.sqrt(cf) * wall_temp_ratio
-        CFL = cf / den
-        dCFL_dcf = \
-            1.0 / den - cf * 3.59 * wall_temp_ratio * 0.5 / (np.sqrt(cf) * den ** 2)
-        dCFL_dwtr = - cf * 3.59 * np.sqrt(cf) / den ** 2
-        dCFL_dmach = np.einsum('ij,i->ij', dCFL_dwtr, dwtr_dmach)
-        dCFL_dT = dCFL_dwtr * dwtr_dT
-        dCFL_dwt = np.einsum('ij,i->ij', dCFL_dwtr, dwtr_dwt)
-
-        term = np.einsum('i,ij->ij', combined_const, wall_temp ** 3)
-        den = 1.0 + term / CFL
-        dreswt_dcomb = -0.5 * self.TAW * wall_temp ** 3 / (CFL * den ** 2)
-        dreswt_dCFL = 0.5 * self.TAW * term / (CFL * den) ** 2
-        dreswt_dwt = (
-            -0.5 - 1.5 * self.TAW * np.einsum('i,ij->ij', combined_const, wall_temp ** 2)
-            / (CFL * den ** 2))
-
-        partials['wall_temp', Dynamic.Mission.STATIC_PRESSURE] = (
-            np.einsum('ij,i->ij', dreswt_dcomb, dcomb_dp)).ravel()
-        partials['wall_temp', Dynamic.Mission.TEMPERATURE] = (
-            np.einsum('ij,i->ij', dreswt_dcomb, dcomb_dT)
-            + dreswt_dCFL * dCFL_dT).ravel()
-        partials['wall_temp', Dynamic.Mission.MACH] = (
-            np.einsum('ij,i->ij', dreswt_dcomb, dcomb_dmach)
-            + dreswt_dCFL * dCFL_dmach).ravel()
-        partials['wall_temp', 'wall_temp'] = (
-            dreswt_dCFL * dCFL_dwt + dreswt_dwt).ravel()
-        partials['wall_temp', 'cf_iter'] = (dreswt_dCFL * dCFL_dcf).ravel()
-
-        den = 1.0 / np.einsum('i,ij->ij', suth_const, wall_temp_ratio ** 2.5)
-        num = np.einsum('ij,i->ij', wall_temp_ratio, T) + 198.72
-        RP = reynolds_num * num * den
-        dRP_dreyn = num * den
-        term = np.einsum('i,ij->ij', T, 1.0 * den)
-        dRP_dwtr = reynolds_num * (
-            term - num * 2.5
-            * np.einsum('i,ij->ij', suth_const, wall_temp_ratio ** 1.5) * den ** 2)
-        dRP_dT = reynolds_num * (
-            wall_temp_ratio * den - num * wall_temp_ratio ** 2.5 * den ** 2)
-        dRP_dp = dRP_dreyn * dreyn_dp
-        dRP_dT = dRP_dreyn * dreyn_dT + dRP_dwtr * dwtr_dT + dRP_dT
-        dRP_dmach = dRP_dreyn * dreyn_dmach + np.einsum('ij,i->ij', dRP_dwtr, dwtr_dmach)
-        dRP_dlen = dRP_dreyn * dreyn_dlen
-        dRP_dwt = np.einsum('ij,i->ij', dRP_dwtr, dwtr_dwt)
+        dRE_dp = 1.479301E9 * (kelvin + 110.4) / (self.sea_level_pressure * kelvin ** 2)
+        dRE_dT = -1.479301E9 / 1.8 * (
+            Pratio * (1.0 / kelvin ** 2 + 2.0 * 110.4 / kelvin ** 3))
 
-        fact = (0.242 * self.CONLOG) ** 2
-        drescf_dRP = -2.0 * fact / (RP * np.log(RP * cf) ** 3)
-        drescf_dcf = -2.0 * fact / (cf * np.log(RP * cf) ** 3) - 1.0
-
-        partials['cf_iter', Dynamic.Mission.STATIC_PRESSURE] = (
-            drescf_dRP * dRP_dp).ravel()
-        partials['cf_iter', Dynamic.Mission.TEMPERATURE] = (drescf_dRP * dRP_dT).ravel()
-        partials['cf_iter', Dynamic.Mission.MACH] = (drescf_dRP * dRP_dmach).ravel()
-        partials['cf_iter', 'characteristic_lengths'] = (drescf_dRP * dRP_dlen).ravel()
-        partials['cf_iter', 'wall_temp'] = (drescf_dRP * dRP_dwt).ravel()
-        partials['cf_iter', 'cf_iter'] = drescf_dcf.ravel()
-
-        dskf_dwtr = outputs['cf_iter'] / wall_temp_ratio ** 2
-
-        partials['skin_friction_coeff', Dynamic.Mission.TEMPERATURE] = (
-            dskf_dwtr * dwtr_dT).ravel()
-        partials['skin_friction_coeff', Dynamic.Mission.MACH] = np.einsum(
-            'ij,i->ij', dskf_dwtr, dwtr_dmach).ravel()
-        partials['skin_friction_coeff', 'wall_temp'] = np.einsum(
-            'ij,i->ij', dskf_dwtr, dwtr_dwt).ravel()
-        partials['skin_friction_coeff', 'cf_iter'] = (- 1.0 / wall_temp_ratio).ravel()
+        dRe = {
+            Dynamic.Mission.TEMPERATURE: np.einsum('i,i,j->ij', dRE_dT, mach, length),
+            Dynamic.Mission.STATIC_PRESSURE:
+                np.einsum('i,i,j->ij', dRE_dp, mach, length),
+            Dynamic.Mission.MACH: np.einsum('i,j->ij', RE, length),
+            'characteristic_lengths': np.einsum('i,j->ij', RE * mach, ones),
+        }
+
+        dcomb_dRE = -combined_const / RE
+        dcomb = {
+            Dynamic.Mission.TEMPERATURE:
+                4.593153E-6 * E * (1.0 / T ** 1.5 - 1.5 * suth_const / T ** 2.5)
+                / (RE * mach) + dcomb_dRE * dRE_dT,
+            Dynamic.Mission.STATIC_PRESSURE: dcomb_dRE * dRE_dp,
+            Dynamic.Mission.MACH: -combined_const / mach,
+            'characteristic_lengths': np.zeros_like(T),
+        }
+
+        dadiabatic = {
+            Dynamic.Mission.TEMPERATURE: 1.0 + 0.176 * mach * mach,
+            Dynamic.Mission.STATIC_PRESSURE: np.zeros_like(T),
+            Dynamic.Mission.MACH: 0.352 * mach * T,
+            'characteristic_lengths': np.zeros_like(T),
+        }
+
+        zeros = np.zeros_like(wall_temp)
+        dwtr = {
+            'wall_temp': dwtr_dwt,
+            Dynamic.Mission.TEMPERATURE: -0.45 * np.einsum('ij,i->ij', wall_temp,
+                                                           1.0 / T ** 2),
+            Dynamic.Mission.STATIC_PRESSURE: zeros,
+            Dynamic.Mission.MACH: np.einsum('i,j->ij', 0.07 * mach, ones),
+            'characteristic_lengths': zeros,
+        }
+
+        # derivative of RP with respect to temperature, other than through Reynolds
+        # number and the wall temperature ratio
+        dRP_dT = reynolds_num * (wall_temp_ratio / RP_den
+                                 - num / np.einsum('i,ij->ij', suth_const, RP_den))
+
+        dres = {}
+        for name in dRe:
+            dR1 = (np.einsum('i,ij->ij', dadiabatic[name], 0.5 / wall_temp_den)
+                   + np.einsum('ij,i->ij', dR1_dratio * dratio_dcomb, dcomb[name])
+                   + dR1_dwtr * dwtr[name])
+
+            dRP = RP / reynolds_num * dRe[name] + dRP_dwtr * dwtr[name]
+
+            if name == Dynamic.Mission.TEMPERATURE:
+                dRP = dRP + dRP_dT
+
+            dres[name] = (dR1, dR2_dRP * dRP)
+
+        return (R1, R2), jac, (dres, dRe, dwtr)
@@ -2,7 +2,7 @@ import unittest
 
 import numpy as np
 import openmdao.api as om
-from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.assert_utils import assert_check_totals, assert_near_equal
 
 from aviary.subsystems.premission import CorePreMission
 from aviary.subsystems.propulsion.utils import build_engine_deck
@@ -352,5 +352,87 @@ class MissionDragTest(unittest.TestCase):
         assert_near_equal(CD[:134], data[:134], .005)
 
 
+class DragPolarTablesTest(unittest.TestCase):
+    """
+    Test that interpolating drag from the drag polar tables computed in pre-mission
+    matches computing drag at every node, and that its derivatives w.r.t. geometry are
+    correct.
+    """
+
+    def _run_drag(self, use_tables):
+        flops_inputs = get_flops_inputs('LargeSingleAisle1FLOPS')
+        flops_outputs = get_flops_outputs('LargeSingleAisle1FLOPS')
+
+        key = Aircraft.Propulsion.TOTAL_SCALED_SLS_THRUST
+        flops_inputs.set_val(key, *(flops_outputs.get_item(key)))
+        flops_inputs.set_val(Settings.VERBOSITY, 0)
+        flops_inputs.set_val(Aircraft.Design.USE_DRAG_POLAR_TABLES, use_tables)
+
+        engine = build_engine_deck(flops_inputs)
+        preprocess_options(flops_inputs, engine_models=engine)
+
+        # don't need mass subsystem, so we skip it
+        default_premission_subsystems = get_default_premission_subsystems(
+            'FLOPS', engine)[:-1]
+        aero = default_premission_subsystems[-1]
+
+        mach = np.repeat([0.3, 0.5, 0.7, 0.75, 0.79, 0.82], 5)
+        CL = np.tile([0.2, 0.35, 0.5, 0.6, 0.7], 6)
+        P = 374.74437747  # 41000 ft
+        nn = len(mach)
+
+        prob = om.Problem(reports=False)
+        model = prob.model
+
+        model.add_subsystem(
+            'pre_mission',
+            CorePreMission(
+                aviary_options=flops_inputs, subsystems=default_premission_subsystems
+            ),
+            promotes_inputs=['aircraft:*'],
+            promotes_outputs=['aircraft:*', 'mission:*'],
+        )
+
+        model.add_subsystem(
+            'aero', aero.build_mission(num_nodes=nn,
+                                       aviary_inputs=flops_inputs,
+                                       **{'method': 'computed'}),
+            promotes=['*']
+        )
+
+        prob.setup(force_alloc_complex=True)
+
+        prob.set_val(Dynamic.Mission.MACH, val=mach)
+        prob.set_val(Dynamic.Mission.STATIC_PRESSURE, val=P, units='lbf/ft**2')
+        prob.set_val(Dynamic.Mission.MASS, val=CL * 1370.0 * 0.7 * P * mach ** 2,
+                     units='lbm')
+
+        if use_tables:
+            prob.set_val(Dynamic.Mission.ALTITUDE, val=41000.0, units='ft')
+        else:
+            prob.set_val(Dynamic.Mission.TEMPERATURE, val=389.97, units='degR')
+
+        set_aviary_initial_values(prob, flops_inputs)
+
+        prob.run_model()
+
+        return prob
+
+    def test_large_single_aisle_1(self):
+        expected = self._run_drag(False).get_val(Dynamic.Mission.DRAG, 'lbf')
+
+        prob = self._run_drag(True)
+
+        assert_near_equal(prob.get_val(Dynamic.Mission.DRAG, 'lbf'), expected, .01)
+
+        data = prob.check_totals(
+            of=[Dynamic.Mission.DRAG],
+            wrt=[Aircraft.Wing.AREA, Aircraft.Wing.ASPECT_RATIO, Aircraft.Wing.SWEEP,
+                 Aircraft.Fuselage.WETTED_AREA],
+            method='cs', out_stream=None)
+
+        assert_check_totals(data, atol=1e-6, rtol=1e-8)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -267,6 +267,65 @@ class SkinFrictionCoeffTest(unittest.TestCase):
         assert_near_equal(
             prob.get_val('wall_temp'), expected_wall_temp, 1e-6)
 
+    def test_cache(self):
+        # Nodes with repeated flight conditions give the same results, whether or not
+        # converged solutions are cached.
+        n = 8
+        nc = 3
+
+        machs = np.array([.5, .785, .785, .785, .6, .785, .5, .785])
+        temp = np.array([500.0, 390.0, 390.0, 390.0, 420.0, 390.0, 500.0, 390.0])
+        pres = np.array([1500.0, 470.0, 470.0, 470.0, 900.0, 470.0, 1500.0, 470.0])
+        lens = np.linspace(1, 2, nc)
+
+        options = {}
+        options[Aircraft.VerticalTail.NUM_TAILS] = (0, 'unitless')
+        options[Aircraft.Fuselage.NUM_FUSELAGES] = (1, 'unitless')
+        options[Aircraft.Engine.NUM_ENGINES] = ([0], 'unitless')
+
+        results = []
+
+        for cache_size in (0, 2, 1024):
+            prob = om.Problem()
+            comp = SkinFriction(num_nodes=n, aviary_options=AviaryValues(options),
+                                cache_size=cache_size)
+            prob.model.add_subsystem('cf', comp, promotes=['*'])
+
+            prob.setup(force_alloc_complex=True)
+
+            prob.set_val('temperature', temp)
+            prob.set_val('static_pressure', pres)
+            prob.set_val('mach', machs)
+            prob.set_val('characteristic_lengths', lens)
+
+            prob.run_model()
+
+            self.assertEqual(len(comp._solution_cache), min(cache_size, 3))
+
+            # reuse cached solutions
+            prob.run_model()
+
+            results.append(prob.get_val('skin_friction_coeff').copy())
+
+            derivs = prob.check_partials(method='cs', out_stream=None)
+            assert_check_partials(derivs, atol=1e-08, rtol=1e-12)
+
+            # changing the characteristic lengths invalidates the cache
+            prob.set_val('characteristic_lengths', 2.0 * lens)
+            prob.run_model()
+
+            longer = prob.get_val('skin_friction_coeff').copy()
+            prob.set_val('characteristic_lengths', lens)
+            prob.run_model()
+
+            self.assertTrue(np.all(longer < results[-1]))
+            assert_near_equal(prob.get_val('skin_friction_coeff'), results[-1], 1e-14)
+
+        for cf in results:
+            assert_near_equal(cf, results[0], 1e-14)
+            assert_near_equal(cf[1:4], np.tile(cf[1], (3, 1)), 1e-14)
+            assert_near_equal(cf[6], cf[0], 1e-14)
+
     def test_skin_friction_algorithm(self):
         # Test vs aviary1 algorithm output.
         n = 12
@@ -1,3 +1,4 @@
+import numpy as np
 import openmdao.api as om
 
 from aviary.variable_info.functions import add_aviary_input
@@ -162,9 +163,6 @@ class CLmaxCalculation(om.ExplicitComponent):
                 "VLAM14",
                 "fus_lift",
             ],
-            dependent=True,
-            method="cs",
-            step=1e-8,
         )
         self.declare_partials(
             Dynamic.Mission.MACH,
@@ -190,9 +188,6 @@ class CLmaxCalculation(om.ExplicitComponent):
                 "VLAM14",
                 "fus_lift",
             ],
-            dependent=True,
-            method="cs",
-            step=1e-8,
         )
         self.declare_partials(
             "reynolds",
@@ -221,9 +216,6 @@ class CLmaxCalculation(om.ExplicitComponent):
                 "VLAM14",
                 "fus_lift",
             ],
-            dependent=True,
-            method="cs",
-            step=1e-8,
         )
 
     def compute(self, inputs, outputs):
@@ -267,3 +259,73 @@ class CLmaxCalculation(om.ExplicitComponent):
 
         VK = mach * sos
         outputs["reynolds"] = reynolds = (avg_chord * VK / kinematic_viscosity) / 100000
+
+    def compute_partials(self, inputs, J):
+
+        VLAM = {f"VLAM{idx}": inputs[f"VLAM{idx}"] for idx in range(1, 15)}
+
+        sos = inputs[Dynamic.Mission.SPEED_OF_SOUND]
+        wing_loading = inputs[Aircraft.Wing.LOADING]
+        P = inputs[Dynamic.Mission.STATIC_PRESSURE]
+        avg_chord = inputs[Aircraft.Wing.AVERAGE_CHORD]
+        kinematic_viscosity = inputs[Dynamic.Mission.KINEMATIC_VISCOSITY]
+        max_lift_reference = inputs[Aircraft.Wing.MAX_LIFT_REF]
+        leading_lift_increment = inputs[Aircraft.Wing.SLAT_LIFT_INCREMENT_OPTIMUM]
+        fus_lift = inputs["fus_lift"]
+        trailing_lift_increment = inputs[Aircraft.Wing.FLAP_LIFT_INCREMENT_OPTIMUM]
+
+        # the wing maximum lift is a sum of products of these terms
+        clean_terms = [max_lift_reference, VLAM["VLAM1"], VLAM["VLAM2"]]
+        flap_terms = [trailing_lift_increment] + \
+            [VLAM[f"VLAM{idx}"] for idx in range(3, 9)]
+        slat_terms = [leading_lift_increment] + \
+            [VLAM[f"VLAM{idx}"] for idx in range(9, 13)]
+        names = [
+            Aircraft.Wing.MAX_LIFT_REF, "VLAM1", "VLAM2",
+            Aircraft.Wing.FLAP_LIFT_INCREMENT_OPTIMUM,
+            "VLAM3", "VLAM4", "VLAM5", "VLAM6", "VLAM7", "VLAM8",
+            Aircraft.Wing.SLAT_LIFT_INCREMENT_OPTIMUM,
+            "VLAM9", "VLAM10", "VLAM11", "VLAM12",
+        ]
+
+        wing_lift = (
+            np.prod(clean_terms, axis=0)
+            + np.prod(flap_terms, axis=0)
+            + np.prod(slat_terms, axis=0)
+        )
+        factor = VLAM["VLAM13"] * VLAM["VLAM14"]
+        CL_max = wing_lift * factor + fus_lift
+
+        dCL_max = {}
+        for terms in (clean_terms, flap_terms, slat_terms):
+            for idx in range(len(terms)):
+                others = terms[:idx] + terms[idx + 1:]
+                dCL_max[names[len(dCL_max)]] = np.prod(others, axis=0) * factor
+        dCL_max["VLAM13"] = wing_lift * VLAM["VLAM14"]
+        dCL_max["VLAM14"] = wing_lift * VLAM["VLAM13"]
+        dCL_max["fus_lift"] = 1.0
+
+        mach = (wing_loading / CL_max / 0.7 / P) ** 0.5
+        dmach_dCL_max = -0.5 * mach / CL_max
+        reynolds = (avg_chord * mach * sos / kinematic_viscosity) / 100000
+        dreynolds_dmach = reynolds / mach
+
+        for name, dCL_max_dname in dCL_max.items():
+            J["CL_max", name] = dCL_max_dname
+            J[Dynamic.Mission.MACH, name] = dmach_dCL_max * dCL_max_dname
+            J["reynolds", name] = dreynolds_dmach * dmach_dCL_max * dCL_max_dname
+
+        dmach = {
+            Aircraft.Wing.LOADING: 0.5 * mach / wing_loading,
+            Dynamic.Mission.STATIC_PRESSURE: -0.5 * mach / P,
+        }
+        for name, dmach_dname in dmach.items():
+            J[Dynamic.Mission.MACH, name] = dmach_dname
+            J["reynolds", name] = dreynolds_dmach * dmach_dname
+
+        J["reynolds", Dynamic.Mission.KINEMATIC_VISCOSITY] = \
+            -reynolds / kinematic_viscosity
+        J["reynolds", Dynamic.Mission.SPEED_OF_SOUND] = \
+            avg_chord * mach / kinematic_viscosity / 100000
+        J["reynolds", Aircraft.Wing.AVERAGE_CHORD] = \
+            mach * sos / kinematic_viscosity / 100000
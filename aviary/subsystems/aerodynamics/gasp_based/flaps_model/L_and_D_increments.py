@@ -1,3 +1,4 @@
+import numpy as np
 import openmdao.api as om
 
 from aviary.variable_info.functions import add_aviary_input
@@ -101,9 +102,6 @@ class LiftAndDragIncrements(om.ExplicitComponent):
             "delta_CD",
             [Aircraft.Wing.FLAP_DRAG_INCREMENT_OPTIMUM,
                 "VDEL1", "VDEL2", "VDEL3", "VDEL4", "VDEL5"],
-            dependent=True,
-            method="cs",
-            step=1e-8,
         )
         self.declare_partials(
             "delta_CL",
@@ -118,9 +116,6 @@ class LiftAndDragIncrements(om.ExplicitComponent):
                 "VLAM13",
                 "VLAM14",
             ],
-            dependent=True,
-            method="cs",
-            step=1e-8,
         )
 
     def compute(self, inputs, outputs):
@@ -155,3 +150,21 @@ class LiftAndDragIncrements(om.ExplicitComponent):
             * VLAM13
             * VLAM14
         )
+
+    def compute_partials(self, inputs, J):
+
+        drag_factors = [
+            Aircraft.Wing.FLAP_DRAG_INCREMENT_OPTIMUM,
+            "VDEL1", "VDEL2", "VDEL3", "VDEL4", "VDEL5",
+        ]
+        lift_factors = [
+            Aircraft.Wing.FLAP_LIFT_INCREMENT_OPTIMUM,
+            "VLAM3", "VLAM4", "VLAM5", "VLAM6", "VLAM7", "VLAM8", "VLAM13", "VLAM14",
+        ]
+
+        # each increment is a product, so its partial with respect to one factor is the
+        # product of all of the others
+        for output, factors in (("delta_CD", drag_factors), ("delta_CL", lift_factors)):
+            for name in factors:
+                J[output, name] = np.prod(
+                    [inputs[other] for other in factors if other != name], axis=0)
@@ -203,18 +203,16 @@ class WingTailRatios(om.ExplicitComponent):
                 Aircraft.Wing.SPAN,
                 Aircraft.Wing.TAPER_RATIO,
             ],
-            method="cs",
         )
         self.declare_partials(
-            "bbar", [Aircraft.HorizontalTail.SPAN, Aircraft.Wing.SPAN], method="cs"
+            "bbar", [Aircraft.HorizontalTail.SPAN, Aircraft.Wing.SPAN]
         )
         self.declare_partials(
-            "sbar", [Aircraft.HorizontalTail.AREA, Aircraft.Wing.AREA], method="cs"
+            "sbar", [Aircraft.HorizontalTail.AREA, Aircraft.Wing.AREA]
         )
         self.declare_partials(
             "cbar",
             [Aircraft.HorizontalTail.AVERAGE_CHORD, Aircraft.Wing.AVERAGE_CHORD],
-            method="cs",
         )
 
     def compute(self, inputs, outputs):
@@ -242,6 +240,52 @@ class WingTailRatios(om.ExplicitComponent):
         outputs["sbar"] = htail_area / wing_area
         outputs["cbar"] = htail_chord / avg_chord
 
+    def compute_partials(self, inputs, J):
+        (
+            wing_area,
+            wingspan,
+            avg_chord,
+            taper_ratio,
+            tc_ratio_root,
+            wing_loc,
+            htail_loc,
+            span_htail,
+            span_vtail,
+            htail_area,
+            htail_chord,
+            cabin_width,
+        ) = inputs.values()
+
+        trtw = tc_ratio_root * 2 * wing_area / wingspan / (1 + taper_ratio)
+        hgap_signed = (
+            htail_loc * span_vtail - 0.5 * (cabin_width - trtw) * (2 * wing_loc - 1)
+        )
+        hgap = cs.abs(hgap_signed)
+        # derivative of abs(hgap_signed), divided by the wingspan
+        dhbar_dhgap = np.sign(hgap_signed) / wingspan
+        dhgap_dtrtw = 0.5 * (2 * wing_loc - 1)
+
+        J["hbar", Aircraft.HorizontalTail.VERTICAL_TAIL_FRACTION] = \
+            dhbar_dhgap * span_vtail
+        J["hbar", Aircraft.VerticalTail.SPAN] = dhbar_dhgap * htail_loc
+        J["hbar", Aircraft.Fuselage.AVG_DIAMETER] = -dhbar_dhgap * dhgap_dtrtw
+        J["hbar", Aircraft.Wing.MOUNTING_TYPE] = -dhbar_dhgap * (cabin_width - trtw)
+        J["hbar", Aircraft.Wing.THICKNESS_TO_CHORD_ROOT] = \
+            dhbar_dhgap * dhgap_dtrtw * trtw / tc_ratio_root
+        J["hbar", Aircraft.Wing.AREA] = dhbar_dhgap * dhgap_dtrtw * trtw / wing_area
+        J["hbar", Aircraft.Wing.SPAN] = (
+            -dhbar_dhgap * dhgap_dtrtw * trtw / wingspan - hgap / wingspan**2
+        )
+        J["hbar", Aircraft.Wing.TAPER_RATIO] = \
+            -dhbar_dhgap * dhgap_dtrtw * trtw / (1 + taper_ratio)
+
+        J["bbar", Aircraft.HorizontalTail.SPAN] = 1 / wingspan
+        J["bbar", Aircraft.Wing.SPAN] = -span_htail / wingspan**2
+        J["sbar", Aircraft.HorizontalTail.AREA] = 1 / wing_area
+        J["sbar", Aircraft.Wing.AREA] = -htail_area / wing_area**2
+        J["cbar", Aircraft.HorizontalTail.AVERAGE_CHORD] = 1 / avg_chord
+        J["cbar", Aircraft.Wing.AVERAGE_CHORD] = -htail_chord / avg_chord**2
+
 
 class Xlifts(om.ExplicitComponent):
     """Compute lift ratio and lift-curve slope for given stability margin"""
@@ -289,29 +333,10 @@ class Xlifts(om.ExplicitComponent):
         self.add_output("lift_ratio", units="unitless", shape=nn, desc="Lift ratio")
 
     def setup_partials(self):
-        ar = np.arange(self.options["num_nodes"])
-
-        self.declare_partials("lift_ratio", "*", method="cs")
-        self.declare_partials("lift_ratio", Dynamic.Mission.MACH,
-                              rows=ar, cols=ar, method="cs")
-        self.declare_partials("lift_curve_slope", "*", method="cs")
-        self.declare_partials(
-            "lift_curve_slope",
-            [
-                Aircraft.Wing.ASPECT_RATIO,
-                Aircraft.Wing.SWEEP,
-                Aircraft.HorizontalTail.VERTICAL_TAIL_FRACTION,
-                Aircraft.HorizontalTail.SWEEP,
-                Aircraft.HorizontalTail.MOMENT_RATIO,
-                "sbar",
-                "cbar",
-                "hbar",
-                "bbar",
-            ],
-            method="cs",
-        )
-        self.declare_partials("lift_curve_slope", Dynamic.Mission.MACH,
-                              rows=ar, cols=ar, method="cs")
+        # Only Mach number varies between nodes, so coloring lets the complex step of
+        # its diagonal blocks be done in one evaluation instead of one per node
+        self.declare_partials("*", "*", method="cs")
+        self.declare_coloring(method="cs", show_summary=False)
 
     def compute(self, inputs, outputs):
         (
@@ -488,100 +513,11 @@ class AeroGeom(om.ExplicitComponent):
         )
 
     def setup_partials(self):
-        # self.declare_coloring(method="cs", show_summary=False)
-        self.declare_partials("*", "*", dependent=False)
-        ar = np.arange(self.options["num_nodes"])
-
-        self.declare_partials(
-            "SA1",
-            [
-                Aircraft.Wing.MIN_PRESSURE_LOCATION,
-                Aircraft.Wing.MAX_THICKNESS_LOCATION,
-                Aircraft.Wing.ASPECT_RATIO,
-                Aircraft.Wing.SWEEP,
-                Aircraft.Wing.TAPER_RATIO,
-                Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
-            ],
-            method="cs",
-        )
-        self.declare_partials(
-            "SA2",
-            [
-                Aircraft.Wing.MIN_PRESSURE_LOCATION,
-                Aircraft.Wing.MAX_THICKNESS_LOCATION,
-                Aircraft.Wing.ASPECT_RATIO,
-                Aircraft.Wing.SWEEP,
-                Aircraft.Wing.TAPER_RATIO,
-            ],
-            method="cs",
-        )
-        self.declare_partials(
-            "SA3",
-            [
-                Aircraft.Wing.ASPECT_RATIO,
-                Aircraft.Wing.SWEEP,
-                Aircraft.Wing.TAPER_RATIO,
-                Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED,
-            ],
-            method="cs",
-        )
-        self.declare_partials(
-            "SA4", [Aircraft.Wing.THICKNESS_TO_CHORD_UNWEIGHTED], method="cs"
-        )
-        self.declare_partials("cf", [Dynamic.Mission.MACH],
-                              rows=ar, cols=ar, method="cs")
-
-        # diag partials for SA5-SA7
-        self.declare_partials(
-            "SA5", [Dynamic.Mission.MACH, Dynamic.Mission.SPEED_OF_SOUND,
-                    Dynamic.Mission.KINEMATIC_VISCOSITY], rows=ar, cols=ar, method="cs"
-        )
-        self.declare_partials(
-            "SA6", [Dynamic.Mission.MACH, Dynamic.Mission.SPEED_OF_SOUND,
-                    Dynamic.Mission.KINEMATIC_VISCOSITY], rows=ar, cols=ar, method="cs"
-        )
-        self.declare_partials(
-            "SA7", [Dynamic.Mission.MACH, Dynamic.Mission.SPEED_OF_SOUND,
-                    Dynamic.Mission.KINEMATIC_VISCOSITY, "ufac"], rows=ar, cols=ar, method="cs"
-        )
-
-        # dense partials for SA5-SA7
-        most_params = [
-            Aircraft.Wing.FORM_FACTOR,
-            Aircraft.Fuselage.FORM_FACTOR,
-            Aircraft.Nacelle.FORM_FACTOR,
-            Aircraft.VerticalTail.FORM_FACTOR,
-            Aircraft.HorizontalTail.FORM_FACTOR,
-            Aircraft.Wing.FUSELAGE_INTERFERENCE_FACTOR,
-            Aircraft.Strut.FUSELAGE_INTERFERENCE_FACTOR,
-            Aircraft.Design.DRAG_COEFFICIENT_INCREMENT,
-            Aircraft.Fuselage.FLAT_PLATE_AREA_INCREMENT,
-            Aircraft.Wing.TAPER_RATIO,
-            Aircraft.Strut.AREA_RATIO,
-            Aircraft.Wing.SPAN,
-            Aircraft.Wing.AVERAGE_CHORD,
-            Aircraft.HorizontalTail.AVERAGE_CHORD,
-            Aircraft.VerticalTail.AVERAGE_CHORD,
-            Aircraft.Fuselage.LENGTH,
-            Aircraft.Nacelle.AVG_LENGTH,
-            Aircraft.HorizontalTail.AREA,
-            Aircraft.Fuselage.WETTED_AREA,
-            Aircraft.Nacelle.SURFACE_AREA,
-            Aircraft.Wing.AREA,
-            Aircraft.Fuselage.AVG_DIAMETER,
-            Aircraft.VerticalTail.AREA,
-            'interference_independent_of_shielded_area',
-            'drag_loss_due_to_shielded_wing_area',
-        ]
-        self.declare_partials("SA5", most_params, method="cs")
-        self.declare_partials(
-            "SA6", [Aircraft.Wing.FORM_FACTOR, Aircraft.Wing.AVERAGE_CHORD], method="cs"
-        )
-        self.declare_partials(
-            "SA7",
-            most_params + [Aircraft.Wing.ASPECT_RATIO, Aircraft.Wing.SWEEP],
-            method="cs",
-        )
+        # The flight conditions only affect the outputs at their own node, so coloring
+        # lets the complex step of their diagonal blocks be done in one evaluation per
+        # input instead of one per node
+        self.declare_partials("*", "*", method="cs")
+        self.declare_coloring(method="cs", show_summary=False)
 
     def compute(self, inputs, outputs):
         (
@@ -891,28 +827,34 @@ class DragCoef(om.ExplicitComponent):
             shape=nn, desc="CD increment with landing gear down")
 
     def setup_partials(self):
-        # self.declare_coloring(method="cs", show_summary=False)
-        self.declare_partials("*", "*", dependent=False)
         ar = np.arange(self.options["num_nodes"])
 
-        self.declare_partials("CD_base", ["*"], method="cs")
+        self.declare_partials(
+            "CD_base",
+            [
+                "flap_defl",
+                Aircraft.Wing.HEIGHT,
+                "airport_alt",
+                Aircraft.Wing.FLAP_CHORD_RATIO,
+                "dCL_flaps_model",
+                "dCL_flaps_coef",
+                "CDI_factor",
+                Aircraft.Wing.AVERAGE_CHORD,
+                Aircraft.Wing.SPAN,
+            ],
+        )
         self.declare_partials(
             "CD_base",
             [Dynamic.Mission.ALTITUDE, "CL", "cf", "SA5", "SA6", "SA7"],
             rows=ar,
             cols=ar,
-            method="cs",
         )
-        # self.declare_partials(
-        #     "CD_base", [Mission.Design.GROSS_MASS, "dCD_flaps_model", "wing_area"], val=0
-        # )
 
         self.declare_partials("dCD_flaps_full", ["dCD_flaps_model"], val=1)
 
         self.declare_partials(
             "dCD_gear_full",
             [Mission.Design.GROSS_MASS, Aircraft.Wing.AREA, "flap_defl"],
-            method="cs",
         )
 
     def compute(self, inputs, outputs):
@@ -960,6 +902,87 @@ class DragCoef(om.ExplicitComponent):
         outputs["dCD_flaps_full"] = dCD_flaps_model
         outputs["dCD_gear_full"] = dcd_gear
 
+    def compute_partials(self, inputs, J):
+        (
+            alt,
+            CL,
+            gross_mass_initial,
+            flap_defl,
+            wing_height,
+            airport_alt,
+            flap_chord_ratio,
+            dCL_flaps_model,
+            dCD_flaps_model,
+            dCL_flaps_coef,
+            CDI_factor,
+            avg_chord,
+            wingspan,
+            wing_area,
+            cf,
+            SA5,
+            SA6,
+            SA7,
+        ) = inputs.values()
+        gross_wt_initial = gross_mass_initial * GRAV_ENGLISH_LBM
+
+        CL_wing = CL - dCL_flaps_coef * dCL_flaps_model
+        cdi = SA7 * CL_wing**2 / CDI_factor
+        dcdi_dCL_wing = 2 * SA7 * CL_wing / CDI_factor
+
+        hac = wing_height + alt - airport_alt
+        flap_sin = np.sin(deg2rad(flap_defl))
+        heff = 2 * hac - flap_sin * flap_chord_ratio * avg_chord
+        h_ratio = heff / wingspan
+        sig = np.exp(-2.48 * h_ratio**0.768)
+        betag = np.sqrt(1 + h_ratio**2) - h_ratio
+        c1 = betag * CL / (12.5664 * hac)
+
+        # partials of CD_base with respect to the intermediate terms
+        dCD_dcdi = 1 - (sig - c1) / (1.0 - c1)
+        dCD_dsig = -cdi / (1.0 - c1)
+        dCD_dc1 = -cdi * (sig - 1) / (1.0 - c1) ** 2 - SA6 * cf
+
+        dsig_dh_ratio = -2.48 * 0.768 * h_ratio**-0.232 * sig
+        dbetag_dh_ratio = h_ratio / np.sqrt(1 + h_ratio**2) - 1
+        dCD_dh_ratio = (
+            dCD_dsig * dsig_dh_ratio
+            + dCD_dc1 * CL / (12.5664 * hac) * dbetag_dh_ratio
+        )
+        dCD_dheff = dCD_dh_ratio / wingspan
+        dCD_dhac = 2 * dCD_dheff - dCD_dc1 * c1 / hac
+
+        J["CD_base", Dynamic.Mission.ALTITUDE] = dCD_dhac
+        J["CD_base", "CL"] = (
+            dCD_dcdi * dcdi_dCL_wing + dCD_dc1 * betag / (12.5664 * hac)
+        )
+        J["CD_base", "cf"] = SA6 * (1 - c1)
+        J["CD_base", "SA5"] = 1.0
+        J["CD_base", "SA6"] = cf * (1 - c1)
+        J["CD_base", "SA7"] = dCD_dcdi * CL_wing**2 / CDI_factor
+
+        J["CD_base", "flap_defl"] = (
+            -dCD_dheff * np.cos(deg2rad(flap_defl)) * np.pi / 180.0
+            * flap_chord_ratio * avg_chord
+        )
+        J["CD_base", Aircraft.Wing.HEIGHT] = dCD_dhac
+        J["CD_base", "airport_alt"] = -dCD_dhac
+        J["CD_base", Aircraft.Wing.FLAP_CHORD_RATIO] = -dCD_dheff * flap_sin * avg_chord
+        J["CD_base", "dCL_flaps_model"] = -dCD_dcdi * dcdi_dCL_wing * dCL_flaps_coef
+        J["CD_base", "dCL_flaps_coef"] = -dCD_dcdi * dcdi_dCL_wing * dCL_flaps_model
+        J["CD_base", "CDI_factor"] = -dCD_dcdi * cdi / CDI_factor
+        J["CD_base", Aircraft.Wing.AVERAGE_CHORD] = \
+            -dCD_dheff * flap_sin * flap_chord_ratio
+        J["CD_base", Aircraft.Wing.SPAN] = -dCD_dh_ratio * h_ratio / wingspan
+
+        grfe = 0.0033 * gross_wt_initial**0.785
+        flap_factor = 1 - 0.454545 * flap_defl / 50
+
+        J["dCD_gear_full", Mission.Design.GROSS_MASS] = (
+            0.785 * grfe / gross_mass_initial / wing_area * flap_factor
+        )
+        J["dCD_gear_full", Aircraft.Wing.AREA] = -grfe / wing_area**2 * flap_factor
+        J["dCD_gear_full", "flap_defl"] = -grfe / wing_area * 0.454545 / 50
+
 
 class DragCoefClean(om.ExplicitComponent):
     """Clean drag coefficient for high-speed flight"""
@@ -1000,10 +1023,9 @@ class DragCoefClean(om.ExplicitComponent):
             [Dynamic.Mission.MACH, "CL", "cf", "SA1", "SA2", "SA5", "SA6", "SA7"],
             rows=ar,
             cols=ar,
-            method="cs",
         )
         self.declare_partials(
-            "CD", [Aircraft.Design.SUPERCRITICAL_DIVERGENCE_SHIFT], method="cs"
+            "CD", [Aircraft.Design.SUPERCRITICAL_DIVERGENCE_SHIFT]
         )
 
     def compute(self, inputs, outputs):
@@ -1025,6 +1047,29 @@ class DragCoefClean(om.ExplicitComponent):
 
         outputs["CD"] = cd0 + cdi + delcdm
 
+    def compute_partials(self, inputs, J):
+        mach, CL, div_drag_supercrit, cf, SA1, SA2, SA5, SA6, SA7 = inputs.values()
+
+        mach_div = SA1 + SA2 * CL + div_drag_supercrit
+
+        sig = sigmoid(mach, mach_div, alpha=0.005)
+        dsig_dmach = sig * (1 - sig) / 0.005
+        ddelcdm_dmach = (
+            dsig_dmach * 10 * (mach - mach_div) ** 3 + sig * 30 * (mach - mach_div) ** 2
+        )
+        # mach_div only enters through (mach - mach_div)
+        ddelcdm_dmach_div = -ddelcdm_dmach
+
+        J["CD", Dynamic.Mission.MACH] = ddelcdm_dmach
+        J["CD", "CL"] = 2 * SA7 * CL + ddelcdm_dmach_div * SA2
+        J["CD", "cf"] = SA6
+        J["CD", "SA1"] = ddelcdm_dmach_div
+        J["CD", "SA2"] = ddelcdm_dmach_div * CL
+        J["CD", "SA5"] = 1.0
+        J["CD", "SA6"] = cf
+        J["CD", "SA7"] = CL**2
+        J["CD", Aircraft.Design.SUPERCRITICAL_DIVERGENCE_SHIFT] = ddelcdm_dmach_div
+
 
 class LiftCoeff(om.ExplicitComponent):
     """GASP lift coefficient calculation for low-speed near-ground flight"""
@@ -1091,24 +1136,34 @@ class LiftCoeff(om.ExplicitComponent):
             "CL_max", units="unitless", shape=nn, desc="Max lift coefficient")
 
     def setup_partials(self):
-        # self.declare_coloring(method="cs", show_summary=False)
-        self.declare_partials("*", "*", dependent=False)
         ar = np.arange(self.options["num_nodes"])
 
         dynvars = ["alpha", Dynamic.Mission.ALTITUDE, "lift_curve_slope", "lift_ratio"]
+        params = [
+            Aircraft.Wing.ZERO_LIFT_ANGLE,
+            Aircraft.Wing.SWEEP,
+            Aircraft.Wing.ASPECT_RATIO,
+            Aircraft.Wing.HEIGHT,
+            "airport_alt",
+            "flap_defl",
+            Aircraft.Wing.FLAP_CHORD_RATIO,
+            Aircraft.Wing.TAPER_RATIO,
+            "dCL_flaps_model",
+            Aircraft.Wing.AVERAGE_CHORD,
+            Aircraft.Wing.SPAN,
+        ]
 
-        self.declare_partials("CL_base", ["*"], method="cs")
-        self.declare_partials("CL_base", dynvars, rows=ar, cols=ar, method="cs")
+        self.declare_partials("CL_base", params)
+        self.declare_partials("CL_base", dynvars, rows=ar, cols=ar)
 
-        self.declare_partials("dCL_flaps_full", ["dCL_flaps_model"], method="cs")
-        self.declare_partials(
-            "dCL_flaps_full", ["lift_ratio"], rows=ar, cols=ar, method="cs")
+        self.declare_partials("dCL_flaps_full", ["dCL_flaps_model"])
+        self.declare_partials("dCL_flaps_full", ["lift_ratio"], rows=ar, cols=ar)
 
-        self.declare_partials("alpha_stall", ["*"], method="cs")
-        self.declare_partials("alpha_stall", dynvars, rows=ar, cols=ar, method="cs")
+        self.declare_partials("alpha_stall", params + ["CL_max_flaps"])
+        self.declare_partials("alpha_stall", dynvars[:-1], rows=ar, cols=ar)
 
-        self.declare_partials("CL_max", ["CL_max_flaps"], method="cs")
-        self.declare_partials("CL_max", ["lift_ratio"], rows=ar, cols=ar, method="cs")
+        self.declare_partials("CL_max", ["CL_max_flaps"])
+        self.declare_partials("CL_max", ["lift_ratio"], rows=ar, cols=ar)
 
     def compute(self, inputs, outputs):
         (
@@ -1159,6 +1214,144 @@ class LiftCoeff(om.ExplicitComponent):
         )
         outputs["CL_max"] = CL_max_flaps * (1 + lift_ratio)
 
+    def compute_partials(self, inputs, J):
+        (
+            alpha,
+            alt,
+            lift_curve_slope,
+            lift_ratio,
+            alpha0,
+            sweep_c4,
+            AR,
+            wing_height,
+            airport_alt,
+            flap_defl,
+            flap_chord_ratio,
+            taper_ratio,
+            CL_max_flaps,
+            dCL_flaps_model,
+            avg_chord,
+            wingspan,
+        ) = inputs.values()
+
+        hac = wing_height + alt - airport_alt
+        flap_sin = np.sin(deg2rad(flap_defl))
+        heff = 2 * hac - flap_sin * flap_chord_ratio * avg_chord
+        h_ratio = heff / wingspan
+        sig = np.exp(-2.48 * h_ratio**0.768)
+        betag = (1 + h_ratio**2) ** 0.5 - h_ratio
+
+        tan_sweep = np.tan(deg2rad(sweep_c4))
+        taper_term = (1 - taper_ratio) / (1 + taper_ratio)
+        rlmc2_y = AR * tan_sweep - taper_term
+        rlmc2 = cs.arctan2(rlmc2_y, AR)
+        cos_rlmc2 = np.cos(rlmc2)
+        c3_root = np.sqrt(AR**2 + (2 * cos_rlmc2) ** 2)
+        c3 = 2 * cos_rlmc2 + c3_root
+        c4 = betag / (12.5664 * hac / avg_chord)
+        alpha_rad = deg2rad(alpha - alpha0)
+        cloge = lift_curve_slope * alpha_rad + dCL_flaps_model
+        q = lift_curve_slope / (16 * hac / avg_chord)
+        kclge = (
+            1
+            + sig
+            - sig * AR * cos_rlmc2 / c3
+            - c4 * (cloge - q)
+        )
+
+        # partials of kclge with respect to the intermediate terms
+        dk_dsig = 1 - AR * cos_rlmc2 / c3
+        dk_dcos = (
+            -sig * AR / c3
+            + sig * AR * cos_rlmc2 / c3**2 * (2 + 4 * cos_rlmc2 / c3_root)
+        )
+        dk_dAR_direct = -sig * cos_rlmc2 / c3 + sig * AR * cos_rlmc2 / c3**2 * AR / c3_root
+        dk_dc4 = -(cloge - q)
+        dk_dcloge = -c4
+        dk_dq = c4
+
+        # rlmc2 = arctan2(rlmc2_y, AR), where AR appears in both arguments
+        dcos_drlmc2 = -np.sin(rlmc2)
+        denom = rlmc2_y**2 + AR**2
+        drlmc2_dy = AR / denom
+        drlmc2_dx = -rlmc2_y / denom
+        dy_dsweep = AR / np.cos(deg2rad(sweep_c4)) ** 2 * np.pi / 180.0
+        dy_dtaper = 2 / (1 + taper_ratio) ** 2
+
+        dsig_dh_ratio = -2.48 * 0.768 * h_ratio**-0.232 * sig
+        dbetag_dh_ratio = h_ratio / np.sqrt(1 + h_ratio**2) - 1
+        dk_dh_ratio = (
+            dk_dsig * dsig_dh_ratio
+            + dk_dc4 * avg_chord / (12.5664 * hac) * dbetag_dh_ratio
+        )
+        dk_dheff = dk_dh_ratio / wingspan
+        dk_dhac = 2 * dk_dheff - dk_dc4 * c4 / hac - dk_dq * q / hac
+
+        dk = {
+            "alpha": dk_dcloge * lift_curve_slope * np.pi / 180.0,
+            Dynamic.Mission.ALTITUDE: dk_dhac,
+            "lift_curve_slope": dk_dcloge * alpha_rad + dk_dq * q / lift_curve_slope,
+            Aircraft.Wing.ZERO_LIFT_ANGLE: -dk_dcloge * lift_curve_slope * np.pi / 180.0,
+            Aircraft.Wing.SWEEP: dk_dcos * dcos_drlmc2 * drlmc2_dy * dy_dsweep,
+            Aircraft.Wing.ASPECT_RATIO: (
+                dk_dAR_direct
+                + dk_dcos * dcos_drlmc2 * (drlmc2_dy * tan_sweep + drlmc2_dx)
+            ),
+            Aircraft.Wing.HEIGHT: dk_dhac,
+            "airport_alt": -dk_dhac,
+            "flap_defl": (
+                -dk_dheff * np.cos(deg2rad(flap_defl)) * np.pi / 180.0
+                * flap_chord_ratio * avg_chord
+            ),
+            Aircraft.Wing.FLAP_CHORD_RATIO: -dk_dheff * flap_sin * avg_chord,
+            Aircraft.Wing.TAPER_RATIO: dk_dcos * dcos_drlmc2 * drlmc2_dy * dy_dtaper,
+            "dCL_flaps_model": dk_dcloge,
+            Aircraft.Wing.AVERAGE_CHORD: (
+                -dk_dheff * flap_sin * flap_chord_ratio
+                + dk_dc4 * c4 / avg_chord
+                + dk_dq * q / avg_chord
+            ),
+            Aircraft.Wing.SPAN: -dk_dh_ratio * h_ratio / wingspan,
+        }
+
+        # kclge is clipped at 1, where it no longer depends on the inputs
+        clipped = kclge.real < 1.0
+        kclge = np.clip(kclge, 1.0, None)
+        for name in dk:
+            dk[name] = np.where(clipped, 0.0, dk[name])
+
+        stall_num = rad2deg(CL_max_flaps - dCL_flaps_model)
+
+        # partials that don't pass through kclge
+        dCL_base = {
+            "alpha": kclge * lift_curve_slope * np.pi / 180.0 * (1 + lift_ratio),
+            Aircraft.Wing.ZERO_LIFT_ANGLE:
+                -kclge * lift_curve_slope * np.pi / 180.0 * (1 + lift_ratio),
+            "lift_curve_slope": kclge * alpha_rad * (1 + lift_ratio),
+        }
+        dalpha_stall = {
+            "lift_curve_slope": -stall_num / (kclge * lift_curve_slope**2),
+            Aircraft.Wing.ZERO_LIFT_ANGLE: 1.0,
+            "dCL_flaps_model": -rad2deg(1 / (kclge * lift_curve_slope)),
+        }
+
+        CL_base_dk = lift_curve_slope * alpha_rad * (1 + lift_ratio)
+        alpha_stall_dk = -stall_num / (kclge**2 * lift_curve_slope)
+
+        for name, dk_dname in dk.items():
+            J["CL_base", name] = CL_base_dk * dk_dname + dCL_base.get(name, 0.0)
+            J["alpha_stall", name] = \
+                alpha_stall_dk * dk_dname + dalpha_stall.get(name, 0.0)
+
+        J["CL_base", "lift_ratio"] = kclge * lift_curve_slope * alpha_rad
+        J["alpha_stall", "CL_max_flaps"] = rad2deg(1 / (kclge * lift_curve_slope))
+
+        J["dCL_flaps_full", "dCL_flaps_model"] = 1 + lift_ratio
+        J["dCL_flaps_full", "lift_ratio"] = dCL_flaps_model
+
+        J["CL_max", "CL_max_flaps"] = 1 + lift_ratio
+        J["CL_max", "lift_ratio"] = CL_max_flaps
+
 
 class LiftCoeffClean(om.ExplicitComponent):
     """Clean wing lift coefficient for high-speed flight"""
@@ -1201,36 +1394,27 @@ class LiftCoeffClean(om.ExplicitComponent):
             "CL_max", units="unitless", shape=nn, desc="Max lift coefficient")
 
     def setup_partials(self):
-        # self.declare_coloring(method="cs", show_summary=False)
-        self.declare_partials("*", "*", dependent=False)
         ar = np.arange(self.options["num_nodes"])
 
         if self.options["output_alpha"]:
             self.declare_partials(
-                "alpha", ["CL", "lift_ratio", "lift_curve_slope"], rows=ar, cols=ar, method="cs"
+                "alpha", ["CL", "lift_ratio", "lift_curve_slope"], rows=ar, cols=ar
             )
-            self.declare_partials("alpha", [Aircraft.Wing.ZERO_LIFT_ANGLE], method="cs")
+            self.declare_partials("alpha", [Aircraft.Wing.ZERO_LIFT_ANGLE], val=1.0)
         else:
             self.declare_partials(
-                "CL", ["lift_curve_slope", "alpha", "lift_ratio"], rows=ar, cols=ar, method="cs"
+                "CL", ["lift_curve_slope", "alpha", "lift_ratio"], rows=ar, cols=ar
             )
-            self.declare_partials("CL", [Aircraft.Wing.ZERO_LIFT_ANGLE], method="cs")
+            self.declare_partials("CL", [Aircraft.Wing.ZERO_LIFT_ANGLE])
 
+        self.declare_partials("alpha_stall", ["lift_curve_slope"], rows=ar, cols=ar)
         self.declare_partials(
-            "alpha_stall", ["lift_curve_slope"], rows=ar, cols=ar, method="cs")
-        self.declare_partials(
-            "alpha_stall",
-            [
-                Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP,
-                Aircraft.Wing.ZERO_LIFT_ANGLE,
-            ],
-            method="cs",
+            "alpha_stall", [Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP]
         )
+        self.declare_partials("alpha_stall", [Aircraft.Wing.ZERO_LIFT_ANGLE], val=1.0)
 
-        self.declare_partials("CL_max", ["lift_ratio"], rows=ar, cols=ar, method="cs")
-        self.declare_partials(
-            "CL_max", [Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP], method="cs"
-        )
+        self.declare_partials("CL_max", ["lift_ratio"], rows=ar, cols=ar)
+        self.declare_partials("CL_max", [Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP])
 
     def compute(self, inputs, outputs):
         _, lift_curve_slope, lift_ratio, alpha0, CL_max_flaps = inputs.values()
@@ -1245,6 +1429,31 @@ class LiftCoeffClean(om.ExplicitComponent):
         outputs["alpha_stall"] = rad2deg(CL_max_flaps / lift_curve_slope) + alpha0
         outputs["CL_max"] = CL_max_flaps * (1 + lift_ratio)
 
+    def compute_partials(self, inputs, J):
+        _, lift_curve_slope, lift_ratio, alpha0, CL_max_flaps = inputs.values()
+        if self.options["output_alpha"]:
+            CL = inputs["CL"]
+            J["alpha", "CL"] = rad2deg(1 / ((1 + lift_ratio) * lift_curve_slope))
+            J["alpha", "lift_ratio"] = \
+                -rad2deg(CL / ((1 + lift_ratio) ** 2 * lift_curve_slope))
+            J["alpha", "lift_curve_slope"] = \
+                -rad2deg(CL / ((1 + lift_ratio) * lift_curve_slope**2))
+        else:
+            alpha = inputs["alpha"]
+            J["CL", "lift_curve_slope"] = deg2rad(alpha - alpha0) * (1 + lift_ratio)
+            J["CL", "alpha"] = deg2rad(lift_curve_slope * (1 + lift_ratio))
+            J["CL", "lift_ratio"] = lift_curve_slope * deg2rad(alpha - alpha0)
+            J["CL", Aircraft.Wing.ZERO_LIFT_ANGLE] = \
+                -deg2rad(lift_curve_slope * (1 + lift_ratio))
+
+        J["alpha_stall", "lift_curve_slope"] = \
+            -rad2deg(CL_max_flaps / lift_curve_slope**2)
+        J["alpha_stall", Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP] = \
+            rad2deg(1 / lift_curve_slope)
+
+        J["CL_max", "lift_ratio"] = CL_max_flaps
+        J["CL_max", Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP] = 1 + lift_ratio
+
 
 class CruiseAero(om.Group):
     """Top-level aerodynamics group for cruise (no flaps, no landing gear)"""
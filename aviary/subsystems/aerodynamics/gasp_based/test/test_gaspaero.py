@@ -154,6 +154,50 @@ class GASPAeroTest(unittest.TestCase):
         partial_data = prob.check_partials(method="fd", out_stream=None)
         assert_check_partials(partial_data, atol=0.02, rtol=1e-4)
 
+    def test_partials_cs(self):
+        # the analytic partials are checked against complex step at several nodes, so
+        # the diagonal and dense blocks are both covered
+        for aero in (CruiseAero, LowSpeedAero):
+            with self.subTest(aero=aero.__name__):
+                prob = om.Problem()
+                prob.model.add_subsystem(
+                    "aero", aero(num_nodes=3, aviary_options=get_option_defaults(),
+                                 input_atmos=True), promotes=["*"]
+                )
+                prob.setup(check=False, force_alloc_complex=True)
+
+                _init_geom(prob)
+
+                prob.set_val("alpha", [0.0, 3.0, 6.0])
+                prob.set_val(Dynamic.Mission.SPEED_OF_SOUND, cruise_data["sos"][0])
+                prob.set_val(Dynamic.Mission.KINEMATIC_VISCOSITY, cruise_data["nu"][0])
+
+                if aero is CruiseAero:
+                    prob.set_val(Mission.Design.LIFT_COEFFICIENT_MAX_FLAPS_UP,
+                                 setup_data["clmwfu"])
+                    prob.set_val(Aircraft.Design.SUPERCRITICAL_DIVERGENCE_SHIFT,
+                                 setup_data["scfac"])
+                    prob.set_val(Dynamic.Mission.MACH, [0.2, 0.5, 0.8])
+                else:
+                    prob.set_val(Aircraft.Wing.HEIGHT, 8.0)
+                    prob.set_val("airport_alt", 0.0)
+                    prob.set_val(Aircraft.Wing.FLAP_CHORD_RATIO, setup_data["cfoc"])
+                    prob.set_val(Mission.Design.GROSS_MASS, setup_data["wgto"])
+                    prob.set_val(Dynamic.Mission.MACH, [0.1, 0.2, 0.3])
+                    prob.set_val(Dynamic.Mission.ALTITUDE, [0.0, 20.0, 100.0])
+                    prob.set_val("flap_defl", setup_data["delfto"])
+                    prob.set_val("CL_max_flaps", setup_data["clmwto"])
+                    prob.set_val("dCL_flaps_model", setup_data["dclto"])
+                    prob.set_val("dCD_flaps_model", setup_data["dcdto"])
+
+                prob.run_model()
+
+                # xlifts and geom use colored complex step, so they can't be checked
+                # against it
+                partial_data = prob.check_partials(
+                    method="cs", excludes=["*xlifts", "*geom"], out_stream=None)
+                assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
 
 def _init_geom(prob):
     """Initialize user inputs and geometry/sizing data"""
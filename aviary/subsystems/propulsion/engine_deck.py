@@ -29,6 +29,7 @@ import warnings
 import numpy as np
 import openmdao.api as om
 
+from openmdao.components.interp_util.interp_semi import InterpNDSemi
 from openmdao.utils.units import convert_units
 
 from aviary.interface.utils.markdown_utils import round_it
@@ -37,6 +38,7 @@ from aviary.subsystems.propulsion.engine_scaling import EngineScaling
 from aviary.subsystems.propulsion.engine_sizing import SizeEngine
 from aviary.subsystems.propulsion.utils import UncorrectData
 from aviary.subsystems.propulsion.utils import (
+    CachedMetaModelSemiStructuredComp,
     EngineModelVariables,
     convert_geopotential_altitude,
     default_units,
@@ -366,8 +368,11 @@ class EngineDeck(EngineModel):
         if self.read_from_file:
             data_file = self.get_val(Aircraft.Engine.DATA_FILE)
 
+            cache = self.get_item(Aircraft.Engine.CACHE_DATA_FILE,
+                                  default=(False, 'unitless'))[0]
+
             # read csv file - currently not saving comments
-            raw_data = read_data_file(data_file, aliases=aliases)
+            raw_data = read_data_file(data_file, aliases=aliases, cache=cache)
 
         else:
             # run provided data through aliases
@@ -397,8 +402,8 @@ class EngineDeck(EngineModel):
                 # Convert data to expected units. Required so settings like tolerances
                 # that assume units work as expected
                 try:
-                    val = np.array([convert_units(i, units, default_units[key])
-                                   for i in val])
+                    val = convert_units(np.array(val, dtype=float), units,
+                                        default_units[key])
                 except TypeError:
                     raise TypeError(
                         f"{message}: units of '{units}' provided for "
@@ -777,11 +782,12 @@ class EngineDeck(EngineModel):
     def _build_engine_interpolator(self, num_nodes, aviary_inputs):
         """
         Builds the OpenMDAO metamodel component for the engine deck.
-        Currently only the semistructured model is supported.
+        Currently only the semistructured model is supported. Interpolation tables are
+        shared between all interpolators built from the same data.
         """
         interp_method = self.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
         # interpolator object for engine data
-        engine = om.MetaModelSemiStructuredComp(
+        engine = CachedMetaModelSemiStructuredComp(
             method=interp_method, extrapolate=True, vec_size=num_nodes)
 
         units = default_units
@@ -813,11 +819,137 @@ class EngineDeck(EngineModel):
 
         return engine
 
+    def _compute_max_performance(self):
+        """
+        Pre-solve maximum thrust (and shaft power, if present) for every flight
+        condition in the engine data. Max performance is assumed to occur at maximum
+        throttle and hybrid throttle, consistent with the runtime max thrust
+        interpolator. The result is computed once per deck and stored.
+
+        Returns
+        -------
+        max_data : dict
+            Mach number and altitude of each unique flight condition, sorted as
+            required by the semistructured interpolator, and the max value of each
+            performance variable at that condition, keyed by EngineModelVariables.
+        """
+        if getattr(self, '_max_performance_data', None) is not None:
+            return self._max_performance_data
+
+        interp_method = self.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
+        data = self.data
+
+        # unique flight conditions, sorted by Mach then altitude
+        conditions, condition_idx = np.unique(
+            np.stack((data[MACH], data[ALTITUDE]), axis=1), axis=0,
+            return_inverse=True)
+        condition_idx = condition_idx.ravel()
+        num_conditions = len(conditions)
+
+        independent_variables = [MACH, ALTITUDE, THROTTLE]
+        max_throttles = [THROTTLE]
+        global_throttles = [self.global_throttle]
+        throttle_max = [self.throttle_max]
+        if self.use_hybrid_throttle:
+            independent_variables.append(HYBRID_THROTTLE)
+            max_throttles.append(HYBRID_THROTTLE)
+            global_throttles.append(self.global_hybrid_throttle)
+            throttle_max.append(self.hybrid_throttle_max)
+
+        points = [conditions[:, 0], conditions[:, 1]]
+        for variable, is_global, global_max in zip(
+                max_throttles, global_throttles, throttle_max):
+            if is_global:
+                points.append(np.full(num_conditions, global_max))
+            else:
+                # max throttle avaliable at each flight condition
+                local_max = np.full(num_conditions, -np.inf)
+                np.maximum.at(local_max, condition_idx, data[variable])
+                points.append(local_max)
+        points = np.array(points).T
+
+        grid = np.array([data[variable] for variable in independent_variables]).T
+
+        max_data = {MACH: conditions[:, 0], ALTITUDE: conditions[:, 1]}
+        max_outputs = [THRUST]
+        if self.use_shaft_power:
+            if SHAFT_POWER in self.engine_variables:
+                max_outputs.append(SHAFT_POWER)
+            else:
+                max_outputs.append(SHAFT_POWER_CORRECTED)
+
+        for variable in max_outputs:
+            interp = InterpNDSemi(grid, data[variable], method=interp_method,
+                                  extrapolate=True)
+            max_data[variable] = interp.interpolate(points)
+
+        self._max_performance_data = max_data
+
+        return max_data
+
+    def _build_max_interpolator(self, num_nodes):
+        """
+        Builds a metamodel component that computes maximum thrust (and shaft power) for
+        the current flight condition from the pre-solved reduced data set produced by
+        _compute_max_performance(). Outputs match the names used by the full max thrust
+        interpolator.
+        """
+        interp_method = self.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
+        units = self.engine_variable_units
+        max_data = self._compute_max_performance()
+
+        max_thrust_engine = CachedMetaModelSemiStructuredComp(
+            method=interp_method, extrapolate=False, vec_size=num_nodes)
+
+        max_thrust_engine.add_input(Dynamic.Mission.MACH,
+                                    max_data[MACH],
+                                    units='unitless',
+                                    desc='Current flight Mach number')
+        max_thrust_engine.add_input(Dynamic.Mission.ALTITUDE,
+                                    max_data[ALTITUDE],
+                                    units=units[ALTITUDE],
+                                    desc='Current flight altitude')
+        max_thrust_engine.add_output('thrust_net_max_unscaled',
+                                     max_data[THRUST],
+                                     units=units[THRUST],
+                                     desc='maximum thrust that can currently be produced')
+        if SHAFT_POWER in max_data:
+            max_thrust_engine.add_output('shaft_power_max_unscaled',
+                                         max_data[SHAFT_POWER],
+                                         units=units[SHAFT_POWER],
+                                         desc='maximum shaft power that can currently be produced')
+        elif SHAFT_POWER_CORRECTED in max_data:
+            max_thrust_engine.add_output('shaft_power_corrected_max_unscaled',
+                                         max_data[SHAFT_POWER_CORRECTED],
+                                         units=units[SHAFT_POWER_CORRECTED],
+                                         desc='maximum corrected shaft power that can currently be produced')
+
+        return max_thrust_engine
+
+    def _max_throttle_conditions(self):
+        """
+        Mach number and altitude of each flight condition in the packed engine data,
+        in the order matching the local max throttle and hybrid throttle values of
+        each condition.
+        """
+        packed_data = self.packed_data
+        mach_table = np.array([])
+        alt_table = np.array([])
+
+        for M in range(self.mach_max_count):
+            for A in range(self.alt_max_count):
+                if self.data_indices[M, A] != 0:
+                    mach_table = np.append(mach_table, packed_data[MACH][M, A, 0])
+                    alt_table = np.append(alt_table, packed_data[ALTITUDE][M, A, 0])
+
+        return mach_table, alt_table
+
     def build_mission(self, num_nodes, aviary_inputs) -> om.Group:
         """
         Creates interpolator objects to be added to mission-level propulsion subsystem.
-        Interpolators must be re-generated for each ODE due to potentialy different
-        num_nodes in each mission segment.
+        Interpolator components must be re-generated for each ODE due to potentialy
+        different num_nodes in each mission segment, but the underlying interpolation
+        tables are built once per deck and shared between all of them.
 
         Parameters
         ----------
@@ -832,6 +964,8 @@ class EngineDeck(EngineModel):
             needed for this EngineDeck.
         """
         interp_method = self.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
+        precompute_max = self.get_item(
+            Aircraft.Engine.PRECOMPUTE_MAX_THRUST, default=(False, 'unitless'))[0]
 
         engine_group = om.Group()
 
@@ -843,9 +977,12 @@ class EngineDeck(EngineModel):
         # NOTE max thrust is assumed to occur at maximum throttle and hybrid throttle
         #      for each flight condition
         # TODO Use solver to find throttle/hybrid throttle for maximum thrust at given flight condition?
-        #      Pre-solve max throttle/hybrid throttle for each flight condition, interpolate on
-        #      reduced data set?
-        if self.use_thrust or self.use_shaft_power:
+        if (self.use_thrust or self.use_shaft_power) and precompute_max:
+            # max thrust/shp pre-solved for each flight condition, interpolated on
+            # reduced (Mach, altitude) data set
+            max_thrust_engine = self._build_max_interpolator(num_nodes)
+
+        elif self.use_thrust or self.use_shaft_power:
             if self.global_throttle or (self.global_hybrid_throttle
                                         and self.use_hybrid_throttle):
                 # create IndepVarComp to pass maximum throttle is to max thrust interpolator
@@ -864,21 +1001,10 @@ class EngineDeck(EngineModel):
                                                desc='Engine maximum hybrid throttle')
             if not (self.global_throttle or (self.global_hybrid_throttle
                                              and self.use_hybrid_throttle)):
-                interp_throttles = om.MetaModelSemiStructuredComp(method=interp_method,
-                                                                  extrapolate=False,
-                                                                  vec_size=num_nodes)
-
-                packed_data = self.packed_data
-                mach_table = np.array([])
-                alt_table = np.array([])
-
-                for M in range(self.mach_max_count):
-                    for A in range(self.alt_max_count):
-                        if self.data_indices[M, A] != 0:
-                            mach_table = np.append(
-                                mach_table, packed_data[MACH][M, A, 0])
-                            alt_table = np.append(
-                                alt_table, packed_data[ALTITUDE][M, A, 0])
+                interp_throttles = CachedMetaModelSemiStructuredComp(
+                    method=interp_method, extrapolate=False, vec_size=num_nodes)
+
+                mach_table, alt_table = self._max_throttle_conditions()
 
                 # add inputs and outputs to interpolator
                 interp_throttles.add_input(Dynamic.Mission.MACH,
@@ -904,7 +1030,7 @@ class EngineDeck(EngineModel):
 
             # Calculation of max thrust currently done with a duplicate of the engine
             # model and scaling components
-            max_thrust_engine = om.MetaModelSemiStructuredComp(
+            max_thrust_engine = CachedMetaModelSemiStructuredComp(
                 method=interp_method, extrapolate=False, vec_size=num_nodes)
 
             max_thrust_engine.add_input(Dynamic.Mission.MACH,
@@ -931,7 +1057,7 @@ class EngineDeck(EngineModel):
                                          self.data[THRUST],
                                          units=units[THRUST],
                                          desc='maximum thrust that can currently be produced')
-        if self.use_shaft_power:
+        if self.use_shaft_power and not precompute_max:
             if SHAFT_POWER in self.engine_variables:
                 max_thrust_engine.add_output('shaft_power_max_unscaled',
                                              self.data[SHAFT_POWER],
@@ -972,14 +1098,17 @@ class EngineDeck(EngineModel):
                                  'uncorrect_shaft_power.corrected_data')
 
         if self.use_thrust or self.use_shaft_power:
-            if self.global_throttle or (self.global_hybrid_throttle
-                                        and self.use_hybrid_throttle):
+            if precompute_max:
+                # max throttles are already accounted for in max_interpolation
+                pass
+
+            elif self.global_throttle or (self.global_hybrid_throttle
+                                          and self.use_hybrid_throttle):
                 engine_group.add_subsystem('fixed_max_throttles',
                                            fixed_throttles,
                                            promotes_outputs=['*'])
 
-            if not (self.global_throttle or (self.global_hybrid_throttle
-                                             and self.use_hybrid_throttle)):
+            else:
                 engine_group.add_subsystem('interp_max_throttles',
                                            interp_throttles,
                                            promotes_inputs=['*'],
@@ -1390,25 +1519,26 @@ class EngineDeck(EngineModel):
         data_indices = self.data_indices
 
         packed_data = self.packed_data = {}
-        idx = 0
 
         for key in self.data:
             packed_data[key] = np.zeros((mach_max_count, alt_max_count, data_max_count))
 
-        for M in range(mach_max_count):
+        # data is sorted, so each Mach, alt point with data takes up the next
+        # data_indices + 1 entries of the unpacked data (points without data are skipped)
+        data_indices = data_indices[:mach_max_count, :alt_max_count]
+        mach_idx, alt_idx = np.nonzero(data_indices)
+        num_points = data_indices[mach_idx, alt_idx] + 1
+        start_idx = np.cumsum(num_points) - num_points
 
-            for A in range(alt_max_count):
-                if data_indices[M, A] == 0:
-                    # skip point if there is no data
-                    continue
+        mach_idx = np.repeat(mach_idx, num_points)
+        alt_idx = np.repeat(alt_idx, num_points)
+        data_idx = np.arange(num_points.sum()) - np.repeat(start_idx, num_points)
 
-                # number of data points is index+1
-                for D in range(data_indices[M, A] + 1):
-                    for key in self.data:
-                        unpacked_data = self.data[key]
-                        if idx < len(unpacked_data):
-                            packed_data[key][M, A, D] = unpacked_data[idx]
-                    idx += 1
+        for key in self.data:
+            unpacked_data = self.data[key]
+            count = min(len(data_idx), len(unpacked_data))
+            packed_data[key][mach_idx[:count], alt_idx[:count], data_idx[:count]] = \
+                unpacked_data[:count]
 
     def _count_data(self):
         """
@@ -0,0 +1,423 @@
+import inspect
+
+import numpy as np
+import openmdao.api as om
+
+from openmdao.components.interp_util.outofbounds_error import OutOfBoundsError
+from openmdao.utils.units import unit_conversion
+
+from aviary.subsystems.propulsion.engine_deck import EngineDeck
+from aviary.subsystems.propulsion.utils import (
+    EngineModelVariables,
+    default_units,
+    get_shared_interpolant,
+)
+from aviary.variable_info.functions import add_aviary_input
+from aviary.variable_info.variables import Aircraft, Dynamic, Mission
+
+
+MACH = EngineModelVariables.MACH
+ALTITUDE = EngineModelVariables.ALTITUDE
+THROTTLE = EngineModelVariables.THROTTLE
+HYBRID_THROTTLE = EngineModelVariables.HYBRID_THROTTLE
+THRUST = EngineModelVariables.THRUST
+SHAFT_POWER = EngineModelVariables.SHAFT_POWER
+SHAFT_POWER_CORRECTED = EngineModelVariables.SHAFT_POWER_CORRECTED
+FUEL_FLOW = EngineModelVariables.FUEL_FLOW
+ELECTRIC_POWER = EngineModelVariables.ELECTRIC_POWER_IN
+NOX_RATE = EngineModelVariables.NOX_RATE
+TEMPERATURE = EngineModelVariables.TEMPERATURE_T4
+
+# engine deck variables provided by the fused component, with the name and units of the
+# vectorized output they are written to
+performance_outputs = {
+    THRUST: (Dynamic.Mission.THRUST, 'lbf'),
+    FUEL_FLOW: (Dynamic.Mission.FUEL_FLOW_RATE_NEGATIVE, 'lbm/h'),
+    ELECTRIC_POWER: (Dynamic.Mission.ELECTRIC_POWER_IN, 'kW'),
+    NOX_RATE: (Dynamic.Mission.NOX_RATE, 'lb/h'),
+    TEMPERATURE: (Dynamic.Mission.TEMPERATURE_T4, 'degR'),
+    SHAFT_POWER: (Dynamic.Mission.SHAFT_POWER, 'hp'),
+}
+
+max_outputs = {
+    THRUST: (Dynamic.Mission.THRUST_MAX, 'lbf'),
+    SHAFT_POWER: (Dynamic.Mission.SHAFT_POWER_MAX, 'hp'),
+}
+
+
+def can_fuse_engine_decks(engine_models):
+    """
+    Check if every engine model can be evaluated by FusedEngineDecks.
+
+    Engine models must be EngineDecks that do not customize their mission
+    subsystem, and that provide uncorrected shaft power (if any), which does not
+    depend on ambient conditions.
+    """
+    for engine in engine_models:
+        if not isinstance(engine, EngineDeck) or \
+                type(engine).build_mission is not EngineDeck.build_mission:
+            return False
+
+        if SHAFT_POWER_CORRECTED in engine.engine_variables and \
+                SHAFT_POWER not in engine.engine_variables:
+            return False
+
+    return True
+
+
+class FusedEngineDecks(om.ExplicitComponent):
+    '''
+    Evaluates the performance of several EngineDecks in a single component, returning
+    scaled performance vectorized across engine types, with shape
+    (num_nodes, num_engine_type).
+
+    Produces the same values as the mission subsystems built by each EngineDeck,
+    combined by a MuxComp, but without a copy of the interpolation, max throttle and
+    scaling components for every engine type. Interpolation tables are shared with
+    any other interpolator built from the same engine data.
+    '''
+
+    def initialize(self):
+        self.options.declare('num_nodes', types=int, lower=0)
+
+        self.options.declare(
+            'engine_models', types=list, desc='list of EngineDecks on aircraft'
+        )
+
+    def setup(self):
+        nn = self.options['num_nodes']
+        engine_models = self.options['engine_models']
+        num_engine_type = len(engine_models)
+        shape = (nn, num_engine_type)
+
+        if not can_fuse_engine_decks(engine_models):
+            raise TypeError(f'{self.msginfo}: engine models must all be EngineDecks '
+                            'that provide uncorrected shaft power to be fused')
+
+        self._engine_data = [self._setup_engine(engine) for engine in engine_models]
+        self._use_hybrid_throttle = any(
+            engine.use_hybrid_throttle for engine in engine_models)
+
+        self.add_input(Dynamic.Mission.MACH, val=np.zeros(nn),
+                       desc='current Mach number', units='unitless')
+        self.add_input(Dynamic.Mission.ALTITUDE, val=np.zeros(nn),
+                       desc='current altitude', units='ft')
+        self.add_input(Dynamic.Mission.THROTTLE, val=np.zeros(shape),
+                       desc='throttle of each engine type', units='unitless')
+        if self._use_hybrid_throttle:
+            self.add_input(Dynamic.Mission.HYBRID_THROTTLE, val=np.zeros(shape),
+                           desc='hybrid throttle of each engine type', units='unitless')
+
+        add_aviary_input(self, Aircraft.Engine.SCALE_FACTOR,
+                         val=np.ones(num_engine_type))
+
+        # outputs not provided by an engine are zero for that engine type
+        for name, units in performance_outputs.values():
+            self.add_output(name, val=np.zeros(shape), units=units)
+        for name, units in max_outputs.values():
+            self.add_output(name, val=np.zeros(shape), units=units)
+
+    def _setup_engine(self, engine):
+        """
+        Collect the interpolants and scaling options used to evaluate a single engine.
+        """
+        options = engine.options
+        data = engine.data
+        interp_method = engine.get_val(Aircraft.Engine.INTERPOLATION_METHOD)
+        precompute_max = engine.get_item(
+            Aircraft.Engine.PRECOMPUTE_MAX_THRUST, default=(False, 'unitless'))[0]
+
+        engine_data = {
+            'use_hybrid_throttle': engine.use_hybrid_throttle,
+            'scale_performance': options.get_val(Aircraft.Engine.SCALE_PERFORMANCE),
+            'subsonic_fuel_factor':
+                options.get_val(Aircraft.Engine.SUBSONIC_FUEL_FLOW_SCALER),
+            'supersonic_fuel_factor':
+                options.get_val(Aircraft.Engine.SUPERSONIC_FUEL_FLOW_SCALER),
+            'constant_fuel_term':
+                options.get_val(Aircraft.Engine.FUEL_FLOW_SCALER_CONSTANT_TERM),
+            'linear_fuel_term':
+                options.get_val(Aircraft.Engine.FUEL_FLOW_SCALER_LINEAR_TERM),
+            'constant_fuel_flow': options.get_val(
+                Aircraft.Engine.CONSTANT_FUEL_CONSUMPTION, units='lbm/h'),
+            'mission_fuel_scaler': options.get_val(Mission.Summary.FUEL_FLOW_SCALER),
+        }
+
+        # interpolants for performance at the current throttle setting
+        independent_variables = [MACH, ALTITUDE, THROTTLE]
+        if engine.use_hybrid_throttle:
+            independent_variables.append(HYBRID_THROTTLE)
+        grid = np.array([data[variable] for variable in independent_variables]).T
+
+        interps = {}
+        for variable, (name, units) in performance_outputs.items():
+            if variable in engine.engine_variables:
+                interps[name] = (
+                    get_shared_interpolant(grid, data[variable], interp_method, True),
+                    variable,
+                    unit_conversion(default_units[variable], units))
+        engine_data['interps'] = interps
+
+        # interpolants for max performance at the current flight condition
+        # NOTE max thrust is assumed to occur at maximum throttle and hybrid throttle
+        #      for each flight condition, consistent with EngineDeck.build_mission()
+        max_interps = {}
+        max_throttles = []
+        if (engine.use_thrust or engine.use_shaft_power) and precompute_max:
+            max_data = engine._compute_max_performance()
+            max_grid = np.array([max_data[MACH], max_data[ALTITUDE]]).T
+
+        elif engine.use_thrust or engine.use_shaft_power:
+            max_data = data
+            max_grid = grid
+
+            global_throttles = [(engine.global_throttle, engine.throttle_max)]
+            if engine.use_hybrid_throttle:
+                global_throttles.append(
+                    (engine.global_hybrid_throttle, engine.hybrid_throttle_max))
+
+            if not all(is_global for is_global, _ in global_throttles):
+                conditions = np.array(engine._max_throttle_conditions()).T
+
+            for is_global, throttle_max in global_throttles:
+                if is_global:
+                    max_throttles.append(throttle_max)
+                else:
+                    max_throttles.append(get_shared_interpolant(
+                        conditions, throttle_max, interp_method, False))
+
+        if engine.use_thrust or engine.use_shaft_power:
+            for variable, (name, units) in max_outputs.items():
+                if variable in engine.engine_variables:
+                    max_interps[name] = (
+                        get_shared_interpolant(
+                            max_grid, max_data[variable], interp_method, False),
+                        variable,
+                        unit_conversion(default_units[variable], units))
+
+        engine_data['max_interps'] = max_interps
+        engine_data['max_throttles'] = max_throttles
+
+        return engine_data
+
+    def setup_partials(self):
+        nn = self.options['num_nodes']
+        num_engine_type = len(self.options['engine_models'])
+
+        # outputs are flattened row-major, so each node holds one entry per engine type
+        r = np.arange(nn * num_engine_type)
+        node_cols = np.repeat(np.arange(nn), num_engine_type)
+        engine_cols = np.tile(np.arange(num_engine_type), nn)
+
+        throttles = [Dynamic.Mission.THROTTLE]
+        if self._use_hybrid_throttle:
+            throttles.append(Dynamic.Mission.HYBRID_THROTTLE)
+
+        # inputs that each output depends on, used to collect partials at run time
+        self._partials_wrt = {}
+        for name, _ in performance_outputs.values():
+            wrt = [Dynamic.Mission.MACH, Dynamic.Mission.ALTITUDE] + throttles
+            if name != Dynamic.Mission.TEMPERATURE_T4:
+                wrt.append(Aircraft.Engine.SCALE_FACTOR)
+            self._partials_wrt[name] = wrt
+        for name, _ in max_outputs.values():
+            self._partials_wrt[name] = [Dynamic.Mission.MACH, Dynamic.Mission.ALTITUDE,
+                                        Aircraft.Engine.SCALE_FACTOR]
+
+        for name, wrt in self._partials_wrt.items():
+            for input_name in wrt:
+                if input_name in throttles:
+                    self.declare_partials(name, input_name, rows=r, cols=r)
+                elif input_name == Aircraft.Engine.SCALE_FACTOR:
+                    self.declare_partials(name, input_name, rows=r, cols=engine_cols)
+                else:
+                    self.declare_partials(name, input_name, rows=r, cols=node_cols)
+
+    def compute(self, inputs, outputs):
+        # interpolation provides derivatives at no extra cost, so keep them for
+        # compute_partials() at the same point
+        values, derivs = self._evaluate(inputs, compute_derivative=True)
+
+        for name, val in values.items():
+            outputs[name] = val
+
+        if self.under_complex_step:
+            self._cached_partials = None
+        else:
+            self._cached_partials = (inputs.asarray().copy(), derivs)
+
+    def compute_partials(self, inputs, J):
+        cached = getattr(self, '_cached_partials', None)
+        if cached is not None and np.array_equal(cached[0], inputs.asarray()):
+            derivs = cached[1]
+        else:
+            _, derivs = self._evaluate(inputs, compute_derivative=True)
+
+        for key, deriv in derivs.items():
+            J[key] = deriv.ravel()
+
+    def _evaluate(self, inputs, compute_derivative=False):
+        """
+        Evaluate the scaled performance of every engine type, and optionally its
+        derivatives with respect to each input (as arrays of shape
+        (num_nodes, num_engine_type), matching the declared sparsity pattern).
+        """
+        nn = self.options['num_nodes']
+        num_engine_type = len(self.options['engine_models'])
+        shape = (nn, num_engine_type)
+
+        mach = inputs[Dynamic.Mission.MACH]
+        altitude = inputs[Dynamic.Mission.ALTITUDE]
+        throttle = inputs[Dynamic.Mission.THROTTLE]
+        scale_factor = inputs[Aircraft.Engine.SCALE_FACTOR]
+        if self._use_hybrid_throttle:
+            hybrid_throttle = inputs[Dynamic.Mission.HYBRID_THROTTLE]
+
+        # use dtype to make complex safe
+        dtype = np.result_type(mach, altitude, throttle, scale_factor)
+
+        values = {}
+        derivs = {}
+        for name, wrt in self._partials_wrt.items():
+            values[name] = np.zeros(shape, dtype=dtype)
+            if compute_derivative:
+                for input_name in wrt:
+                    derivs[name, input_name] = np.zeros(shape, dtype=dtype)
+
+        for idx, engine_data in enumerate(self._engine_data):
+            point = [mach, altitude, throttle[:, idx]]
+            throttle_inputs = [Dynamic.Mission.THROTTLE]
+            if engine_data['use_hybrid_throttle']:
+                point.append(hybrid_throttle[:, idx])
+                throttle_inputs.append(Dynamic.Mission.HYBRID_THROTTLE)
+            point = np.array(point).T
+
+            scaling = self._compute_scaling(engine_data, scale_factor[idx], mach)
+
+            for name, (interp, variable, conversion) in engine_data['interps'].items():
+                val, d_dx = self._interpolate(interp, point, name, throttle_inputs)
+                factor, offset = conversion
+                val = (val + offset) * factor
+                d_dx = d_dx * factor
+
+                if variable is TEMPERATURE:
+                    # T4 is not scaled
+                    scale, d_scale, constant = 1.0, 0.0, 0.0
+                elif variable is FUEL_FLOW:
+                    # fuel flow is output as a negative rate
+                    scale, d_scale, constant = scaling['fuel_flow']
+                    scale, d_scale, constant = -scale, -d_scale, -constant
+                else:
+                    scale, d_scale, constant = scaling['performance']
+
+                values[name][:, idx] = val * scale + constant
+
+                if compute_derivative:
+                    derivs[name, Dynamic.Mission.MACH][:, idx] = d_dx[:, 0] * scale
+                    derivs[name, Dynamic.Mission.ALTITUDE][:, idx] = d_dx[:, 1] * scale
+                    for dim, input_name in enumerate(throttle_inputs):
+                        derivs[name, input_name][:, idx] = d_dx[:, 2 + dim] * scale
+                    if variable is not TEMPERATURE:
+                        derivs[name, Aircraft.Engine.SCALE_FACTOR][:, idx] = \
+                            val * d_scale
+
+            if not engine_data['max_interps']:
+                continue
+
+            # max throttles at current flight condition, with their derivatives with
+            # respect to Mach number and altitude
+            point = [mach, altitude]
+            throttle_derivs = []
+            condition = np.array(point).T
+            for throttle_max in engine_data['max_throttles']:
+                if np.isscalar(throttle_max):
+                    point.append(np.full(nn, throttle_max))
+                    throttle_derivs.append(None)
+                else:
+                    val, d_dx = self._interpolate(throttle_max, condition,
+                                                  'throttle_max', [])
+                    point.append(val)
+                    throttle_derivs.append(d_dx)
+            point = np.array(point).T
+
+            scale, d_scale, _ = scaling['performance']
+
+            for name, (interp, variable, conversion) in \
+                    engine_data['max_interps'].items():
+                val, d_dx = self._interpolate(interp, point, name,
+                                              ['throttle_max', 'hybrid_throttle_max'])
+                factor, offset = conversion
+                val = (val + offset) * factor
+                d_dx = d_dx * factor
+
+                values[name][:, idx] = val * scale
+
+                if compute_derivative:
+                    d_condition = d_dx[:, :2].copy()
+                    for dim, d_throttle in enumerate(throttle_derivs):
+                        if d_throttle is not None:
+                            d_condition += d_dx[:, 2 + dim, np.newaxis] * d_throttle
+
+                    derivs[name, Dynamic.Mission.MACH][:, idx] = \
+                        d_condition[:, 0] * scale
+                    derivs[name, Dynamic.Mission.ALTITUDE][:, idx] = \
+                        d_condition[:, 1] * scale
+                    derivs[name, Aircraft.Engine.SCALE_FACTOR][:, idx] = val * d_scale
+
+        return values, derivs
+
+    def _compute_scaling(self, engine_data, engine_scale_factor, mach_number):
+        """
+        Scaling applied to performance of a single engine, matching EngineScaling.
+
+        Returns
+        -------
+        dict
+            (scale, derivative of scale with respect to engine scale factor, constant
+            term) applied to fuel flow rate ('fuel_flow') and to all other performance
+            variables ('performance').
+        """
+        nn = self.options['num_nodes']
+
+        if not engine_data['scale_performance']:
+            return {'performance': (1.0, 0.0, 0.0),
+                    'fuel_flow': (1.0, 0.0, engine_data['constant_fuel_flow'])}
+
+        constant_fuel_term = engine_data['constant_fuel_term']
+        linear_fuel_term = engine_data['linear_fuel_term']
+
+        # Calculate fuel flow rate scaling factor using FLOPS-derived equation
+        fuel_flow_equation_scaling = (
+            1 + constant_fuel_term + linear_fuel_term * (1 - engine_scale_factor))
+
+        # use dtype to make complex safe
+        fuel_flow_mach_scaling = np.full(
+            nn, engine_data['subsonic_fuel_factor'],
+            dtype=np.result_type(engine_scale_factor, float))
+        fuel_flow_mach_scaling[mach_number.real >= 1.0] = \
+            engine_data['supersonic_fuel_factor']
+        fuel_flow_mach_scaling *= engine_data['mission_fuel_scaler']
+
+        fuel_flow_scale_factor = (
+            engine_scale_factor * fuel_flow_mach_scaling * fuel_flow_equation_scaling)
+        fuel_flow_scale_deriv = fuel_flow_mach_scaling * (
+            1 + constant_fuel_term + linear_fuel_term
+            - 2 * linear_fuel_term * engine_scale_factor)
+
+        return {'performance': (engine_scale_factor, 1.0, 0.0),
+                'fuel_flow': (fuel_flow_scale_factor, fuel_flow_scale_deriv,
+                              engine_data['constant_fuel_flow'])}
+
+    def _interpolate(self, interp, point, name, throttle_names):
+        try:
+            return interp.interpolate(point, compute_derivative=True)
+
+        except OutOfBoundsError as err:
+            input_names = [Dynamic.Mission.MACH, Dynamic.Mission.ALTITUDE] + \
+                list(throttle_names)
+            errmsg = (f"{self.msginfo}: Error interpolating output '{name}' because "
+                      f"input '{input_names[err.idx]}' required extrapolation while "
+                      f"interpolating dimension {err.idx + 1}, where its value "
+                      f"'{err.value}' exceeded the range ('{err.lower}', '{err.upper}')")
+            raise om.AnalysisError(errmsg, inspect.getframeinfo(inspect.currentframe()),
+                                   self.msginfo)
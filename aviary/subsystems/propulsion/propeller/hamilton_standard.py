@@ -249,6 +249,194 @@ def _biquad(T, i, xi, yi):
     return z, lmt
 
 
+def _interp_coeffs(xc, x, ra, dra=None):
+    """
+    Vectorized 4-point coefficient routine shared by _unint_vec and _biquad_vec.
+    xc is an (n, 4) array of the bracketing table points, x and ra are (n,) arrays.
+    Returns an (n, 4) array of interpolation weights. If dra, the derivative of ra with
+    respect to x, is given, the derivatives of the weights with respect to x are also
+    returned.
+    """
+    rb = 1.0 - ra
+    p1 = xc[:, 1] - xc[:, 0]
+    p2 = xc[:, 2] - xc[:, 1]
+    p3 = xc[:, 3] - xc[:, 2]
+    p4 = p1 + p2
+    p5 = p2 + p3
+    d1 = x - xc[:, 0]
+    d2 = x - xc[:, 1]
+    d3 = x - xc[:, 2]
+    d4 = x - xc[:, 3]
+    c = np.empty((x.size, 4))
+    c[:, 0] = ra / p1 * d2 / p4 * d3
+    c[:, 1] = -ra / p1 * d1 / p2 * d3 + rb / p2 * d3 / p5 * d4
+    c[:, 2] = ra / p2 * d1 / p4 * d2 - rb / p2 * d2 / p3 * d4
+    c[:, 3] = rb / p5 * d2 / p3 * d3
+
+    if dra is None:
+        return c
+
+    dc = np.empty((x.size, 4))
+    dc[:, 0] = (dra * d2 * d3 + ra * (d2 + d3)) / (p1 * p4)
+    dc[:, 1] = (-(dra * d1 * d3 + ra * (d1 + d3)) / (p1 * p2)
+                + (-dra * d3 * d4 + rb * (d3 + d4)) / (p2 * p5))
+    dc[:, 2] = ((dra * d1 * d2 + ra * (d1 + d2)) / (p2 * p4)
+                - (-dra * d2 * d4 + rb * (d2 + d4)) / (p2 * p3))
+    dc[:, 3] = (-dra * d2 * d3 + rb * (d2 + d3)) / (p5 * p3)
+    return c, dc
+
+
+def _unint_vec(xa, ya, x, compute_derivative=False):
+    """
+    Vectorized version of _unint that evaluates all points of x at once.
+    xa and ya may either be 1-D tables shared by every point or 2-D arrays with one
+    table row per point. Returns arrays of y and the limit flag Lmt for every point.
+    If compute_derivative is True, the derivatives of y with respect to x, and with
+    respect to the (n, m) table values ya, are also returned.
+    """
+    x = np.atleast_1d(np.asarray(x, dtype=float))
+    n = x.size
+    xa = np.asarray(xa, dtype=float)
+    m = xa.shape[-1]
+    xa = np.broadcast_to(xa, (n, m))
+    ya = np.broadcast_to(np.asarray(ya, dtype=float)[..., :m], (n, m))
+    rows = np.arange(n)
+
+    # first table index (after the low end) where xa[i] >= x
+    ge = xa[:, 1:] >= x[:, np.newaxis]
+    found = ge.any(axis=1)
+    idx = np.argmax(ge, axis=1) + 1
+    at_node = found & (xa[rows, idx] == x)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # jx1: the first point of four points
+        jx1 = np.where(idx == 1, 0, np.where(idx == m - 1, m - 4, idx - 2))
+        interior = (idx != 1) & (idx != m - 1)
+        ra = np.where(
+            interior, (xa[rows, idx] - x) / (xa[rows, idx] - xa[rows, idx - 1]),
+            np.where(idx == 1, 1.0, 0.0))
+        cols = jx1[:, np.newaxis] + np.arange(4)
+        xc = np.take_along_axis(xa, cols, axis=1)
+        yc = np.take_along_axis(ya, cols, axis=1)
+
+        if compute_derivative:
+            dra = np.where(interior, -1.0 / (xa[rows, idx] - xa[rows, idx - 1]), 0.0)
+            c, dc = _interp_coeffs(xc, x, ra, dra)
+        else:
+            c = _interp_coeffs(xc, x, ra)
+
+        y_interp = np.sum(c * yc, axis=1)
+
+    low = x <= xa[:, 0]
+    high = ~low & ~found
+    y = np.where(low, ya[:, 0], np.where(
+        high, ya[:, -1], np.where(at_node, ya[rows, idx], y_interp)))
+    Lmt = np.where(x < xa[:, 0], 1, np.where((x > xa[:, 0]) & ~found, 2, 0))
+
+    if not compute_derivative:
+        return y, Lmt
+
+    # y is constant off the ends of the table
+    inside = ~low & ~high
+    with np.errstate(invalid='ignore'):
+        dy_dx = np.where(inside, np.sum(dc * yc, axis=1), 0.0)
+
+    # at a node, the interpolation weights select that node
+    dy_dya = np.zeros((n, m))
+    np.put_along_axis(dy_dya, cols, np.where(inside[:, np.newaxis], c, 0.0), axis=1)
+    dy_dya[low, 0] = 1.0
+    dy_dya[high, -1] = 1.0
+
+    return y, Lmt, dy_dx, dy_dya
+
+
+def _biquad_search_vec(grid, x):
+    """
+    Vectorized table search used by _biquad_vec. Returns the (possibly clamped)
+    evaluation point, the index of the first of the four bracketing points, the
+    interpolation ratio, the limit flag, whether x was found inside the table
+    (i.e. is not off the high end), whether x was clamped to the table, and the
+    derivative of the interpolation ratio with respect to x for every point of x.
+    """
+    m = grid.size
+    ge = grid[np.newaxis, :] >= x[:, np.newaxis]
+    found = ge.any(axis=1)
+    jn = np.argmax(ge, axis=1)
+
+    # off low end
+    low = found & (jn == 0) & (grid[jn] != x)
+    x = np.where(low, grid[0], np.where(found, x, grid[-1]))
+    lmt = np.where(low, 1, np.where(found, 0, 2))
+    clamped = low | ~found
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        j1 = np.where(
+            ~found | (jn == m - 1), m - 4, np.where(jn <= 1, 0, jn - 2))
+        interior = found & (jn > 1) & (jn != m - 1)
+        ra = np.where(
+            ~found | ((jn > 1) & (jn == m - 1)), 0.0, np.where(
+                jn <= 1, 1.0, (grid[jn] - x) / (grid[jn] - grid[jn - 1])))
+        dra = np.where(interior, -1.0 / (grid[jn] - grid[jn - 1]), 0.0)
+
+    return x, j1, ra, lmt, found, clamped, dra
+
+
+def _biquad_vec(T, i, xi, yi, compute_derivative=False):
+    """
+    Vectorized version of _biquad that evaluates all points (xi, yi) at once using
+    the same table layout. If compute_derivative is True, the derivatives of the
+    result with respect to xi and yi are also returned.
+    """
+    xi = np.atleast_1d(np.asarray(xi, dtype=float))
+    yi = np.broadcast_to(np.asarray(yi, dtype=float), xi.shape)
+    nx = int(T[i])
+    ny = int(T[i+1])
+    j1 = int(i + 2)
+    x_grid = np.asarray(T[j1:j1 + nx], dtype=float)
+
+    x, jx1, ra_x, lmt, found_x, clamped_x, dra_x = _biquad_search_vec(x_grid, xi)
+    cols_x = jx1[:, np.newaxis] + np.arange(4)
+    cx, dcx = _interp_coeffs(x_grid[cols_x], x, ra_x, dra_x)
+    # clamped points do not vary with the input
+    dcx[clamped_x] = 0.0
+
+    # NOTE consistent with _biquad, points off the high end of x return zero
+    if ny == 0:
+        # univariate table
+        values = np.asarray(T[j1 + nx:j1 + 2 * nx], dtype=float)
+        z = np.sum(cx * values[cols_x], axis=1)
+        result = np.where(found_x, z, 0.0), np.where(found_x, lmt, 0)
+
+        if compute_derivative:
+            dz_dx = np.where(found_x, np.sum(dcx * values[cols_x], axis=1), 0.0)
+            result += (dz_dx, np.zeros_like(dz_dx))
+
+        return result
+
+    # bivariate table
+    j3 = j1 + nx
+    y_grid = np.asarray(T[j3:j3 + ny], dtype=float)
+    table = np.asarray(T[j3 + ny:j3 + ny + nx * ny], dtype=float).reshape(nx, ny)
+
+    y, jy1, ra_y, lmt_y, _, clamped_y, dra_y = _biquad_search_vec(y_grid, yi)
+    cols_y = jy1[:, np.newaxis] + np.arange(4)
+    cy, dcy = _interp_coeffs(y_grid[cols_y], y, ra_y, dra_y)
+    dcy[clamped_y] = 0.0
+
+    # interpolate in x sense for each of the four bracketing y values, then in y sense
+    block = table[cols_x[:, :, np.newaxis], cols_y[:, np.newaxis, :]]
+    yt = np.einsum('nk,nkm->nm', cx, block)
+    z = np.sum(cy * yt, axis=1)
+    result = np.where(found_x, z, 0.0), np.where(found_x, lmt + 3 * lmt_y, 0)
+
+    if compute_derivative:
+        dz_dx = np.sum(cy * np.einsum('nk,nkm->nm', dcx, block), axis=1)
+        dz_dy = np.sum(dcy * yt, axis=1)
+        result += (np.where(found_x, dz_dx, 0.0), np.where(found_x, dz_dy, 0.0))
+
+    return result
+
+
 # DO NOT AUTO-FORMAT TABLES
 # autopep8: off
 # fmt: off
@@ -599,6 +787,15 @@ class PreHamiltonStandard(om.ExplicitComponent):
             (rho * tipspd**3*diam_prop**3)
 
 
+# vector (per node) and scalar (per blade design) inputs of HamiltonStandard, in the
+# order expected by HamiltonStandard._compute_vectorized
+_NODE_INPUTS = [
+    'power_coefficient', 'advance_ratio', Dynamic.Mission.MACH, 'tip_mach']
+_BLADE_INPUTS = [
+    Aircraft.Engine.PROPELLER_ACTIVITY_FACTOR,
+    Aircraft.Engine.PROPELLER_INTEGRATED_LIFT_COEFFICIENT]
+
+
 class HamiltonStandard(om.ExplicitComponent):
     """
     This is Hamilton Standard component rewritten from Fortran code. 
@@ -612,6 +809,12 @@ class HamiltonStandard(om.ExplicitComponent):
             'aviary_options', types=AviaryValues,
             desc='collection of Aircraft/Mission specific options')
         self.options.declare('num_nodes', default=1, types=int)
+        self.options.declare(
+            'vectorized', default=True, types=bool,
+            desc='If True, evaluate the table lookups for all nodes at once and '
+            'compute analytic partials alongside them. If False, '
+            'use the legacy node-by-node scalar implementation with dense finite '
+            'difference partials.')
 
     def setup(self):
         nn = self.options['num_nodes']
@@ -634,9 +837,377 @@ class HamiltonStandard(om.ExplicitComponent):
         # propeller tip compressibility loss factor
         self.add_output('comp_tip_loss_factor', val=np.zeros(nn), units='unitless')
 
-        self.declare_partials('*', '*', method='fd', form='forward')
+    def setup_partials(self):
+        if not self.options['vectorized']:
+            self.declare_partials('*', '*', method='fd', form='forward')
+            return
+
+        nn = self.options['num_nodes']
+        arange = np.arange(nn)
+
+        # every node only depends on its own flight condition, plus the scalar
+        # blade design parameters
+        self.declare_partials(
+            ['thrust_coefficient', 'comp_tip_loss_factor'],
+            _NODE_INPUTS, rows=arange, cols=arange)
+        self.declare_partials(
+            ['thrust_coefficient', 'comp_tip_loss_factor'],
+            _BLADE_INPUTS, rows=arange, cols=np.zeros(nn, dtype=int))
 
     def compute(self, inputs, outputs):
+        if self.options['vectorized']:
+            ct, xft = self._compute_vectorized(
+                *[inputs[name] for name in _NODE_INPUTS + _BLADE_INPUTS])
+            outputs['thrust_coefficient'] = ct
+            outputs['comp_tip_loss_factor'] = xft
+        else:
+            self._compute_legacy(inputs, outputs)
+
+    def compute_partials(self, inputs, J):
+        if not self.options['vectorized']:
+            return
+
+        names = _NODE_INPUTS + _BLADE_INPUTS
+        _, _, dct, dxft = self._compute_vectorized(
+            *[inputs[name] for name in names], compute_derivative=True)
+
+        for i, name in enumerate(names):
+            J['thrust_coefficient', name] = dct[:, i]
+            J['comp_tip_loss_factor', name] = dxft[:, i]
+
+    # nodes keep iterating after they converge (their values are discarded), which
+    # can overflow or divide by zero
+    @np.errstate(divide='ignore', invalid='ignore', over='ignore')
+    def _compute_vectorized(
+        self, power_coefficient, advance_ratio, mach, tip_mach, act_factor, cli,
+        compute_derivative=False
+    ):
+        """
+        Compute thrust coefficient and compressibility tip loss factor for all nodes
+        at once. This is a batched version of _compute_legacy: every table lookup is
+        performed across the nodes simultaneously, table rows that depend on advance
+        ratio are evaluated for all rows and then selected per node, and the
+        thrust coefficient iteration is carried out with per-node convergence masks.
+
+        If compute_derivative is True, the derivatives of both outputs with respect to
+        the inputs (in argument order) are propagated alongside every intermediate
+        value, including through the iteration, and returned as (nn, 6) arrays.
+        """
+        verbosity = self.options['aviary_options'].get_val(Settings.VERBOSITY)
+        num_blades = self.options['aviary_options'].get_val(
+            Aircraft.Engine.NUM_PROPELLER_BLADES
+        )
+        try:
+            len(num_blades)
+        except TypeError:
+            num_blades = int(num_blades)
+        else:
+            num_blades = int(num_blades[0])
+
+        act_factor = act_factor[0]
+        cli = cli[0]
+        nn = advance_ratio.size
+        debug = verbosity >= Verbosity.DEBUG
+
+        # Derivatives are carried as (..., ndir) arrays, one direction per input. When
+        # they are not needed there are no directions, so the same expressions apply.
+        ndir = 6 if compute_derivative else 0
+        seeds = np.eye(6)[:, :ndir]
+        d_power_coefficient, d_advance_ratio, d_mach, d_tip_mach = [
+            np.tile(seed, (nn, 1)) for seed in seeds[:4]]
+        d_act_factor, d_cli = seeds[4:]
+        zero = np.zeros((nn, ndir))
+
+        def lookup(xa, ya, x, dx, dya=None):
+            # table lookup, with the derivative of the result if needed
+            if not compute_derivative:
+                return _unint_vec(xa, ya, x) + (zero,)
+
+            y, flag, dy_dx, dy_dya = _unint_vec(xa, ya, x, compute_derivative=True)
+            dy = dy_dx[:, np.newaxis] * dx
+            if dya is not None:
+                dy = dy + np.einsum('nm,nmk->nk', dy_dya, dya[:, :dy_dya.shape[1]])
+            return y, flag, dy
+
+        AF_adj_CP = np.zeros(7)  # AFCP: an AF adjustment of CP to be assigned
+        AF_adj_CT = np.zeros(7)  # AFCT: an AF adjustment of CT to be assigned
+        dAF_adj_CP = np.zeros((7, ndir))
+        dAF_adj_CT = np.zeros((7, ndir))
+        for k in range(2):
+            AF_adj_CP[k], _ = _unint(Act_Factor_arr, AFCPC[k], act_factor)
+            AF_adj_CT[k], _ = _unint(Act_Factor_arr, AFCTC[k], act_factor)
+            if compute_derivative:
+                for adj, table in ((dAF_adj_CP, AFCPC), (dAF_adj_CT, AFCTC)):
+                    slope = _unint_vec(Act_Factor_arr, table[k], act_factor,
+                                       compute_derivative=True)[2]
+                    adj[k] = slope * d_act_factor
+        AF_adj_CP[2:] = AF_adj_CP[1]
+        AF_adj_CT[2:] = AF_adj_CT[1]
+        dAF_adj_CP[2:] = dAF_adj_CP[1]
+        dAF_adj_CT[2:] = dAF_adj_CT[1]
+        low_advance_ratio = advance_ratio <= 0.5
+        AFCTE = np.where(
+            low_advance_ratio,
+            2.0 * advance_ratio * (AF_adj_CT[1] - AF_adj_CT[0]) + AF_adj_CT[0],
+            AF_adj_CT[1])
+        dAFCTE = np.where(
+            low_advance_ratio[:, np.newaxis],
+            2.0 * (AF_adj_CT[1] - AF_adj_CT[0]) * d_advance_ratio
+            + 2.0 * advance_ratio[:, np.newaxis] * (dAF_adj_CT[1] - dAF_adj_CT[0])
+            + dAF_adj_CT[0],
+            dAF_adj_CT[1])
+
+        # bounding J (advance ratio) for setting up interpolation
+        J_begin = np.select(
+            [advance_ratio <= 1.0, advance_ratio <= 1.5, advance_ratio <= 2.0],
+            [0, 1, 2], default=3)
+        J_idx = J_begin[:, np.newaxis] + np.arange(4)
+
+        # lift coefficient table bounds are the same for every node
+        CL_node = np.where(np.abs(cli - CL_arr) <= 0.0009)[0]
+        if CL_node.size > 0:
+            # given lift coeff (cli) falls on a node point of CL_arr
+            CL_tab_idx_begin = CL_tab_idx_end = CL_node[0]
+        elif cli <= 0.6:
+            CL_tab_idx_begin, CL_tab_idx_end = 0, 3
+        elif cli <= 0.7:
+            CL_tab_idx_begin, CL_tab_idx_end = 1, 4
+        else:
+            CL_tab_idx_begin, CL_tab_idx_end = 2, 5
+        CL_range = range(CL_tab_idx_begin, CL_tab_idx_end + 1)
+        CL_slice = slice(CL_tab_idx_begin, CL_tab_idx_begin + 4)
+        cli_nodes = np.full(nn, cli)
+        d_cli_nodes = np.tile(d_cli, (nn, 1))
+
+        def cli_adjustment(table, dtable):
+            # interpolate (or select) CLI adjustment across the CL_arr tables
+            if CL_node.size > 0:
+                return table[:, CL_tab_idx_begin], dtable[:, CL_tab_idx_begin]
+            y, _, dy = lookup(CL_arr[CL_slice], table[:, CL_slice], cli_nodes,
+                              d_cli_nodes, dtable[:, CL_slice])
+            return y, dy
+
+        if num_blades % 2 == 0:
+            # even number of blades, no interpolation needed
+            nbb = 1
+            idx_blade = num_blades // 2 - 1
+        else:
+            # odd number of blades, interpolate using the 4 tabulated blade counts
+            nbb = 4
+            idx_blade = 0
+
+        # compressibility Mach number offset for each CL table, fixed per node
+        DMN = np.zeros((nn, 6))
+        dDMN = np.zeros((nn, 6, ndir))
+        nonzero_advance_ratio = advance_ratio != 0.0
+        for kl in CL_range:
+            ZMCRT, _, dZMCRT = lookup(
+                advance_ratio_array2, mach_corr_table[kl], advance_ratio,
+                d_advance_ratio)
+            DMN[:, kl] = np.where(
+                nonzero_advance_ratio, mach - ZMCRT, tip_mach - mach_tip_corr_arr[kl])
+            dDMN[:, kl] = np.where(
+                nonzero_advance_ratio[:, np.newaxis], d_mach - dZMCRT, d_tip_mach)
+
+        TFCLII, _, dTFCLII = lookup(
+            advance_ratio_array, TF_CLI_arr, advance_ratio, d_advance_ratio)
+
+        ichck = np.zeros(nn, dtype=int)
+        CTTT = np.zeros((nn, 4))
+        XXXFT = np.zeros((nn, 4))
+        dCTTT = np.zeros((nn, 4, ndir))
+        dXXXFT = np.zeros((nn, 4, ndir))
+
+        for ibb in range(nbb):
+            BLL = np.zeros((nn, 7))
+            CTT = np.zeros((nn, 7))
+            dCTT = np.zeros((nn, 7, ndir))
+            for kdx in range(7):
+                # only nodes whose advance ratio bounds include kdx use these values
+                in_bounds = (kdx >= J_begin) & (kdx <= J_begin + 3)
+                CP_Eff = power_coefficient * AF_adj_CP[kdx]
+                dCP_Eff = (AF_adj_CP[kdx] * d_power_coefficient
+                           + power_coefficient[:, np.newaxis] * dAF_adj_CP[kdx])
+                # PBL = number of blades correction for power_coefficient
+                PBL, _, dPBL = lookup(CPEC, BL_P_corr_table[idx_blade], CP_Eff, dCP_Eff)
+                CPE1 = CP_Eff * PBL * PF_CLI_arr[kdx]
+                dCPE1 = PF_CLI_arr[kdx] * (dCP_Eff * PBL[:, np.newaxis]
+                                           + CP_Eff[:, np.newaxis] * dPBL)
+                PXCLI = np.zeros((nn, 7))
+                dPXCLI = np.zeros((nn, 7, ndir))
+                for kl in CL_range:
+                    CPE1X = np.maximum(CPE1, CP_CLi_table[kl][0])
+                    dCPE1X = np.where(
+                        (CPE1 >= CP_CLi_table[kl][0])[:, np.newaxis], dCPE1, 0.0)
+                    cli_len = cli_arr_len[kl]
+                    PXCLI[:, kl], run_flag, dPXCLI[:, kl] = lookup(
+                        CP_CLi_table[kl][:cli_len], XPCLI[kl], CPE1X, dCPE1X)
+                    off_low = in_bounds & (run_flag == 1)
+                    ichck += off_low
+                    report = in_bounds & (debug | (ichck <= 1))
+                    for i in np.where(report & off_low)[0]:
+                        warnings.warn(
+                            "Mach,VTMACH,J,power_coefficient,CP_Eff =: "
+                            f"{mach[i]},{tip_mach[i]},{advance_ratio[i]},"
+                            f"{power_coefficient[i]},{CP_Eff[i]}")
+                    if kl in (4, 5):
+                        for i in np.where(report & (CPE1 < 0.010))[0]:
+                            print(
+                                f"Extrapolated data is being used for CLI=.{kl + 2}"
+                                f"--CPE1,PXCLI,L= , {CPE1[i]},{PXCLI[i, kl]},"
+                                f"{idx_blade}   Suggest inputting CLI=.5")
+                # PCLI = CLI adjustment to power_coefficient
+                PCLI, dPCLI = cli_adjustment(PXCLI, dPXCLI)
+                # the effective CP at baseline point for kdx
+                dCP_Eff = dCP_Eff * PCLI[:, np.newaxis] + CP_Eff[:, np.newaxis] * dPCLI
+                CP_Eff = CP_Eff * PCLI
+                ang_len = ang_arr_len[kdx]
+                # blade angle at baseline point for kdx
+                BLL[:, kdx], _, dBLL = lookup(
+                    CP_Angle_table[idx_blade][kdx][:ang_len], Blade_angle_table[kdx],
+                    CP_Eff, dCP_Eff)
+                # thrust coeff at baseline point for kdx
+                CTT[:, kdx], run_flag, dCTT[:, kdx] = lookup(
+                    Blade_angle_table[kdx][:ang_len],
+                    CT_Angle_table[idx_blade][kdx][:ang_len], BLL[:, kdx], dBLL)
+                if debug:
+                    for i in np.where(in_bounds & (run_flag > 1))[0]:
+                        print(f"ERROR IN PROP. PERF.-- NERPT=2, run_flag={run_flag[i]}")
+
+            # NOTE the blade angle at the given advance ratio is not an output, so
+            #      only the baseline thrust coefficient is interpolated here
+            CTTT[:, ibb], _, dCTTT[:, ibb] = lookup(
+                advance_ratio_array[J_idx], np.take_along_axis(CTT, J_idx, axis=1),
+                advance_ratio, d_advance_ratio,
+                np.take_along_axis(dCTT, J_idx[:, :, np.newaxis], axis=1))
+
+            # make extra correction. CTG is an "error" function, and the iteration
+            # tries to drive CTG/CT to 0 independently for each node
+            CTG = np.zeros((nn, 11))
+            CTG1 = np.zeros((nn, 11))
+            dCTG = np.zeros((nn, 11, ndir))
+            dCTG1 = np.zeros((nn, 11, ndir))
+            CTG[:, 0] = .100
+            CTG[:, 1] = .200
+            TXCLI = np.zeros((nn, 6))
+            XFFT = np.zeros((nn, 6))
+            dTXCLI = np.zeros((nn, 6, ndir))
+            dXFFT = np.zeros((nn, 6, ndir))
+            ct = np.zeros(nn)
+            xft = np.ones(nn)
+            dct = np.zeros((nn, ndir))
+            dxft = np.zeros((nn, ndir))
+            active = np.ones(nn, dtype=bool)
+            ifnd2 = np.zeros(nn, dtype=bool)
+            NCTG = 10
+            for il in range(NCTG):
+                CT_Eff = CTG[:, il] * AFCTE
+                dCT_Eff = (dCTG[:, il] * AFCTE[:, np.newaxis]
+                           + CTG[:, il, np.newaxis] * dAFCTE)
+                # TBL = number of blades correction for thrust_coefficient
+                TBL, _, dTBL = lookup(CTEC, BL_T_corr_table[idx_blade], CT_Eff, dCT_Eff)
+                CTE1 = CT_Eff * TBL * TFCLII
+                dCTE1 = ((dCT_Eff * TBL[:, np.newaxis] + CT_Eff[:, np.newaxis] * dTBL)
+                         * TFCLII[:, np.newaxis]
+                         + (CT_Eff * TBL)[:, np.newaxis] * dTFCLII)
+                for kl in CL_range:
+                    CTE1X = np.maximum(CTE1, CT_CLi_table[kl][0])
+                    dCTE1X = np.where(
+                        (CTE1 >= CT_CLi_table[kl][0])[:, np.newaxis], dCTE1, 0.0)
+                    cli_len = cli_arr_len[kl]
+                    TXCLI[:, kl], run_flag, dTXCLI[:, kl] = lookup(
+                        CT_CLi_table[kl][:cli_len], XTCLI[kl][:cli_len], CTE1X,
+                        dCTE1X)
+                    if debug:
+                        # off lower bound only.
+                        for i in np.where(active & (run_flag == 1))[0]:
+                            print(
+                                f"ERROR IN PROP. PERF.-- NERPT=5, run_flag={run_flag[i]}"
+                                f", il = {il}, kl = {kl}")
+                    # compressibility tip loss factor
+                    CTE2 = CT_Eff * TXCLI[:, kl] * TBL
+                    supercritical = DMN[:, kl] > 0.0
+                    if compute_derivative:
+                        dCTE2 = (
+                            (dCT_Eff * TXCLI[:, kl, np.newaxis]
+                             + CT_Eff[:, np.newaxis] * dTXCLI[:, kl])
+                            * TBL[:, np.newaxis]
+                            + (CT_Eff * TXCLI[:, kl])[:, np.newaxis] * dTBL)
+                        XFFT_kl, _, dXFFT_dDMN, dXFFT_dCTE2 = _biquad_vec(
+                            comp_mach_CT_arr, 1, DMN[:, kl], CTE2,
+                            compute_derivative=True)
+                        dXFFT[:, kl] = np.where(
+                            supercritical[:, np.newaxis],
+                            dXFFT_dDMN[:, np.newaxis] * dDMN[:, kl]
+                            + dXFFT_dCTE2[:, np.newaxis] * dCTE2, 0.0)
+                    else:
+                        XFFT_kl, _ = _biquad_vec(comp_mach_CT_arr, 1, DMN[:, kl], CTE2)
+                    XFFT[:, kl] = np.where(supercritical, XFFT_kl, 1.0)
+                TCLII, dTCLII = cli_adjustment(TXCLI, dTXCLI)
+                XFT, dXFT = cli_adjustment(XFFT, dXFFT)
+                ct = np.where(active, CTG[:, il], ct)
+                dct = np.where(active[:, np.newaxis], dCTG[:, il], dct)
+                xft = np.where(active, XFT, xft)
+                dxft = np.where(active[:, np.newaxis], dXFT, dxft)
+                CTG1[:, il] = CTG[:, il] * AFCTE * TCLII - CTTT[:, ibb]
+                dCTG1[:, il] = (
+                    dCTG[:, il] * (AFCTE * TCLII)[:, np.newaxis]
+                    + (CTG[:, il] * TCLII)[:, np.newaxis] * dAFCTE
+                    + (CTG[:, il] * AFCTE)[:, np.newaxis] * dTCLII
+                    - dCTTT[:, ibb])
+                active &= ~(np.abs(CTG1[:, il] / CTTT[:, ibb]) < 0.001)
+                if il > 0:
+                    # secant update
+                    a = CTG1[:, il-1]
+                    b = CTG[:, il] - CTG[:, il-1]
+                    c = CTG1[:, il] - CTG1[:, il-1]
+                    CTG[:, il+1] = -a * b / c + CTG[:, il-1]
+                    da = dCTG1[:, il-1]
+                    db = dCTG[:, il] - dCTG[:, il-1]
+                    dc = dCTG1[:, il] - dCTG1[:, il-1]
+                    dCTG[:, il+1] = (
+                        -(da * (b / c)[:, np.newaxis] + db * (a / c)[:, np.newaxis])
+                        + dc * (a * b / c ** 2)[:, np.newaxis] + dCTG[:, il-1])
+                    diverged = active & (CTG[:, il+1] <= 0)
+                    ifnd2 |= diverged
+                    active &= ~diverged
+                if not active.any():
+                    break
+
+            if active.any():
+                raise ValueError(
+                    "Integrated design cl adjustment not working properly for ct "
+                    f"definition (ibb={ibb})"
+                )
+            CTTT[:, ibb] = np.where(ifnd2, 0.0, ct)
+            dCTTT[:, ibb] = np.where(ifnd2[:, np.newaxis], 0.0, dct)
+            XXXFT[:, ibb] = xft
+            dXXXFT[:, ibb] = dxft
+            idx_blade = idx_blade + 1
+
+        if nbb != 1:
+            # interpolation by the number of blades if odd number
+            blades = np.full(nn, float(num_blades))
+            ct, _, dct = lookup(num_blades_arr, CTTT, blades, zero, dCTTT)
+            xft, _, dxft = lookup(num_blades_arr, XXXFT, blades, zero, dXXXFT)
+        else:
+            ct = CTTT[:, 0]
+            xft = XXXFT[:, 0]
+            dct = dCTTT[:, 0]
+            dxft = dXXXFT[:, 0]
+
+        # NOTE this could be handled via the metamodel comps (extrapolate flag)
+        if debug:
+            for i in np.where(ichck > 0)[0]:
+                print(f"  table look-up error = {ichck[i]} "
+                      "(if you go outside the tables.)")
+
+        if compute_derivative:
+            return ct, xft, dct, dxft
+
+        return ct, xft
+
+    def _compute_legacy(self, inputs, outputs):
         verbosity = self.options['aviary_options'].get_val(Settings.VERBOSITY)
         act_factor = inputs[Aircraft.Engine.PROPELLER_ACTIVITY_FACTOR][0]
         cli = inputs[Aircraft.Engine.PROPELLER_INTEGRATED_LIFT_COEFFICIENT][0]
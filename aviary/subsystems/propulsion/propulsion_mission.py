@@ -3,6 +3,8 @@ import sys
 import numpy as np
 import openmdao.api as om
 
+from aviary.subsystems.propulsion.fused_engine_decks import (
+    FusedEngineDecks, can_fuse_engine_decks)
 from aviary.utils.aviary_values import AviaryValues
 from aviary.variable_info.variables import Aircraft, Dynamic, Settings
 
@@ -27,13 +29,35 @@ class PropulsionMission(om.Group):
             'engine_models', types=list, desc='list of EngineModels on aircraft'
         )
 
+        self.options.declare(
+            'fuse_engine_decks', types=bool, default=True,
+            desc='if True and there are multiple engine types that are all '
+            'EngineDecks, evaluate them in a single vectorized component instead of '
+            'building a separate mission subsystem for each engine type',
+        )
+
     def setup(self):
         nn = self.options['num_nodes']
         options: AviaryValues = self.options['aviary_options']
         engine_models = self.options['engine_models']
         num_engine_type = len(engine_models)
 
-        if num_engine_type > 1:
+        self._fused = (
+            num_engine_type > 1
+            and self.options['fuse_engine_decks']
+            and can_fuse_engine_decks(engine_models)
+        )
+
+        if self._fused:
+            # performance of all engine types is already vectorized
+            self.add_subsystem(
+                'engine_decks',
+                FusedEngineDecks(num_nodes=nn, engine_models=engine_models),
+                promotes_inputs=['*'],
+                promotes_outputs=['*'],
+            )
+
+        elif num_engine_type > 1:
 
             # We need a single component with scale_factor. Dymos can't find it when it is
             # already sliced across several component.
@@ -93,6 +117,20 @@ class PropulsionMission(om.Group):
                 if engine.use_hybrid_throttle:
                     self.promotes(engine.name, inputs=[Dynamic.Mission.HYBRID_THROTTLE])
 
+        if not self._fused:
+            self._add_performance_mux()
+
+        self.add_subsystem(
+            'propulsion_sum',
+            subsys=PropulsionSum(num_nodes=nn, aviary_options=options),
+            promotes_inputs=['*'],
+            promotes_outputs=['*'],
+        )
+
+    def _add_performance_mux(self):
+        nn = self.options['num_nodes']
+        num_engine_type = len(self.options['engine_models'])
+
         # TODO might be able to avoid hardcoding using propulsion Enums
         # mux component to vectorize individual engine outputs into 2d arrays
         perf_mux = om.MuxComp(vec_size=num_engine_type)
@@ -135,17 +173,13 @@ class PropulsionMission(om.Group):
             'vectorize_performance', subsys=perf_mux, promotes_outputs=['*']
         )
 
-        self.add_subsystem(
-            'propulsion_sum',
-            subsys=PropulsionSum(num_nodes=nn, aviary_options=options),
-            promotes_inputs=['*'],
-            promotes_outputs=['*'],
-        )
-
     def configure(self):
         # Special configure step needed to handle multiple, unique engine models.
         # Handle checking each EngineModel for compatible outputs with
         # vectorize_performance component and connecting those outputs
+        if self._fused:
+            # fused engine decks have no individual engine outputs to connect
+            return
 
         # TODO this list shouldn't be hardcoded so it can be extended by users
         supported_outputs = [
@@ -2,16 +2,26 @@ import csv
 import unittest
 from pathlib import Path
 
+import numpy as np
+import openmdao.api as om
+
 from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
 
 from aviary.subsystems.propulsion.engine_deck import EngineDeck
 from aviary.subsystems.propulsion.utils import EngineModelVariables as keys
+from aviary.utils.csv_data_file import convert_data_file_to_binary
+from aviary.utils.functions import get_path
 from aviary.utils.named_values import NamedValues
 from aviary.validation_cases.validation_data.flops_data.FLOPS_Test_Data import \
     FLOPS_Test_Data
-from aviary.subsystems.propulsion.utils import build_engine_deck
+from aviary.subsystems.propulsion.utils import INTERPOLANT_CACHE_SIZE, \
+    _interpolant_cache, build_engine_deck, clear_interpolant_cache, \
+    get_shared_interpolant
+from aviary.variable_info.variables import Aircraft, Dynamic
 
 
+@use_tempdirs
 class EngineDeckTest(unittest.TestCase):
     def test_flight_idle(self):
         tol = 1e-6
@@ -132,6 +142,133 @@ class EngineDeckTest(unittest.TestCase):
         assert_near_equal(thrust, expected_thrust, tolerance=tol)
         assert_near_equal(fuel_flow_rate, expected_fuel_flow_rate, tolerance=tol)
 
+    def test_shared_interpolants(self):
+        aviary_values = FLOPS_Test_Data['LargeSingleAisle2FLOPS']['inputs']
+        engine = build_engine_deck(aviary_values)[0]
+
+        prob = om.Problem()
+        for name, num_nodes in [('phase_a', 3), ('phase_b', 5)]:
+            phase = prob.model.add_subsystem(name, om.Group())
+            ivc = om.IndepVarComp(
+                Dynamic.Mission.MACH, np.linspace(0.2, 0.8, num_nodes), units='unitless')
+            ivc.add_output(
+                Dynamic.Mission.ALTITUDE, np.linspace(0., 35000., num_nodes), units='ft')
+            ivc.add_output(
+                Dynamic.Mission.THROTTLE, np.linspace(0.5, 1.0, num_nodes),
+                units='unitless')
+            ivc.add_output(Aircraft.Engine.SCALE_FACTOR, 1.0, units='unitless')
+            phase.add_subsystem('ivc', ivc, promotes=['*'])
+            phase.add_subsystem(
+                'engine', engine.build_mission(num_nodes, aviary_values),
+                promotes=['*'])
+        prob.setup()
+        prob.run_model()
+
+        # interpolation tables are built once and shared between phases
+        for comp in ['interpolation', 'max_interpolation']:
+            interps_a = prob.model._get_subsystem('phase_a.engine.' + comp).interps
+            interps_b = prob.model._get_subsystem('phase_b.engine.' + comp).interps
+            for output in interps_a:
+                self.assertIs(interps_a[output].table, interps_b[output].table)
+
+        # phases evaluating the same flight conditions see the same results
+        thrust_a = prob.get_val('phase_a.' + Dynamic.Mission.THRUST)
+        thrust_b = prob.get_val('phase_b.' + Dynamic.Mission.THRUST)
+        assert_near_equal(thrust_a[[0, -1]], thrust_b[[0, -1]], tolerance=1e-12)
+
+        # results match an interpolator that builds its own tables
+        standalone = om.Problem()
+        interp = standalone.model.add_subsystem('interp', om.MetaModelSemiStructuredComp(
+            method=engine.get_val(Aircraft.Engine.INTERPOLATION_METHOD),
+            extrapolate=True, vec_size=5))
+        for key in [keys.MACH, keys.ALTITUDE, keys.THROTTLE]:
+            interp.add_input(key.value, engine.data[key])
+        interp.add_output('thrust', engine.data[keys.THRUST])
+        standalone.setup()
+        standalone.set_val('interp.' + keys.MACH.value, np.linspace(0.2, 0.8, 5))
+        standalone.set_val('interp.' + keys.ALTITUDE.value, np.linspace(0., 35000., 5))
+        standalone.set_val('interp.' + keys.THROTTLE.value, np.linspace(0.5, 1.0, 5))
+        standalone.run_model()
+
+        assert_near_equal(
+            prob.get_val('phase_b.interpolation.' + keys.THRUST.value + '_unscaled'),
+            standalone.get_val('interp.thrust'), tolerance=1e-12)
+
+    def test_interpolant_cache_size(self):
+        clear_interpolant_cache()
+        grid = np.linspace(0.0, 1.0, 5)[:, np.newaxis]
+
+        first = get_shared_interpolant(grid, grid[:, 0], 'slinear', True)
+        for i in range(1, INTERPOLANT_CACHE_SIZE + 1):
+            get_shared_interpolant(grid, grid[:, 0] + i, 'slinear', True)
+
+        # the least recently used table was evicted, but is still usable by its owner
+        self.assertEqual(len(_interpolant_cache), INTERPOLANT_CACHE_SIZE)
+        self.assertIsNot(
+            get_shared_interpolant(grid, grid[:, 0], 'slinear', True).table,
+            first.table)
+        assert_near_equal(first.interpolate(np.array([[0.5]])), [0.5], 1e-12)
+
+        clear_interpolant_cache()
+
+    def test_precompute_max_thrust(self):
+        aviary_values = FLOPS_Test_Data['LargeSingleAisle2FLOPS']['inputs'].deepcopy()
+        engine = build_engine_deck(aviary_values)[0]
+
+        # flight conditions that exist in the engine deck
+        conditions = np.unique(
+            np.stack((engine.data[keys.MACH], engine.data[keys.ALTITUDE]), axis=1),
+            axis=0)
+        conditions = conditions[::max(len(conditions) // 7, 1)]
+        num_nodes = len(conditions)
+
+        def run(precompute):
+            engine.set_val(Aircraft.Engine.PRECOMPUTE_MAX_THRUST, precompute)
+            prob = om.Problem()
+            ivc = om.IndepVarComp(
+                Dynamic.Mission.MACH, conditions[:, 0], units='unitless')
+            ivc.add_output(Dynamic.Mission.ALTITUDE, conditions[:, 1], units='ft')
+            ivc.add_output(
+                Dynamic.Mission.THROTTLE, np.full(num_nodes, 0.8), units='unitless')
+            ivc.add_output(Aircraft.Engine.SCALE_FACTOR, 1.0, units='unitless')
+            prob.model.add_subsystem('ivc', ivc, promotes=['*'])
+            prob.model.add_subsystem(
+                'engine', engine.build_mission(num_nodes, aviary_values),
+                promotes=['*'])
+            prob.setup()
+            prob.run_model()
+            return prob
+
+        full = run(False)
+        reduced = run(True)
+
+        subsystems = reduced.model.engine._subsystems_allprocs
+        self.assertNotIn('interp_max_throttles', subsystems)
+        self.assertNotIn('fixed_max_throttles', subsystems)
+
+        assert_near_equal(reduced.get_val(Dynamic.Mission.THRUST_MAX, units='lbf'),
+                          full.get_val(Dynamic.Mission.THRUST_MAX, units='lbf'),
+                          tolerance=1e-10)
+        assert_near_equal(reduced.get_val(Dynamic.Mission.THRUST, units='lbf'),
+                          full.get_val(Dynamic.Mission.THRUST, units='lbf'),
+                          tolerance=1e-12)
+
+    def test_binary_data_file(self):
+        aviary_values = FLOPS_Test_Data['LargeSingleAisle2FLOPS']['inputs'].deepcopy()
+        csv_engine = build_engine_deck(aviary_values)[0]
+
+        convert_data_file_to_binary(
+            get_path(aviary_values.get_val(Aircraft.Engine.DATA_FILE)), 'engine.npz')
+        aviary_values.set_val(Aircraft.Engine.DATA_FILE, 'engine.npz')
+        binary_engine = build_engine_deck(aviary_values)[0]
+
+        self.assertEqual(list(binary_engine.data), list(csv_engine.data))
+        for key in csv_engine.data:
+            assert_near_equal(binary_engine.data[key], csv_engine.data[key],
+                              tolerance=1e-15)
+            assert_near_equal(binary_engine.packed_data[key],
+                              csv_engine.packed_data[key], tolerance=1e-15)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -126,6 +126,68 @@ class HamiltonStandardTest(unittest.TestCase):
         assert_check_partials(partial_data, atol=1e-5, rtol=1e-5)
 
 
+class HamiltonStandardVectorizedTest(unittest.TestCase):
+    """
+    Test that the vectorized HamiltonStandard evaluation matches the legacy
+    node-by-node implementation, and that its analytic partials are correct.
+    """
+
+    def _run(self, num_blades, vectorized):
+        options = get_option_defaults()
+        options.set_val(
+            Aircraft.Engine.NUM_PROPELLER_BLADES, val=num_blades, units='unitless')
+
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            'hs',
+            HamiltonStandard(
+                num_nodes=6, aviary_options=options, vectorized=vectorized),
+            promotes_inputs=['*'],
+            promotes_outputs=["*"],
+        )
+        prob.setup()
+
+        prob.set_val("power_coefficient",
+                     [0.2352, 0.2352, 0.2553, 0.1, 0.35, 0.05], units="unitless")
+        prob.set_val("advance_ratio",
+                     [0.0066, 0.8295, 1.9908, 1.25, 2.6, 0.45], units="unitless")
+        prob.set_val(Dynamic.Mission.MACH,
+                     [0.001509, 0.1887, 0.4976, 0.3, 0.6, 0.1], units="unitless")
+        prob.set_val("tip_mach",
+                     [1.2094, 1.2094, 1.3290, 0.9, 1.1, 0.8], units="unitless")
+        prob.set_val(Aircraft.Engine.PROPELLER_ACTIVITY_FACTOR, 114.0, units="unitless")
+        prob.set_val(Aircraft.Engine.PROPELLER_INTEGRATED_LIFT_COEFFICIENT,
+                     0.45, units="unitless")
+
+        prob.run_model()
+
+        return prob
+
+    def test_even_blades(self):
+        self._compare(4)
+
+    def test_odd_blades(self):
+        self._compare(3)
+
+    def _compare(self, num_blades):
+        vec_prob = self._run(num_blades, vectorized=True)
+        legacy_prob = self._run(num_blades, vectorized=False)
+
+        for name in ['thrust_coefficient', 'comp_tip_loss_factor']:
+            assert_near_equal(
+                vec_prob.get_val(name), legacy_prob.get_val(name), tolerance=1e-12)
+
+        partial_data = vec_prob.check_partials(
+            out_stream=None,
+            compact_print=True,
+            show_only_incorrect=True,
+            form='central',
+            method="fd",
+            step=1e-7,
+        )
+        assert_check_partials(partial_data, atol=1e-5, rtol=1e-5)
+
+
 class PostHamiltonStandardTest(unittest.TestCase):
     """
     Test computation in PostHamiltonStandard class.
@@ -212,6 +212,69 @@ class PropulsionMissionTest(unittest.TestCase):
         partial_data = self.prob.check_partials(out_stream=None, method="cs")
         assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
 
+    def test_fused_engine_decks(self):
+        # engine decks with different variables and max thrust methods, evaluated
+        # by a single fused component and by separate engine subsystems
+        nn = 12
+
+        options = get_flops_inputs('LargeSingleAisle2FLOPS')
+        options.set_val(Settings.VERBOSITY, 0)
+
+        engine = build_engine_deck(options)[0]
+        engine.set_val(Aircraft.Engine.PRECOMPUTE_MAX_THRUST, True)
+
+        options2 = options.deepcopy()
+        options2.set_val(Aircraft.Engine.DATA_FILE,
+                         'models/engines/turbofan_28k_with_electric.deck')
+        options2.set_val(Aircraft.Engine.CONSTANT_FUEL_CONSUMPTION, 50., units='lbm/h')
+        engine2 = build_engine_deck(options2)[0]
+        engine2.name = 'engine2'
+
+        engine_models = [engine, engine2]
+        preprocess_propulsion(options, engine_models=engine_models)
+
+        throttle = np.linspace(1.0, 0.6, nn)
+
+        def run(fuse_engine_decks):
+            prob = om.Problem()
+            # avoid flight conditions on data points, where derivatives are one-sided
+            ivc = om.IndepVarComp(Dynamic.Mission.MACH, np.linspace(0.02, 0.83, nn),
+                                  units='unitless')
+            ivc.add_output(Dynamic.Mission.ALTITUDE, np.linspace(500, 35000, nn),
+                           units='ft')
+            ivc.add_output(Dynamic.Mission.THROTTLE,
+                           np.vstack((throttle, throttle[::-1])).transpose(),
+                           units='unitless')
+            prob.model.add_subsystem('ivc', ivc, promotes=['*'])
+            prob.model.add_subsystem(
+                'propulsion',
+                PropulsionMission(num_nodes=nn, aviary_options=options,
+                                  engine_models=engine_models,
+                                  fuse_engine_decks=fuse_engine_decks),
+                promotes=['*'])
+            prob.setup(force_alloc_complex=True)
+            prob.set_val(Aircraft.Engine.SCALE_FACTOR, [0.975, 1.1])
+            prob.run_model()
+            return prob
+
+        fused = run(True)
+        separate = run(False)
+
+        subsystems = fused.model.propulsion._subsystems_allprocs
+        self.assertIn('engine_decks', subsystems)
+        self.assertNotIn('vectorize_performance', subsystems)
+
+        for name in [Dynamic.Mission.THRUST, Dynamic.Mission.THRUST_MAX,
+                     Dynamic.Mission.FUEL_FLOW_RATE_NEGATIVE,
+                     Dynamic.Mission.ELECTRIC_POWER_IN, Dynamic.Mission.NOX_RATE,
+                     Dynamic.Mission.THRUST_TOTAL,
+                     Dynamic.Mission.FUEL_FLOW_RATE_NEGATIVE_TOTAL]:
+            assert_near_equal(fused.get_val(name), separate.get_val(name),
+                              tolerance=1e-10)
+
+        partial_data = fused.check_partials(out_stream=None, method="cs")
+        assert_check_partials(partial_data, atol=1e-10, rtol=1e-10)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -5,12 +5,18 @@ default_units : dict
     Matches each EngineModelVariables entry with default units (str)
 """
 
+import copy
+import hashlib
+
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
 
 import numpy as np
 import openmdao.api as om
 
+from openmdao.components.interp_util.interp_semi import InterpNDSemi
+
 import aviary.constants as constants
 
 from aviary.utils.aviary_values import AviaryValues
@@ -346,6 +352,135 @@ class EngineDataInterpolator(om.Group):
         )
 
 
+# Maximum number of interpolants kept in _interpolant_cache. Instances already using an
+# interpolant keep it alive after it is evicted.
+INTERPOLANT_CACHE_SIZE = 64
+
+# Interpolants shared between all CachedMetaModelSemiStructuredComp instances, keyed on
+# a hash of the training data plus interpolation settings, in least recently used order
+_interpolant_cache = OrderedDict()
+
+
+def clear_interpolant_cache():
+    """
+    Remove all interpolants stored by CachedMetaModelSemiStructuredComp, releasing the
+    memory held by their tables.
+    """
+    _interpolant_cache.clear()
+
+
+def _hash_training_data(*arrays):
+    """
+    Return a digest of the contents of the provided training data arrays.
+    """
+    digest = hashlib.sha1()
+    for array in arrays:
+        array = np.ascontiguousarray(array, dtype=float)
+        digest.update(str(array.shape).encode())
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def get_shared_interpolant(grid, values, method, extrapolate):
+    """
+    Return an InterpNDSemi for the given training data, re-using the interpolation
+    table of any interpolant previously built from identical data and settings.
+
+    Parameters
+    ----------
+    grid : ndarray
+        Training input points, with one column per independent variable.
+    values : ndarray
+        Training output values at each point in grid.
+    method : str
+        Interpolation method.
+    extrapolate : bool
+        If False, evaluating points outside the training data range raises an error.
+
+    Returns
+    -------
+    InterpNDSemi
+        Shallow copy of the shared interpolant. The copy shares the table but keeps
+        its own cached evaluation point and derivatives, so it can be used
+        independently of other copies.
+    """
+    key = (_hash_training_data(grid), _hash_training_data(values), method,
+           extrapolate)
+
+    if key in _interpolant_cache:
+        _interpolant_cache.move_to_end(key)
+    else:
+        _interpolant_cache[key] = InterpNDSemi(
+            grid, values, method=method, extrapolate=extrapolate)
+        if len(_interpolant_cache) > INTERPOLANT_CACHE_SIZE:
+            _interpolant_cache.popitem(last=False)
+
+    return copy.copy(_interpolant_cache[key])
+
+
+class CachedMetaModelSemiStructuredComp(om.MetaModelSemiStructuredComp):
+    """
+    MetaModelSemiStructuredComp that re-uses interpolation tables between instances.
+
+    The interpolant for each output (the sorted grid and the table coefficients) is
+    built the first time a given set of training data and interpolation settings is
+    set up, and then shared by every other instance using identical data, regardless
+    of vec_size. This avoids re-ingesting the same engine deck for every mission
+    phase. Evaluation state is kept per instance, so instances remain independent.
+
+    Output training data is kept in shared_training_outputs instead of
+    training_outputs, so MetaModelSemiStructuredComp does not build interpolants of
+    its own. If training data gradients are requested the tables must be rebuilt every
+    iteration, so caching is skipped.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+        self.shared_training_outputs = {}
+
+    def add_output(self, name, training_data=None, **kwargs):
+        """
+        Add an output to this component and a corresponding training output.
+
+        Parameters
+        ----------
+        name : str
+            Name of the output.
+        training_data : ndarray
+            Training data sample points for this output variable. Must be of length m,
+            where m is the total number of points in the table.
+        **kwargs : dict
+            Additional arguments for add_output.
+        """
+        super().add_output(name, training_data, **kwargs)
+
+        if not self.options['training_data_gradients']:
+            self.shared_training_outputs[name] = self.training_outputs.pop(name)
+
+    def setup(self):
+        super().setup()
+
+        if not self.shared_training_outputs:
+            return
+
+        # Make sure all training data is sized correctly.
+        size = len(self.training_inputs[self.pnames[0]])
+        for data_dict in [self.training_inputs, self.shared_training_outputs]:
+            for name, data in data_dict.items():
+                size2 = len(data)
+                if size2 != size:
+                    msg = f"Size mismatch: training data for '{name}' is length " + \
+                        f"{size2}, but data for '{self.pnames[0]}' is length {size}."
+                    raise ValueError(msg)
+
+        grid = np.array([col for col in self.training_inputs.values()]).T
+
+        for name, train_data in self.shared_training_outputs.items():
+            self.interps[name] = get_shared_interpolant(
+                grid, train_data, self.options['method'], self.options['extrapolate'])
+
+
 class UncorrectData(om.Group):
     """
     Calculations to recover physical parameter values that have been corrected based on ambient atmospheric conditions
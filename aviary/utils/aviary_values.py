@@ -16,6 +16,7 @@ OptionalValueAndUnits : type alias
 class AviaryValues
     define a collection of named values with associated units
 '''
+from collections import namedtuple
 from enum import EnumMeta
 
 import numpy as np
@@ -57,20 +58,19 @@ class AviaryValues(NamedValues):
 
         # Special handling to access an Enum member from either the member name or its value.
         my_val = val
-        if key in _MetaData.keys():
-            expected_types = _MetaData[key]['types']
-            if type(expected_types) is EnumMeta:
+        compiled = _compile_meta_data(key, _MetaData)
+        if compiled is not None:
+            if compiled.enum_type is not None:
                 if self._is_iterable(val):
                     my_val = [self._convert_to_enum(
-                        item, expected_types) for item in val]
+                        item, compiled.enum_type) for item in val]
                 else:
-                    my_val = self._convert_to_enum(val, expected_types)
+                    my_val = self._convert_to_enum(val, compiled.enum_type)
 
-        # Special handling if the variable is supposed to be an array
-        if key in _MetaData.keys():
-            default_value = _MetaData[key]['default_value']
+            # Special handling if the variable is supposed to be an array
+            default_value = compiled.default_value
             # if the item is supposed to be an iterable...
-            if self._is_iterable(default_value):
+            if compiled.iterable_default:
                 # but the provided value is not...
                 if not self._is_iterable(my_val):
                     # make object the correct iterable
@@ -79,61 +79,105 @@ class AviaryValues(NamedValues):
                     else:
                         my_val = np.array([my_val], dtype=type(default_value[0]))
 
-        self._check_type(key, my_val, meta_data=meta_data)
-        self._check_units_compatability(key, my_val, units, meta_data=meta_data)
+        if meta_data is not _MetaData:
+            compiled = _compile_meta_data(key, meta_data)
+
+        if compiled is not None:
+            self._check_type(key, my_val, compiled=compiled)
+            self._check_units_compatability(key, my_val, units, compiled=compiled)
 
         super().set_val(key=key, val=my_val, units=units)
 
-    def _check_type(self, key, val, meta_data=_MetaData):
-        if key in meta_data.keys():
-            expected_types = meta_data[key]['types']
-            if expected_types is not None:
-                if self._is_iterable(expected_types):
-                    expected_types = tuple(expected_types)
-                # if val is not iterable, add it to a list (length 1), checks assume
-                # val is iterable
-                if not self._is_iterable(val):
-                    val = [val]
-                # numpy arrays have special typings. Extract item of equivalent built-in python type
-                # numpy arrays do not allow mixed types, only have to check first entry
-                # empty arrays do not need this check
-                if isinstance(val, np.ndarray) and len(val) > 0:
-                    # NoneType numpy arrays do not need to be "converted" to built-in python types
-                    if val.dtype == type(None):
-                        val = [val[0]]
-                    else:
-                        # item() gets us native Python equivalent object (i.e. int vs. numpy.int64)
-                        # wrap first index in np array to ensures works on any dtype
-                        val = [np.array(val[0]).item()]
-                for item in val:
-                    has_bool = False  # needs some fancy shenanigans because bools will register as ints
-                    if (isinstance(expected_types, type)):
-                        if expected_types is bool:
-                            has_bool = True
-                    elif bool in expected_types:
-                        has_bool = True
-                    if (not isinstance(item, expected_types)) or (
-                            (has_bool == False) and (isinstance(item, bool))):
-                        raise TypeError(
-                            f'{key} is of type(s) {meta_data[key]["types"]} but you '
-                            f'have provided a value of type {type(item)}.')
-
-    def _check_units_compatability(self, key, val, units, meta_data=_MetaData):
-        if key in meta_data.keys():
-            expected_units = meta_data[key]['units']
+    def update_many(self, other, meta_data=_MetaData):
+        '''
+        Assign many named values and their associated units at once, checking each of
+        them against the given metadata.
+
+        This is the same as calling `set_val` for each item, but the metadata of each
+        variable is only looked up once.
+
+        Parameters
+        ----------
+        other : NamedValues, dict, or iterable
+            a collection of named values and their associated units, in any of the forms
+            accepted by `update`
+
+        meta_data : dict
+            the metadata the values are checked against
+        '''
+        if isinstance(other, NamedValues):
+            other = other._mapping
+
+        if hasattr(other, 'keys'):
+            other = other.items()
 
+        set_val = self.set_val
+
+        for key, (val, units) in other:
+            set_val(key, val, units, meta_data=meta_data)
+
+    def _check_type(self, key, val, meta_data=_MetaData, compiled=None):
+        if compiled is None:
+            compiled = _compile_meta_data(key, meta_data)
+            if compiled is None:
+                return
+
+        expected_types = compiled.expected_types
+        if expected_types is not None:
+            # if val is not iterable, add it to a list (length 1), checks assume
+            # val is iterable
+            if not self._is_iterable(val):
+                val = [val]
+            # numpy arrays have special typings. Extract item of equivalent built-in python type
+            # numpy arrays do not allow mixed types, only have to check first entry
+            # empty arrays do not need this check
+            if isinstance(val, np.ndarray) and len(val) > 0:
+                # NoneType numpy arrays do not need to be "converted" to built-in python types
+                if val.dtype == type(None):
+                    val = [val[0]]
+                else:
+                    # item() gets us native Python equivalent object (i.e. int vs. numpy.int64)
+                    # wrap first index in np array to ensures works on any dtype
+                    val = [np.array(val[0]).item()]
+            # needs some fancy shenanigans because bools will register as ints
+            has_bool = compiled.has_bool
+            for item in val:
+                if (not isinstance(item, expected_types)) or (
+                        (has_bool == False) and (isinstance(item, bool))):
+                    raise TypeError(
+                        f'{key} is of type(s) {compiled.types} but you '
+                        f'have provided a value of type {type(item)}.')
+
+    def _check_units_compatability(self, key, val, units, meta_data=_MetaData,
+                                   compiled=None):
+        if compiled is None:
+            compiled = _compile_meta_data(key, meta_data)
+            if compiled is None:
+                return
+
+        expected_units = compiled.units
+
+        try:
+            error = _units_compatibility_cache[expected_units, units]
+        except (KeyError, TypeError):
+            error = _find_units_error(expected_units, units)
             try:
-                # NOTE the value here is unimportant, we only care if OpenMDAO will
-                # convert the units
-                _convert_units(10, expected_units, units)
-            except ValueError:
-                raise ValueError(
-                    f'The units {units} which you have provided for {key} are invalid.')
+                _units_compatibility_cache[expected_units, units] = error
             except TypeError:
-                raise TypeError(
-                    f'The base units of {key} are {expected_units}, and you have tried to set {key} with units of {units}, which are not compatible.')
-            except BaseException:
-                raise KeyError('There is an unknown error with your units.')
+                # units that can't be hashed aren't cached
+                pass
+
+        if error is None:
+            return
+
+        if issubclass(error, ValueError):
+            raise ValueError(
+                f'The units {units} which you have provided for {key} are invalid.')
+        elif issubclass(error, TypeError):
+            raise TypeError(
+                f'The base units of {key} are {expected_units}, and you have tried to set {key} with units of {units}, which are not compatible.')
+        else:
+            raise KeyError('There is an unknown error with your units.')
 
     def _is_iterable(self, val):
         return isinstance(val, _valid_iterables)
@@ -151,3 +195,81 @@ class AviaryValues(NamedValues):
 
 
 _valid_iterables = (list, np.ndarray, tuple)
+
+
+# The parts of a variable's metadata that set_val needs, derived once per variable.
+# meta is the metadata dictionary of the variable the rest were derived from, used to
+# detect when the metadata has been replaced.
+_CompiledMetaData = namedtuple(
+    '_CompiledMetaData',
+    ('meta', 'units', 'types', 'default_value', 'enum_type', 'iterable_default',
+     'expected_types', 'has_bool'))
+
+# compiled metadata of each variable, keyed on (id of the metadata dictionary, name) so
+# that problems using different metadata do not evict each other's entries
+_compiled_meta_data_cache = {}
+
+# the type of exception (or None) raised when converting between a pair of units
+_units_compatibility_cache = {}
+
+
+def _compile_meta_data(key, meta_data):
+    """
+    Get the compiled metadata of a variable, or None if it isn't in the metadata.
+    """
+    meta = meta_data.get(key)
+    if meta is None:
+        return None
+
+    cache_key = (id(meta_data), key)
+    compiled = _compiled_meta_data_cache.get(cache_key)
+
+    # The metadata of a variable is normally replaced rather than modified (see
+    # update_meta_data), but edits in place of the parts used here are also caught.
+    # Checking the metadata itself also guards against the id of a deleted metadata
+    # dictionary being reused.
+    if compiled is not None and compiled.meta is meta and \
+            compiled.units is meta['units'] and compiled.types is meta['types'] and \
+            compiled.default_value is meta['default_value']:
+        return compiled
+
+    types = meta['types']
+    default_value = meta['default_value']
+
+    expected_types = types
+    if isinstance(expected_types, _valid_iterables):
+        expected_types = tuple(expected_types)
+
+    if isinstance(expected_types, type):
+        has_bool = expected_types is bool
+    else:
+        has_bool = expected_types is not None and bool in expected_types
+
+    compiled = _CompiledMetaData(
+        meta=meta,
+        units=meta['units'],
+        types=types,
+        default_value=default_value,
+        enum_type=types if type(types) is EnumMeta else None,
+        iterable_default=isinstance(default_value, _valid_iterables),
+        expected_types=expected_types,
+        has_bool=has_bool)
+
+    _compiled_meta_data_cache[cache_key] = compiled
+
+    return compiled
+
+
+def _find_units_error(expected_units, units):
+    """
+    Get the type of exception raised converting from the expected units to the given
+    units, or None if they are compatible.
+    """
+    try:
+        # NOTE the value here is unimportant, we only care if OpenMDAO will
+        # convert the units
+        _convert_units(10, expected_units, units)
+    except BaseException as err:
+        return type(err)
+
+    return None
@@ -1,4 +1,6 @@
 import getpass
+import hashlib
+import json
 import numpy as np
 import re
 import warnings
@@ -12,15 +14,21 @@ from aviary.utils.named_values import get_items, get_keys
 from aviary.utils.functions import get_path
 from aviary.utils.named_values import NamedValues
 
+# data files at least this large (in bytes) are read with numpy's bulk parser
+FAST_READ_MIN_SIZE = 20000
+
 
 # multiple type annotation uses "typeA | typeB" syntax, but requires Python 3.10+
 def read_data_file(filename: (str, Path), metadata=None, aliases=None,
-                   save_comments=False):
+                   save_comments=False, cache=False, fast=None):
     """
     Read data file in Aviary format, which is data delimited by commas with any amount of
     whitespace allowed between data entries. Spaces are not allowed in openMDAO
     variables, so any spaces in header entries are replaced with underscores.
 
+    Binary data files created by write_binary_data_file() are also accepted, and are
+    loaded without any text parsing.
+
     Parameters
     ----------
     filename : (str, Path)
@@ -37,6 +45,15 @@ def read_data_file(filename: (str, Path), metadata=None, aliases=None,
     save_comments : bool, optional
         flag if comments in data file should be returned along with data. Defaults to 
         False.
+    cache : bool, optional
+        flag if a binary copy of the data file should be kept next to it (with ".npz"
+        appended to the filename). If an up-to-date binary copy exists it is read
+        instead of the data file, otherwise one is created. Defaults to False.
+    fast : bool, optional
+        flag if numerical data should be parsed in bulk by numpy instead of line by
+        line. Files that cannot be bulk parsed (such as those with blank entries or
+        rows of differing lengths) are always read line by line. If None, bulk parsing
+        is used for files of at least FAST_READ_MIN_SIZE bytes. Defaults to None.
 
     Returns
     -------
@@ -49,15 +66,41 @@ def read_data_file(filename: (str, Path), metadata=None, aliases=None,
     """
     filepath = get_path(filename)
 
+    _prep_aliases(aliases)
+
+    if _is_binary_data_file(filepath):
+        return read_binary_data_file(filepath, metadata, aliases, save_comments)
+
+    if cache:
+        cache_path = _binary_cache_path(filepath)
+        if _is_binary_cache_current(cache_path, filepath):
+            return read_binary_data_file(cache_path, metadata, aliases, save_comments)
+        convert_data_file_to_binary(filepath, cache_path, ignore_errors=True)
+
     data = NamedValues()
-    comments = []
 
-    # prep aliases for case-insensitive matching, with spaces == underscores
-    if aliases:
-        for key in aliases:
-            if isinstance(aliases[key], str):
-                aliases[key] = [aliases[key]]
-            aliases[key] = [re.sub('\s', '_', item).lower() for item in aliases[key]]
+    if fast is None:
+        fast = filepath.stat().st_size >= FAST_READ_MIN_SIZE
+
+    raw_data = _bulk_read_data_file(filepath) if fast else None
+    if raw_data is not None:
+        comments, line_count, line_data, values = raw_data
+        header, valid_indices = _parse_header(line_data, filepath, metadata, aliases)
+
+        if len(header) == 0:
+            raise ValueError(
+                f'Non-numerical value found in data file <{filepath}> on line '
+                f'{str(line_count)}')
+
+        for idx, variable in zip(valid_indices, header):
+            data.set_val(variable, val=values[:, idx].copy(), units=header[variable])
+
+        if save_comments:
+            return data, comments
+        else:
+            return data
+
+    comments = []
 
     with open(filepath, newline=None, encoding='utf-8-sig') as file:
         # csv.reader() and other avaliable packages that can read csv files are not used
@@ -85,65 +128,8 @@ def read_data_file(filename: (str, Path), metadata=None, aliases=None,
             except (ValueError):
                 # skip checking for header data if not required
                 if check_for_header:
-                    # dictionary of header name: units
-                    header = {}
-                    # list of which column goes with each valid header entry
-                    valid_indices = []
-                    for index in range(len(line_data)):
-                        item = re.split('[(]', line_data[index])
-                        item = [item[i].strip(') ') for i in range(len(item))]
-                        # openMDAO vars can't have spaces, convert to underscores
-                        name = re.sub('\s', '_', item[0])
-                        if aliases:
-                            # "reverse" lookup name in alias dict
-                            for key in aliases:
-                                if name.lower() in aliases[key]:
-                                    name = key
-                                    break
-                        # 'default' default_units
-                        default_units = 'unitless'
-                        # if metadata is provided, ensure variable exists and update
-                        # default_units
-                        if metadata is not None:
-                            if name not in metadata.keys():
-                                warnings.warn(f'Header <{name}> was not recognized, and '
-                                              'will be skipped'
-                                              )
-                                continue
-                            else:
-                                default_units = metadata[name]['units']
-
-                        # if units are provided, check that they are valid
-                        if len(item) > 1:
-                            units = item[-1]
-                            if valid_units(item[1]):
-                                # check that units are compatible with expected units
-                                if metadata is not None:
-                                    if not is_compatible(units, default_units):
-                                        # Raising error here, as trying to use default
-                                        # units could mean accidental conversion which
-                                        # would significantly impact analysis
-                                        raise ValueError(f'Provided units of <{units}> '
-                                                         f'for column <{name}>, which '
-                                                         'are not compatible with default '
-                                                         f'units of {default_units}')
-                            else:
-                                # Units were not recognized. Raise error
-                                raise ValueError(f'Invalid units <{units}> provided for '
-                                                 f'column <{name}> while reading '
-                                                 f'<{filepath}>.')
-                        else:
-                            if metadata is not None and default_units != 'unitless':
-                                # units were not provided, but variable should have them
-                                # assume default units for that variable
-                                warning = f'Units were not provided for column <{name}> '\
-                                          f'while reading <{filepath}>. Using default '\
-                                          f'units of {default_units}.'
-                                warnings.warn(warning)
-                            units = default_units
-
-                        header[name] = units
-                        valid_indices.append(index)
+                    header, valid_indices = _parse_header(
+                        line_data, filepath, metadata, aliases)
 
                     if len(header) > 0:
                         check_for_header = False
@@ -174,6 +160,333 @@ def read_data_file(filename: (str, Path), metadata=None, aliases=None,
         return data
 
 
+def _prep_aliases(aliases):
+    # prep aliases for case-insensitive matching, with spaces == underscores
+    if aliases:
+        for key in aliases:
+            if isinstance(aliases[key], str):
+                aliases[key] = [aliases[key]]
+            aliases[key] = [re.sub('\s', '_', item).lower() for item in aliases[key]]
+
+
+def _parse_header(line_data, filepath, metadata=None, aliases=None):
+    """
+    Interpret the entries of a data file header line.
+
+    Returns
+    -------
+    header : dict
+        Variable name: units for each valid header entry.
+    valid_indices : list of int
+        Index of the column that goes with each valid header entry.
+    """
+    # dictionary of header name: units
+    header = {}
+    # list of which column goes with each valid header entry
+    valid_indices = []
+    for index in range(len(line_data)):
+        item = re.split('[(]', line_data[index])
+        item = [item[i].strip(') ') for i in range(len(item))]
+        # openMDAO vars can't have spaces, convert to underscores
+        name = re.sub('\s', '_', item[0])
+        if aliases:
+            # "reverse" lookup name in alias dict
+            for key in aliases:
+                if name.lower() in aliases[key]:
+                    name = key
+                    break
+        # 'default' default_units
+        default_units = 'unitless'
+        # if metadata is provided, ensure variable exists and update
+        # default_units
+        if metadata is not None:
+            if name not in metadata.keys():
+                warnings.warn(f'Header <{name}> was not recognized, and '
+                              'will be skipped'
+                              )
+                continue
+            else:
+                default_units = metadata[name]['units']
+
+        # if units are provided, check that they are valid
+        if len(item) > 1:
+            units = item[-1]
+            if valid_units(item[1]):
+                # check that units are compatible with expected units
+                if metadata is not None:
+                    if not is_compatible(units, default_units):
+                        # Raising error here, as trying to use default
+                        # units could mean accidental conversion which
+                        # would significantly impact analysis
+                        raise ValueError(f'Provided units of <{units}> '
+                                         f'for column <{name}>, which '
+                                         'are not compatible with default '
+                                         f'units of {default_units}')
+            else:
+                # Units were not recognized. Raise error
+                raise ValueError(f'Invalid units <{units}> provided for '
+                                 f'column <{name}> while reading '
+                                 f'<{filepath}>.')
+        else:
+            if metadata is not None and default_units != 'unitless':
+                # units were not provided, but variable should have them
+                # assume default units for that variable
+                warning = f'Units were not provided for column <{name}> '\
+                          f'while reading <{filepath}>. Using default '\
+                          f'units of {default_units}.'
+                warnings.warn(warning)
+            units = default_units
+
+        header[name] = units
+        valid_indices.append(index)
+
+    return header, valid_indices
+
+
+def _bulk_read_data_file(filepath):
+    """
+    Split a text data file into its comments, header entries, and a 2D array of all
+    numerical data, without interpreting the header. Comments and the header are
+    found in a single pass over the file, then all numerical data is parsed at once
+    by numpy.
+
+    Returns
+    -------
+    comments : list of str
+        Any comments from file, with comment characters ('#') stripped out.
+    header_line : int
+        Line number of the header.
+    header : list of str
+        Header entries.
+    values : numpy.ndarray
+        2D array of data, with one column per header entry.
+
+    None is returned instead if the file is not a rectangular table of numbers below
+    a single header line, in which case it must be read line by line.
+    """
+    with open(filepath, newline=None, encoding='utf-8-sig') as file:
+        lines = file.read().split('\n')
+
+    comments = []
+    if any('#' in line for line in lines):
+        for idx, line in enumerate(lines):
+            if '#' in line:
+                index = line.index('#')
+                comments.append(line[index+1:].strip())
+                lines[idx] = line[:index]
+
+    header_line = 0
+    while header_line < len(lines) and not lines[header_line].strip():
+        header_line += 1
+    if header_line == len(lines):
+        return None
+
+    header = re.split(r'[;,]\s*', lines[header_line].strip())
+    try:
+        [float(var) for var in header if var != '']
+    except ValueError:
+        pass
+    else:
+        # numerical data found before header
+        return None
+
+    data_lines = [line for line in lines[header_line+1:] if line and not line.isspace()]
+    if not data_lines:
+        return None
+
+    try:
+        values = np.loadtxt([line.replace(';', ',') for line in data_lines],
+                            delimiter=',', comments=None, ndmin=2)
+    except ValueError:
+        return None
+
+    if values.shape[1] != len(header):
+        return None
+
+    return comments, header_line, header, values
+
+
+def _read_raw_data_file(filepath):
+    """
+    Split a text data file into its comments, header entries, and a 2D array of all
+    numerical data, without interpreting the header.
+    """
+    raw_data = _bulk_read_data_file(filepath)
+    if raw_data is not None:
+        comments, _, header, values = raw_data
+        return comments, header, values
+
+    comments = []
+    header = None
+    rows = []
+
+    with open(filepath, newline=None, encoding='utf-8-sig') as file:
+        for line_count, line_data in enumerate(file):
+            if '#' in line_data:
+                index = line_data.index('#')
+                comments.append(line_data[index+1:].strip())
+                line_data = line_data[:index]
+
+            line_data = re.split(r'[;,]\s*', line_data.strip())
+
+            if not line_data or line_data == ['']:
+                continue
+
+            try:
+                rows.append([float(var) for var in line_data if var != ''])
+            except (ValueError):
+                if header is None and not rows:
+                    header = line_data
+                    continue
+                raise ValueError(
+                    f'Non-numerical value found in data file <{filepath}> on line '
+                    f'{str(line_count)}')
+
+    if header is None:
+        raise ValueError(f'No header found in data file <{filepath}>')
+
+    return comments, header, np.array(rows, dtype=float)
+
+
+def _file_signature(filepath):
+    stat = Path(filepath).stat()
+    with open(filepath, 'rb') as file:
+        sha1 = hashlib.sha1(file.read()).hexdigest()
+    return {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha1': sha1}
+
+
+def _binary_cache_path(filepath):
+    return filepath.with_name(filepath.name + '.npz')
+
+
+def _is_binary_data_file(filepath):
+    # npz files are zip archives
+    with open(filepath, 'rb') as file:
+        return file.read(4) == b'PK\x03\x04'
+
+
+def _is_binary_cache_current(cache_path, source_path):
+    """
+    Check if a binary data file was created from the current version of a text data
+    file. Modification time and size are compared first, falling back on the file
+    hash if the modification time has changed (e.g. after a fresh checkout).
+    """
+    if not cache_path.exists():
+        return False
+    try:
+        with np.load(cache_path) as binary_data:
+            source = json.loads(str(binary_data['source']))
+    except (OSError, KeyError, ValueError):
+        return False
+    if not source:
+        return False
+
+    stat = source_path.stat()
+    if stat.st_size != source['size']:
+        return False
+    if stat.st_mtime_ns == source['mtime_ns']:
+        return True
+    return _file_signature(source_path)['sha1'] == source['sha1']
+
+
+def write_binary_data_file(filename: (str, Path), header, values, comments=[],
+                           source=None):
+    """
+    Write tabular data to a binary (numpy .npz) data file, which can be read by
+    read_data_file() without any text parsing.
+
+    Parameters
+    ----------
+    filename : (str, Path)
+        filename or filepath for binary data file to be written
+    header : list of str
+        header entry for each column, in the same "name (units)" format used by text
+        data files
+    values : numpy.ndarray
+        2D array of data, with one column per header entry
+    comments : list of str, optional
+        comments to store with the data
+    source : (str, Path), optional
+        text data file the binary data was created from. Its modification time, size
+        and hash are stored so the binary file can be used as a cache of it.
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim != 2 or values.shape[1] != len(header):
+        raise ValueError(f'Data written to <{filename}> must have one column for each '
+                         'header entry')
+
+    signature = _file_signature(source) if source is not None else {}
+
+    # write through a file object so numpy doesn't append a second extension
+    with open(filename, 'wb') as file:
+        np.savez(file, header=np.array(header, dtype=str), values=values,
+                 comments=np.array(comments, dtype=str),
+                 source=np.array(json.dumps(signature)))
+
+
+def read_binary_data_file(filename: (str, Path), metadata=None, aliases=None,
+                          save_comments=False):
+    """
+    Read binary data file created by write_binary_data_file(). Header entries are
+    checked against metadata and aliases exactly as in read_data_file().
+
+    Returns
+    -------
+    data : NamedValues
+        data read from file in NamedValues format, including variable name, units, and
+        values (stored in a numpy array)
+    comments : list of str
+        any comments from file (only if save_comments=True)
+    """
+    filepath = get_path(filename)
+    data = NamedValues()
+
+    _prep_aliases(aliases)
+
+    with np.load(filepath) as binary_data:
+        raw_header = [str(item) for item in binary_data['header']]
+        values = binary_data['values']
+        comments = [str(item) for item in binary_data['comments']]
+
+    header, valid_indices = _parse_header(raw_header, filepath, metadata, aliases)
+
+    for idx, variable in zip(valid_indices, header):
+        data.set_val(variable, val=values[:, idx].copy(), units=header[variable])
+
+    if save_comments:
+        return data, comments
+    else:
+        return data
+
+
+def convert_data_file_to_binary(filename: (str, Path), output_file: (str, Path) = None,
+                                ignore_errors=False):
+    """
+    Convert a text data file in Aviary format to a binary data file.
+
+    Parameters
+    ----------
+    filename : (str, Path)
+        filename or filepath of data file to be converted
+    output_file : (str, Path), optional
+        filename or filepath of binary file to be written. Defaults to the data file
+        path with ".npz" appended.
+    ignore_errors : bool, optional
+        if True, data files that cannot be converted and binary files that cannot be
+        written are silently skipped. Defaults to False.
+    """
+    filepath = get_path(filename)
+    if output_file is None:
+        output_file = _binary_cache_path(filepath)
+
+    try:
+        comments, header, values = _read_raw_data_file(filepath)
+        write_binary_data_file(output_file, header, values, comments, source=filepath)
+    except (OSError, ValueError):
+        if not ignore_errors:
+            raise
+
+
 # multiple type annotation uses "typeA | typeB" syntax, but requires Python 3.10+
 def write_data_file(filename: (str, Path) = None, data: NamedValues = None,
                     comments: (str, list) = [], include_timestamp: bool = False):
@@ -269,3 +582,20 @@ def write_data_file(filename: (str, Path) = None, data: NamedValues = None,
                delimiter=',',
                header=', '.join(header),
                comments='\n'.join(comments))
+
+
+def _setup_DFC_parser(parser):
+    parser.add_argument('input_file', nargs='+', type=str,
+                        help='path to Aviary data file(s) to be converted')
+    parser.add_argument('-o', '--output_file', type=str, default=None,
+                        help='path to binary file to be written, only valid when '
+                        'converting a single file. Defaults to the input file path '
+                        'with ".npz" appended')
+
+
+def _exec_DFC(args, user_args):
+    if args.output_file is not None and len(args.input_file) > 1:
+        raise ValueError('An output file can only be specified when converting a '
+                         'single data file')
+    for filename in args.input_file:
+        convert_data_file_to_binary(filename, args.output_file)
@@ -14,7 +14,7 @@ from aviary.utils.conversion_utils import _rep, _parse, _read_map
 from aviary.subsystems.propulsion.engine_deck import normalize
 from aviary.subsystems.propulsion.utils import EngineModelVariables, default_units
 from aviary.variable_info.variables import Dynamic
-from aviary.utils.csv_data_file import write_data_file
+from aviary.utils.csv_data_file import write_binary_data_file, write_data_file
 from aviary.utils.functions import get_path
 from aviary.utils.named_values import NamedValues
 
@@ -71,7 +71,8 @@ header_names = {
 }
 
 
-def EngineDeckConverter(input_file, output_file, data_format: EngineDeckType):
+def EngineDeckConverter(input_file, output_file, data_format: EngineDeckType,
+                        binary=False):
     '''
     Converts FLOPS- or GASP-formatted engine decks into Aviary csv format.
     FLOPS decks are changed from column-delimited to csv format with added headers.
@@ -86,6 +87,9 @@ def EngineDeckConverter(input_file, output_file, data_format: EngineDeckType):
         path to file where new converted data will be written
     data_format : (EngineDeckType)
         data format used by input_file (FLOPS or GASP)
+    binary : bool, optional
+        if True, the converted deck is written as a binary data file (see
+        write_binary_data_file), which is read without any text parsing
     '''
     # TODO rounding for calculated values?
 
@@ -134,15 +138,17 @@ def EngineDeckConverter(input_file, output_file, data_format: EngineDeckType):
 
     elif data_format in (EngineDeckType.GASP, EngineDeckType.GASP_TS):
         is_turbo_prop = True if data_format == EngineDeckType.GASP_TS else False
-        temperature = gasp_keys.pop()
-        fuelflow = gasp_keys.pop()
+        # work on a copy so the module-level keys are the same for every conversion
+        deck_keys = gasp_keys.copy()
+        temperature = deck_keys.pop()
+        fuelflow = deck_keys.pop()
         if is_turbo_prop:
-            gasp_keys.extend((SHAFT_POWER_CORRECTED, TAILPIPE_THRUST))
+            deck_keys.extend((SHAFT_POWER_CORRECTED, TAILPIPE_THRUST))
         else:
-            gasp_keys.extend((THRUST,))  # must keep "," here
-        gasp_keys.extend((fuelflow, temperature))
+            deck_keys.extend((THRUST,))  # must keep "," here
+        deck_keys.extend((fuelflow, temperature))
 
-        data = {key: [] for key in gasp_keys}
+        data = {key: [] for key in deck_keys}
 
         scalars, tables, fields = _read_gasp_engine(data_file, is_turbo_prop)
         if 'throttle_type' in scalars:
@@ -197,16 +203,16 @@ def EngineDeckConverter(input_file, output_file, data_format: EngineDeckType):
             compute_T4 = False
             data.pop(TEMPERATURE)
             # temperature is assumed last in keys
-            gasp_keys.pop(-1)
+            deck_keys.pop(-1)
         else:
             compute_T4 = True
 
         # define header now that we know what is in the engine deck
-        header = {key: default_units[key] for key in gasp_keys}
+        header = {key: default_units[key] for key in deck_keys}
 
         if compute_T4:
             # compute T4 using atmospheric model
-            prob = om.Problem()
+            prob = om.Problem(reports=False)
 
             prob.model.add_subsystem('T4T2', om.IndepVarComp('T4:T2',
                                                              T4T2,
@@ -277,18 +283,14 @@ def EngineDeckConverter(input_file, output_file, data_format: EngineDeckType):
         else:
             data[THRUST] = data[THRUST][valid_idx]
 
-        # data needs to be string so column length can be easily found later
-        for var in data:
-            data[var] = np.array([str(item) for item in data[var]])
-
     else:
         quit("Invalid engine deck format provided")
 
     # sort data
-    # create parallel dict to data that stores floats
+    # create parallel dict to data that stores floats (FLOPS data is read as strings)
     formatted_data = {}
     for key in data:
-        formatted_data[key] = data[key].astype(float)
+        formatted_data[key] = np.asarray(data[key], dtype=float)
 
     # convert engine_data from dict to list so it can be sorted
     sorted_values = np.array(list(formatted_data.values())).transpose()
@@ -314,7 +316,19 @@ def EngineDeckConverter(input_file, output_file, data_format: EngineDeckType):
         else:
             ext = '.deck'
         output_file = data_file.stem + ext
-    write_data_file(output_file, write_data, comments, include_timestamp=False)
+
+    if binary:
+        # same header format as write_data_file, units are only given if there are any
+        header = []
+        for key in data:
+            units = default_units[key]
+            formatted_units = '' if units == 'unitless' else f' ({units})'
+            header.append(header_names[key] + formatted_units)
+
+        write_binary_data_file(output_file, header, sorted_values,
+                               [line.lstrip('#').strip() for line in comments])
+    else:
+        write_data_file(output_file, write_data, comments, include_timestamp=False)
 
 
 def _read_flops_engine(input_file):
@@ -463,7 +477,14 @@ def _read_table(f, is_turbo_prop=False):
 
 
 def _make_structured_grid(data, method="lagrange3", fields=["thrust", "fuelflow", "airflow"], throttle_step=.05):
-    """Generate a structured grid of unique mach/T4:T2/alt values in the deck"""
+    """
+    Generate a structured grid of unique mach/T4:T2/alt values in the deck.
+
+    Every altitude slice of every field is interpolated onto the same T4:T2 and Mach
+    points, so the flattened altitude, T4:T2, and Mach vectors are built once for each
+    set of altitudes and shared between fields, and the rows of each slice are found
+    with a single sort of the table rather than a search per altitude.
+    """
     # step size in t4/t2 ratio used in generating the structured grid
     # t2t2_step = 0.5 # original value
     t4t2_step = throttle_step
@@ -482,19 +503,28 @@ def _make_structured_grid(data, method="lagrange3", fields=["thrust", "fuelflow"
     pts = np.dstack(np.meshgrid(t4t2s, machs, indexing="ij")).reshape(-1, 2)
     npts = pts.shape[0]
 
+    # flattened altitude, T4:T2, and Mach vectors for each set of altitudes
+    grids = {}
+
     for field in fields:
         map_data = data[field]
-        all_alts = map_data[:, 0]
-        alts = np.unique(all_alts)
+        alts, alt_idx = np.unique(map_data[:, 0], return_inverse=True)
+
+        # rows of each altitude slice, keeping the order they are in the table
+        order = np.argsort(alt_idx, kind='stable')
+        bounds = np.searchsorted(alt_idx[order], np.arange(alts.size + 1))
+
+        grid_key = alts.tobytes()
+        if grid_key not in grids:
+            grids[grid_key] = (np.repeat(alts, npts),
+                               np.tile(pts[:, 0], alts.size),
+                               np.tile(pts[:, 1], alts.size))
+        alt_vec, t4t2_vec, mach_vec = grids[grid_key]
 
-        sizes = (alts.size, t4t2s.size, machs.size)
-        vals = np.zeros(np.prod(sizes), dtype=float)
-        alt_vec = np.zeros(np.prod(sizes), dtype=float)
-        mach_vec = np.zeros(np.prod(sizes), dtype=float)
-        t4t2_vec = np.zeros(np.prod(sizes), dtype=float)
+        vals = np.empty(alts.size * npts, dtype=float)
 
-        for i, alt in enumerate(alts):
-            d = map_data[all_alts == alt]
+        for i in range(alts.size):
+            d = map_data[order[bounds[i]:bounds[i + 1]]]
             t4t2 = np.unique(d[:, 1])
             mach = np.unique(d[:, 2])
             f = d[:, 3].reshape(t4t2.size, mach.size)
@@ -511,11 +541,7 @@ def _make_structured_grid(data, method="lagrange3", fields=["thrust", "fuelflow"
             interp = InterpND(
                 method="2D-" + method, points=(t4t2, mach), values=f, extrapolate=True
             )
-            sl = slice(i * npts, (i + 1) * npts)
-            vals[sl] = interp.interpolate(pts)
-            alt_vec[sl] = [alt] * len(pts)
-            t4t2_vec[sl] = pts[:, 0]
-            mach_vec[sl] = pts[:, 1]
+            vals[i * npts:(i + 1) * npts] = interp.interpolate(pts)
 
         structured_data[field] = {
             "vals": vals,
@@ -537,7 +563,7 @@ def _generate_flight_idle(data, T4T2, ref_sls_airflow, ref_sfn_idle):
 
     nn = len(mach_list)
 
-    prob = om.Problem()
+    prob = om.Problem(reports=False)
 
     prob.model.add_subsystem(
         Dynamic.Mission.MACH,
@@ -721,13 +747,17 @@ def _setup_EDC_parser(parser):
                         help='path to file where new converted data will be written')
     parser.add_argument('-f', '--data_format', type=EngineDeckType, choices=list(EngineDeckType),
                         help='data format used by input_file')
+    parser.add_argument('-b', '--binary', action='store_true',
+                        help='write the converted deck as a binary data file, which '
+                             'is read without any text parsing')
 
 
 def _exec_EDC(args, user_args):
     EngineDeckConverter(
         input_file=args.input_file,
         output_file=args.output_file,
-        data_format=args.data_format
+        data_format=args.data_format,
+        binary=args.binary
     )
 
 
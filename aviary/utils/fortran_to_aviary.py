@@ -20,6 +20,8 @@ import csv
 import re
 import getpass
 
+from copy import deepcopy
+
 from datetime import datetime
 from pathlib import Path
 from openmdao.utils.units import valid_units
@@ -51,9 +53,6 @@ def create_aviary_deck(fortran_deck: str, legacy_code=None, defaults_deck=None,
 
     # TODO generate both an Aviary input file and a phase_info file
 
-    vehicle_data = {'input_values': NamedValues(), 'unused_values': NamedValues(),
-                    'initialization_guesses': initialization_guesses, 'verbosity': verbosity}
-
     fortran_deck: Path = get_path(fortran_deck, verbose=False)
 
     timestamp = datetime.now().strftime('%m/%d/%y at %H:%M')
@@ -84,16 +83,16 @@ def create_aviary_deck(fortran_deck: str, legacy_code=None, defaults_deck=None,
         defaults_deck = Path(__file__).parent.resolve().joinpath(
             'legacy_code_data', defaults_filename)
 
-    # create dictionary to convert legacy code variables to Aviary variables
-    # key: variable name, value: either None or relevant historical_name
-    aviary_variable_dict = generate_aviary_names([legacy_code.value])
+    # index to convert legacy code variables to Aviary variables, shared by every
+    # conversion in this process
+    name_index = get_name_index([legacy_code.value])
 
-    if defaults_deck:  # If defaults are specified, initialize the vehicle with them
-        vehicle_data = input_parser(defaults_deck, vehicle_data,
-                                    aviary_variable_dict, deprecated_vars, legacy_code)
+    # If defaults are specified, initialize the vehicle with them
+    vehicle_data = _parse_defaults(defaults_deck, name_index, deprecated_vars,
+                                   legacy_code, verbosity)
 
     vehicle_data = input_parser(fortran_deck, vehicle_data,
-                                aviary_variable_dict, deprecated_vars, legacy_code)
+                                name_index, deprecated_vars, legacy_code)
     if legacy_code is GASP:
         vehicle_data = update_gasp_options(vehicle_data)
     elif legacy_code is FLOPS:
@@ -154,6 +153,84 @@ def create_aviary_deck(fortran_deck: str, legacy_code=None, defaults_deck=None,
             writer.writerow([var] + val)
 
 
+def create_aviary_decks(input_decks, legacy_code, defaults_deck=None, out_dir=None,
+                        force=False, verbosity=Verbosity.BRIEF):
+    '''
+    Create Aviary CSV files from many Fortran input decks in a single process, so that
+    the legacy name index and the parsed defaults deck are shared by every conversion.
+    input_decks is either a directory, in which case every file in it with the default
+    extension of the legacy code (.txt for FLOPS, .dat for GASP) is converted, or a
+    list of filepaths.
+    Converted decks are written to out_dir, or next to each input deck if out_dir is
+    not given, named after the input deck with a "_converted.csv" suffix.
+    Decks that fail to convert are reported after all other decks are converted.
+    Returns the list of files that were written.
+    '''
+    verbosity = Verbosity(verbosity)
+
+    if isinstance(input_decks, (str, Path)):
+        directory = get_path(input_decks, verbose=False)
+        extension = '.dat' if legacy_code is GASP else '.txt'
+        input_decks = sorted(path for path in directory.iterdir()
+                             if path.is_file() and path.suffix.lower() == extension)
+
+    out_files = []
+    failures = {}
+    for fortran_deck in input_decks:
+        fortran_deck = Path(fortran_deck)
+        out_file = None
+        if out_dir is not None:
+            out_file = Path(out_dir).resolve() / (fortran_deck.stem + '_converted.csv')
+
+        try:
+            create_aviary_deck(fortran_deck, legacy_code, defaults_deck, out_file,
+                               force, verbosity)
+        except Exception as err:
+            failures[fortran_deck] = err
+            continue
+
+        if out_file is None:
+            out_file = fortran_deck.parent.resolve() / \
+                (fortran_deck.stem + '_converted.csv')
+        out_files.append(out_file)
+
+        if verbosity >= Verbosity.VERBOSE:
+            print('Converted', fortran_deck, 'to', out_file)
+
+    if failures:
+        messages = '\n'.join(f'{deck}: {err}' for deck, err in failures.items())
+        raise RuntimeError(f'{len(failures)} of {len(failures) + len(out_files)} decks '
+                           f'could not be converted:\n{messages}')
+
+    if verbosity >= Verbosity.BRIEF:
+        print(f'Converted {len(out_files)} decks')
+
+    return out_files
+
+
+def _parse_defaults(defaults_deck, name_index, unused_vars, legacy_code, verbosity):
+    '''
+    Return vehicle data initialized with the values in the defaults deck. Parsed
+    defaults decks are cached, so each one is only read once per process.
+    '''
+    if not defaults_deck:
+        return {'input_values': NamedValues(), 'unused_values': NamedValues(),
+                'initialization_guesses': initialization_guesses.copy(),
+                'verbosity': verbosity}
+
+    defaults_deck = Path(defaults_deck).resolve()
+    key = (defaults_deck, defaults_deck.stat().st_mtime_ns, legacy_code, verbosity,
+           id(name_index))
+
+    if key not in _defaults_cache:
+        vehicle_data = _parse_defaults(None, name_index, unused_vars, legacy_code,
+                                       verbosity)
+        _defaults_cache[key] = input_parser(defaults_deck, vehicle_data, name_index,
+                                            unused_vars, legacy_code)
+
+    return deepcopy(_defaults_cache[key])
+
+
 def input_parser(fortran_deck, vehicle_data, alternate_names, unused_vars, legacy_code):
     '''
     input_parser will modify the values in the vehicle_data dictionary using the data in the
@@ -161,7 +238,12 @@ def input_parser(fortran_deck, vehicle_data, alternate_names, unused_vars, legac
     Lines are read one by one, comments are removed, and namelists are tracked.
     Lines with multiple variable-data pairs are supported, but the last value per variable must
     be followed by a trailing comma.
+    alternate_names is either a dictionary created by generate_aviary_names, or a
+    LegacyNameIndex of one.
     '''
+    if not isinstance(alternate_names, LegacyNameIndex):
+        alternate_names = LegacyNameIndex(alternate_names)
+
     with open(fortran_deck, 'r') as f_in:
         current_namelist = current_tag = ''
         for line in f_in:
@@ -236,7 +318,7 @@ def input_parser(fortran_deck, vehicle_data, alternate_names, unused_vars, legac
 def process_and_store_data(data, var_name, legacy_code, current_namelist, alternate_names, vehicle_data, unused_vars, comment=''):
     '''
     process_and_store_data takes in a string that contains the data, the current variable's name and
-    namelist, the dictionary of alternate names, and the current vehicle data.
+    namelist, the dictionary (or LegacyNameIndex) of alternate names, and the current vehicle data.
     It will convert the string of data into a list, get units, check whether the data specified is
     part of a list or a single element, and update the current name to it's equivalent Aviary name.
     The variables are also sorted based on whether they will set an Aviary variable or they are for initial guessing
@@ -356,8 +438,81 @@ def generate_aviary_names(code_bases):
     return alternate_names
 
 
+class LegacyNameIndex:
+    '''
+    Index of the Fortran names in a dictionary created by generate_aviary_names, used
+    to find the Aviary names whose Fortran names end with a given name without
+    searching every Fortran name.
+    Every suffix of every (lowercase) Fortran name is mapped to the Aviary names it
+    belongs to, along with the position of the Fortran name in the dictionary so that
+    matches are found in the same order as a search through the dictionary.
+    '''
+
+    def __init__(self, alternate_names):
+        self.suffixes = {}
+
+        position = 0
+        for code_base in alternate_names.keys():
+            for key, list_of_names in alternate_names[code_base].items():
+                if list_of_names is None:
+                    continue
+                for altname in list_of_names:
+                    altname = altname.lower()
+                    for start in range(len(altname) + 1):
+                        self.suffixes.setdefault(altname[start:], []).append(
+                            (position, key))
+                    position += 1
+
+    def find(self, var_name, var_ind=None):
+        '''
+        Return the Aviary names whose Fortran names end with var_name, and the index
+        of the value in the variable. Names ending with var_name followed by the index
+        in parentheses also match, in which case the index is consumed by the first
+        such name and None is returned for it.
+        '''
+        var_name = var_name.lower()
+        matches = [(position, key, True)
+                   for position, key in self.suffixes.get(var_name, ())]
+
+        if var_ind is not None:
+            found = {position for position, *_ in matches}
+            matches.extend(
+                (position, key, False)
+                for position, key in self.suffixes.get(f'{var_name}({var_ind})', ())
+                if position not in found)
+            matches.sort()
+
+        all_equivalent_names = []
+        for _, key, without_index in matches:
+            if without_index:
+                all_equivalent_names.append(key)
+            elif var_ind is not None:
+                all_equivalent_names.append(key)
+                var_ind = None
+
+        return all_equivalent_names, var_ind
+
+
+def get_name_index(code_bases):
+    '''
+    Return the LegacyNameIndex of the Fortran names of the specified code bases. Indices
+    are cached, so they are only created once per process unless more variables are
+    added to the metadata.
+    '''
+    key = (tuple(code_bases), len(_MetaData))
+
+    if key not in _name_index_cache:
+        _name_index_cache[key] = LegacyNameIndex(generate_aviary_names(code_bases))
+
+    return _name_index_cache[key]
+
+
 def update_name(alternate_names, var_name, verbosity=Verbosity.BRIEF):
-    '''update_name will convert a Fortran name to a list of equivalent Aviary names.'''
+    '''
+    update_name will convert a Fortran name to a list of equivalent Aviary names.
+    alternate_names is either a dictionary created by generate_aviary_names, or a
+    LegacyNameIndex of one (which is much faster when converting many names).
+    '''
 
     if '(' in var_name:  # some GASP lists are given as individual elements
         # get the target index
@@ -366,21 +521,10 @@ def update_name(alternate_names, var_name, verbosity=Verbosity.BRIEF):
     else:
         var_ind = None
 
-    all_equivalent_names = []
-    for code_base in alternate_names.keys():
-        for key, list_of_names in alternate_names[code_base].items():
-            if list_of_names is not None:
-                for altname in list_of_names:
-                    altname = altname.lower()
-                    if altname.endswith(var_name.lower()):
-                        all_equivalent_names.append(key)
-                        continue
-                    elif var_ind is not None and altname.endswith(
-                        f'{var_name.lower()}({var_ind})'
-                    ):
-                        all_equivalent_names.append(key)
-                        var_ind = None
-                        continue
+    if not isinstance(alternate_names, LegacyNameIndex):
+        alternate_names = LegacyNameIndex(alternate_names)
+
+    all_equivalent_names, var_ind = alternate_names.find(var_name, var_ind)
 
     # if there are no equivalent variable names, return the original name
     if len(all_equivalent_names) == 0:
@@ -657,6 +801,11 @@ gasp_scaler_variables = [
     Aircraft.Fuselage.WETTED_AREA,
 ]
 
+# LegacyNameIndex of each set of code bases, see get_name_index()
+_name_index_cache = {}
+# vehicle data parsed from each defaults deck, see _parse_defaults()
+_defaults_cache = {}
+
 initialization_guesses = {
     # initialization_guesses is a dictionary that contains values used to initialize the trajectory
     'actual_takeoff_mass': 0,
@@ -683,13 +832,16 @@ def _setup_F2A_parser(parser):
         "input_deck",
         type=str,
         nargs=1,
-        help="Filename of vehicle input deck, including partial or complete path.",
+        help="Filename of vehicle input deck, including partial or complete path. "
+        "If a directory is given, every deck in it with the default extension of the "
+        "legacy code (.txt for FLOPS, .dat for GASP) is converted.",
     )
     parser.add_argument(
         "-o",
         "--out_file",
         default=None,
-        help="Filename for converted input deck, including partial or complete path."
+        help="Filename for converted input deck, including partial or complete path. "
+        "When converting a directory, the directory the converted decks are written to."
     )
     parser.add_argument(
         "-l",
@@ -729,5 +881,9 @@ def _exec_F2A(args, user_args):
     # convert verbosity from int to enum
     verbosity = Verbosity(args.verbosity)
 
-    create_aviary_deck(filepath, args.legacy_code, args.defaults_deck,
-                       args.out_file, args.force, verbosity)
+    if Path(filepath).is_dir():
+        create_aviary_decks(filepath, args.legacy_code, args.defaults_deck,
+                            args.out_file, args.force, verbosity)
+    else:
+        create_aviary_deck(filepath, args.legacy_code, args.defaults_deck,
+                           args.out_file, args.force, verbosity)
@@ -1,11 +1,13 @@
 import unittest
+from copy import deepcopy
 
 import numpy as np
 from openmdao.utils.assert_utils import assert_near_equal
 
 from aviary.examples.variable_meta_data_extension import ExtendedMetaData
 from aviary.examples.variables_extension import Aircraft as ExtendedAircraft
-from aviary.utils.aviary_values import AviaryValues
+from aviary.utils.aviary_values import AviaryValues, _compile_meta_data
+from aviary.utils.develop_metadata import update_meta_data
 from aviary.utils.functions import get_path
 from aviary.variable_info.enums import FlapType, GASPEngineType
 from aviary.variable_info.variables import Aircraft, Mission
@@ -255,6 +257,60 @@ class TestVariableExtension(unittest.TestCase):
 
         assert_near_equal(check_val, 60, 1e-9)
 
+    def test_update_many(self):
+        vals = AviaryValues()
+
+        vals.update_many({Aircraft.Engine.TYPE: ('turbojet', 'unitless'),
+                          ExtendedAircraft.Wing.AERO_CENTER: (5, 'ft'),
+                          Mission.Design.CRUISE_ALTITUDE: (35000, 'ft')},
+                         meta_data=ExtendedMetaData)
+
+        self.assertIs(vals.get_val(Aircraft.Engine.TYPE), GASPEngineType.TURBOJET)
+        assert_near_equal(
+            vals.get_val(ExtendedAircraft.Wing.AERO_CENTER, units='inch'), 60, 1e-9)
+
+        other = AviaryValues()
+        other.update_many(vals, meta_data=ExtendedMetaData)
+        self.assertEqual(len(other), 3)
+
+        with self.assertRaises(TypeError):
+            vals.update_many([(Aircraft.Wing.LOADING, (20, 'inch**2/NM'))])
+
+    def test_updated_metadata(self):
+        meta_data = deepcopy(ExtendedMetaData)
+        vals = AviaryValues()
+
+        vals.set_val(ExtendedAircraft.Wing.AERO_CENTER, val=5, units='ft',
+                     meta_data=meta_data)
+
+        # the metadata used by set_val follows changes made to it
+        update_meta_data(ExtendedAircraft.Wing.AERO_CENTER, meta_data, units='s',
+                         types=float)
+
+        with self.assertRaises(TypeError):
+            vals.set_val(ExtendedAircraft.Wing.AERO_CENTER, val=5.0, units='ft',
+                         meta_data=meta_data)
+
+        with self.assertRaises(TypeError):
+            vals.set_val(ExtendedAircraft.Wing.AERO_CENTER, val=5, units='s',
+                         meta_data=meta_data)
+
+        vals.set_val(ExtendedAircraft.Wing.AERO_CENTER, val=5.0, units='s',
+                     meta_data=meta_data)
+
+    def test_compiled_metadata_per_dictionary(self):
+        meta_data = deepcopy(ExtendedMetaData)
+        update_meta_data(ExtendedAircraft.Wing.AERO_CENTER, meta_data, units='s')
+        key = ExtendedAircraft.Wing.AERO_CENTER
+
+        # alternating between two metadata dictionaries reuses each one's entry
+        compiled = _compile_meta_data(key, ExtendedMetaData)
+        other = _compile_meta_data(key, meta_data)
+        self.assertIs(_compile_meta_data(key, ExtendedMetaData), compiled)
+        self.assertIs(_compile_meta_data(key, meta_data), other)
+        self.assertEqual(compiled.units, 'ft')
+        self.assertEqual(other.units, 's')
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,13 +1,17 @@
 import os
+import shutil
+import time
 import unittest
 import warnings
+from pathlib import Path
 
 from openmdao.utils.assert_utils import assert_near_equal, assert_warning
 from openmdao.utils.om_warnings import SetupWarning
 from openmdao.utils.testing_utils import use_tempdirs
 
-from aviary.utils.csv_data_file import write_data_file, read_data_file
-from aviary.utils.functions import get_path
+from aviary.utils.csv_data_file import write_data_file, read_data_file, \
+    convert_data_file_to_binary
+from aviary.utils.functions import get_aviary_resource_path, get_path
 from aviary.utils.named_values import NamedValues, get_items, get_keys
 from aviary.utils.process_input_decks import parse_inputs
 from aviary.variable_info.options import get_option_defaults
@@ -88,6 +92,55 @@ class TestAviaryCSV(unittest.TestCase):
         if 'Real Var' not in get_keys(data):
             raise RuntimeError("'Real Var' is not in data read from csv")
 
+    def test_fast_read(self):
+        self._compare_csv_results(
+            *read_data_file(self.filename, save_comments=True, fast=True))
+
+        # files that can't be parsed in bulk are read line by line
+        with open('ragged.csv', 'w') as file:
+            file.write('# comment\nmach, altitude (ft)\n0.2, 0,\n0.4, 1000\n')
+        data, comments = read_data_file('ragged.csv', save_comments=True, fast=True)
+        self.assertEqual(comments, ['comment'])
+        assert_near_equal(data.get_val('altitude', 'ft'), [0, 1000])
+
+        with open('bad.csv', 'w') as file:
+            file.write('mach, altitude (ft)\n0.2, 0\n0.4, high\n')
+        with self.assertRaises(ValueError):
+            read_data_file('bad.csv', fast=True)
+
+    def test_binary_data_file(self):
+        convert_data_file_to_binary(self.filename, 'binary.npz')
+        self._compare_csv_results(*read_data_file('binary.npz', save_comments=True))
+
+        aliases = {'Real Var': 'Fake Var'}
+        data = read_data_file('binary.npz', aliases=aliases)
+        self.assertIn('Real Var', get_keys(data))
+        self.assertNotIn('fake_var', get_keys(data))
+
+    def test_cached_read(self):
+        shutil.copy(self.filename, 'cached.csv')
+        cache_file = Path('cached.csv.npz')
+
+        self._compare_csv_results(
+            *read_data_file('cached.csv', save_comments=True, cache=True))
+        self.assertTrue(cache_file.exists())
+
+        # second read comes from the binary file
+        mtime = cache_file.stat().st_mtime_ns
+        self._compare_csv_results(
+            *read_data_file('cached.csv', save_comments=True, cache=True))
+        self.assertEqual(cache_file.stat().st_mtime_ns, mtime)
+
+        # changing the data file replaces the out of date binary file
+        with open('cached.csv') as file:
+            contents = file.read()
+        with open('cached.csv', 'w') as file:
+            file.write(contents.replace('-13', '-14.5'))
+        data = read_data_file('cached.csv', cache=True)
+        assert_near_equal(data.get_val('fake_var', 'lbm')[-1], -14.5)
+        data = read_data_file('cached.csv', cache=True)
+        assert_near_equal(data.get_val('fake_var', 'lbm')[-1], -14.5)
+
     @use_tempdirs
     def test_parse_input(self):
         aircraft_values = get_option_defaults(engine=False)
@@ -125,5 +178,32 @@ class TestAviaryCSV(unittest.TestCase):
                                  f'match expected units of {expected_units}')
 
 
+class ReadDataFileBenchmark(unittest.TestCase):
+    """
+    Compare line by line and bulk parsing of the data files shipped with Aviary.
+    """
+
+    def bench_test_fast_read(self):
+        models = get_aviary_resource_path('models')
+        files = sorted(list(models.glob('engines/*.deck')) +
+                       list(models.glob('propellers/*.prop')))
+
+        print(f"\n{'file':40s} {'line (ms)':>10s} {'bulk (ms)':>10s}")
+        for filename in files:
+            timings = []
+            results = []
+            for fast in (False, True):
+                start = time.perf_counter()
+                results.append(read_data_file(filename, save_comments=True, fast=fast))
+                timings.append(1e3 * (time.perf_counter() - start))
+            print(f'{filename.name:40s} {timings[0]:10.1f} {timings[1]:10.1f}')
+
+            (slow_data, slow_comments), (fast_data, fast_comments) = results
+            self.assertEqual(fast_comments, slow_comments)
+            self.assertEqual(list(get_keys(fast_data)), list(get_keys(slow_data)))
+            for key, (val, units) in get_items(slow_data):
+                assert_near_equal(fast_data.get_val(key, units), val, tolerance=0.)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,13 @@
 import unittest
 from pathlib import Path
 
+from openmdao.utils.assert_utils import assert_near_equal
 from openmdao.utils.testing_utils import use_tempdirs
 
+from aviary.utils.csv_data_file import read_data_file
 from aviary.utils.engine_deck_conversion import EngineDeckType, _exec_EDC
 from aviary.utils.functions import get_path
+from aviary.utils.named_values import get_items, get_keys
 
 
 class DummyArgs(object):
@@ -12,6 +15,7 @@ class DummyArgs(object):
         self.input_file = None
         self.output_file = None
         self.data_format = None
+        self.binary = False
 
 
 @use_tempdirs
@@ -20,7 +24,8 @@ class TestEngineDeckConversion(unittest.TestCase):
     Test engine deck conversion utility by comparing against previously converted engine deck files
     """
 
-    def prepare_and_run(self, filename, output_file=None, data_format=EngineDeckType.GASP):
+    def prepare_and_run(self, filename, output_file=None, data_format=EngineDeckType.GASP,
+                        binary=False):
         args = DummyArgs()
 
         # Specify the input file
@@ -35,6 +40,7 @@ class TestEngineDeckConversion(unittest.TestCase):
 
         # Specify the legacy code and engine type
         args.data_format = data_format
+        args.binary = binary
 
         # Execute the conversion
         _exec_EDC(args, None)
@@ -83,6 +89,21 @@ class TestEngineDeckConversion(unittest.TestCase):
         args = self.prepare_and_run(filename, data_format=EngineDeckType.GASP_TS)
         self.compare_files(filename, skip_list=['# created'])
 
+    def test_binary_conversion(self):
+        filename = 'turboshaft_4465hp.eng'
+
+        # the binary deck holds the same data as the text deck
+        self.prepare_and_run(filename, data_format=EngineDeckType.GASP_TS)
+        self.prepare_and_run(filename, output_file='TEST_turboshaft_4465hp.deck.npz',
+                             data_format=EngineDeckType.GASP_TS, binary=True)
+
+        data = read_data_file('TEST_turboshaft_4465hp.deck.npz')
+        expected = read_data_file('TEST_turboshaft_4465hp.deck')
+
+        self.assertEqual(list(get_keys(data)), list(get_keys(expected)))
+        for name, (val, units) in get_items(expected):
+            assert_near_equal(data.get_val(name, units), val, 1e-10)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,4 @@
+import shutil
 import unittest
 from pathlib import Path
 from datetime import datetime
@@ -105,6 +106,34 @@ class TestFortranToAviary(unittest.TestCase):
         self.compare_files(
             'models/N3CC/N3CC_generic_low_speed_polars_FLOPSinp.csv')
 
+    def test_convert_directory(self):
+        filepaths = ['models/small_single_aisle/small_single_aisle_GwGm.dat',
+                     'models/test_aircraft/converter_configuration_test_data_GwGm.dat']
+
+        # the decks are converted from a directory in one process
+        deck_dir = Path.cwd() / 'decks'
+        deck_dir.mkdir()
+        for filepath in filepaths:
+            shutil.copy(get_path(filepath), deck_dir)
+        (deck_dir / 'notes.txt').write_text('not a GASP deck')
+
+        args = DummyArgs()
+        args.input_deck = str(deck_dir)
+        args.out_file = Path.cwd() / 'converted'
+        args.legacy_code = LegacyCode.GASP
+        _exec_F2A(args, None)
+
+        self.assertEqual(len(list(args.out_file.iterdir())), 2)
+
+        for filepath in filepaths:
+            name = Path(filepath).stem
+            filename = filepath.split('.')[0]+'.csv'
+            converted = args.out_file / (name + '_converted.csv')
+            (Path.cwd() / ('TEST_'+filename)).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy(converted, 'TEST_'+filename)
+
+            self.compare_files(filepath)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1292,6 +1292,18 @@ add_meta_data(
     desc='Scaling factor for lift-dependent drag coefficient'
 )
 
+add_meta_data(
+    Aircraft.Design.LIFT_DEPENDENT_DRAG_POLAR,
+    meta_data=_MetaData,
+    historical_name={"GASP": None,
+                     "FLOPS": None,
+                     "LEAPS1": None
+                     },
+    units='unitless',
+    desc='Lift-dependent drag coefficient computed during Aviary pre-mission on a grid '
+         'of Mach number and lift coefficient.',
+)
+
 add_meta_data(
     Aircraft.Design.LIFT_POLAR,
     meta_data=_MetaData,
@@ -1569,6 +1581,22 @@ add_meta_data(
     default_value=False,
 )
 
+add_meta_data(
+    Aircraft.Design.USE_DRAG_POLAR_TABLES,
+    meta_data=_MetaData,
+    historical_name={"GASP": None,
+                     "FLOPS": None,
+                     "LEAPS1": None
+                     },
+    units='unitless',
+    desc='if true, FLOPS-based computed aerodynamics is evaluated once during '
+         'pre-mission on a grid of Mach number, altitude, and lift coefficient, and '
+         'mission drag is interpolated from the resulting drag polar tables',
+    option=True,
+    types=bool,
+    default_value=False,
+)
+
 add_meta_data(
     Aircraft.Design.WETTED_AREAS,
     meta_data=_MetaData,
@@ -1609,6 +1637,18 @@ add_meta_data(
     desc='Scaling factor for zero-lift drag coefficient'
 )
 
+add_meta_data(
+    Aircraft.Design.ZERO_LIFT_DRAG_POLAR,
+    meta_data=_MetaData,
+    historical_name={"GASP": None,
+                     "FLOPS": None,
+                     "LEAPS1": None
+                     },
+    units='unitless',
+    desc='Zero-lift drag coefficient computed during Aviary pre-mission on a grid of '
+         'Mach number and altitude.',
+)
+
 #
 #  ______   _                 _            _                  _
 # |  ____| | |               | |          (_)                | |
@@ -1712,6 +1752,22 @@ add_meta_data(
     default_value=0.0,
 )
 
+add_meta_data(
+    Aircraft.Engine.CACHE_DATA_FILE,
+    meta_data=_MetaData,
+    historical_name={"GASP": None,
+                     "FLOPS": None,
+                     "LEAPS1": None
+                     },
+    units="unitless",
+    option=True,
+    default_value=False,
+    types=bool,
+    desc='If True, a binary copy of the engine data file is saved next to it and '
+         'reused by later runs for as long as the data file is unchanged, skipping '
+         'text parsing of the data file',
+)
+
 # NOTE if FT < 0, this bool is true, if >= 0, this is false and the value of FT is used
 # as the installation loss factor
 add_meta_data(
@@ -2047,6 +2103,24 @@ add_meta_data(
     default_value=0,
 )
 
+add_meta_data(
+    Aircraft.Engine.PRECOMPUTE_MAX_THRUST,
+    meta_data=_MetaData,
+    historical_name={"GASP": None,
+                     "FLOPS": None,
+                     "LEAPS1": None
+                     },
+    units="unitless",
+    option=True,
+    default_value=False,
+    types=bool,
+    desc='If True, maximum thrust (and shaft power, if present) of an engine deck is '
+         'pre-solved once at maximum throttle and hybrid throttle for every flight '
+         'condition in the deck, and interpolated at runtime from that reduced '
+         '(Mach, altitude) table instead of a second full interpolation of the engine '
+         'deck'
+)
+
 add_meta_data(
     Aircraft.Engine.PROPELLER_ACTIVITY_FACTOR,
     meta_data=_MetaData,
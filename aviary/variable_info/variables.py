@@ -163,6 +163,7 @@ class Aircraft:
         LIFT_CURVE_SLOPE = 'aircraft:design:lift_curve_slope'
         LIFT_DEPENDENT_DRAG_COEFF_FACTOR = \
             'aircraft:design:lift_dependent_drag_coeff_factor'
+        LIFT_DEPENDENT_DRAG_POLAR = 'aircraft:design:lift_dependent_drag_polar'
         LIFT_POLAR = 'aircraft:design:lift_polar'
 
         MAX_FUSELAGE_PITCH_ANGLE = 'aircraft:design:max_fuselage_pitch_angle'
@@ -191,10 +192,12 @@ class Aircraft:
         TOUCHDOWN_MASS = 'aircraft:design:touchdown_mass'
         ULF_CALCULATED_FROM_MANEUVER = 'aircraft:design:ulf_calculated_from_maneuver'
         USE_ALT_MASS = 'aircraft:design:use_alt_mass'
+        USE_DRAG_POLAR_TABLES = 'aircraft:design:use_drag_polar_tables'
         WETTED_AREAS = 'aircraft:design:wetted_areas'
         ZERO_FUEL_MASS = 'aircraft:design:zero_fuel_mass'
         ZERO_LIFT_DRAG_COEFF_FACTOR = \
             'aircraft:design:zero_lift_drag_coeff_factor'
+        ZERO_LIFT_DRAG_POLAR = 'aircraft:design:zero_lift_drag_polar'
 
     class Electrical:
         HAS_HYBRID_SYSTEM = 'aircraft:electrical:has_hybrid_system'
@@ -205,6 +208,7 @@ class Aircraft:
     class Engine:
         ADDITIONAL_MASS = 'aircraft:engine:additional_mass'
         ADDITIONAL_MASS_FRACTION = 'aircraft:engine:additional_mass_fraction'
+        CACHE_DATA_FILE = 'aircraft:engine:cache_data_file'
         COMPUTE_PROPELLER_INSTALLATION_LOSS = \
             'aircraft:engine:compute_propeller_installation_loss'
         CONSTANT_FUEL_CONSUMPTION = 'aircraft:engine:constant_fuel_consumption'
@@ -231,6 +235,7 @@ class Aircraft:
         POD_MASS = 'aircraft:engine:pod_mass'
         POD_MASS_SCALER = 'aircraft:engine:pod_mass_scaler'
         POSITION_FACTOR = 'aircraft:engine:position_factor'
+        PRECOMPUTE_MAX_THRUST = 'aircraft:engine:precompute_max_thrust'
         PROPELLER_ACTIVITY_FACTOR = 'aircraft:engine:propeller_activity_factor'
         PROPELLER_DATA_FILE = 'aircraft:engine:propeller_data_file'
         PROPELLER_DIAMETER = 'aircraft:engine:propeller_diameter'
@@ -7,6 +7,7 @@ import os
 import pathlib
 import re
 import shutil
+import time
 import warnings
 import zipfile
 
@@ -35,6 +36,7 @@ from openmdao.utils.om_warnings import issue_warning
 from dymos.visualization.timeseries.bokeh_timeseries_report import _meta_tree_subsys_iter
 
 from aviary.visualization.aircraft_3d_model import Aircraft3DModel
+from aviary.visualization.driver_history import DriverHistory
 
 # support getting this function from OpenMDAO post movement of the function to utils
 #    but also support its old location
@@ -473,6 +475,24 @@ def create_aviary_variables_table_data_nested(script_name, recorder_file):
     return table_data_nested
 
 
+def run_finished(problem_recorder):
+    """
+    Check whether the run writing to a problem case recorder file has finished, which
+    is when its final problem case has been recorded.
+
+    Parameters
+    ----------
+    problem_recorder : str
+        Name of the recorder file containing the Problem cases.
+    """
+    if not os.path.isfile(problem_recorder):
+        return False
+
+    cr = om.CaseReader(problem_recorder)
+
+    return len(cr.list_cases('problem', out_stream=None)) > 0
+
+
 def convert_driver_case_recorder_file_to_df(recorder_file_name):
     """
     Convert a case recorder file into a Pandas data frame.
@@ -482,66 +502,10 @@ def convert_driver_case_recorder_file_to_df(recorder_file_name):
     recorder_file_name : str
         Name of the case recorder file.
     """
-    cr = om.CaseReader(recorder_file_name)
-    driver_cases = cr.list_cases("driver", out_stream=None)
-
-    df = None
-    for i, case in enumerate(driver_cases):
-        driver_case = cr.get_case(case)
-
-        desvars = driver_case.get_design_vars(scaled=False)
-        objectives = driver_case.get_objectives(scaled=False)
-        constraints = driver_case.get_constraints(scaled=False)
-
-        if i == 0:  # Only need to get header of the data frame once
-            # Need to worry about the fact that a variable can be in more than one of
-            #  desvars, cons, and obj. So filter out the dupes
-            initial_desvars_names = list(desvars.keys())
-            initial_constraints_names = list(constraints.keys())
-            objectives_names = list(objectives.keys())
-
-            # Start with obj, then cons, then desvars
-            # Give priority to having a duplicate being in the obj and cons
-            #  over being in the desvars
-            all_var_names = objectives_names.copy()
-            constraints_names = []
-            for name in initial_constraints_names:
-                if name not in all_var_names:
-                    constraints_names.append(name)
-                    all_var_names.append(name)
-            desvars_names = []
-            for name in initial_desvars_names:
-                if name not in all_var_names:
-                    desvars_names.append(name)
-                    all_var_names.append(name)
-            header = ["iter_count"] + all_var_names
-            df = pd.DataFrame(columns=header)
-
-        # Now fill up a row
-        row = [
-            i,
-        ]
-        # important to do in this order since that is the order added to the header
-        for varname in objectives_names:
-            value = objectives[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-
-        for varname in constraints_names:
-            value = constraints[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-
-        for varname in desvars_names:
-            value = desvars[varname]
-            if not np.isscalar(value):
-                value = np.linalg.norm(value)
-            row.append(value)
-        df.loc[i] = row
-
-    return df
+    driver_history = DriverHistory(recorder_file_name)
+    driver_history.read()
+
+    return driver_history.to_dataframe()
 
 
 def create_aircraft_3d_file(recorder_file, reports_dir, outfilepath):
@@ -587,7 +551,30 @@ def _get_interactive_plot_sources(data_by_varname_and_phase, x_varname, y_varnam
         return [], []
 
 
-def create_optimization_history_plot(case_recorder, df):
+def create_optimization_history_plot(case_recorder, df, driver_history=None,
+                                     refresh_period=2000, problem_recorder=None,
+                                     idle_timeout=300000):
+    """
+    Create the plot of the optimization history.
+
+    Parameters
+    ----------
+    case_recorder : CaseReader
+        Reader of the case recorder file containing the Driver cases.
+    df : DataFrame
+        The driver history, as returned by convert_driver_case_recorder_file_to_df.
+    driver_history : DriverHistory or None
+        If given, cases recorded after df was read are added to the plot as they are
+        recorded, so the plot updates live while the driver is still running.
+    refresh_period : int
+        Period in milliseconds between checks for new cases, if driver_history is given.
+    problem_recorder : str or None
+        Name of the recorder file containing the Problem cases. If given, checking for
+        new cases stops once the run has finished.
+    idle_timeout : int
+        Period in milliseconds after which checking for new cases stops if neither
+        recorder file has changed, e.g. because the run crashed.
+    """
 
     # Create a ColumnDataSource
     source = ColumnDataSource(df)
@@ -774,6 +761,48 @@ def create_optimization_history_plot(case_recorder, df):
     """ for i, variable_name in enumerate(variable_names))
     variable_scroll_box.text = initial_html
 
+    if driver_history is not None:
+        recorder_files = [driver_history.recorder_file]
+        if problem_recorder is not None:
+            recorder_files.append(problem_recorder)
+
+        # modification times of the recorder files when they were last read
+        last_mtimes = None
+        last_change = time.monotonic()
+
+        def stream_new_cases():
+            nonlocal last_mtimes, last_change
+
+            # only open the recorder files when they have changed
+            mtimes = [os.path.getmtime(f) if os.path.isfile(f) else None
+                      for f in recorder_files]
+            if mtimes == last_mtimes:
+                if time.monotonic() - last_change > idle_timeout / 1000:
+                    stream_callback.stop()
+                return
+            last_mtimes = mtimes
+            last_change = time.monotonic()
+
+            # checked before reading, so the cases recorded before the run finished
+            # are not missed
+            finished = problem_recorder is not None and run_finished(problem_recorder)
+
+            new_rows = driver_history.read()
+            if new_rows is not None:
+                source.stream(ColumnDataSource.from_df(new_rows))
+
+                # extend the ranges to include the new values
+                for variable_name in variable_names:
+                    y_range = plotting_figure.extra_y_ranges[f"extra_y_{variable_name}"]
+                    y_range.start = min(y_range.start, new_rows[variable_name].min())
+                    y_range.end = max(y_range.end, new_rows[variable_name].max())
+
+            if finished:
+                stream_callback.stop()
+
+        stream_callback = pn.state.add_periodic_callback(
+            stream_new_cases, period=refresh_period)
+
     # Arrange the layout using Panel
     layout = pn.Row(pn.Column(filter_variables_text_box,
                     variable_scroll_box), plotting_figure)
@@ -880,10 +909,20 @@ def dashboard(script_name, problem_recorder, driver_recorder, port, run_in_backg
     # Optimization History Plot
     if driver_recorder:
         if os.path.isfile(driver_recorder):
-            df = convert_driver_case_recorder_file_to_df(f"{driver_recorder}")
-            cr = om.CaseReader(f"{driver_recorder}")
-            opt_history_pane = create_optimization_history_plot(cr, df)
-            optimization_tabs_list.append(("Optimization History", opt_history_pane))
+            driver_history = DriverHistory(driver_recorder)
+            driver_history.read()
+            df = driver_history.to_dataframe()
+            if df is not None:
+                cr = om.CaseReader(f"{driver_recorder}")
+                # keep reading new cases while the driver is still running, which
+                # can only be detected if the problem cases are recorded
+                if os.path.isfile(problem_recorder) and \
+                        not run_finished(problem_recorder):
+                    opt_history_pane = create_optimization_history_plot(
+                        cr, df, driver_history, problem_recorder=problem_recorder)
+                else:
+                    opt_history_pane = create_optimization_history_plot(cr, df)
+                optimization_tabs_list.append(("Optimization History", opt_history_pane))
 
     # IPOPT report
     if os.path.isfile(f"{reports_dir}/IPOPT.out"):
@@ -0,0 +1,133 @@
+"""
+Incremental loading of the driver history in a case recorder file.
+
+The dashboard plots the objectives, constraints, and design variables of every driver
+iteration. Only cases recorded since the previous read are fetched, which lets the
+history be refreshed cheaply while the driver is still running.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+import openmdao.api as om
+
+
+class DriverHistory:
+    """
+    Columns of the driver history in a case recorder file, read incrementally.
+
+    There is one column per objective, constraint, and design variable (in that order,
+    with each variable only listed once), plus an iteration count ('iter_count').
+    Non-scalar values are reduced to their norm.
+
+    Cases are fetched by their iteration coordinate, which restarts each time the
+    driver is run, so only the history of a single driver run should be recorded in
+    the file.
+
+    Parameters
+    ----------
+    recorder_file : str or Path
+        Name of the case recorder file containing the driver cases.
+    """
+
+    def __init__(self, recorder_file):
+        self.recorder_file = str(recorder_file)
+
+        # number of driver cases that have been read
+        self.num_cases_read = 0
+        # names of the columns, found from the first case
+        self.names = None
+
+        self._groups = None
+        self._columns = None
+
+    def read(self):
+        """
+        Read the driver cases recorded since the previous read.
+
+        Returns
+        -------
+        DataFrame or None
+            The new rows of the history, or None if there were no new cases.
+        """
+        if not os.path.isfile(self.recorder_file):
+            return None
+
+        # a CaseReader only lists the cases once, so a new one is needed to see the
+        # cases recorded since the previous read
+        reader = om.CaseReader(self.recorder_file)
+        case_ids = reader.list_cases('driver', recurse=False, out_stream=None)
+        case_ids = case_ids[self.num_cases_read:]
+        if not case_ids:
+            return None
+
+        new_values = []
+
+        for case_id in case_ids:
+            case = reader.get_case(case_id)
+
+            values = (case.get_objectives(scaled=False),
+                      case.get_constraints(scaled=False),
+                      case.get_design_vars(scaled=False))
+
+            if self.names is None:
+                self._set_names(*values)
+
+            new_values.append(values)
+
+        new_columns = {'iter_count': np.arange(self.num_cases_read,
+                                               self.num_cases_read + len(new_values))}
+        for group, names in enumerate(self._groups):
+            for name in names:
+                new_columns[name] = np.array(
+                    [_norm(values[group].get(name, np.nan)) for values in new_values])
+
+        for name, column in new_columns.items():
+            self._columns[name].append(column)
+        self.num_cases_read += len(new_values)
+
+        return pd.DataFrame(new_columns, index=new_columns['iter_count'])
+
+    def to_dataframe(self):
+        """
+        Get all rows of the history read so far.
+
+        Returns
+        -------
+        DataFrame or None
+            The history, or None if no driver cases have been read.
+        """
+        if self.names is None:
+            return None
+
+        columns = {name: np.concatenate(self._columns[name])
+                   for name in ['iter_count'] + self.names}
+
+        return pd.DataFrame(columns)
+
+    def _set_names(self, objectives, constraints, desvars):
+        # A variable can be in more than one of desvars, cons, and obj, so filter
+        # out the dupes. Start with obj, then cons, then desvars, giving priority to
+        # having a duplicate being in the obj and cons over being in the desvars
+        objectives_names = list(objectives)
+        constraints_names = []
+        desvars_names = []
+
+        all_var_names = objectives_names.copy()
+        for names, group_names in ((constraints, constraints_names),
+                                   (desvars, desvars_names)):
+            for name in names:
+                if name not in all_var_names:
+                    group_names.append(name)
+                    all_var_names.append(name)
+
+        self.names = all_var_names
+        self._groups = (objectives_names, constraints_names, desvars_names)
+        self._columns = {name: [] for name in ['iter_count'] + all_var_names}
+
+
+def _norm(value):
+    if not np.isscalar(value):
+        value = np.linalg.norm(value)
+    return value
@@ -0,0 +1,109 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+from openmdao.utils.assert_utils import assert_near_equal
+from openmdao.utils.testing_utils import use_tempdirs
+
+from aviary.visualization.driver_history import DriverHistory
+
+
+@use_tempdirs
+class DriverHistoryTest(unittest.TestCase):
+    """
+    Test reading the driver history from a case recorder file while it is recorded.
+    """
+
+    def test_incremental_read(self):
+        prob = om.Problem()
+        prob.model.add_subsystem(
+            'comp', om.ExecComp(['f = sum((x - 3.0)**2) + y**2', 'g = x - y'],
+                                x=np.ones(3), g=np.ones(3)),
+            promotes=['*'])
+        prob.model.add_design_var('x', lower=-10.0, upper=10.0)
+        prob.model.add_design_var('y', lower=-10.0, upper=10.0)
+        prob.model.add_objective('f')
+        prob.model.add_constraint('g', upper=1.0)
+        # also a design variable, so only listed once as a constraint
+        prob.model.add_constraint('y', lower=-5.0)
+
+        prob.driver = om.ScipyOptimizeDriver(optimizer='SLSQP', disp=False)
+        prob.driver.add_recorder(om.SqliteRecorder('history.db'))
+        prob.setup()
+
+        history = DriverHistory('history.db')
+        self.assertIsNone(history.read())
+
+        prob.run_driver()
+
+        rows = history.read()
+        num_rows = len(rows)
+        # objectives first, then constraints, then the remaining design variables
+        self.assertEqual(history.names[0], 'f')
+        self.assertEqual(set(history.names[1:3]), {'g', 'y'})
+        self.assertEqual(history.names[3:], ['x'])
+        self.assertEqual(list(rows.columns), ['iter_count'] + history.names)
+        assert_near_equal(rows['iter_count'].to_numpy(), np.arange(num_rows))
+
+        cr = om.CaseReader('history.db')
+        cases = cr.list_cases('driver', out_stream=None)
+        self.assertEqual(num_rows, len(cases))
+
+        last_case = cr.get_case(cases[-1])
+        assert_near_equal(rows['f'].iloc[-1], np.abs(last_case.get_val('f')[0]), 1e-12)
+        assert_near_equal(rows['x'].iloc[-1], np.linalg.norm(last_case.get_val('x')),
+                          1e-12)
+        assert_near_equal(rows['g'].iloc[-1], np.linalg.norm(last_case.get_val('g')),
+                          1e-12)
+
+        # nothing new has been recorded
+        self.assertIsNone(history.read())
+
+        prob.cleanup()
+
+    def test_read_while_recording(self):
+        history = DriverHistory('history.db')
+        reads = []
+
+        class ReadingComp(om.ExplicitComponent):
+            # reads the history each time the driver evaluates the model
+
+            def setup(self):
+                self.add_input('x', np.ones(2))
+                self.add_output('f')
+
+            def compute(self, inputs, outputs):
+                outputs['f'] = np.sum(inputs['x'])
+                reads.append(history.read())
+
+        xs = [np.array([1.0, 2.0]), np.array([3.0, 4.0]), np.array([5.0, 12.0])]
+
+        prob = om.Problem()
+        prob.model.add_subsystem('comp', ReadingComp(), promotes=['*'])
+        prob.model.add_design_var('x')
+        prob.model.add_objective('f')
+        prob.driver = om.DOEDriver(om.ListGenerator([[('x', x)] for x in xs]))
+        prob.driver.add_recorder(om.SqliteRecorder('history.db'))
+        prob.setup()
+        prob.run_driver()
+        prob.cleanup()
+
+        # the first evaluation happens before anything is recorded, then every read
+        # returns just the case recorded since the previous read
+        self.assertIsNone(reads[0])
+        for i, rows in enumerate(reads[1:]):
+            self.assertEqual(len(rows), 1)
+            assert_near_equal(rows['iter_count'].to_numpy(), [i])
+            assert_near_equal(rows['x'].to_numpy(), [np.linalg.norm(xs[i])], 1e-12)
+
+        rows = history.read()
+        assert_near_equal(rows['iter_count'].to_numpy(), [len(xs) - 1])
+        assert_near_equal(rows['f'].to_numpy(), [np.sum(xs[-1])], 1e-12)
+
+        df = history.to_dataframe()
+        assert_near_equal(df['iter_count'].to_numpy(), np.arange(len(xs)))
+        assert_near_equal(df['x'].to_numpy(), [np.linalg.norm(x) for x in xs], 1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()